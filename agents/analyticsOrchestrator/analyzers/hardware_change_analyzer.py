@@ -6,9 +6,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List, NoReturn
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.utils import load_annotation_path, load_json, read_change_log
+from agents.database_loader import load_database, schema_dtypes
 from agents.analyticsOrchestrator.analyzers.configs.change_analyzer_config import ChangeAnalyzerConfig
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.analyticsOrchestrator.analyzers.configs.save_output_formatter import save_machine_layout, save_mold_machine_pair
+from agents.analyticsOrchestrator.trackers.history_sweep import CHECKPOINT_FILE_NAME
 
 # Import agent report format components
 from configs.shared.agent_report_format import (
@@ -86,7 +88,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -164,6 +166,12 @@ class  MachineLayoutTrackingPhase(AtomicPhase):
             logger.error(f"Error loading layout changes: {str(e)}")
             return None
         
+    def _checkpoint_path(self) -> Optional[str]:
+        """Sweep checkpoint next to the saved tracker results (only kept when results are saved)"""
+        if not self.config.save_machine_layout_result:
+            return None
+        return str(Path(self.config.shared_source_config.machine_layout_tracker_dir) / CHECKPOINT_FILE_NAME)
+
     def _execute_impl(self) -> Dict[str, Any]:
         """Run machine layout tracker logic"""
         logger.info("🔄 Running machine layout tracker...")
@@ -177,7 +185,8 @@ class  MachineLayoutTrackingPhase(AtomicPhase):
         tracker = MachineLayoutTracker( 
             productRecords_df=productRecords_df, 
             databaseSchemas_data=databaseSchemas_data,
-            layout_changes_dict = layout_changes_dict
+            layout_changes_dict = layout_changes_dict,
+            checkpoint_path = self._checkpoint_path()
             )
         
         # Check for new layout changes
@@ -242,6 +251,12 @@ class  MoldMachinePairTrackingPhase(AtomicPhase):
             logger.error(f"Error loading mold-machine dict: {str(e)}")
             return None
         
+    def _checkpoint_path(self) -> Optional[str]:
+        """Sweep checkpoint next to the saved tracker results (only kept when results are saved)"""
+        if not self.config.save_mold_machine_pair_result:
+            return None
+        return str(Path(self.config.shared_source_config.mold_machine_pair_tracker_dir) / CHECKPOINT_FILE_NAME)
+
     def _execute_impl(self) -> Dict[str, Any]:
         """Run mold machine pair tracker logic"""
         logger.info("🔄 Running mold machine pair tracker...")
@@ -259,7 +274,8 @@ class  MoldMachinePairTrackingPhase(AtomicPhase):
                  moldInfo_df = moldInfo_df,
                  machineInfo_df = machineInfo_df,
                  databaseSchemas_data = databaseSchemas_data,
-                 mold_machines_dict = mold_machines_dict)
+                 mold_machines_dict = mold_machines_dict,
+                 checkpoint_path = self._checkpoint_path())
 
         # Check for new mold-machine pair changes
         latest_record_date = productRecords_df['recordDate'].max()
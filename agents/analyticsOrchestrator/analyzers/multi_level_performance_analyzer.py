@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List, NoReturn
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.utils import load_annotation_path
+from agents.database_loader import load_database, schema_dtypes, read_dataset_manifest, database_date_bounds, UNDATED_PARTITION
 from agents.analyticsOrchestrator.analyzers.configs.performance_analyzer_config import LevelConfig, PerformanceAnalyzerConfig
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.analyticsOrchestrator.analyzers.configs.save_output_formatter import save_analyzer_reports
@@ -38,6 +39,10 @@ class DataLoadingPhase(AtomicPhase):
         super().__init__("DataLoading")
         self.config = config.shared_source_config
         self.data_container = data_container
+
+        # Only the year level needs every production record; day/month levels read
+        # their own partitions of productRecords (see _load_day_records/_load_month_records)
+        self.defer_product_records = not config.enable_year_level_processor
     
     def _load_annotation(self, path: str, name: str) -> Dict:
 
@@ -80,7 +85,8 @@ class DataLoadingPhase(AtomicPhase):
         return loaded_configs
     
     def _load_dataframes(self,
-                         path_annotation: Dict) -> Dict[str, Any]:
+                         path_annotation: Dict,
+                         databaseSchemas_data: Dict) -> Dict[str, Any]:
         
         # Define dataframes to load
         dataframes_to_load = [
@@ -104,9 +110,13 @@ class DataLoadingPhase(AtomicPhase):
             if not os.path.exists(path):
                 missing_files.append(f"{path_key}: file not found at {path}")
                 continue
+
+            if path_key == 'productRecords' and self.defer_product_records:
+                logger.debug("{}: deferred to the level processors (partition pruning)", path_key)
+                continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -150,7 +160,7 @@ class DataLoadingPhase(AtomicPhase):
         )
         
         logger.info("📊 Loading DataFrames from parquet files...")
-        loaded_dfs = self._load_dataframes(path_annotation)
+        loaded_dfs = self._load_dataframes(path_annotation, databaseSchemas_data)
 
         self.data_container.update({
             'constant_config': constant_config,
@@ -204,12 +214,13 @@ class  DayLevelProcessingPhase(AtomicPhase):
         """Run day-level data processor logic"""
         logger.info("🔄 Running day-level data processor...")
 
-        productRecords_df = self.loaded_data['dataframes']["productRecords_df"]
+        record_date = self.config.day_level_processor_params.requested_timestamp
+
+        productRecords_df = self._load_day_records(record_date)
         purchaseOrders_df = self.loaded_data['dataframes']["purchaseOrders_df"]
         databaseSchemas_data = self.loaded_data['databaseSchemas_data']
 
         constant_configs = self.loaded_data.get('component_configs', {})
-        record_date = self.config.day_level_processor_params.requested_timestamp
 
         # Initialize day-level data processor
         from agents.analyticsOrchestrator.processor.day_level_data_processor import DayLevelDataProcessor
@@ -227,6 +238,36 @@ class  DayLevelProcessingPhase(AtomicPhase):
             "savable": True
         }
 
+    def _load_day_records(self, record_date: Optional[str]) -> pd.DataFrame:
+        """
+        Production records needed for one day: the requested day, or the latest
+        recorded day when it is missing (the processor then falls back to it).
+        """
+        loaded = self.loaded_data['dataframes'].get("productRecords_df")
+        if loaded is not None:
+            return loaded
+
+        path = self.loaded_data['path_annotation']['productRecords']
+        dtypes = schema_dtypes(self.loaded_data['databaseSchemas_data'], 'productRecords')
+        if read_dataset_manifest(path) is None:
+            return load_database(path, dtypes=dtypes)
+
+        if record_date is not None:
+            try:
+                requested_date = pd.Timestamp(record_date).normalize()
+            except Exception:
+                # Let the processor report the invalid date
+                return load_database(path, dtypes=dtypes)
+            day_df = load_database(path, dtypes=dtypes, start=requested_date, end=requested_date)
+            if not day_df.empty:
+                return day_df
+
+        latest_date = database_date_bounds(path)[1]
+        if pd.isna(latest_date):
+            return load_database(path, dtypes=dtypes)
+        latest_date = latest_date.normalize()
+        return load_database(path, dtypes=dtypes, start=latest_date, end=latest_date + pd.Timedelta(days=1) - pd.Timedelta(1))
+
     def _fallback(self) -> Dict[str, Any]:
         """Fallback: return empty processing results"""
         logger.warning("Using fallback for DayLevelProcessingPhase - returning empty results")
@@ -257,15 +298,15 @@ class  MonthLevelProcessingPhase(AtomicPhase):
         """Run month-level data processor logic"""
         logger.info("🔄 Running month-level data processor...")
 
-        productRecords_df = self.loaded_data['dataframes']["productRecords_df"]
+        record_month = self.config.month_level_processor_params.requested_timestamp
+        analysis_date = self.config.month_level_processor_params.analysis_date
+
+        productRecords_df = self._load_month_records(record_month, analysis_date)
         purchaseOrders_df = self.loaded_data['dataframes']["purchaseOrders_df"]
         moldInfo_df = self.loaded_data['dataframes']["moldInfo_df"]
         moldSpecificationSummary_df = self.loaded_data['dataframes']["moldSpecificationSummary_df"]
         databaseSchemas_data = self.loaded_data['databaseSchemas_data']
 
-        record_month = self.config.month_level_processor_params.requested_timestamp
-        analysis_date = self.config.month_level_processor_params.analysis_date
-
         # Initialize month-level data processor
         from agents.analyticsOrchestrator.processor.month_level_data_processor import MonthLevelDataProcessor
 
@@ -285,6 +326,38 @@ class  MonthLevelProcessingPhase(AtomicPhase):
             "savable": True
         }
 
+    def _load_month_records(self,
+                            record_month: Optional[str],
+                            analysis_date: Optional[str]) -> pd.DataFrame:
+        """
+        Production records needed for one month: every partition up to the analysis
+        month (backlog detection looks at earlier months), plus the next non-empty
+        partition so the processor still sees whether data continues past the analysis date.
+        """
+        loaded = self.loaded_data['dataframes'].get("productRecords_df")
+        if loaded is not None:
+            return loaded
+
+        path = self.loaded_data['path_annotation']['productRecords']
+        dtypes = schema_dtypes(self.loaded_data['databaseSchemas_data'], 'productRecords')
+        manifest = read_dataset_manifest(path)
+        if manifest is None:
+            return load_database(path, dtypes=dtypes)
+
+        try:
+            if analysis_date is not None:
+                analysis_month = pd.Timestamp(analysis_date).strftime("%Y-%m")
+            else:
+                analysis_month = pd.Period(record_month, freq="M").strftime("%Y-%m")
+        except Exception:
+            # Let the processor report the invalid timestamp
+            return load_database(path, dtypes=dtypes)
+
+        dated_keys = [p["key"] for p in manifest["partitions"] if p["key"] != UNDATED_PARTITION]
+        keys = [key for key in dated_keys if key <= analysis_month]
+        keys += [key for key in dated_keys if key > analysis_month][:1]
+        return load_database(path, dtypes=dtypes, partitions=keys)
+
     def _fallback(self) -> Dict[str, Any]:
         """Fallback: return empty processing results"""
         logger.warning("Using fallback for MonthLevelProcessingPhase - returning empty results")
@@ -0,0 +1,267 @@
+# agents/analyticsOrchestrator/trackers/history_sweep.py
+
+"""
+Single-pass history sweeps for the hardware trackers.
+
+MachineLayoutTracker and MoldMachinePairTracker describe history as snapshots taken on
+every date where a new (machine, partner) pair first appears. Instead of re-filtering
+all records up to each change date, a sweep sorts the records once and advances a
+running state date by date:
+
+- LayoutSweep:       machineNo -> machineCode of its latest record
+- MoldMachineSweep:  moldNo -> set of machineCodes it has run on
+
+A SweepCheckpoint (last swept date, running state, seen pairs, change history) can be
+persisted so the next run only sweeps records after the last tracked date. It is resumed
+only while the swept records are unchanged (same rows_digest).
+"""
+
+from loguru import logger
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
+from pathlib import Path
+import json
+import os
+import numpy as np
+import pandas as pd
+
+from agents.incremental_state import rows_digest
+
+EmitMode = Literal["snapshot", "delta"]
+
+CHECKPOINT_FILE_NAME = "history_sweep_checkpoint.json"
+
+@dataclass
+class SweepCheckpoint:
+    """Where a sweep stopped: resume it on records after `last_date`"""
+    last_date: str
+    rows_swept: int
+    state: Dict[str, Any] = field(default_factory=dict)
+    seen_pairs: List[List[str]] = field(default_factory=list)
+    # rows_digest of the swept records (None: written before digests, never resumed)
+    rows_digest: Optional[str] = None
+    # Snapshots of every change date so far (None once a delta sweep emitted some instead)
+    changes: Optional[Dict[str, Any]] = None
+
+def load_checkpoint(path: Path | str) -> Optional[SweepCheckpoint]:
+    """Read a checkpoint written by save_checkpoint; None if missing or unreadable."""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return SweepCheckpoint(**json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable sweep checkpoint {}: {}", path, e)
+        return None
+
+def save_checkpoint(path: Path | str, checkpoint: SweepCheckpoint) -> None:
+    """Write the checkpoint atomically (tmp file + replace)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(checkpoint), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    logger.debug("Saved sweep checkpoint at {} ({})", checkpoint.last_date, path)
+
+class HistorySweep(ABC):
+    """
+    Sweep records in date order, keeping a running state and the set of
+    (key, value) pairs seen so far. Subclasses define the state update.
+    """
+
+    date_column = "recordDate"
+    key_column: str
+    value_column: str
+
+    def __init__(self, checkpoint: Optional[SweepCheckpoint] = None):
+        self.last_date: Optional[pd.Timestamp] = None
+        self.rows_swept = 0
+        self.seen_pairs = set()
+        self.state = self._empty_state()
+        self.swept_digest: Optional[str] = None
+        self.changes: Optional[Dict[str, Dict]] = {}
+
+        if checkpoint is not None:
+            self.last_date = pd.Timestamp(checkpoint.last_date)
+            self.rows_swept = checkpoint.rows_swept
+            self.seen_pairs = {tuple(pair) for pair in checkpoint.seen_pairs}
+            self.state = self._state_from_checkpoint(checkpoint.state)
+            self.swept_digest = checkpoint.rows_digest
+            self.changes = checkpoint.changes
+
+    #---------------#
+    # Subclass API  #
+    #---------------#
+    def _empty_state(self) -> Dict:
+        return {}
+
+    def _state_from_checkpoint(self, state: Dict) -> Dict:
+        return dict(state)
+
+    def _state_to_checkpoint(self) -> Dict:
+        return dict(self.state)
+
+    @abstractmethod
+    def _advance(self, keys: np.ndarray, values: np.ndarray) -> Dict:
+        """Apply one date's records (in record order) to the state; return the delta."""
+
+    @abstractmethod
+    def snapshot(self) -> Dict:
+        """Current state, as emitted for a change date."""
+
+    #----------#
+    # Sweeping #
+    #----------#
+    def _sweepable(self, df: pd.DataFrame) -> pd.Series:
+        """Records a sweep advances over: those with a date, a key and a value."""
+        return df[[self.date_column, self.key_column, self.value_column]].notna().all(axis=1)
+
+    def _swept_mask(self, df: pd.DataFrame) -> pd.Series:
+        return self._sweepable(df) & (df[self.date_column] <= self.last_date)
+
+    def _swept_rows_digest(self, df: pd.DataFrame) -> str:
+        return rows_digest(df.loc[self._swept_mask(df)], [self.date_column, self.key_column, self.value_column])
+
+    def is_resumable(self, df: pd.DataFrame) -> bool:
+        """
+        True if `df` still holds exactly the rows the checkpoint swept up to `last_date`,
+        with the same values (history was only appended to). A fresh sweep is always resumable.
+        """
+        if self.last_date is None:
+            return True
+        if self.swept_digest is None:
+            return False
+        if int(self._swept_mask(df).sum()) != self.rows_swept:
+            return False
+        return self._swept_rows_digest(df) == self.swept_digest
+
+    def iter_changes(self,
+                     df: pd.DataFrame,
+                     until: Optional[pd.Timestamp] = None,
+                     emit: EmitMode = "snapshot") -> Iterator[Tuple[pd.Timestamp, Dict]]:
+
+        """
+        Advance over records after the last swept date (up to `until`, inclusive) and
+        yield (date, snapshot or delta) for every date where a new pair first appears.
+        Records without a date, key or value are skipped.
+        """
+
+        if emit not in ("snapshot", "delta"):
+            raise ValueError(f"Unknown emit mode: {emit}")
+
+        dates = df[self.date_column]
+        mask = self._sweepable(df)
+        if self.last_date is not None:
+            mask &= dates > self.last_date
+        if until is not None:
+            mask &= dates <= until
+
+        # Stable sort: records of the same date keep their order in `df`
+        pending = df.loc[mask, [self.date_column, self.key_column, self.value_column]]
+        pending = pending.sort_values(self.date_column, kind="stable")
+
+        date_values = pending[self.date_column].to_numpy()
+        keys = pending[self.key_column].to_numpy(dtype=object)
+        values = pending[self.value_column].to_numpy(dtype=object)
+
+        block_dates, starts = np.unique(date_values, return_index=True)
+        ends = np.append(starts[1:], len(date_values))
+
+        for date, start, end in zip(block_dates, starts, ends):
+            block_keys, block_values = keys[start:end], values[start:end]
+
+            new_pairs = {(str(k), str(v)) for k, v in zip(block_keys, block_values)} - self.seen_pairs
+            self.seen_pairs |= new_pairs
+            delta = self._advance(block_keys, block_values)
+
+            self.last_date = pd.Timestamp(date)
+            self.rows_swept += end - start
+
+            if new_pairs:
+                if emit == "snapshot":
+                    snapshot = self.snapshot()
+                    if self.changes is not None:
+                        self.changes[self.last_date.isoformat()] = snapshot
+                    yield self.last_date, snapshot
+                else:
+                    self.changes = None
+                    yield self.last_date, delta
+
+        if until is not None and (self.last_date is None or self.last_date < until):
+            # Nothing left to sweep up to `until`
+            self.last_date = pd.Timestamp(until)
+
+    def sweep(self,
+              df: pd.DataFrame,
+              until: Optional[pd.Timestamp] = None,
+              emit: EmitMode = "snapshot") -> Dict[str, Dict]:
+        """Collect iter_changes() into {date.isoformat(): snapshot or delta}."""
+        changes = {date.isoformat(): state for date, state in self.iter_changes(df, until, emit)}
+        logger.debug("{} swept {} rows, {} change dates", self.__class__.__name__, self.rows_swept, len(changes))
+        return changes
+
+    def checkpoint(self, df: pd.DataFrame) -> SweepCheckpoint:
+        """Checkpoint of the sweep over `df` (the records it was advanced over)."""
+        if self.last_date is None:
+            raise ValueError("Nothing has been swept yet")
+        return SweepCheckpoint(
+            last_date=self.last_date.isoformat(),
+            rows_swept=int(self.rows_swept),
+            state=self._state_to_checkpoint(),
+            seen_pairs=sorted([list(pair) for pair in self.seen_pairs]),
+            rows_digest=self._swept_rows_digest(df),
+            changes=self.changes
+        )
+
+class LayoutSweep(HistorySweep):
+    """Running machine layout: machineNo -> machineCode of its latest record"""
+
+    key_column = "machineNo"
+    value_column = "machineCode"
+
+    def _advance(self, keys: np.ndarray, values: np.ndarray) -> Dict[str, str]:
+        delta = {}
+        for machine_no, machine_code in zip(keys, values):
+            # Re-insert so the order matches drop_duplicates('machineNo', keep='last')
+            self.state.pop(machine_no, None)
+            self.state[machine_no] = machine_code
+            delta[machine_no] = machine_code
+        return delta
+
+    def snapshot(self) -> Dict[str, str]:
+        return dict(self.state)
+
+class MoldMachineSweep(HistorySweep):
+    """Running mold -> machines mapping: every machineCode a mold has run on"""
+
+    key_column = "moldNo"
+    value_column = "machineCode"
+
+    def __init__(self, checkpoint: Optional[SweepCheckpoint] = None):
+        # Formatted machine lists per mold, rebuilt only for molds that changed
+        self._formatted: Dict[Any, List[str]] = {}
+        super().__init__(checkpoint)
+
+    def _state_from_checkpoint(self, state: Dict[str, List[str]]) -> Dict:
+        return {mold: set(machines) for mold, machines in state.items()}
+
+    def _state_to_checkpoint(self) -> Dict[str, List[str]]:
+        return self.snapshot()
+
+    def _advance(self, keys: np.ndarray, values: np.ndarray) -> Dict[str, List[str]]:
+        delta = {}
+        for mold_no, machine_code in zip(keys, values):
+            machines = self.state.setdefault(mold_no, set())
+            if machine_code not in machines:
+                machines.add(machine_code)
+                self._formatted.pop(mold_no, None)
+                delta.setdefault(str(mold_no), []).append(str(machine_code))
+        return delta
+
+    def snapshot(self) -> Dict[str, List[str]]:
+        for mold in self.state.keys() - self._formatted.keys():
+            self._formatted[mold] = [str(machine) for machine in sorted(self.state[mold])]
+        return {str(mold): list(self._formatted[mold]) for mold in sorted(self.state)}
@@ -6,6 +6,7 @@ from agents.decorators import validate_init_dataframes
 from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.analyticsOrchestrator.trackers.configs.tracker_config import TrackerResult
+from agents.analyticsOrchestrator.trackers.history_sweep import LayoutSweep, load_checkpoint, save_checkpoint
 
 @validate_init_dataframes(lambda self: {
     "record_df": list(self.databaseSchemas_data['dynamicDB']['productRecords']['dtypes'].keys())
@@ -16,7 +17,8 @@ class MachineLayoutTracker(ConfigReportMixin):
     def __init__(self,
                  productRecords_df: pd.DataFrame,
                  databaseSchemas_data: Dict,
-                 layout_changes_dict: Optional[Dict[str, Dict[str, str]]] = None):
+                 layout_changes_dict: Optional[Dict[str, Dict[str, str]]] = None,
+                 checkpoint_path: Optional[str] = None):
         
         self._capture_init_args()
         self.logger = logger.bind(class_="MachineLayoutTracker")
@@ -25,6 +27,9 @@ class MachineLayoutTracker(ConfigReportMixin):
         self.databaseSchemas_data = databaseSchemas_data
         self.layout_changes_dict = layout_changes_dict
 
+        # Optional persisted sweep state: later runs only sweep records after it
+        self.checkpoint_path = checkpoint_path
+
     def check_new_layout_change(self, new_record_date: pd.Timestamp) -> TrackerResult:
 
         """Check for new layout changes"""
@@ -124,20 +129,12 @@ class MachineLayoutTracker(ConfigReportMixin):
             raise
 
     def detect_all_layout_changes(self) -> Dict[str, Dict[str, str]]:
-        """Detect all layout changes from dataframe"""
+        """Detect all layout changes from dataframe (resumes from the checkpoint if valid)"""
         try:
-            layout_change_dates = (
-                self.record_df[['recordDate', 'machineNo', 'machineCode']]
-                .sort_values('recordDate')
-                .drop_duplicates(['machineNo', 'machineCode'], keep='first')
-                ['recordDate']
-                .unique()
-            )
-            
-            layout_changes_dict = {
-                date.isoformat(): self._get_layout_at_date(date)
-                for date in sorted(layout_change_dates)
-            }
+            sweep = self._resume_sweep(with_changes=True)
+            sweep.sweep(self.record_df)
+            self._save_checkpoint(sweep)
+            layout_changes_dict = dict(sweep.changes)
             
             self.logger.info(f"Detected {len(layout_changes_dict)} layout change dates")
             return layout_changes_dict
@@ -159,14 +156,33 @@ class MachineLayoutTracker(ConfigReportMixin):
         self.record_df = self.record_df.sort_values('recordDate')
 
     def _get_layout_at_date(self, target_date: pd.Timestamp) -> Dict[str, str]:
-        """Get complete machine layout at a specific date - Optimized"""
-        mask = self.record_df['recordDate'] <= target_date
-        active_machines = (
-            self.record_df[mask]
-            .drop_duplicates('machineNo', keep='last')
-        )
-        
-        return dict(zip(active_machines['machineNo'], active_machines['machineCode']))
+        """Get complete machine layout at a specific date (resumes from the checkpoint if valid)"""
+        sweep = self._resume_sweep(target_date)
+        sweep.sweep(self.record_df, until=target_date)
+        self._save_checkpoint(sweep)
+        return sweep.snapshot()
+
+    def _resume_sweep(self,
+                      target_date: Optional[pd.Timestamp] = None,
+                      with_changes: bool = False) -> LayoutSweep:
+        """
+        Sweep state from the checkpoint, or a fresh one if records were rewritten since
+        (or the checkpoint is past `target_date`, or lacks the change history when `with_changes`)
+        """
+        checkpoint = load_checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+        if checkpoint is not None:
+            sweep = LayoutSweep(checkpoint)
+            if ((target_date is None or sweep.last_date <= target_date)
+                    and (not with_changes or sweep.changes is not None)
+                    and sweep.is_resumable(self.record_df)):
+                self.logger.debug("Resuming layout sweep after {}", checkpoint.last_date)
+                return sweep
+            self.logger.info("Layout sweep checkpoint is stale. Sweeping full history...")
+        return LayoutSweep()
+
+    def _save_checkpoint(self, sweep: LayoutSweep) -> None:
+        if self.checkpoint_path and sweep.last_date is not None:
+            save_checkpoint(self.checkpoint_path, sweep.checkpoint(self.record_df))
 
     def update_machine_layout_hist_change(self) -> pd.DataFrame:
         """Update machine layout historical change - Optimized"""
@@ -1,11 +1,12 @@
 from loguru import logger
-from typing import Dict, Set, Tuple, List, Any
+from typing import Dict, Set, Tuple, List, Any, Optional
 import pandas as pd
 from datetime import datetime
 from agents.decorators import validate_init_dataframes
 from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.analyticsOrchestrator.trackers.configs.tracker_config import TrackerResult
+from agents.analyticsOrchestrator.trackers.history_sweep import MoldMachineSweep, load_checkpoint, save_checkpoint
 
 # Decorator to validate DataFrames are initialized with the correct schema
 @validate_init_dataframes(lambda self: {
@@ -21,7 +22,8 @@ class MoldMachinePairTracker(ConfigReportMixin):
                  moldInfo_df: pd.DataFrame,
                  machineInfo_df: pd.DataFrame,
                  databaseSchemas_data: Dict,
-                 mold_machines_dict: Dict = None):
+                 mold_machines_dict: Dict = None,
+                 checkpoint_path: Optional[str] = None):
 
         self.logger = logger.bind(class_="MoldMachinePairTracker")
 
@@ -33,6 +35,9 @@ class MoldMachinePairTracker(ConfigReportMixin):
 
         self.mold_machines_dict = mold_machines_dict
 
+        # Optional persisted sweep state: later runs only sweep records after it
+        self.checkpoint_path = checkpoint_path
+
     def check_new_pairs(self, new_record_date: pd.Timestamp) -> TrackerResult:
 
         """Check for new mold-machines pairs"""
@@ -139,22 +144,14 @@ class MoldMachinePairTracker(ConfigReportMixin):
 
     def detect_all_mold_machines(self) -> Dict[str, Dict[str, List[str]]]:
 
-        """Detect all mold-machine mappings from dataframe"""
+        """Detect all mold-machine mappings from dataframe (resumes from the checkpoint if valid)"""
 
         try:
-            # Get dates when new mold-machine combinations appear
-            change_dates = (
-                self.product_df[['recordDate', 'machineCode', 'moldNo']]
-                .sort_values('recordDate')
-                .drop_duplicates(['machineCode', 'moldNo'], keep='first')
-                ['recordDate']
-                .unique()
-            )
-
-            mold_machines_dict = {}
-            for date in sorted(change_dates):
-                mapping = self._get_mold_machines_at_date(date)
-                mold_machines_dict[date.isoformat()] = mapping
+            # Snapshot the mapping on every date a new mold-machine combination appears
+            sweep = self._resume_sweep(with_changes=True)
+            sweep.sweep(self.product_df)
+            self._save_checkpoint(sweep)
+            mold_machines_dict = dict(sweep.changes)
 
             self.logger.info(f"Detected {len(mold_machines_dict)} change dates")
             return mold_machines_dict
@@ -167,15 +164,36 @@ class MoldMachinePairTracker(ConfigReportMixin):
                                    target_date: pd.Timestamp
                                    ) -> Dict[str, List[str]]:
 
-        """Get mold->machines mapping at specific date"""
-
-        df_filtered = self.product_df[self.product_df['recordDate'] <= target_date]
-        mapping = df_filtered.groupby('moldNo')['machineCode'].apply(
-            lambda x: sorted(list(x.unique()))
-        ).to_dict()
-
-        # Convert to string keys and values
-        return {str(k): [str(v) for v in vals] for k, vals in mapping.items()}
+        """Get mold->machines mapping at specific date (resumes from the checkpoint if valid)"""
+
+        sweep = self._resume_sweep(target_date)
+        sweep.sweep(self.product_df, until=target_date)
+        self._save_checkpoint(sweep)
+
+        # String keys and values
+        return sweep.snapshot()
+
+    def _resume_sweep(self,
+                      target_date: Optional[pd.Timestamp] = None,
+                      with_changes: bool = False) -> MoldMachineSweep:
+        """
+        Sweep state from the checkpoint, or a fresh one if records were rewritten since
+        (or the checkpoint is past `target_date`, or lacks the change history when `with_changes`)
+        """
+        checkpoint = load_checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+        if checkpoint is not None:
+            sweep = MoldMachineSweep(checkpoint)
+            if ((target_date is None or sweep.last_date <= target_date)
+                    and (not with_changes or sweep.changes is not None)
+                    and sweep.is_resumable(self.product_df)):
+                self.logger.debug("Resuming mold-machine sweep after {}", checkpoint.last_date)
+                return sweep
+            self.logger.info("Mold-machine sweep checkpoint is stale. Sweeping full history...")
+        return MoldMachineSweep()
+
+    def _save_checkpoint(self, sweep: MoldMachineSweep) -> None:
+        if self.checkpoint_path and sweep.last_date is not None:
+            save_checkpoint(self.checkpoint_path, sweep.checkpoint(self.product_df))
 
     def _extract_latest_pairs(self,
                               mold_machines_dict: Dict[str, List[str]]
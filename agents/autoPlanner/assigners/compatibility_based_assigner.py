@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 from loguru import logger
 from typing import List, Dict, Optional, Union
 from datetime import datetime
@@ -7,7 +8,7 @@ from agents.autoPlanner.assigners.configs.assigner_config import (
     PriorityOrder, AssignerStats, AssignerResult, PriorityOrdersConfig)
 from agents.autoPlanner.assigners.configs.assigner_formatter import (
     log_machine_load, log_priority_order, log_final_results)
-from agents.autoPlanner.tools.machine_assignment import find_best_machine, update_machine_dataframe_optimized
+from agents.autoPlanner.tools.machine_assignment import find_best_machine, build_assigned_matrix, label_index_map
 
 class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMachineOptimizer
 
@@ -143,27 +144,16 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
         
         """Calculate mold priorities based on flexible priority order"""
 
-        priority_data = []
+        # Compatibility score: number of compatible machines (no compatibility = highest priority)
+        compatible_counts = dict(zip(self.compatibility_matrix.index, self.compatibility_matrix.sum(axis=1)))
 
-        for _, row in mold_lead_times_df.iterrows():
-            mold_id = row['moldNo']
+        priority_df = pd.DataFrame({
+            'moldNo': mold_lead_times_df['moldNo'].tolist(),
+            'machine_compatibility': [compatible_counts.get(mold_id, 0) for mold_id in mold_lead_times_df['moldNo']],
+            'moldLeadTime': mold_lead_times_df['moldLeadTime'].tolist(),
+            'totalQuantity': mold_lead_times_df['totalQuantity'].tolist()
+        })
 
-            # Calculate compatibility score
-            if mold_id in self.compatibility_matrix.index:
-                compatible_count = self.compatibility_matrix.loc[mold_id].sum()
-            else:
-                compatible_count = 0  # No compatibility = highest priority
-
-            priority_data.append({
-                'moldNo': mold_id,
-                'machine_compatibility': compatible_count,
-                'moldLeadTime': row['moldLeadTime'],
-                'totalQuantity': row['totalQuantity']
-            })
-
-        # Convert to DataFrame and sort
-        priority_df = pd.DataFrame(priority_data)
-        
         # Create sorting configuration
         sort_keys = []
         ascending_flags = []
@@ -189,7 +179,7 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
         mold_priorities = priority_df_sorted['moldNo'].tolist()
         
         self.logger.info('Total molds to process: {}', len(mold_priorities))
-        calculator_log.append(f"Total molds to process: {len(mold_priorities)}")
+        calculator_log += f"\nTotal molds to process: {len(mold_priorities)}"
         
         return mold_priorities, calculator_log
     
@@ -201,16 +191,21 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
                                   mold_lead_times_dict: Dict[str, int]
                                   ) -> str:
 
-        # Initial machine load and result matrix
-        machine_df = self.mold_machine_assigned_matrix.copy()
-        assigned_matrix = pd.DataFrame(columns=machine_df.columns)
-
-        # Calculate initial machine load
+        # Initial machine load
+        machine_df = self.mold_machine_assigned_matrix
         current_load = machine_df.sum().to_dict()
         machine_load_log_str = log_machine_load(
             "INITIAL", 
             current_load, 
             self.max_load_threshold)
+
+        # Compatibility as a dense boolean (mold x machine) array with an integer index map
+        compatible_array = (self.compatibility_matrix.to_numpy() == 1)
+        machine_codes = np.asarray(self.compatibility_matrix.columns, dtype=object)
+        mold_index = label_index_map(self.compatibility_matrix.index)
+
+        # (moldNo, machineCode, leadTime) rows, turned into the result matrix once at the end
+        assigned_rows = []
         
         # Process molds by priority order
         for i, mold_id in enumerate(mold_priorities):
@@ -220,9 +215,12 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
                 self.logger.info("Processing mold {}/{}: {}", i+1, len(mold_priorities), mold_id)
 
             # Process individual mold assignment
+            row_index = mold_index.get(mold_id)
+            suitable_machines = (None if row_index is None 
+                                 else machine_codes[compatible_array[row_index]].tolist())
             result = self._process_mold_assignment(
                 mold_id, i, 
-                self.compatibility_matrix, 
+                suitable_machines, 
                 current_load, 
                 mold_lead_times_dict, 
                 self.max_load_threshold)
@@ -235,20 +233,14 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
                 self.assignments.append(mold_id)
                 current_load[best_machine] += mold_lead_time
                 self.stats.assignments_made += 1
-
-                # Update matrices
-                machine_df = update_machine_dataframe_optimized(
-                    machine_df, best_machine, 
-                    mold_id, mold_lead_time)
-                
-                assigned_matrix = update_machine_dataframe_optimized(
-                    assigned_matrix, best_machine, 
-                    mold_id, mold_lead_time)
+                assigned_rows.append((mold_id, best_machine, mold_lead_time))
             else:
                 self.unassigned_molds.append(mold_id)
                 if result['overloaded_machines']:
                     self.overloaded_machines.update(result['overloaded_machines'])
 
+        assigned_matrix = build_assigned_matrix(machine_df.columns, assigned_rows)
+
         # Finalize results
         assigned_matrix.index.name = "moldNo"
         self.stats.end_time = datetime.now()
@@ -272,23 +264,22 @@ class CompatibilityBasedAssigner(ConfigReportMixin): #CompatibilityBasedMoldMach
     def _process_mold_assignment(self, 
                                  mold_id: str, 
                                  iteration: int, 
-                                 compatibility_matrix: pd.DataFrame,
+                                 suitable_machines: Optional[List[str]],
                                  current_load: Dict[str, int],
                                  mold_lead_times_dict: Dict[str, int],
                                  max_load_threshold: Optional[int]) -> Dict:
         
-        """Process assignment for a single mold"""
+        """
+        Process assignment for a single mold.
+        `suitable_machines` are its compatible machines (None if it is not in the compatibility matrix).
+        """
         
         # Check compatibility
-        if mold_id not in compatibility_matrix.index:
+        if suitable_machines is None:
             if iteration < 5:
                 self.logger.info("❌ {} not found in compatibility matrix", mold_id)
             return {'assigned': False, 'overloaded_machines': set()}
 
-        # Get compatible machines
-        compatible_machines = compatibility_matrix.loc[mold_id]
-        suitable_machines = compatible_machines[compatible_machines == 1].index.tolist()
-
         if not suitable_machines:
             if iteration < 5:
                 self.logger.info("❌ {} has no compatible machines", mold_id)
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,6 +10,21 @@ class PriorityOrder(Enum):
     PRIORITY_2 = "priority_order_2"
     PRIORITY_3 = "priority_order_3"
 
+class SolverMode(Enum):
+    """Enumeration for pending-order assignment solvers"""
+    GREEDY = "greedy"      # HistoryBasedAssigner + CompatibilityBasedAssigner
+    OPTIMAL = "optimal"    # OptimalAssigner (MILP), greedy plan kept as fallback
+
+    @classmethod
+    def resolve(cls, mode: Union[str, "SolverMode"]) -> "SolverMode":
+        """Get solver mode by enum or string"""
+        if isinstance(mode, SolverMode):
+            return mode
+        try:
+            return cls(mode)
+        except ValueError:
+            raise ValueError(f"Invalid solver mode: {mode}. Available: {[m.value for m in cls]}")
+
 class PriorityOrdersConfig:
     """Configuration for priority orders"""
     
@@ -53,4 +68,18 @@ class AssignerResult:
     unassigned_molds: List[str]
     stats: AssignerStats
     overloaded_machines: set[str] = field(default_factory=set)
-    log: str = ""
\ No newline at end of file
+    log: str = ""
+
+@dataclass
+class PlanMetrics:
+    """Shop-floor metrics of an assignment plan (loads in days)"""
+    assigned_molds: int
+    unassigned_molds: int
+    makespan: float
+    total_lead_time: float
+    overload: float
+    machine_load: Dict[str, float] = field(default_factory=dict)
+
+    def rank_key(self) -> Tuple[int, float, float]:
+        """Lower is better: more assigned molds, then less overload, then shorter makespan"""
+        return (-self.assigned_molds, self.overload, self.makespan)
@@ -1,6 +1,6 @@
 import pandas as pd
 from typing import List, Dict, Optional
-from agents.autoPlanner.assigners.configs.assigner_config import AssignerStats
+from agents.autoPlanner.assigners.configs.assigner_config import AssignerStats, PlanMetrics
 
 # HistoryBasedAssigner logging functions
 def log_constraint_based_optimization(
@@ -129,4 +129,39 @@ def log_final_results(stats: AssignerStats,
                                                 max_load_threshold)
         log_lines.append(f"{machine_load_log_str}")
 
-        return "\n".join(log_lines)
\ No newline at end of file
+        return "\n".join(log_lines)
+
+# OptimalAssigner logging functions
+def log_plan_comparison(greedy_metrics: PlanMetrics,
+                        optimal_metrics: Optional[PlanMetrics],
+                        solver_status: str,
+                        selected_plan: str) -> str:
+
+        """Log optimal vs greedy plan metrics"""
+
+        log_lines = [
+            "=" * 50,
+            "OPTIMAL vs GREEDY PLAN",
+            "=" * 50,
+            f"Solver status: {solver_status}"
+            ]
+
+        rows = [("Assigned molds", "assigned_molds", "{:d}"),
+                ("Unassigned molds", "unassigned_molds", "{:d}"),
+                ("Makespan (days)", "makespan", "{:.1f}"),
+                ("Total lead time (days)", "total_lead_time", "{:.1f}"),
+                ("Load over threshold (days)", "overload", "{:.1f}")]
+
+        for label, attr, fmt in rows:
+            greedy_value = getattr(greedy_metrics, attr)
+            if optimal_metrics is None:
+                log_lines.append(f"{label}: greedy={fmt.format(greedy_value)}")
+                continue
+            optimal_value = getattr(optimal_metrics, attr)
+            log_lines.append(f"{label}: greedy={fmt.format(greedy_value)}, optimal={fmt.format(optimal_value)}, "
+                             f"delta={fmt.format(optimal_value - greedy_value)}")
+
+        log_lines.append(f"Selected plan: {selected_plan}")
+        log_lines.append("=" * 50)
+
+        return "\n".join(log_lines)
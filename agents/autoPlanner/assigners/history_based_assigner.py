@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 from loguru import logger
 from typing import Tuple, List, Dict
 import time
@@ -9,8 +10,7 @@ from agents.autoPlanner.assigners.configs.assigner_formatter import (
     log_load_balance_based_optimization)
 from agents.autoPlanner.assigners.configs.assigner_config import AssignerStats, AssignerResult
 from agents.autoPlanner.tools.machine_assignment import (
-    create_binary_priority_matrix, calculate_machine_statistics,
-    update_total_machine_load, create_candidate_lead_time_matrix)
+    create_binary_priority_matrix, update_total_machine_load, create_candidate_lead_time_matrix)
 
 class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
 
@@ -230,8 +230,6 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
 
         self.logger.debug("Finding unique matches")
 
-        unique_matched_list = []
-
         # Filter for valid molds only
         valid_mold_nos = set(mold_lead_time_df['moldNo'])
         filtered_priority_matrix = mold_machine_priority_matrix[
@@ -244,14 +242,9 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         machine_count = (filtered_priority_matrix != 0).sum(axis=1)
         unique_molds = machine_count[machine_count == 1].index
 
-        # Process unique matches
-        for mold_no in unique_molds:
-            # Find the single compatible machine
-            compatible_machine = filtered_priority_matrix.loc[
-                mold_no][filtered_priority_matrix.loc[mold_no] != 0].index[0]
-            leadtime = mold_leadtime_mapping.get(mold_no)
-            if leadtime is not None:
-                unique_matched_list.append(mold_no)
+        # Keep unique matches that have a lead time
+        unique_matched_list = [mold_no for mold_no in unique_molds
+                               if mold_leadtime_mapping.get(mold_no) is not None]
 
         # Split matrices
         unique_matched_priority_matrix = filtered_priority_matrix.loc[
@@ -291,13 +284,13 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         # Step 2: Create lead time matrix
         mold_leadtime_matrix = self.create_leadtime_matrix(binary_priority_matrix, mold_lead_time_df)
 
-        # Step 3: Initialize assigned matrix with optimal dtype
-        assigned_matrix = pd.DataFrame(
-            data=0,
-            index=mold_machine_priority_matrix.index,
-            columns=mold_machine_priority_matrix.columns,
-            dtype='int32'
-        )
+        # Step 3: Work on dense (mold x machine) arrays; DataFrames are rebuilt at the end
+        leadtime_values = mold_leadtime_matrix.to_numpy(dtype='int32', copy=True)
+        assigned_values = np.zeros(leadtime_values.shape, dtype='int32')
+        mold_nos = mold_leadtime_matrix.index
+
+        # Number of suitable molds per machine, updated as molds get assigned
+        suitable_count = (leadtime_values > 0).sum(axis=0)
 
         # Pre-compute lead time mapping for efficiency
         mold_leadtime_mapping = dict(zip(mold_lead_time_df['moldNo'], mold_lead_time_df['moldLeadTime']))
@@ -311,26 +304,34 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         while self.stats.iterations < max_iterations:
 
             # Find valid pairs with machines having exactly 1 suitable mold
-            valid_pairs = self.find_valid_pairs(mold_leadtime_matrix, mold_leadtime_mapping, target_suitable_count=1)
+            valid_pairs = self.find_valid_pairs(leadtime_values, suitable_count, mold_nos,
+                                                mold_leadtime_mapping, target_suitable_count=1)
 
             if not valid_pairs:
                 self.logger.debug("No more valid pairs found, terminating optimization")
                 break
 
             # Assign molds to machines
-            valid_pairs, assigned_matrix, mold_leadtime_matrix = self.assign_molds_to_machines(
-                valid_pairs, assigned_matrix, mold_leadtime_matrix
-            )
+            self.assign_molds_to_machines(valid_pairs, assigned_values, leadtime_values, suitable_count)
 
-            all_assigned_pairs.extend(valid_pairs)
+            all_assigned_pairs.extend((mold_nos[i], mold_leadtime_matrix.columns[j], leadtime)
+                                      for i, j, leadtime in valid_pairs)
             self.stats.iterations += 1
 
             if self.stats.iterations % 10 == 0:
                 self.logger.debug("Completed {} iterations, {} assignments made",
                                   self.stats.iterations, len(all_assigned_pairs))
+
+        assigned_matrix = pd.DataFrame(assigned_values,
+                                       index=mold_machine_priority_matrix.index,
+                                       columns=mold_machine_priority_matrix.columns)
+        mold_leadtime_matrix = pd.DataFrame(leadtime_values,
+                                            index=mold_leadtime_matrix.index,
+                                            columns=mold_leadtime_matrix.columns)
+
         # Classify results
         assigned_molds = list(set([mold for mold, _, _ in all_assigned_pairs]))
-        remaining_molds = mold_leadtime_matrix[mold_leadtime_matrix.sum(axis=1) > 0].index.tolist()
+        remaining_molds = mold_nos[leadtime_values.sum(axis=1) > 0].tolist()
 
         elapsed_time = time.time() - start_time
 
@@ -340,44 +341,41 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         return assigned_matrix, assigned_molds, remaining_molds, mold_leadtime_matrix
 
     def find_valid_pairs(self,
-                         mold_leadtime_matrix: pd.DataFrame,
+                         leadtime_values: np.ndarray,
+                         suitable_count: np.ndarray,
+                         mold_nos: pd.Index,
                          mold_leadtime_mapping: Dict[str, int],
                          target_suitable_count: int = 1
-                         ) -> List[Tuple[str, str, int]]:
+                         ) -> List[Tuple[int, int, int]]:
 
         """
         Find valid (mold, machine) pairs based on machine constraints.
 
         Args:
-            mold_leadtime_matrix: Current lead time matrix
+            leadtime_values: Current (mold x machine) lead time array
+            suitable_count: Number of suitable molds per machine
+            mold_nos: Mold numbers of the array rows
             mold_leadtime_mapping: Pre-computed mapping of mold to lead time
             target_suitable_count: Target number of suitable molds per machine
 
         Returns:
-            List of valid (moldNo, machineCode, leadTime) tuples
+            List of valid (mold position, machine position, leadTime) tuples
         """
 
-        # Calculate statistics efficiently
-        suitable_count, _ = calculate_machine_statistics(mold_leadtime_matrix)
-        self.logger.debug("Calculated statistics for {} machines", len(suitable_count))
-
         # Find machines with target suitable count
-        target_machines = suitable_count[suitable_count == target_suitable_count].index
+        target_machines = np.flatnonzero(suitable_count == target_suitable_count)
 
         if len(target_machines) == 0:
             return []
 
         valid_pairs = []
 
-        # Only iterate through target machines for efficiency
+        # Only scan the columns of target machines
         for machine in target_machines:
-            # Find the single compatible mold for this machine
-            compatible_molds = mold_leadtime_matrix[mold_leadtime_matrix[machine] > 0].index
-
-            for mold in compatible_molds:
-                leadtime = mold_leadtime_mapping.get(mold)
+            for mold in np.flatnonzero(leadtime_values[:, machine] > 0):
+                leadtime = mold_leadtime_mapping.get(mold_nos[mold])
                 if leadtime is not None:
-                    valid_pairs.append((mold, machine, int(leadtime)))
+                    valid_pairs.append((int(mold), int(machine), int(leadtime)))
 
         self.logger.debug("Found {} valid pairs with target count {}",
                           len(valid_pairs), target_suitable_count)
@@ -385,41 +383,34 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         return valid_pairs
     
     def assign_molds_to_machines(self,
-                                 valid_mold_machine_pairs: List[Tuple[str, str, int]],
-                                 assigned_matrix: pd.DataFrame,
-                                 mold_leadtime_matrix: pd.DataFrame
-                                 ) -> Tuple[List[Tuple[str, str, int]],
-                                            pd.DataFrame, pd.DataFrame]:
+                                 valid_mold_machine_pairs: List[Tuple[int, int, int]],
+                                 assigned_values: np.ndarray,
+                                 leadtime_values: np.ndarray,
+                                 suitable_count: np.ndarray) -> None:
 
         """
-        Assign molds to machines and update matrices efficiently.
+        Assign molds to machines, updating the arrays in place.
 
         Args:
-            valid_mold_machine_pairs: List of valid assignments
-            assigned_matrix: Mold-machine matrix to update
-            mold_leadtime_matrix: Lead time matrix to modify
-
-        Returns:
-            Tuple of (valid_pairs, updated_assigned_matrix, updated_leadtime_matrix)
+            valid_mold_machine_pairs: List of valid (mold position, machine position, leadTime) assignments
+            assigned_values: (mold x machine) assignment array to update
+            leadtime_values: Lead time array; assigned molds are cleared
+            suitable_count: Suitable molds per machine, kept in sync with leadtime_values
         """
 
         if not valid_mold_machine_pairs:
-            return valid_mold_machine_pairs, assigned_matrix, mold_leadtime_matrix
+            return
 
-        # Batch update assigned matrix
         for mold, machine, leadtime in valid_mold_machine_pairs:
-            if mold in assigned_matrix.index and machine in assigned_matrix.columns:
-                assigned_matrix.loc[mold, machine] = leadtime
+            assigned_values[mold, machine] = leadtime
 
-        # Efficiently remove assigned molds using vectorized operation
-        assigned_molds = [mold for mold, _, _ in valid_mold_machine_pairs]
-        if assigned_molds:
-            mold_leadtime_matrix.loc[assigned_molds] = 0
+        # Remove assigned molds from the candidate pool
+        assigned_molds = np.unique([mold for mold, _, _ in valid_mold_machine_pairs])
+        suitable_count -= (leadtime_values[assigned_molds] > 0).sum(axis=0)
+        leadtime_values[assigned_molds] = 0
 
         self.stats.assignments_made += len(valid_mold_machine_pairs)
         self.logger.debug("Assigned {} molds to machines", len(valid_mold_machine_pairs))
-
-        return valid_mold_machine_pairs, assigned_matrix, mold_leadtime_matrix
     
     def create_leadtime_matrix(self,
                                mold_machine_binary_priority: pd.DataFrame,
@@ -517,88 +508,96 @@ class HistoryBasedAssigner(ConfigReportMixin): # HistBasedMoldMachineOptimizer
         self.logger.info("Initial Candidate Machine Load:\n{}\n",
                          current_candidate_load.loc['candidateMachineLoad'].to_dict())
 
+        # Dense arrays: lead times (NaN = missing), base machine load and running column sums
+        machine_codes = leadtime_df.columns
+        leadtime_values = leadtime_df.to_numpy(dtype='float64', na_value=np.nan)
+        base_load = machine_load_df.loc['machineLoad'].to_numpy(dtype='float64', na_value=np.nan)
+        column_sums = np.nansum(leadtime_values, axis=0)
+        candidate_load = current_candidate_load.loc['candidateMachineLoad'].to_numpy(dtype='float64', na_value=np.nan)
+
+        # Loads are sorted in the dtype pandas gives the selected row (float if any float column)
+        float_columns = np.array([pd.api.types.is_float_dtype(dtype) for dtype in current_candidate_load.dtypes])
+
+        selected_positions = np.full(len(leadtime_df), -1)
+
+        # A mold listed more than once (several items share it) has no single candidate row
+        duplicated_molds = leadtime_df.index.duplicated(keep=False)
+
         # Iterate over each moldNo to assign
-        for moldNo in leadtime_df.index:
-            row = leadtime_df.loc[moldNo]
+        for i, moldNo in enumerate(leadtime_df.index):
+
+            if duplicated_molds[i]:
+                unassigned_molds.append(moldNo)
+                self.logger.warning("No valid machine in candidate load for {}", moldNo)
+                continue
 
             # Filter machines with valid leadtime > 0
-            available_machines = row[row > 0].index.tolist()
+            available = np.flatnonzero(leadtime_values[i] > 0)
 
-            if not available_machines:
+            if len(available) == 0:
                 unassigned_molds.append(moldNo)
                 self.logger.warning("No available machine for {}", moldNo)
                 continue
 
-            # Only include machines that exist in both available_machines and current_candidate_load.columns
-            valid_machines = [m for m in available_machines if m in current_candidate_load.columns]
-            
-            if not valid_machines:
-                unassigned_molds.append(moldNo)
-                self.logger.warning("No valid machine in candidate load for {}", moldNo)
-                continue
+            available_loads = candidate_load[available]
+            if np.isnan(available_loads).any():
+                # Missing machine load: let pandas order and compare the loads
+                selected = self._select_machine_with_missing_load(
+                    leadtime_df.loc[moldNo], current_candidate_load, machine_codes[available], candidate_load)
+            else:
+                sort_dtype = 'float64' if float_columns[available].any() else 'int64'
+                sorted_machines = available[np.argsort(available_loads.astype(sort_dtype), kind='quicksort')]
 
-            # Load values of available machines
-            available_loads = current_candidate_load[available_machines].loc['candidateMachineLoad']
-            sorted_machines = available_loads.sort_values().index.tolist()
-
-            self.logger.debug("{}:", moldNo)
-            self.logger.debug("- Available machines (sorted by load): {}", sorted_machines)
-            self.logger.debug("- Corresponding loads: {}", [available_loads[m] for m in sorted_machines])
-
-            selected_machine = None
-            selected_load = None
-
-            # Try assigning to the best available machine under threshold
-            for machine in sorted_machines:
-                machine_load = available_loads[machine]
-                mold_leadtime = row[machine]
-                projected_load = machine_load + mold_leadtime
-
-                self.logger.debug("- Trying machine {}: current load = {}, leadtime = {}",
-                                  machine, machine_load, mold_leadtime)
-                self.logger.debug("→ Projected load after assignment = {}", projected_load)
-
-                if projected_load <= self.max_load_threshold:
-                    selected_machine = machine
-                    selected_load = machine_load
-                    self.logger.debug("✓ Selected machine {} - {} days (projected load: {} ≤ {})",
-                                      selected_machine, selected_load, projected_load, self.max_load_threshold)
-                    break
-                else:
-                    self.logger.debug("✗ Skipped machine {} (projected load: {} > {})",
-                                      machine, projected_load, self.max_load_threshold)
-
-            # If no machine meets threshold, assign to the one with the lowest load
-            if selected_machine is None:
-                selected_machine = sorted_machines[0]
-                selected_load = available_loads[selected_machine]
-                self.logger.debug("⚠ No machine ≤ {} days, choosing best option: {} - {} days",
-                                  self.max_load_threshold, selected_machine, selected_load)
-
-            # Update assigned_df: keep only selected machine's leadtime, others set to 0
-            assigned_molds.append(moldNo)
-            mold_leadtime = assigned_df.loc[moldNo, selected_machine]
-            for col in leadtime_df.columns:
-                if col != selected_machine:
-                    assigned_df.at[moldNo, col] = 0
+                # Try assigning to the best available machine under threshold,
+                # otherwise to the one with the lowest load
+                projected_loads = candidate_load[sorted_machines] + leadtime_values[i, sorted_machines]
+                under_threshold = np.flatnonzero(projected_loads <= self.max_load_threshold)
+                selected = sorted_machines[under_threshold[0] if len(under_threshold) else 0]
 
-            self.logger.debug("- Leadtime kept for {} on {}: {}\nDetails: {}\n",
-                              moldNo, selected_machine, mold_leadtime, assigned_df.loc[moldNo].to_dict())
+            self.logger.debug("{}: {} selected (load {}, leadtime {})",
+                              moldNo, machine_codes[selected], candidate_load[selected], leadtime_values[i, selected])
 
-            # Update candidateMachineLoad in real-time
+            # Keep only selected machine's leadtime and update candidateMachineLoad in real-time
+            assigned_molds.append(moldNo)
+            selected_positions[i] = selected
+            dropped = np.nan_to_num(leadtime_values[i])
+            dropped[selected] = 0
+            column_sums -= dropped
+            candidate_load = base_load + column_sums
+
+        # Apply the selections: other machines' lead times set to 0
+        assigned_rows = np.flatnonzero(selected_positions >= 0)
+        for j, col in enumerate(machine_codes):
+            zero_rows = assigned_rows[selected_positions[assigned_rows] != j]
+            if len(zero_rows):
+                assigned_df.iloc[zero_rows, j] = 0
+
+        if len(assigned_rows):
             current_candidate_load.loc['candidateMachineLoad'] = (
                 machine_load_df.loc['machineLoad'] + assigned_df.sum(numeric_only=True)
             )
 
-            self.logger.debug("- Updated Candidate Load:\n{}\n",
-                              current_candidate_load.loc['candidateMachineLoad'].to_dict())
-
-        # Combine final result
-        final_result = pd.concat([machine_load_df, assigned_df], axis=0)
-        final_result.loc['candidateMachineLoad'] = current_candidate_load.loc['candidateMachineLoad']
-
         self.logger.info("=== FINAL RESULT ===")
         self.logger.info("Final Candidate Machine Load:\n{}\n",
-                         final_result.loc['candidateMachineLoad'].to_dict())
+                         current_candidate_load.loc['candidateMachineLoad'].to_dict())
+
+        return assigned_df, assigned_molds, unassigned_molds
+
+    def _select_machine_with_missing_load(self,
+                                          row: pd.Series,
+                                          current_candidate_load: pd.DataFrame,
+                                          available_machines: pd.Index,
+                                          candidate_load: np.ndarray) -> int:
+
+        """Select a machine through pandas when some candidate machine loads are missing."""
+
+        load_row = current_candidate_load.copy()
+        load_row.loc['candidateMachineLoad'] = candidate_load
+        available_loads = load_row[available_machines].loc['candidateMachineLoad']
+        sorted_machines = available_loads.sort_values().index.tolist()
+
+        for machine in sorted_machines:
+            if available_loads[machine] + row[machine] <= self.max_load_threshold:
+                return current_candidate_load.columns.get_loc(machine)
 
-        return assigned_df, assigned_molds, unassigned_molds
\ No newline at end of file
+        return current_candidate_load.columns.get_loc(sorted_machines[0])
@@ -0,0 +1,294 @@
+import pandas as pd
+import numpy as np
+from loguru import logger
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from configs.shared.config_report_format import ConfigReportMixin
+from agents.autoPlanner.assigners.configs.assigner_config import AssignerStats, AssignerResult
+from agents.autoPlanner.tools.machine_assignment import producing_machine_load
+
+class OptimalAssigner(ConfigReportMixin):
+
+    """
+    Assign all pending molds at once by solving a mixed-integer program (scipy.optimize.milp)
+    instead of the greedy HistoryBasedAssigner -> CompatibilityBasedAssigner chain.
+
+    Candidate pairs come from the priority matrix (history); molds without any history
+    use the compatibility matrix. Each mold with a candidate goes to exactly one machine:
+
+        minimize    machines * sum(overload) + makespan + eps * sum(priority rank)
+        subject to  producing load + assigned lead times <= makespan           (every machine)
+                    producing load + assigned lead times <= threshold + overload
+
+    The load cap is soft (as the greedy round 2 still places molds above the threshold),
+    so overload is minimized first, then the makespan, then history ranks break ties.
+
+    Parameters:
+    -----------
+    mold_machine_priority_matrix : pd.DataFrame
+        Priority matrix (moldNo x machineCode, 1 = best, 0 = never used)
+    mold_lead_times_df : pd.DataFrame
+        DataFrame with lead time information (moldNo, moldLeadTime)
+    producing_data : pd.DataFrame
+        Current production data (machineCode, remainTime)
+    machine_info_df : pd.DataFrame
+        Machine information DataFrame
+    compatibility_matrix : Optional[pd.DataFrame]
+        Mold-machine compatibility matrix for molds without history
+    max_load_threshold : Optional[int], default=30
+        Maximum machine load (days). If None, only the makespan is minimized
+    time_limit : float, default=30
+        Solver time budget in seconds; the best plan found so far is returned
+
+    Returns:
+    --------
+    AssignerResult
+        Complete assignment results (empty assignments if the solver found no plan)
+    """
+
+    SOLVER_STATUS = {
+        0: "optimal",
+        1: "time limit reached",
+        2: "infeasible",
+        3: "unbounded",
+        4: "solver error"
+    }
+
+    def __init__(self,
+                 mold_machine_priority_matrix: pd.DataFrame,
+                 mold_lead_times_df: pd.DataFrame,
+                 producing_data: pd.DataFrame,
+                 machine_info_df: pd.DataFrame,
+                 compatibility_matrix: Optional[pd.DataFrame] = None,
+                 max_load_threshold: Optional[int] = 30,
+                 time_limit: float = 30):
+
+        self._capture_init_args()
+
+        # Initialize logger with class name for better tracking
+        self.logger = logger.bind(class_="OptimalAssigner")
+
+        self.mold_machine_priority_matrix = mold_machine_priority_matrix
+        self.mold_lead_times_df = mold_lead_times_df
+        self.producing_data = producing_data
+        self.machine_info_df = machine_info_df
+        self.compatibility_matrix = compatibility_matrix
+        self.max_load_threshold = max_load_threshold
+        self.time_limit = time_limit
+
+        self.solver_status = None
+        self.has_solution = False
+
+    def run_assign(self) -> AssignerResult:
+
+        self.logger.info("Starting OptimalAssigner ...")
+        self.stats = AssignerStats(start_time=datetime.now())
+
+        try:
+            # Generate config header using mixin
+            timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            config_header = self._generate_config_report(timestamp_str)
+
+            assignment_log_lines = [config_header,
+                                    f"--Processing Summary--",
+                                    f"⤷ {self.__class__.__name__} results:"]
+
+            # Step 1: Candidate (mold, machine) pairs
+            molds, machines, lead_times, mold_pos, machine_pos, ranks = self._build_candidate_pairs()
+            base_load = producing_machine_load(self.producing_data)
+            machine_base_load = np.array([base_load.get(machine, 0) for machine in machines], dtype='float64')
+
+            # Step 2: Solve
+            selected = self._solve(len(molds), len(machines), lead_times,
+                                   mold_pos, machine_pos, ranks, machine_base_load)
+
+            # Step 3: Build the (mold x machine) lead time matrix
+            assigned_values = np.zeros((len(molds), len(machines)), dtype='int64')
+            if selected is not None:
+                assigned_values[mold_pos[selected], machine_pos[selected]] = lead_times[mold_pos[selected]]
+
+            is_assigned = assigned_values.any(axis=1)
+            assigned_matrix = pd.DataFrame(assigned_values[is_assigned],
+                                           index=pd.Index(np.asarray(molds, dtype=object)[is_assigned], name='moldNo'),
+                                           columns=machines)
+
+            assignments = assigned_matrix.index.tolist()
+            unassigned_molds = [mold for mold, assigned in zip(molds, is_assigned) if not assigned]
+
+            machine_load = machine_base_load + assigned_values.sum(axis=0)
+            overloaded_machines = set()
+            if self.max_load_threshold is not None:
+                overloaded_machines = {machine for machine, load in zip(machines, machine_load)
+                                       if load > self.max_load_threshold}
+
+            self.stats.end_time = datetime.now()
+            self.stats.assignments_made = len(assignments)
+
+            assignment_log_lines.extend([
+                "=" * 50,
+                "OPTIMAL ASSIGNMENT RESULTS SUMMARY",
+                "=" * 50,
+                f"Candidate pairs: {len(mold_pos)} ({len(molds)} molds x {len(machines)} machines)",
+                f"Solver status: {self.solver_status} (time limit: {self.time_limit}s)",
+                f"Successfully assigned molds: {len(assignments)}. \nDetails: {assignments}",
+                f"Unassigned molds: {len(unassigned_molds)}. \nDetail: {unassigned_molds}",
+                f"Makespan: {machine_load.max() if len(machine_load) else 0:.1f} days",
+                f"Overloaded machines: {sorted(overloaded_machines)}",
+                f"Total execution time: {self.stats.duration or 0:.2f} seconds",
+                "=" * 50
+                ])
+
+            self.logger.info("✅ Process finished!!!")
+
+            return AssignerResult(
+                assigned_matrix=assigned_matrix,
+                assignments=assignments,
+                unassigned_molds=unassigned_molds,
+                stats=self.stats,
+                overloaded_machines=overloaded_machines,
+                log="\n".join(assignment_log_lines))
+
+        except Exception as e:
+            self.logger.error("Assignment failed: {}", str(e))
+            raise
+
+    #--------------------------#
+    # Candidate pair building  #
+    #--------------------------#
+    def _build_candidate_pairs(self) -> Tuple[List[str], pd.Index, np.ndarray,
+                                              np.ndarray, np.ndarray, np.ndarray]:
+
+        """
+        Collect allowed (mold, machine) pairs.
+
+        Returns:
+            molds, machines, lead time per mold, and per pair: mold position,
+            machine position and priority rank (compatibility-only pairs rank last)
+        """
+
+        # One lead time per mold (last one wins, as in HistoryBasedAssigner)
+        mold_leadtime_mapping = dict(zip(self.mold_lead_times_df['moldNo'],
+                                         self.mold_lead_times_df['moldLeadTime']))
+        molds = list(mold_leadtime_mapping)
+        lead_times = pd.to_numeric(pd.Series(list(mold_leadtime_mapping.values()), dtype=object),
+                                   errors='coerce').fillna(0).to_numpy(dtype='int64')
+
+        # Machines of the current layout first, then any other machine seen in the matrices
+        machines = list(dict.fromkeys(self.machine_info_df['machineCode']))
+        for matrix in (self.mold_machine_priority_matrix, self.compatibility_matrix):
+            if matrix is not None:
+                machines.extend(machine for machine in matrix.columns if machine not in machines)
+        machines = pd.Index(machines)
+
+        priority_values = self._aligned_values(self.mold_machine_priority_matrix, molds, machines)
+        compatibility_values = self._aligned_values(self.compatibility_matrix, molds, machines)
+
+        history_pairs = priority_values > 0
+        has_history = history_pairs.any(axis=1)
+        max_rank = priority_values.max() if history_pairs.any() else 0
+
+        allowed = np.where(has_history[:, None], history_pairs, compatibility_values > 0)
+        allowed &= (lead_times > 0)[:, None]
+        ranks = np.where(has_history[:, None], priority_values, max_rank + 1)
+
+        mold_pos, machine_pos = np.nonzero(allowed)
+
+        self.logger.info("{} candidate pairs for {} molds ({} with history)",
+                         len(mold_pos), len(molds), int(has_history.sum()))
+
+        return molds, machines, lead_times, mold_pos, machine_pos, ranks[mold_pos, machine_pos]
+
+    @staticmethod
+    def _aligned_values(matrix: Optional[pd.DataFrame],
+                        molds: List[str],
+                        machines: pd.Index) -> np.ndarray:
+
+        """Matrix values reindexed to (molds x machines), missing entries as 0."""
+
+        if matrix is None or matrix.empty:
+            return np.zeros((len(molds), len(machines)), dtype='float64')
+
+        matrix = matrix[~matrix.index.duplicated(keep='first')]
+        aligned = matrix.reindex(index=molds, columns=machines)
+        return aligned.apply(pd.to_numeric, errors='coerce').fillna(0).to_numpy(dtype='float64')
+
+    #----------#
+    # Solving  #
+    #----------#
+    def _solve(self,
+               n_molds: int,
+               n_machines: int,
+               lead_times: np.ndarray,
+               mold_pos: np.ndarray,
+               machine_pos: np.ndarray,
+               ranks: np.ndarray,
+               machine_base_load: np.ndarray) -> Optional[np.ndarray]:
+
+        """
+        Solve the assignment MILP.
+
+        Returns:
+            Boolean mask over candidate pairs, or None if no feasible plan was found
+        """
+
+        n_pairs = len(mold_pos)
+        if n_pairs == 0:
+            self.solver_status = "no candidate pairs"
+            return None
+
+        from scipy.optimize import milp, LinearConstraint, Bounds
+        from scipy.sparse import coo_matrix, hstack
+
+        use_cap = self.max_load_threshold is not None
+        n_overload = n_machines if use_cap else 0
+        pair_lead_times = lead_times[mold_pos].astype('float64')
+
+        # Variables: x (one per pair) | makespan | overload per machine
+        # Ranks only break ties: their total stays below one day of makespan
+        rank_weight = 1.0 / (float(ranks.sum()) + 1.0)
+        c = np.concatenate([ranks * rank_weight, [1.0], np.full(n_overload, float(n_machines))])
+
+        integrality = np.concatenate([np.ones(n_pairs), np.zeros(1 + n_overload)])
+        bounds = Bounds(np.zeros(n_pairs + 1 + n_overload),
+                        np.concatenate([np.ones(n_pairs), np.full(1 + n_overload, np.inf)]))
+
+        # Each mold with candidates is assigned exactly once
+        candidate_molds, mold_rows = np.unique(mold_pos, return_inverse=True)
+        assign_once = coo_matrix((np.ones(n_pairs), (mold_rows, np.arange(n_pairs))),
+                                 shape=(len(candidate_molds), n_pairs))
+        constraints = [LinearConstraint(
+            hstack([assign_once, coo_matrix((len(candidate_molds), 1 + n_overload))]), 1, 1)]
+
+        # Machine load (producing + assigned) is bounded by the makespan
+        machine_lead = coo_matrix((pair_lead_times, (machine_pos, np.arange(n_pairs))),
+                                  shape=(n_machines, n_pairs))
+        makespan_column = coo_matrix(-np.ones((n_machines, 1)))
+        constraints.append(LinearConstraint(
+            hstack([machine_lead, makespan_column, coo_matrix((n_machines, n_overload))]),
+            -np.inf, -machine_base_load))
+
+        # Soft load cap: load above the threshold is carried by the overload variables
+        if use_cap:
+            overload_block = coo_matrix((-np.ones(n_machines), (np.arange(n_machines), np.arange(n_machines))))
+            constraints.append(LinearConstraint(
+                hstack([machine_lead, coo_matrix((n_machines, 1)), overload_block]),
+                -np.inf, self.max_load_threshold - machine_base_load))
+
+        self.logger.info("Solving assignment for {} pairs (time limit: {}s)", n_pairs, self.time_limit)
+
+        result = milp(c,
+                      integrality=integrality,
+                      bounds=bounds,
+                      constraints=constraints,
+                      options={"time_limit": self.time_limit, "disp": False})
+
+        self.solver_status = self.SOLVER_STATUS.get(result.status, result.message)
+        self.has_solution = result.x is not None
+
+        if not self.has_solution:
+            self.logger.warning("No feasible assignment found: {}", result.message)
+            return None
+
+        self.logger.info("Solver finished: {} (objective {:.3f})", self.solver_status, result.fun)
+
+        return result.x[:n_pairs] > 0.5
@@ -65,6 +65,7 @@ class AutoPlanner(ConfigReportMixin):
             'feature_extractor': {
                 'enabled': bool,
                 'save_result': bool,
+                'incremental': bool,
                 'cavity_stability_threshold': float,
                 'cycle_stability_threshold': float,
                 'total_records_threshold': int,
@@ -81,7 +82,9 @@ class AutoPlanner(ConfigReportMixin):
                 'save_result': bool,
                 "priority_order": str,
                 'max_load_threshold': int,
-                'log_progress_interval': int
+                'log_progress_interval': int,
+                'solver_mode': str,
+                'solver_time_limit': float
                 },
             'save_planner_log': bool
             }
@@ -4,7 +4,7 @@ from typing import Optional, Literal, Dict
 from configs.shared.shared_source_config import SharedSourceConfig
 from agents.autoPlanner.calculators.configs.feature_weight_config import FeatureWeightConfig
 from agents.autoPlanner.calculators.configs.mold_stability_config import MoldStabilityConfig
-from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder
+from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder, SolverMode
 from agents.autoPlanner.phases.initialPlanner.configs.initial_planner_config import InitialPlannerConfig
 from agents.autoPlanner.featureExtractor.initial.historicalFeaturesExtractor.features_extractor_config import (
     FeaturesExtractorConfig)    
@@ -19,6 +19,7 @@ class FeatureExtractorParams:
     """
     enabled: Optional[bool] = None
     save_result: Optional[bool] = None
+    incremental: Optional[bool] = None
 
     # MoldStabilityIndexCalculator params
     cavity_stability_threshold: Optional[float] = None
@@ -44,6 +45,8 @@ class InitialPlannerParams:
     priority_order: Optional[PriorityOrder] = None
     max_load_threshold: Optional[int] = None
     log_progress_interval: Optional[int] = None
+    solver_mode: Optional[SolverMode] = None
+    solver_time_limit: Optional[float] = None
 
 @dataclass
 class AutoPlannerConfig:
@@ -143,6 +146,11 @@ class AutoPlannerConfig:
         if self.initial_planner.priority_order is None:
             self.initial_planner.priority_order = PriorityOrder.PRIORITY_1
 
+        # Apply default solver_mode if None (strings from YAML are resolved to SolverMode)
+        if self.initial_planner.solver_mode is None:
+            self.initial_planner.solver_mode = SolverMode.GREEDY
+        self.initial_planner.solver_mode = SolverMode.resolve(self.initial_planner.solver_mode)
+
         # Orchestrator logging
         if self.save_planner_log is None:
             self.save_planner_log = (
@@ -160,6 +168,7 @@ class AutoPlannerConfig:
             self._feature_extractor_config = FeaturesExtractorConfig(
                 efficiency=self.efficiency,
                 loss=self.loss,
+                incremental=self.feature_extractor.incremental,
                 shared_source_config=self.shared_source_config,
                 # Nested configs - NO need to pass efficiency/loss
                 # FeaturesExtractorConfig.__post_init__ handles propagation
@@ -187,6 +196,8 @@ class AutoPlannerConfig:
                 priority_order=self.initial_planner.priority_order,
                 max_load_threshold=self.initial_planner.max_load_threshold,
                 log_progress_interval=self.initial_planner.log_progress_interval,
+                solver_mode=self.initial_planner.solver_mode,
+                solver_time_limit=self.initial_planner.solver_time_limit,
                 efficiency=self.efficiency,
                 loss=self.loss
             )
@@ -245,6 +256,7 @@ class AutoPlannerConfig:
             summary["components"]["feature_extractor"] = {
                 "enabled": True,
                 "save_result": self.feature_extractor.save_result,
+                "incremental": self.feature_extractor.incremental,
                 "mold_stability": {
                     k: v for k, v in {
                         "cavity_threshold": self.feature_extractor.cavity_stability_threshold,
@@ -268,7 +280,9 @@ class AutoPlannerConfig:
                 "save_result": self.initial_planner.save_result,
                 "priority_order": self.initial_planner.priority_order.name if self.initial_planner.priority_order else None,
                 "max_load_threshold": self.initial_planner.max_load_threshold,
-                "log_progress_interval": self.initial_planner.log_progress_interval
+                "log_progress_interval": self.initial_planner.log_progress_interval,
+                "solver_mode": self.initial_planner.solver_mode.name if self.initial_planner.solver_mode else None,
+                "solver_time_limit": self.initial_planner.solver_time_limit
             }
         
         return summary
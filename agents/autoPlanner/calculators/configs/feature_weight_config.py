@@ -1,6 +1,7 @@
 from dataclasses import dataclass, asdict
 from typing import Literal, Dict, Optional
 from copy import deepcopy
+import pandas as pd
 
 @dataclass
 class FeatureWeightCalculationResult:
@@ -9,6 +10,7 @@ class FeatureWeightCalculationResult:
     enhanced_weights: Dict[str, float]
     confidence_report_text: str
     log_str: str
+    po_statistics: Optional[pd.DataFrame] = None
 
     def to_dict(self) -> Dict:
         """Convert dataclass to dictionary for serialization/logging."""
@@ -7,6 +7,7 @@ class MoldStabilityCalculationResult:
     mold_stability_index: pd.DataFrame
     index_calculation_summary: str
     log_str: str
+    mold_statistics: Optional[pd.DataFrame] = None
     def to_dict(self) -> Dict:
         """Convert dataclass to dictionary for serialization/logging."""
         return asdict(self)
@@ -3,12 +3,12 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List, Optional
 from loguru import logger
 from datetime import datetime
 import copy
 
-from agents.autoPlanner.tools.performance import summarize_mold_machine_history
+from agents.autoPlanner.tools.performance import summarize_mold_machine_performance
 from agents.autoPlanner.tools.mold_machine_feature_weight import suggest_weights_standard_based
 from agents.autoPlanner.tools.bootstrap import (
     calculate_feature_confidence_scores, calculate_overall_confidence, generate_confidence_report)
@@ -41,6 +41,9 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
                                    'itemCode', 'itemName', 'moldNo', 'moldShot', 'moldCavity',
                                    'itemTotalQuantity', 'itemGoodQuantity']
 
+    # Per (poNo, moldNo, machineCode) aggregates kept between runs (see _aggregate_po_statistics)
+    PO_STATISTICS_KEYS = ['poNo', 'moldNo', 'machineCode']
+
     def __init__(self,
                  databaseSchemas_data: Dict,
                  sharedDatabaseSchemas_data: Dict, 
@@ -107,10 +110,15 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
         else:
             self.weight_constant_config = copy.deepcopy(weight_constant_config)
     
-    def process(self) -> FeatureWeightCalculationResult:
+    def process(self,
+                previous_statistics: Optional[pd.DataFrame] = None,
+                since: Optional[pd.Timestamp] = None) -> FeatureWeightCalculationResult:
 
         """
         Main method to calculate feature confidence scores and enhanced weights.
+
+        With `previous_statistics` (the po_statistics of an earlier result, covering records up to
+        `since`), only records dated after `since` are aggregated and folded into them.
         """
 
         try:
@@ -129,8 +137,20 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
             self.proStatus_df.rename(columns={'lastestMachineNo': 'machineNo',
                                               'lastestMoldNo': 'moldNo'}, inplace=True)
 
-            # Step 1: Group historical production records into good and bad performance categories
-            good_sample, bad_sample = self._group_hist_by_performance()
+            # Step 1: Aggregate production records per (PO, mold, machine)
+            if previous_statistics is None:
+                po_statistics = self._aggregate_po_statistics(self.productRecords_df)
+            else:
+                if since is None:
+                    raise ValueError("`since` is required to update previous PO statistics")
+                new_records = self.productRecords_df[self.productRecords_df['recordDate'] > pd.Timestamp(since)]
+                po_statistics = self.combine_po_statistics(previous_statistics,
+                                                           self._aggregate_po_statistics(new_records))
+                calculator_log_entries.append(
+                    f"Incremental update: folded {len(new_records)} records after {pd.Timestamp(since)}\n")
+
+            # Step 2: Group historical production records into good and bad performance categories
+            good_sample, bad_sample = self._group_hist_by_performance(po_statistics)
             
             good_count = good_sample.shape[0]
             bad_count = bad_sample.shape[0]
@@ -147,7 +167,7 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
                 self.logger.warning("Low bad sample size: {} rows (minimum recommended: 10)", bad_count)
                 calculator_log_entries.append(f"Low bad sample size: {bad_count} rows (minimum recommended: 10)")
 
-            # Step 2: Calculate confidence scores
+            # Step 3: Calculate confidence scores
             confidence_scores, overall_confidence = self._calculate_confidence_scores(good_sample, 
                                                                                       bad_sample)
             
@@ -162,7 +182,7 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
                 calculator_log_entries.append(
                     f"Low model reliability: {model_reliability:.2%} (threshold: 50%)")
     
-            # Step 3: Suggests feature weights enhanced by confidence scores.
+            # Step 4: Suggests feature weights enhanced by confidence scores.
             enhanced_weights = self._suggest_weights_with_confidence(good_sample,
                                                                      bad_sample)
             
@@ -190,58 +210,111 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
                 overall_confidence=overall_confidence,
                 enhanced_weights=enhanced_weights,
                 confidence_report_text=confidence_report_text,
-                log_str=calculator_log_str
+                log_str=calculator_log_str,
+                po_statistics=po_statistics
                 )
         
         except Exception as e:
             self.logger.error("Failed to process MoldMachineFeatureWeightCalculator: {}", str(e))
             raise RuntimeError(f"MoldMachineFeatureWeightCalculator processing failed: {str(e)}") from e
         
-    #---------------------------------#
-    # PHASE 1: GROUP HISTORICAL DATA  #
-    #---------------------------------#
-    def _group_hist_by_performance(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    #---------------------------------------#
+    # PHASE 1: AGGREGATE HISTORICAL RECORDS #
+    #---------------------------------------#
+    def _aggregate_po_statistics(self,
+                                 records_df: pd.DataFrame) -> pd.DataFrame:
 
         """
-        Group historical production records into good and bad performance categories
+        Aggregate production records per (poNo, moldNo, machineCode).
 
-        Args:
-            proStatus_df (pd.DataFrame): Production status dataframe.
-            productRecords_df (pd.DataFrame): Production records dataframe.
-            moldInfo_df (pd.DataFrame): Mold information dataframe.
-            efficiency (float): Expected efficiency rate.
-            loss (float): Expected loss rate.
+        Sums and counts (rather than means) are kept so that aggregates of newer records
+        can be folded in with combine_po_statistics(). Records with a positive itemTotalQuantity
+        are counted separately: only those take part in the good/bad classification.
 
         Returns:
-            Tuple[pd.DataFrame, pd.DataFrame]: Two dataframes (good_hist, bad_hist)
-            representing good and poor performance histories respectively.
+            pd.DataFrame: One row per (poNo, moldNo, machineCode)
         """
 
         required_fields = self.weight_constant_config.get("PRO_RECORDS_REQUIRED_FIELDS", 
                                                           self.PRO_RECORDS_REQUIRED_FIELDS)
         
         # Validate required fields in productRecords_df
-        missing_fields = [field for field in required_fields if field not in self.productRecords_df.columns]
+        missing_fields = [field for field in required_fields if field not in records_df.columns]
         if missing_fields:
             raise ValueError(f"Missing fields in productRecords_df: {missing_fields}")
         self.logger.info("Validating required fields in productRecords_df successfully!")
 
-        # Filter out records with zero total quantity
-        hist = self.productRecords_df[
-            self.productRecords_df['itemTotalQuantity'] > 0][required_fields].copy()
+        # Records with zero total quantity only count towards the performance summaries
+        is_active = (records_df['itemTotalQuantity'] > 0).fillna(False).to_numpy(dtype=bool)
+        has_shift = records_df['workingShift'].notna().to_numpy()
+
+        aggregates = pd.DataFrame({
+            'poNo': records_df['poNo'],
+            'moldNo': records_df['moldNo'],
+            'machineCode': records_df['machineCode'],
+            'activeRecords': is_active,
+            'activeShiftsUsed': is_active & has_shift,
+            'shiftsUsed': has_shift,
+            'totalQuantity': records_df['itemTotalQuantity'],
+            'totalGoodQuantity': records_df['itemGoodQuantity'],
+            'totalShots': records_df['moldShot'],
+            'shotRecords': records_df['moldShot'].notna(),
+            'totalCavities': records_df['moldCavity'],
+            'cavityRecords': records_df['moldCavity'].notna(),
+            'latestDate': records_df['recordDate'],
+            'oldestDate': records_df['recordDate'],
+        })
+
+        return self._reduce_po_statistics(aggregates)
+
+    @classmethod
+    def _reduce_po_statistics(cls, aggregates: pd.DataFrame) -> pd.DataFrame:
+        """Sum counts and totals per (poNo, moldNo, machineCode); keep the date range."""
+        sum_columns = [col for col in aggregates.columns
+                       if col not in cls.PO_STATISTICS_KEYS + ['latestDate', 'oldestDate']]
+        return aggregates.groupby(cls.PO_STATISTICS_KEYS, sort=True).agg(
+            {**{col: 'sum' for col in sum_columns}, 'latestDate': 'max', 'oldestDate': 'min'}
+            ).reset_index()
+
+    @classmethod
+    def combine_po_statistics(cls,
+                              previous: pd.DataFrame,
+                              new: pd.DataFrame) -> pd.DataFrame:
+        """Fold (poNo, moldNo, machineCode) aggregates of newer records into previous ones."""
+        if previous.empty:
+            return new.copy()
+        if new.empty:
+            return previous.copy()
+        return cls._reduce_po_statistics(pd.concat([previous, new], ignore_index=True))
+
+    #---------------------------------#
+    # PHASE 2: GROUP HISTORICAL DATA  #
+    #---------------------------------#
+    def _group_hist_by_performance(self,
+                                   po_statistics: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+
+        """
+        Group historical production records into good and bad performance categories
+
+        Args:
+            po_statistics (pd.DataFrame): Production records aggregated per (poNo, moldNo, machineCode).
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Two dataframes (good_hist, bad_hist)
+            representing good and poor performance histories respectively.
+        """
 
         self.logger.info("Starting grouping of historical data into good and bad performance categories ...")
 
         try:
-            # Aggregate data by PO, mold, and machine
-            results = hist.groupby(['poNo', 'moldNo', 'machineCode']).agg(
-                shiftsUsed=('workingShift', 'count'),
-                totalQuantity=('itemTotalQuantity', 'sum'),
-                totalGoodQuantity=('itemGoodQuantity', 'sum'),
-                totalShots=('moldShot', 'sum'),
-                shiftShots=('moldShot', 'mean'),
-                shiftCavities=('moldCavity', 'mean'),
-            ).reset_index()
+            # Shifts used by PO, mold, and machine (records with a positive total quantity)
+            active_statistics = po_statistics[po_statistics['activeRecords'] > 0]
+            results = pd.DataFrame({
+                'poNo': active_statistics['poNo'],
+                'moldNo': active_statistics['moldNo'],
+                'machineCode': active_statistics['machineCode'],
+                'shiftsUsed': active_statistics['activeShiftsUsed'],
+            }).reset_index(drop=True)
 
             # Merge with mold information and production status
             merged_results = results.merge(
@@ -295,22 +368,12 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
             bad_hist_list = final_results[final_results['isBad'] == True]['poNo'].tolist()
             good_hist_list = final_results[final_results['isBad'] == False]['poNo'].tolist()
 
-            # Extract bad and good historical records
-            bad_hist = self.productRecords_df[required_fields][
-                self.productRecords_df['poNo'].isin(bad_hist_list)
-                ].copy()
-            self.logger.debug('Bad groups information: {}-{}', bad_hist.shape, bad_hist.columns)
-
-            good_hist = self.productRecords_df[required_fields][
-                self.productRecords_df['poNo'].isin(good_hist_list)
-                ].copy()
-            self.logger.debug('Good groups information: {}-{}', good_hist.shape, good_hist.columns)
+            self.logger.debug('Bad groups information: {} POs', len(bad_hist_list))
+            self.logger.debug('Good groups information: {} POs', len(good_hist_list))
 
             # Summarize mold-machine history for both groups
-            good_sample, _ = summarize_mold_machine_history(good_hist,
-                                                            self.mold_estimated_capacity_df)
-            bad_sample, _ = summarize_mold_machine_history(bad_hist,
-                                                           self.mold_estimated_capacity_df)
+            good_sample, _ = self._summarize_po_group(po_statistics, good_hist_list)
+            bad_sample, _ = self._summarize_po_group(po_statistics, bad_hist_list)
             
             # Validate the resulting DataFrames
             self._validate_shared_database(df_name="mold_machine_history_summary", 
@@ -324,6 +387,36 @@ class MoldMachineFeatureWeightCalculator(ConfigReportMixin):
         except Exception as e:  
             self.logger.error("Failed to group historical data: {}", str(e))
             raise
+
+    def _summarize_po_group(self,
+                            po_statistics: pd.DataFrame,
+                            po_list: List[str]) -> Tuple[pd.DataFrame, List[str]]:
+
+        """
+        Summarize the (moldNo, machineCode) performance of the given POs, as 
+        summarize_mold_machine_history does on their production records.
+        """
+
+        group_statistics = po_statistics[po_statistics['poNo'].isin(po_list)]
+        summary = group_statistics.groupby(['moldNo', 'machineCode'], sort=True).agg(
+            shiftsUsed=('shiftsUsed', 'sum'),
+            totalQuantity=('totalQuantity', 'sum'),
+            totalGoodQuantity=('totalGoodQuantity', 'sum'),
+            latestDate=('latestDate', 'max'),
+            oldestDate=('oldestDate', 'min'),
+            totalShots=('totalShots', 'sum'),
+            shotRecords=('shotRecords', 'sum'),
+            totalCavities=('totalCavities', 'sum'),
+            cavityRecords=('cavityRecords', 'sum'),
+        ).reset_index()
+
+        # Means over the records with a value
+        summary['shiftShots'] = summary['totalShots'] / summary['shotRecords'].where(summary['shotRecords'] > 0)
+        summary['shiftCavities'] = summary['totalCavities'] / summary['cavityRecords'].where(summary['cavityRecords'] > 0)
+
+        return summarize_mold_machine_performance(
+            summary.drop(columns=['shotRecords', 'totalCavities', 'cavityRecords']),
+            self.mold_estimated_capacity_df)
     
     def _validate_shared_database(self, df_name, df) -> None:
         """Validate shared database DataFrame against expected schema."""
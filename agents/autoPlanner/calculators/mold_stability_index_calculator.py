@@ -3,7 +3,7 @@ import numpy as np
 from loguru import logger
 
 from agents.decorators import validate_init_dataframes
-from typing import List, Dict
+from typing import Dict, Optional
 import copy
 
 from configs.shared.config_report_format import ConfigReportMixin
@@ -12,6 +12,10 @@ from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.autoPlanner.calculators.configs.mold_stability_config import (
     MoldStabilityConfig, MoldStabilityCalculationResult)
 
+def _round_values(values: pd.Series, decimals: int = 2) -> list:
+    """Round with Python round() (exact at .xx5 boundaries, unlike np.round) as the per-mold loop did."""
+    return [round(value, decimals) for value in values.tolist()]
+
 # Decorator to validate DataFrames are initialized with the correct schema
 # This ensures that required DataFrames have all necessary columns before processing
 @validate_init_dataframes(lambda self: {
@@ -48,6 +52,14 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
         "utilization_rate_weight": 0.2,
         "data_completeness_weight": 0.1}
 
+    # Per-mold statistics kept between runs (see _aggregate_mold_statistics)
+    MOLD_STATISTICS_COLUMNS = [
+        'moldCavityStandard', 'moldSettingCycle', 'moldInfoRows',
+        'measurementCount', 'cavityMatchCount', 'cavityMean', 'cavityStd', 'cavityMin', 'cavityMax',
+        'cycleMean', 'cycleStd', 'cycleDeviationMean', 'cycleInRangeCount', 'cycleOutlierCount',
+        'totalRecords', 'firstRecordDate', 'lastRecordDate'
+        ]
+
     REQUIRED_DF_FIELDS = [
         "moldNo", "moldName", "recordDate",
         "moldCavity", "moldCavityStandard", "moldCycle", 
@@ -108,10 +120,16 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
         else:
             self.stability_constant_config = copy.deepcopy(stability_constant_config)
 
-    def process(self) -> MoldStabilityCalculationResult:
+    def process(self,
+                previous_statistics: Optional[pd.DataFrame] = None,
+                since: Optional[pd.Timestamp] = None) -> MoldStabilityCalculationResult:
         """
         Calculates cavity and cycle stability indices for molds based on historical production data
-        and will be used to estimate mold capacity in planning steps
+        and will be used to estimate mold capacity in planning steps.
+
+        With `previous_statistics` (the mold_statistics of an earlier result, covering records up to
+        `since`), only records dated after `since` are aggregated and folded into them. Molds whose
+        mold info changed since then are recomputed from their full history.
 
         Args:
             df: A DataFrame containing production records with columns:
@@ -139,11 +157,19 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
             calculator_log_entries.append(f"--Processing Summary--\n")
             calculator_log_entries.append(f"⤷ {self.__class__.__name__} results:\n")
 
-            # Extract historical data
-            historical_data = self._stability_index_input_processing()
+            if previous_statistics is None:
+                # Extract historical data and aggregate per-mold statistics
+                mold_statistics = self._aggregate_mold_statistics(self._stability_index_input_processing())
+            else:
+                if since is None:
+                    raise ValueError("`since` is required to update previous mold statistics")
+                mold_statistics = self._update_mold_statistics(previous_statistics, pd.Timestamp(since))
+                calculator_log_entries.append(
+                    f"Incremental update: folded records after {pd.Timestamp(since)} "
+                    f"into {len(previous_statistics)} molds\n")
 
             # Calculate stability index
-            mold_stability_index = self._calculate_stability_index(historical_data)
+            mold_stability_index = self._stability_index_from_statistics(mold_statistics)
 
             # Generate report
             reporter = DictBasedReportGenerator(use_colors=False)
@@ -158,7 +184,8 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
             return MoldStabilityCalculationResult(
                 mold_stability_index = mold_stability_index,
                 index_calculation_summary = index_calculation_summary,
-                log_str = calculator_log_str
+                log_str = calculator_log_str,
+                mold_statistics = mold_statistics
                 )
 
         except Exception as e:
@@ -168,196 +195,351 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
     #-------------------------#
     # Extract historical data #
     #-------------------------#
-    def _stability_index_input_processing(self) -> pd.DataFrame:
+    def _stability_index_input_processing(self,
+                                          records_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Extract historical data to calculate stability index calculation.
         
         Args:
-            productRecords_df: Production records DataFrame
-            moldInfo_df: Mold information DataFrame
+            records_df: Production records to process (default: all productRecords_df)
             
         Returns:
-            pd.DataFrame: Processed DataFrame with required fields
+            pd.DataFrame: One row per production record (moldCavity, moldCycle) merged with 
+            mold info, sorted by moldNo and recordDate
         """
         required_fields = self.stability_constant_config.get(
             "REQUIRED_DF_FIELDS", self.REQUIRED_DF_FIELDS)
         
-        filter_df = self.productRecords_df[self.productRecords_df['moldShot'] > 0].copy()
-        filter_df['moldCycle'] = (self.stability_constant_config.get(
-            "PRODUCTION_WINDOW_SECONDS", self.PRODUCTION_WINDOW_SECONDS) / filter_df['moldShot']).round(2)
-
-        # Group and aggregate
-        df = filter_df.groupby(['moldNo', 'recordDate'])[['moldCavity', 'moldCycle']].agg(list).reset_index()
+        if records_df is None:
+            records_df = self.productRecords_df
 
-        # Ensure correct data types
-        df['moldCavity'] = df['moldCavity'].apply(lambda lst: [int(x) for x in lst])
-        df['moldCycle'] = df['moldCycle'].apply(lambda lst: [float(x) for x in lst])
+        filter_df = records_df.loc[records_df['moldShot'] > 0,
+                                   ['moldNo', 'recordDate', 'moldCavity', 'moldShot']]
         
-        merged_df = df.merge(self.moldInfo_df[['moldNo', 'moldName',
-                                          'moldCavityStandard', 'moldSettingCycle',
-                                          'acquisitionDate', 'machineTonnage']], 
-                            how='left', 
-                            on='moldNo')
-
-        valid_df = merged_df[
-            (merged_df['moldCavityStandard'] > 0) &
-            (merged_df['moldSettingCycle'] > 0) &
-            (merged_df['moldCavityStandard'].notna()) &
-            (merged_df['moldSettingCycle'].notna())
-        ]
-
-        filtered_count = len(merged_df) - len(valid_df)
+        # Records without a mold or a date do not belong to any (moldNo, recordDate) group
+        filter_df = filter_df.dropna(subset=['moldNo', 'recordDate'])
+
+        merged_df = pd.DataFrame({
+            'moldNo': filter_df['moldNo'],
+            'recordDate': filter_df['recordDate'],
+            'moldCavity': filter_df['moldCavity'].astype('int64'),
+            'moldCycle': (self.stability_constant_config.get(
+                "PRODUCTION_WINDOW_SECONDS", self.PRODUCTION_WINDOW_SECONDS) / filter_df['moldShot']
+                ).round(2).astype('float64')
+            }).merge(self._indexed_mold_info(), how='left', on='moldNo')
+        merged_df = merged_df.sort_values(['moldNo', 'recordDate'], kind='stable', ignore_index=True)
+
+        valid_df = merged_df[self._valid_mold_info_mask(merged_df)]
+
+        # Count filtered (moldNo, recordDate) groups
+        group_keys = ['moldNo', 'recordDate', 'moldInfoRow']
+        filtered_count = (len(merged_df.drop_duplicates(group_keys)) - 
+                          len(valid_df.drop_duplicates(group_keys)))
         if filtered_count > 0:
-            invalid_molds = merged_df[~merged_df['moldNo'].isin(valid_df['moldNo'])]['moldNo'].unique()
+            invalid_molds = merged_df.loc[~merged_df['moldNo'].isin(valid_df['moldNo']), 'moldNo'].unique()
             self.logger.warning("Filtered {} records from {} molds ", filtered_count, len(invalid_molds))
             self.logger.warning("with invalid cavity/cycle: {}", list(invalid_molds)[:5])
 
-        return valid_df[required_fields]
+        return valid_df[list(dict.fromkeys(required_fields + ['moldInfoRow']))]
     
+    def _indexed_mold_info(self) -> pd.DataFrame:
+        """Mold info columns used by the calculator, with the position of each moldInfo row."""
+        # Keep the position of each mold info row: a mold listed twice in moldInfo counts its records twice
+        mold_info_df = self.moldInfo_df[['moldNo', 'moldName',
+                                         'moldCavityStandard', 'moldSettingCycle',
+                                         'acquisitionDate', 'machineTonnage']].copy()
+        mold_info_df['moldInfoRow'] = np.arange(len(mold_info_df))
+        return mold_info_df
+
+    @staticmethod
+    def _valid_mold_info_mask(df: pd.DataFrame) -> pd.Series:
+        """Rows with a usable standard cavity and setting cycle."""
+        return (
+            (df['moldCavityStandard'] > 0) &
+            (df['moldSettingCycle'] > 0) &
+            (df['moldCavityStandard'].notna()) &
+            (df['moldSettingCycle'].notna())
+        )
+
+    def _valid_mold_info(self) -> pd.DataFrame:
+        """Valid moldInfo rows (in moldInfo order), as the records are matched against."""
+        mold_info_df = self._indexed_mold_info()
+        return mold_info_df[self._valid_mold_info_mask(mold_info_df)]
+
     #---------------------------#
-    # Calculate stability index #
+    # Aggregate mold statistics #
     #---------------------------#
-    def _calculate_stability_index(self, 
+    def _aggregate_mold_statistics(self,
                                    df: pd.DataFrame) -> pd.DataFrame:
-        """Calculates cavity and cycle stability indices"""
 
-        # Validate input DataFrame has required columns and data
+        """
+        Aggregate per-mold statistics of the processed records in one grouped pass.
+
+        Counts, means and population standard deviations are kept (rather than the values)
+        so statistics of newer records can be folded in with combine_mold_statistics().
+        The standards they were computed against are kept as well.
+
+        Returns:
+            pd.DataFrame: MOLD_STATISTICS_COLUMNS indexed by moldNo (sorted)
+        """
+
         if df.empty:
-            self.logger.error("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
-            raise ValueError("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
+            return pd.DataFrame(columns=self.MOLD_STATISTICS_COLUMNS, index=pd.Index([], name='moldNo'))
+
+        # Mold info comes from the first record of each mold (records are sorted by date)
+        first_records = df.drop_duplicates('moldNo', keep='first').set_index('moldNo')
+        standard_cavity = df['moldNo'].map(first_records['moldCavityStandard']).to_numpy(dtype='float64')
+        standard_cycle = df['moldNo'].map(first_records['moldSettingCycle']).to_numpy(dtype='float64')
+
+        cavity_values = df['moldCavity'].to_numpy(dtype='float64')
+        cycle_values = df['moldCycle'].to_numpy(dtype='float64')
+        cycle_deviation = np.abs(cycle_values - standard_cycle) / standard_cycle
+
+        measurements = pd.DataFrame({
+            'moldNo': df['moldNo'].to_numpy(),
+            'recordDate': df['recordDate'].to_numpy(),
+            'cavity': cavity_values,
+            'cavityMatch': cavity_values == standard_cavity,
+            'cycle': cycle_values,
+            'cycleDeviation': cycle_deviation,
+            'cycleInRange': cycle_deviation <= self.stability_constant_config.get(
+                "CYCLE_TIME_TOLERANCE", self.CYCLE_TIME_TOLERANCE),
+            'cycleOutlier': cycle_deviation > self.stability_constant_config.get(
+                "EXTREME_DEVIATION_THRESHOLD", self.EXTREME_DEVIATION_THRESHOLD)
+        })
+
+        grouped = measurements.groupby('moldNo', sort=True)
+        mold_stats = grouped.agg(
+            measurementCount=('cavity', 'size'),
+            cavityMatchCount=('cavityMatch', 'sum'),
+            cavityMean=('cavity', 'mean'),
+            cavityMin=('cavity', 'min'),
+            cavityMax=('cavity', 'max'),
+            cycleMean=('cycle', 'mean'),
+            cycleDeviationMean=('cycleDeviation', 'mean'),
+            cycleInRangeCount=('cycleInRange', 'sum'),
+            cycleOutlierCount=('cycleOutlier', 'sum'),
+            firstRecordDate=('recordDate', 'min'),
+            lastRecordDate=('recordDate', 'max'))
+        
+        # Population standard deviation (as np.std)
+        mold_stats['cavityStd'] = grouped['cavity'].std(ddof=0)
+        mold_stats['cycleStd'] = grouped['cycle'].std(ddof=0)
         
-        # Initialize list to collect ALL mold results
-        stability_results_list = []
+        # A record is one (moldNo, recordDate) group
+        mold_stats['totalRecords'] = df.drop_duplicates(['moldNo', 'recordDate', 'moldInfoRow']).groupby('moldNo').size()
 
-        # Iterate through each mold
-        for mold_no in df['moldNo'].unique():
+        # Mold info the statistics were aggregated against
+        mold_stats['moldCavityStandard'] = first_records['moldCavityStandard']
+        mold_stats['moldSettingCycle'] = first_records['moldSettingCycle']
+        mold_stats['moldInfoRows'] = df.groupby('moldNo')['moldInfoRow'].nunique()
 
-            mold_data = df[df['moldNo'] == mold_no].copy()
+        return mold_stats[self.MOLD_STATISTICS_COLUMNS]
 
-            if mold_data.empty:
-                self.logger.warning(f"Mold {mold_no} has no data after filtering, skipping")
-                continue
+    @staticmethod
+    def combine_mold_statistics(previous: pd.DataFrame,
+                                new: pd.DataFrame) -> pd.DataFrame:
 
-            # Extract mold info efficiently using iloc
-            mold_info = mold_data.iloc[0]
+        """
+        Fold statistics of newer records into previous ones.
 
-            moldName = mold_info['moldName']
-            acquisitionDate = mold_info['acquisitionDate']
-            machineTonnage = mold_info['machineTonnage']
-            standard_cavity = mold_info['moldCavityStandard']
-            standard_cycle = mold_info['moldSettingCycle']
+        Counts are added, means are count-weighted and standard deviations use the pairwise
+        update of Chan et al. Records of `new` must be dated after those of `previous`.
+        Molds on only one side are kept as they are.
+        """
 
-            # Calculate theoretical capacity
-            theoretical_hour_capacity = self.stability_constant_config.get(
-                "SECONDS_PER_HOUR", 
-                self.SECONDS_PER_HOUR) / standard_cycle * standard_cavity
+        if previous.empty:
+            return new.copy()
+        if new.empty:
+            return previous.copy()
+
+        shared = previous.index.intersection(new.index)
+        a, b = previous.loc[shared], new.loc[shared]
+        n_a = a['measurementCount'].astype('float64')
+        n_b = b['measurementCount'].astype('float64')
+        n = n_a + n_b
+
+        # Standards come from the newer aggregation (stale molds are recomputed beforehand)
+        combined = b.copy()
+        for col in ['measurementCount', 'cavityMatchCount', 'cycleInRangeCount',
+                    'cycleOutlierCount', 'totalRecords']:
+            combined[col] = a[col] + b[col]
+
+        for value in ['cavity', 'cycle']:
+            mean_a, mean_b = a[f'{value}Mean'], b[f'{value}Mean']
+            sum_squares = (n_a * a[f'{value}Std'] ** 2 + n_b * b[f'{value}Std'] ** 2 +
+                           (mean_b - mean_a) ** 2 * n_a * n_b / n)
+            combined[f'{value}Mean'] = (n_a * mean_a + n_b * mean_b) / n
+            combined[f'{value}Std'] = np.sqrt(sum_squares / n)
+
+        combined['cycleDeviationMean'] = (n_a * a['cycleDeviationMean'] + n_b * b['cycleDeviationMean']) / n
+        combined['cavityMin'] = np.minimum(a['cavityMin'], b['cavityMin'])
+        combined['cavityMax'] = np.maximum(a['cavityMax'], b['cavityMax'])
+        combined['firstRecordDate'] = a['firstRecordDate']
+        combined['lastRecordDate'] = b['lastRecordDate']
+
+        return pd.concat([previous.drop(index=shared), new.drop(index=shared), combined]).sort_index()
+
+    def _update_mold_statistics(self,
+                                previous_statistics: pd.DataFrame,
+                                since: pd.Timestamp) -> pd.DataFrame:
 
-            # Gather all cavity and cycle values
-            mold_data = mold_data.sort_values('recordDate')
-            all_cavity_values = [val for sublist in mold_data['moldCavity'] for val in sublist]
-            all_cycle_values = [val for sublist in mold_data['moldCycle'] for val in sublist]
+        """
+        Fold records dated after `since` into statistics that cover the records up to `since`.
 
-            # Calculate stability scores
-            total_records = len(mold_data)
-            cavity_stability = self._calculate_cavity_stability(
-                all_cavity_values, standard_cavity, total_records, self.config.total_records_threshold
-                )
-            cycle_stability = self._calculate_cycle_stability(
-                all_cycle_values, standard_cycle, total_records, self.config.total_records_threshold
-                )
-            
-            # Calculate weighted stability
-            overall_stability = (
-                cavity_stability * self.config.cavity_stability_threshold) + (
-                    cycle_stability * self.config.cycle_stability_threshold)
+        Statistics aggregated against other mold info (standards or duplicated moldInfo rows
+        changed, mold no longer valid) and molds that only became valid now are recomputed
+        from their full history.
+        """
+
+        records = self.productRecords_df
+        is_new = records['recordDate'] > since
+        is_folded = records['recordDate'] <= since
+
+        valid_mold_info = self._valid_mold_info().groupby('moldNo', sort=True)
+        signature_columns = ['moldCavityStandard', 'moldSettingCycle', 'moldInfoRows']
+        current_signature = pd.DataFrame({
+            'moldCavityStandard': valid_mold_info['moldCavityStandard'].first(),
+            'moldSettingCycle': valid_mold_info['moldSettingCycle'].first(),
+            'moldInfoRows': valid_mold_info.size()}).reindex(previous_statistics.index)
+
+        unchanged = (current_signature[signature_columns].to_numpy(dtype='float64') ==
+                     previous_statistics[signature_columns].to_numpy(dtype='float64')).all(axis=1)
+        changed_molds = previous_statistics.index[~unchanged]
+        newly_valid_molds = (pd.Index(valid_mold_info.size().index)
+                             .difference(previous_statistics.index)
+                             .intersection(pd.Index(records.loc[is_folded, 'moldNo'].dropna().unique())))
+        stale_molds = changed_molds.union(newly_valid_molds)
+
+        self.logger.info("Folding {} new records into {} molds ({} molds recomputed from full history)",
+                         int(is_new.sum()), len(previous_statistics), len(stale_molds))
+
+        rebuilt_statistics = self._aggregate_mold_statistics(self._stability_index_input_processing(
+            records[is_folded & records['moldNo'].isin(stale_molds)]))
+        new_statistics = self._aggregate_mold_statistics(self._stability_index_input_processing(
+            records[is_new]))
+
+        return self.combine_mold_statistics(
+            self.combine_mold_statistics(previous_statistics.drop(index=changed_molds), rebuilt_statistics),
+            new_statistics)
+
+    #---------------------------#
+    # Calculate stability index #
+    #---------------------------#
+    def _calculate_stability_index(self, 
+                                   df: pd.DataFrame) -> pd.DataFrame:
+        """Calculates cavity and cycle stability indices for all molds in one grouped pass"""
+
+        # Validate input DataFrame has required columns and data
+        if df.empty:
+            self.logger.error("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
+            raise ValueError("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
 
-            # Calculate effective capacity
-            effective_hour_capacity = theoretical_hour_capacity * overall_stability
+        return self._stability_index_from_statistics(self._aggregate_mold_statistics(df))
 
-            # Calculate estimated capacity (considering efficiency and loss)
-            estimated_hour_capacity = theoretical_hour_capacity * (self.config.efficiency - self.config.loss)
+    def _stability_index_from_statistics(self,
+                                         mold_stats: pd.DataFrame) -> pd.DataFrame:
+        """Calculates cavity and cycle stability indices from per-mold statistics"""
+
+        if mold_stats.empty:
+            self.logger.error("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
+            raise ValueError("Extracted historical data is empty. Cannot calculate cavity and cycle stability indices")
+
+        # Descriptive mold info comes from the first valid moldInfo row
+        mold_info = (self._valid_mold_info().drop_duplicates('moldNo', keep='first')
+                     .set_index('moldNo').reindex(mold_stats.index))
+        standard_cavity = mold_stats['moldCavityStandard']
+        standard_cycle = mold_stats['moldSettingCycle']
+        total_records = mold_stats['totalRecords']
+
+        # Calculate theoretical capacity
+        theoretical_hour_capacity = self.stability_constant_config.get(
+            "SECONDS_PER_HOUR", 
+            self.SECONDS_PER_HOUR) / standard_cycle * standard_cavity
+
+        # Calculate stability scores
+        cavity_stability = self._calculate_cavity_stability(
+            mold_stats, standard_cavity, total_records, self.config.total_records_threshold)
+        cycle_stability = self._calculate_cycle_stability(
+            mold_stats, total_records, self.config.total_records_threshold)
         
-            # Calculate balanced capacity (balance effective and estimated capacity by using alpha
-            # Alpha: trust coefficient from historical data (0.1 - 1.0)
-            alpha = max(
-                self.stability_constant_config.get(
-                    "MIN_HISTORICAL_TRUST", self.MIN_HISTORICAL_TRUST), 
-                min(
-                    self.stability_constant_config.get(
-                        "MAX_HISTORICAL_TRUST", self.MAX_HISTORICAL_TRUST), 
-                    total_records / self.config.total_records_threshold)
-                    )
-            balanced_hour_capacity = alpha * effective_hour_capacity + (1 - alpha) * estimated_hour_capacity
-
-            # Append single mold stability to result list
-            stability_results = {
-                'moldNo': mold_no,
-                'moldName': moldName,
-                'acquisitionDate': acquisitionDate,
-                'machineTonnage': machineTonnage,
-                'moldCavityStandard': standard_cavity,
-                'moldSettingCycle': standard_cycle,
-
-                'cavityStabilityIndex': round(cavity_stability, 2),
-                'cycleStabilityIndex': round(cycle_stability, 2),
-
-                'theoreticalMoldHourCapacity': round(theoretical_hour_capacity, 2),
-                'effectiveMoldHourCapacity': round(effective_hour_capacity, 2),
-                'estimatedMoldHourCapacity': round(estimated_hour_capacity, 2),
-                'balancedMoldHourCapacity': round(balanced_hour_capacity, 2),
-
-                'totalRecords': total_records,
-                'totalCavityMeasurements': len(all_cavity_values),
-                'totalCycleMeasurements': len(all_cycle_values),
-                'firstRecordDate': mold_data['recordDate'].min(),
-                'lastRecordDate': mold_data['recordDate'].max(),
-            }
-
-            # Append to list
-            stability_results_list.append(stability_results)
+        # Calculate weighted stability
+        overall_stability = (
+            cavity_stability * self.config.cavity_stability_threshold) + (
+                cycle_stability * self.config.cycle_stability_threshold)
+
+        # Calculate effective capacity
+        effective_hour_capacity = theoretical_hour_capacity * overall_stability
+
+        # Calculate estimated capacity (considering efficiency and loss)
+        estimated_hour_capacity = theoretical_hour_capacity * (self.config.efficiency - self.config.loss)
+    
+        # Calculate balanced capacity (balance effective and estimated capacity by using alpha
+        # Alpha: trust coefficient from historical data (0.1 - 1.0)
+        alpha = (total_records / self.config.total_records_threshold).clip(
+            upper=self.stability_constant_config.get(
+                "MAX_HISTORICAL_TRUST", self.MAX_HISTORICAL_TRUST)).clip(
+            lower=self.stability_constant_config.get(
+                "MIN_HISTORICAL_TRUST", self.MIN_HISTORICAL_TRUST))
+        balanced_hour_capacity = alpha * effective_hour_capacity + (1 - alpha) * estimated_hour_capacity
 
         # Return result as DataFrame
-        return pd.DataFrame(stability_results_list)
+        return pd.DataFrame({
+            'moldNo': mold_stats.index.to_numpy(),
+            'moldName': mold_info['moldName'].tolist(),
+            'acquisitionDate': mold_info['acquisitionDate'].tolist(),
+            'machineTonnage': mold_info['machineTonnage'].tolist(),
+            'moldCavityStandard': standard_cavity.tolist(),
+            'moldSettingCycle': standard_cycle.tolist(),
+
+            'cavityStabilityIndex': _round_values(cavity_stability),
+            'cycleStabilityIndex': _round_values(cycle_stability),
+
+            'theoreticalMoldHourCapacity': _round_values(theoretical_hour_capacity),
+            'effectiveMoldHourCapacity': _round_values(effective_hour_capacity),
+            'estimatedMoldHourCapacity': _round_values(estimated_hour_capacity),
+            'balancedMoldHourCapacity': _round_values(balanced_hour_capacity),
+
+            'totalRecords': total_records.to_numpy(),
+            'totalCavityMeasurements': mold_stats['measurementCount'].to_numpy(),
+            'totalCycleMeasurements': mold_stats['measurementCount'].to_numpy(),
+            'firstRecordDate': mold_stats['firstRecordDate'].tolist(),
+            'lastRecordDate': mold_stats['lastRecordDate'].tolist(),
+        })
     
     def _calculate_cavity_stability(self,
-                                    cavity_values: List[int],
-                                    standard_cavity: float,
-                                    total_records: int,
-                                    total_records_threshold: int) -> float:
+                                    mold_stats: pd.DataFrame,
+                                    standard_cavity: pd.Series,
+                                    total_records: pd.Series,
+                                    total_records_threshold: int) -> pd.Series:
         """
-        Calculate cavity stability index.
+        Calculate cavity stability index per mold.
         
         Args:
-            cavity_values: List of actual cavity values
-            standard_cavity: Standard number of cavities
-            total_records: Total number of production records
+            mold_stats: Per-mold cavity aggregates (measurementCount, cavityMatchCount, 
+                cavityMean, cavityStd, cavityMin, cavityMax)
+            standard_cavity: Standard number of cavities per mold
+            total_records: Total number of production records per mold
             total_records_threshold: Minimum threshold for records
             
         Returns:
-            float: Stability score between 0.0 and 1.0
+            pd.Series: Stability score between 0.0 and 1.0 per mold
         """
 
         # 1. Accuracy rate (how many values match the standard)
-        correct_count = sum(1 for val in cavity_values if val == standard_cavity)
-        accuracy_rate = correct_count / len(cavity_values)
+        accuracy_rate = mold_stats['cavityMatchCount'] / mold_stats['measurementCount']
 
-        # 2. Consistency: variation of cavity values
-        if len(set(cavity_values)) == 1:
-            consistency_score = 1.0  # Perfectly consistent
-        else:
-            mean_val = np.mean(cavity_values)
-            if mean_val > 0:
-                cv = np.std(cavity_values) / mean_val
-                consistency_score = max(0, 1 - cv)
-            else:
-                consistency_score = 0
+        # 2. Consistency: variation of cavity values (a single distinct value is perfectly consistent)
+        mean_val = mold_stats['cavityMean']
+        cv = mold_stats['cavityStd'] / mean_val.where(mean_val > 0)
+        consistency_score = (1 - cv).clip(lower=0).fillna(0)
+        consistency_score = consistency_score.mask(mold_stats['cavityMin'] == mold_stats['cavityMax'], 1.0)
 
         # 3. Utilization rate: actual average cavity vs standard
-        avg_active_cavity = np.mean(cavity_values)
-        utilization_rate = min(1.0, avg_active_cavity / standard_cavity)
+        utilization_rate = (mean_val / standard_cavity).clip(upper=1.0)
 
         # 4. Penalty for low data volume
-        data_completeness = min(1.0, total_records / total_records_threshold)
+        data_completeness = (total_records / total_records_threshold).clip(upper=1.0)
 
         # Final weighted score
         cavity_stability_weights = self.stability_constant_config.get(
@@ -369,54 +551,43 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
             data_completeness *cavity_stability_weights['data_completeness_weight']      # 10% - Data completeness
         )
 
-        return min(1.0, max(0.0, stability_score))
+        return stability_score.clip(lower=0.0, upper=1.0)
 
     def _calculate_cycle_stability(self,
-                                   cycle_values: List[float],
-                                   standard_cycle: float,
-                                   total_records: int,
-                                   total_records_threshold: int) -> float:
+                                   mold_stats: pd.DataFrame,
+                                   total_records: pd.Series,
+                                   total_records_threshold: int) -> pd.Series:
         """
-        Calculate cycle time stability index.
+        Calculate cycle time stability index per mold.
         
         Args:
-            cycle_values: List of actual cycle times
-            standard_cycle: Standard cycle time
-            total_records: Total number of production records
+            mold_stats: Per-mold cycle aggregates (measurementCount, cycleMean, cycleStd, 
+                cycleDeviationMean, cycleInRangeCount, cycleOutlierCount)
+            total_records: Total number of production records per mold
             total_records_threshold: Minimum threshold for records
             
         Returns:
-            float: Stability score between 0.0 and 1.0
+            pd.Series: Stability score between 0.0 and 1.0 per mold
         """
 
+        measurement_count = mold_stats['measurementCount']
+
         # 1. Deviation from standard
-        deviations = [abs(val - standard_cycle) / standard_cycle for val in cycle_values]
-        avg_deviation = np.mean(deviations) if deviations else self.stability_constant_config.get(
-            "EXTREME_DEVIATION_THRESHOLD", self.EXTREME_DEVIATION_THRESHOLD)
-        accuracy_score = max(0, 1 - avg_deviation)
+        accuracy_score = (1 - mold_stats['cycleDeviationMean']).clip(lower=0)
 
         # 2. Consistency: variation of cycle time
-        mean_val = np.mean(cycle_values)
-        if mean_val > 0:
-            cv = np.std(cycle_values) / mean_val
-            consistency_score = max(0, 1 - cv)
-        else:
-            consistency_score = 0
+        mean_val = mold_stats['cycleMean']
+        cv = mold_stats['cycleStd'] / mean_val.where(mean_val > 0)
+        consistency_score = (1 - cv).clip(lower=0).fillna(0)
 
         # 3. Compliance within ±20% range
-        in_range_count = sum(1 for val in cycle_values
-                            if abs(val - standard_cycle) / standard_cycle <= self.stability_constant_config.get(
-                                "CYCLE_TIME_TOLERANCE", self.CYCLE_TIME_TOLERANCE))
-        range_compliance = in_range_count / len(cycle_values) if cycle_values else 0
+        range_compliance = mold_stats['cycleInRangeCount'] / measurement_count
 
         # 4. Penalty for extreme outliers (deviation > 100%)
-        extreme_outliers = sum(1 for val in cycle_values
-                            if abs(val - standard_cycle) / standard_cycle > self.stability_constant_config.get(
-                                "EXTREME_DEVIATION_THRESHOLD", self.EXTREME_DEVIATION_THRESHOLD))
-        outlier_penalty = max(0, 1 - (extreme_outliers / len(cycle_values))) if cycle_values else 0
+        outlier_penalty = (1 - mold_stats['cycleOutlierCount'] / measurement_count).clip(lower=0)
 
         # 5. Data completeness penalty
-        data_completeness = min(1.0, total_records / total_records_threshold)
+        data_completeness = (total_records / total_records_threshold).clip(upper=1.0)
 
         # Final weighted score
         cycle_stability_weights = self.stability_constant_config.get(
@@ -429,4 +600,4 @@ class MoldStabilityIndexCalculator(ConfigReportMixin):
             data_completeness * cycle_stability_weights['data_completeness_weight']     # 10% - Data completeness
         )
 
-        return min(1.0, max(0.0, stability_score))
\ No newline at end of file
+        return stability_score.clip(lower=0.0, upper=1.0)
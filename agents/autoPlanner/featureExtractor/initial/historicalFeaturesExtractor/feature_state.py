@@ -0,0 +1,79 @@
+"""
+Persisted feature state for incremental HistoricalFeaturesExtractor runs.
+
+A FeatureState keeps the statistics the calculators aggregate from productRecords,
+covering every record up to a watermark (the latest recordDate folded in):
+
+- mold_statistics: per-mold counts, means and deviations (MoldStabilityIndexCalculator)
+- po_statistics:   per (poNo, moldNo, machineCode) sums and counts (MoldMachineFeatureWeightCalculator)
+
+The next incremental run only aggregates records dated after the watermark and folds them
+in. The state is discarded (full recompute) when records up to the watermark changed (row
+count or rows_digest of the aggregated columns) or the constant configuration the statistics
+depend on is different.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+from pathlib import Path
+import pandas as pd
+
+from agents.incremental_state import (
+    FoldedState, count_folded_rows, folded_rows_digest, load_state_files, make_settings_key, save_state_files)
+
+FEATURE_STATE_DIR_NAME = "feature_state"
+
+_META_FILE_NAME = "feature_state.json"
+
+# productRecords columns the statistics are aggregated from (covered by the digest)
+FOLDED_COLUMNS = ['recordDate', 'workingShift', 'poNo', 'machineCode', 'moldNo',
+                  'moldShot', 'moldCavity', 'itemTotalQuantity', 'itemGoodQuantity']
+
+@dataclass
+class FeatureState(FoldedState):
+    """Calculator statistics covering productRecords up to `watermark`"""
+    mold_statistics: pd.DataFrame = field(default_factory=pd.DataFrame)
+    po_statistics: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    def is_resumable(self, records: pd.DataFrame, settings_key: str) -> bool:
+        """True if the statistics can be updated with `records` dated after the watermark."""
+        return self.covers(records, records['recordDate'], settings_key, _folded_columns(records))
+
+def _folded_columns(records: pd.DataFrame) -> List[str]:
+    return [column for column in FOLDED_COLUMNS if column in records.columns]
+
+def build_feature_state(records: pd.DataFrame,
+                        settings_key: str,
+                        mold_statistics: pd.DataFrame,
+                        po_statistics: pd.DataFrame) -> Optional[FeatureState]:
+    """State covering all dated `records`; None if no record has a date."""
+    dates = records['recordDate']
+    watermark = dates.max()
+    if pd.isna(watermark):
+        return None
+    watermark = pd.Timestamp(watermark)
+    return FeatureState(
+        watermark=watermark.isoformat(),
+        rows_folded=count_folded_rows(dates, watermark),
+        settings_key=settings_key,
+        rows_digest=folded_rows_digest(records, dates, watermark, _folded_columns(records)),
+        mold_statistics=mold_statistics,
+        po_statistics=po_statistics)
+
+def load_feature_state(state_dir: Path | str) -> Optional[FeatureState]:
+    """Read a state written by save_feature_state; None if missing or unreadable."""
+    loaded = load_state_files(state_dir, _META_FILE_NAME)
+    if loaded is None:
+        return None
+    fields, tables = loaded
+    if not {'mold_statistics', 'po_statistics'} <= tables.keys() or 'moldNo' not in tables['mold_statistics']:
+        return None
+    return FeatureState(**fields,
+                        mold_statistics=tables['mold_statistics'].set_index('moldNo'),
+                        po_statistics=tables['po_statistics'])
+
+def save_feature_state(state_dir: Path | str, state: FeatureState) -> None:
+    """Write the statistics and their metadata (see save_state_files)."""
+    save_state_files(state_dir, _META_FILE_NAME, state,
+                     {'mold_statistics': state.mold_statistics.reset_index(),
+                      'po_statistics': state.po_statistics})
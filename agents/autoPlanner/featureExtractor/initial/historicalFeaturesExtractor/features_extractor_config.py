@@ -12,6 +12,9 @@ class FeaturesExtractorConfig:
     efficiency: Optional[float] = None
     loss: Optional[float] = None
 
+    # Fold only records newer than the saved feature state into the statistics
+    incremental: Optional[bool] = None
+
     # Shared source configs
     shared_source_config: SharedSourceConfig = field(default_factory=SharedSourceConfig)
 
@@ -23,11 +26,13 @@ class FeaturesExtractorConfig:
 
     DEFAULT_EFFICIENCY = 0.85
     DEFAULT_LOSS = 0.03
+    DEFAULT_INCREMENTAL = False
 
     def __post_init__(self):
         """Apply default values for None fields"""
         self.efficiency = self._get_default(self.efficiency, self.DEFAULT_EFFICIENCY)
         self.loss = self._get_default(self.loss, self.DEFAULT_LOSS)
+        self.incremental = self._get_default(self.incremental, self.DEFAULT_INCREMENTAL)
 
         for cfg in (self.mold_stability_config, self.feature_weight_config):
             cfg.efficiency = self.efficiency
@@ -6,12 +6,16 @@ import pandas as pd
 import os
 
 from agents.utils import load_annotation_path, read_change_log
+from agents.database_loader import load_database, schema_dtypes
+from agents.result_store import read_result
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.autoPlanner.featureExtractor.initial.historicalFeaturesExtractor.features_extractor_config import (
     FeaturesExtractorConfig)
 from agents.autoPlanner.featureExtractor.initial.historicalFeaturesExtractor.save_output_formatter import (
     save_mold_stability_index, save_mold_machine_weights)
+from agents.autoPlanner.featureExtractor.initial.historicalFeaturesExtractor.feature_state import (
+    FEATURE_STATE_DIR_NAME, build_feature_state, load_feature_state, make_settings_key, save_feature_state)
 
 # Import agent report format components
 from configs.shared.agent_report_format import (
@@ -109,7 +113,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -155,6 +159,52 @@ class DataLoadingPhase(AtomicPhase):
             "Please check paths in configuration."
         )
 
+# ============================================
+# FEATURE STATE LOADING PHASE
+# ============================================
+class FeatureStateLoadingPhase(AtomicPhase):
+    """Phase for loading the feature state of the previous run (incremental extraction)"""
+
+    RECOVERABLE_ERRORS = (OSError, ValueError, KeyError)
+    CRITICAL_ERRORS = (MemoryError, KeyboardInterrupt)
+    FALLBACK_FAILURE_IS_CRITICAL = False  # Without a state, the features are fully recomputed
+
+    def __init__(self,
+                 config: FeaturesExtractorConfig,
+                 data_container: Dict[str, Any],
+                 state_container: Dict[str, Any]):
+        super().__init__("FeatureStateLoading")
+        self.config = config
+        self.loaded_data = data_container
+        self.state_container = state_container
+
+    def _execute_impl(self) -> Dict[str, Any]:
+        """Load the previous feature state if records were only appended since"""
+        state_dir = feature_state_dir(self.config)
+        logger.info("📂 Loading feature state from {}...", state_dir)
+
+        state = load_feature_state(state_dir)
+        productRecords_df = self.loaded_data['dataframes']['productRecords_df']
+        settings_key = make_settings_key(self.loaded_data.get('constant_config', {}))
+
+        if state is None:
+            logger.info("No feature state found, features will be fully recomputed")
+        elif not state.is_resumable(productRecords_df, settings_key):
+            logger.info("Records up to {} or constant configs changed, features will be fully recomputed",
+                        state.watermark)
+            state = None
+        else:
+            logger.info("✓ Feature state loaded: folding records after {}", state.watermark)
+
+        self.state_container['previous_state'] = state
+
+        return {"watermark": state.watermark if state is not None else None}
+
+    def _fallback(self) -> Dict[str, Any]:
+        """Run a full recompute"""
+        self.state_container['previous_state'] = None
+        return {"watermark": None}
+
 # ============================================
 # PHASE 1: MOLD STABILITY CALCULATING
 # ============================================
@@ -169,12 +219,14 @@ class MoldStabilityCalculatingPhase(AtomicPhase):
     def __init__(self, 
                  config: FeaturesExtractorConfig,
                  data_container: Dict[str, Any], 
-                 index_data_container: Dict[str, Any]):
+                 index_data_container: Dict[str, Any],
+                 state_container: Dict[str, Any]):
         super().__init__("MoldStabilityIndexCalculator")
 
         self.config = config
         self.loaded_data = data_container
         self.index_data_container = index_data_container
+        self.state_container = state_container
 
     def _execute_impl(self) -> Dict[str, Any]:
         """Run mold stability calculator logic"""
@@ -203,9 +255,14 @@ class MoldStabilityCalculatingPhase(AtomicPhase):
             mold_stability_config,
             stability_constant_config)
         
-        calculator_result = calculator.process()
+        previous_state = self.state_container.get('previous_state')
+        if previous_state is None:
+            calculator_result = calculator.process()
+        else:
+            calculator_result = calculator.process(previous_state.mold_statistics, previous_state.since)
 
         self.index_data_container.update(calculator_result.to_dict())
+        self.state_container['mold_statistics'] = calculator_result.mold_statistics
         
         logger.info("✓ MoldStabilityIndexCalculator completed")
         
@@ -257,7 +314,7 @@ class DependencyDataLoadingPhase(AtomicPhase):
             logger.info("No change log file found")
             raise FileNotFoundError("No progress tracking change log found")
         
-        progress_tracking_data = pd.read_excel(excel_file_path)
+        progress_tracking_data = read_result(excel_file_path)
 
         self.dependency_data_container.update({"proStatus_df": progress_tracking_data})
 
@@ -292,13 +349,15 @@ class FeatureWeightCalculatingPhase(AtomicPhase):
                  config: FeaturesExtractorConfig,
                  data_container: Dict[str, Any], 
                  dependency_data_container: Dict[str, Any], 
-                 index_data_container: Dict[str, Any]):
+                 index_data_container: Dict[str, Any],
+                 state_container: Dict[str, Any]):
         super().__init__("MoldMachineFeatureWeightCalculator")
 
         self.config = config
         self.loaded_data = data_container
         self.dependency_data = dependency_data_container
         self.index_calculating_data = index_data_container
+        self.state_container = state_container
 
     def _execute_impl(self) -> Dict[str, Any]:
         """Run feature weight calulator logic"""
@@ -314,6 +373,7 @@ class FeatureWeightCalculatingPhase(AtomicPhase):
         try: 
             # Running feature weight calulator
             calculator_result = self._calculate_feature_weight(estimator_result.mold_estimated_capacity)
+            self.state_container['po_statistics'] = calculator_result.po_statistics
             logger.info("✓ MoldMachineFeatureWeightCalculator completed")
         except Exception as e:
             raise FileNotFoundError(f"Failed to running feature weight calulator: {e}")
@@ -384,7 +444,10 @@ class FeatureWeightCalculatingPhase(AtomicPhase):
             self.config.feature_weight_config,
             weight_constant_config)
 
-        return calculator.process()
+        previous_state = self.state_container.get('previous_state')
+        if previous_state is None:
+            return calculator.process()
+        return calculator.process(previous_state.po_statistics, previous_state.since)
     
     def _fallback(self) -> NoReturn:
         """
@@ -398,6 +461,54 @@ class FeatureWeightCalculatingPhase(AtomicPhase):
             "MoldMachineFeatureWeightCalculator cannot fallback."
         )
     
+# ============================================
+# FEATURE STATE SAVING PHASE
+# ============================================
+class FeatureStateSavingPhase(AtomicPhase):
+    """Phase for saving the statistics of this run, so the next run can be incremental"""
+
+    RECOVERABLE_ERRORS = (OSError, ValueError, KeyError)
+    CRITICAL_ERRORS = (MemoryError, KeyboardInterrupt)
+    FALLBACK_FAILURE_IS_CRITICAL = False  # The next run falls back to a full recompute
+
+    def __init__(self,
+                 config: FeaturesExtractorConfig,
+                 data_container: Dict[str, Any],
+                 state_container: Dict[str, Any]):
+        super().__init__("FeatureStateSaving")
+        self.config = config
+        self.loaded_data = data_container
+        self.state_container = state_container
+
+    def _execute_impl(self) -> Dict[str, Any]:
+        """Save the statistics covering all loaded records"""
+        if ('mold_statistics' not in self.state_container or
+            'po_statistics' not in self.state_container):
+            raise KeyError("Feature statistics are missing, state not saved")
+
+        state = build_feature_state(
+            self.loaded_data['dataframes']['productRecords_df'],
+            make_settings_key(self.loaded_data.get('constant_config', {})),
+            self.state_container['mold_statistics'],
+            self.state_container['po_statistics'])
+        if state is None:
+            raise ValueError("Records have no dates, state not saved")
+
+        state_dir = feature_state_dir(self.config)
+        save_feature_state(state_dir, state)
+        logger.info("✓ Feature state saved up to {} ({})", state.watermark, state_dir)
+
+        return {"watermark": state.watermark, "saved": True}
+
+    def _fallback(self) -> Dict[str, Any]:
+        """Skip saving: the next run recomputes the features from the full history"""
+        logger.warning("Feature state not saved, the next run will fully recompute features")
+        return {"watermark": None, "saved": False}
+
+def feature_state_dir(config: FeaturesExtractorConfig) -> Path:
+    """Directory of the persisted feature state (next to the extractor reports)"""
+    return Path(config.shared_source_config.features_extractor_dir) / FEATURE_STATE_DIR_NAME
+
 # ============================================
 # MAIN AGENT: HISTORICAL FEATURES EXTRACTOR
 # ============================================
@@ -418,6 +529,7 @@ class HistoricalFeaturesExtractor(ConfigReportMixin):
         'config': {
             'efficiency': float,
             'loss': float,
+            'incremental': bool,
             'shared_source_config': {
                 'databaseSchemas_path': str,
                 'sharedDatabaseSchemas_path': str,
@@ -464,6 +576,9 @@ class HistoricalFeaturesExtractor(ConfigReportMixin):
                     - efficiency (float): Global efficiency threshold to classify good/bad records.
                     - loss (float): Global allowable production loss threshold.
 
+                - incremental (bool): Fold only records newer than the saved feature state
+                  (full recompute if no resumable state exists).
+
                 - shared_source_config:
                     - annotation_path (str): Path to the JSON file containing path annotations.
                     - databaseSchemas_path (str): Path to database schema for validation.
@@ -560,6 +675,7 @@ class HistoricalFeaturesExtractor(ConfigReportMixin):
         shared_data = {}  # This will be populated by DataLoadingPhase
         index_calculating_data = {} # This will be populated by MoldStabilityCalculatingPhase
         dependency_data = {} # This will be populated by DependencyDataLoadingPhase
+        feature_state = {} # This will be populated by FeatureStateLoadingPhase and the calculating phases
         
         # ============================================
         # BUILD PHASE LIST WITH SHARED CONTAINER
@@ -568,9 +684,14 @@ class HistoricalFeaturesExtractor(ConfigReportMixin):
         
         # Phase 1: Data Loading (always required)
         phases.append(DataLoadingPhase(self.config, shared_data))
+
+        # Incremental extraction: statistics of the previous run (full recompute otherwise)
+        if self.config.incremental:
+            phases.append(FeatureStateLoadingPhase(self.config, shared_data, feature_state))
         
         # Phase 2: Mold Stability Index Calculation
-        phases.append(MoldStabilityCalculatingPhase(self.config, shared_data, index_calculating_data))
+        phases.append(MoldStabilityCalculatingPhase(self.config, shared_data, index_calculating_data,
+                                                    feature_state))
 
         # Phase 3: Dependency data Loading (always required)
         phases.append(DependencyDataLoadingPhase(self.config, dependency_data))
@@ -579,7 +700,12 @@ class HistoricalFeaturesExtractor(ConfigReportMixin):
         phases.append(FeatureWeightCalculatingPhase(self.config, 
                                                     shared_data, 
                                                     dependency_data,
-                                                    index_calculating_data))
+                                                    index_calculating_data,
+                                                    feature_state))
+
+        # Save the statistics for the next incremental run
+        if self.config.incremental:
+            phases.append(FeatureStateSavingPhase(self.config, shared_data, feature_state))
 
         # ============================================
         # EXECUTE USING COMPOSITE AGENT
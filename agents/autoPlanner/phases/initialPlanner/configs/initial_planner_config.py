@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 from configs.shared.shared_source_config import SharedSourceConfig
-from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder
+from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder, SolverMode
 
 @dataclass
 class InitialPlannerConfig:
@@ -15,12 +15,16 @@ class InitialPlannerConfig:
     max_load_threshold: Optional[int] = None
     log_progress_interval: Optional[int] = None
 
+    solver_mode: SolverMode = SolverMode.GREEDY
+    solver_time_limit: Optional[float] = None
+
     efficiency: Optional[float] = None
     loss: Optional[float] = None
 
     # Default values
     MAX_LOAD_THRESHOLD = 30
     LOG_PROGRESS_INTERVAL = 10
+    SOLVER_TIME_LIMIT = 30
 
     DEFAULT_EFFICIENCY = 0.85
     DEFAULT_LOSS = 0.03
@@ -29,6 +33,7 @@ class InitialPlannerConfig:
         """Apply default values for None fields"""
         self.max_load_threshold = self._get_default(self.max_load_threshold, self.MAX_LOAD_THRESHOLD)
         self.log_progress_interval = self._get_default(self.log_progress_interval, self.LOG_PROGRESS_INTERVAL)
+        self.solver_time_limit = self._get_default(self.solver_time_limit, self.SOLVER_TIME_LIMIT)
 
         self.efficiency = self._get_default(self.efficiency, self.DEFAULT_EFFICIENCY)
         self.loss = self._get_default(self.loss, self.DEFAULT_LOSS)  
@@ -7,6 +7,8 @@ from pathlib import Path
 from datetime import datetime
 
 from agents.utils import load_annotation_path, read_change_log, get_latest_change_row
+from agents.database_loader import load_database, schema_dtypes
+from agents.result_store import read_result
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.autoPlanner.phases.initialPlanner.configs.initial_planner_config import InitialPlannerConfig
@@ -85,7 +87,8 @@ class DataLoadingPhase(AtomicPhase):
         return loaded_configs
     
     def _load_dataframes(self,
-                         path_annotation: Dict) -> Dict[str, Any]:
+                         path_annotation: Dict,
+                         databaseSchemas_data: Dict) -> Dict[str, Any]:
         
         # Define dataframes to load
         dataframes_to_load = [
@@ -112,7 +115,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -159,7 +162,7 @@ class DataLoadingPhase(AtomicPhase):
         )
         
         logger.info("📊 Loading DataFrames from parquet files...")
-        loaded_dfs = self._load_dataframes(path_annotation)
+        loaded_dfs = self._load_dataframes(path_annotation, databaseSchemas_data)
 
         self.data_container.update({
             'constant_config': constant_config,
@@ -225,7 +228,7 @@ class DependencyDataLoadingPhase(AtomicPhase):
             logger.info("No change log file found")
             raise FileNotFoundError("No progress tracking change log found")
         
-        progress_tracking_data = pd.read_excel(excel_file_path)
+        progress_tracking_data = read_result(excel_file_path)
 
         self.dependency_data_container.update({"proStatus_df": progress_tracking_data})
 
@@ -273,7 +276,7 @@ class OptionalDependencyDataLoadingPhase(AtomicPhase):
             logger.warning("Stability index file not found")
             return None
         
-        return pd.read_excel(stability_path)
+        return read_result(stability_path)
     
     def _load_mold_machine_feature_weights(self) -> Optional[pd.Series]:
         """Load mold-machine feature weights"""
@@ -572,7 +575,9 @@ class PendingOrderPlanningPhase(AtomicPhase):
             mold_machine_priority_matrix,
             self.config.priority_order,
             self.config.max_load_threshold,
-            self.config.log_progress_interval
+            self.config.log_progress_interval,
+            self.config.solver_mode,
+            self.config.solver_time_limit
             )
         
         return planner.process_planning()
@@ -687,6 +692,8 @@ class InitialPlanner(ConfigReportMixin):
             "priority_order": str,
             'max_load_threshold': int,
             'log_progress_interval': int,
+            'solver_mode': str,
+            'solver_time_limit': float,
             'efficiency': float,
             'loss': float
             }
@@ -718,6 +725,8 @@ class InitialPlanner(ConfigReportMixin):
                 - priority_order (str): Priority ordering strategy
                 - max_load_threshold (int): Maximum allowed load threshold. If None, no load constraint is applied
                 - log_progress_interval (int): Interval at which progress logs are emitted during processing.
+                - solver_mode (str): "greedy" assigners or "optimal" MILP solver (greedy plan kept as fallback)
+                - solver_time_limit (float): Time budget in seconds for the optimal solver
                 - efficiency (float): Production efficiency factor (0.0 to 1.0)
                 - loss (float): Production loss factor (0.0 to 1.0)
         """
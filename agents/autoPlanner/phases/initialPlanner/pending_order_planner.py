@@ -12,7 +12,7 @@ from agents.autoPlanner.tools.compatibility import create_mold_machine_compatibi
 
 from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
-from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder, AssignerResult
+from agents.autoPlanner.assigners.configs.assigner_config import PriorityOrder, SolverMode, AssignerResult
 from dataclasses import dataclass, asdict
 
 @dataclass
@@ -24,6 +24,7 @@ class PendingPlannerResult:
     not_matched_pending: pd.DataFrame
     planner_summary: str
     log_str: str
+    plan_comparison: Optional[Dict] = None
     def to_dict(self) -> Dict:
         """Convert dataclass to dictionary for serialization/logging."""
         return asdict(self)
@@ -43,6 +44,9 @@ class PendingOrderPlanner(ConfigReportMixin):
     Processor for handling pending production assignments using two-tier optimization:
     1. History-based optimization (primary)
     2. Compatibility-based optimization (fallback for unassigned molds)
+
+    With solver_mode="optimal", the greedy plan is compared against an OptimalAssigner
+    plan (MILP over the same priority/compatibility matrices) and the better one is kept.
     """
 
     def __init__(self, 
@@ -57,7 +61,9 @@ class PendingOrderPlanner(ConfigReportMixin):
                  mold_machine_priority_matrix: pd.DataFrame,
                  priority_order: Union[str, PriorityOrder] = "priority_order_1",
                  max_load_threshold: int = 30,
-                 log_progress_interval: int = 5
+                 log_progress_interval: int = 5,
+                 solver_mode: Union[str, SolverMode] = "greedy",
+                 solver_time_limit: float = 30
                  ):
         
         """
@@ -76,6 +82,8 @@ class PendingOrderPlanner(ConfigReportMixin):
             - priority_order: Priority ordering strategy
             - max_load_threshold: Maximum allowed load threshold. If None, no load constraint is applied (default=30)
             - log_progress_interval: Interval for logging progress during optimization (default=10)
+            - solver_mode: "greedy" (default) or "optimal" (MILP plan, greedy plan kept as fallback)
+            - solver_time_limit: Time budget in seconds for the optimal solver (default=30)
         """
 
         self._capture_init_args()
@@ -104,10 +112,14 @@ class PendingOrderPlanner(ConfigReportMixin):
         self.priority_order = priority_order
         self.max_load_threshold = max_load_threshold
         self.log_progress_interval = log_progress_interval
+        self.solver_mode = SolverMode.resolve(solver_mode)
+        self.solver_time_limit = solver_time_limit
 
         """Initialize all data containers to None"""
         self.mold_lead_times = None
         self.not_matched_pending = None
+        self.compatibility_matrix = None
+        self.plan_comparison = None
 
     def process_planning(self) -> PendingPlannerResult:
         """
@@ -173,7 +185,8 @@ class PendingOrderPlanner(ConfigReportMixin):
                 overloaded_machines = overloaded_machines,
                 not_matched_pending = self.not_matched_pending,
                 planner_summary = planner_summary,
-                log_str = "\n".join(planner_log_lines)
+                log_str = "\n".join(planner_log_lines),
+                plan_comparison = self.plan_comparison
                 )
             
         except Exception as e:
@@ -267,6 +280,19 @@ class PendingOrderPlanner(ConfigReportMixin):
             history_result,
             compatibility_result
         )
+
+        # === OPTIONAL: Optimal solver (greedy plan kept as fallback) ===
+        if self.solver_mode == SolverMode.OPTIMAL:
+            optimal_result = self._process_optimal_phase(
+                mold_machine_priority_matrix,
+                mold_lead_times,
+                history_result,
+                compatibility_result
+            )
+            phase_log_lines.append(optimal_result["phase_log"])
+            if optimal_result["use_optimal"]:
+                final_summary = optimal_result["assignment_summary"]
+                final_assignments = optimal_result["assigner_result"]
         
         self.logger.info("✅ Process finished!!!")
         
@@ -473,11 +499,7 @@ class PendingOrderPlanner(ConfigReportMixin):
         
         try:
             # Create compatibility matrix
-            compatibility_matrix = create_mold_machine_compatibility_matrix(
-                self.machineInfo_df, 
-                self.moldInfo_df, 
-                validate_data=True
-            )
+            compatibility_matrix = self._get_compatibility_matrix()
             
             from agents.autoPlanner.assigners.compatibility_based_assigner import CompatibilityBasedAssigner
 
@@ -505,6 +527,128 @@ class PendingOrderPlanner(ConfigReportMixin):
             self.logger.error("Compatibility-based optimization failed: {}", str(e))
             raise
     
+    def _get_compatibility_matrix(self) -> pd.DataFrame:
+        """Create the mold-machine compatibility matrix once per planner"""
+        if self.compatibility_matrix is None:
+            self.compatibility_matrix = create_mold_machine_compatibility_matrix(
+                self.machineInfo_df, 
+                self.moldInfo_df, 
+                validate_data=True
+            )
+        return self.compatibility_matrix
+
+    #----------------------------------------------------------------#
+    # STEP 2-3: OPTIMAL SOLVER (OPTIONAL)                            #
+    #----------------------------------------------------------------#
+    def _process_optimal_phase(self,
+                               mold_machine_priority_matrix: pd.DataFrame,
+                               mold_lead_times: pd.DataFrame,
+                               history_result: Optional[Dict],
+                               compatibility_result: Optional[Dict]) -> Dict[str, Any]:
+
+        """
+        Solve the whole assignment with OptimalAssigner and compare it with the greedy plan.
+
+        The optimal plan is used only if the solver found one and it ranks better
+        (more assigned molds, then less load over the threshold, then shorter makespan);
+        any solver failure keeps the greedy plan.
+        """
+
+        self.logger.info("Starting optimal solver phase ...")
+
+        from agents.autoPlanner.tools.machine_assignment import evaluate_assigned_plan, producing_machine_load
+        from agents.autoPlanner.assigners.configs.assigner_formatter import log_plan_comparison
+
+        total_molds = mold_lead_times['moldNo'].nunique()
+        base_load = producing_machine_load(self.producing_status_data)
+
+        greedy_metrics = evaluate_assigned_plan(
+            [result["assigner_result"].assigned_matrix
+             for result in (history_result, compatibility_result) if result is not None],
+            total_molds, base_load, self.max_load_threshold)
+
+        phase_log_lines = []
+        optimal_metrics = None
+        assigner_result = None
+        solver_status = "not run"
+
+        try:
+            assigner_result, solver_status = self._run_optimal_assigner(mold_machine_priority_matrix,
+                                                                        mold_lead_times)
+            phase_log_lines.append(assigner_result.log)
+            if assigner_result.assignments:
+                optimal_metrics = evaluate_assigned_plan([assigner_result.assigned_matrix],
+                                                         total_molds, base_load, self.max_load_threshold)
+        except Exception as e:
+            solver_status = f"failed ({e})"
+            self.logger.warning("Optimal solver failed, keeping greedy plan: {}", str(e))
+
+        use_optimal = (optimal_metrics is not None and
+                       optimal_metrics.rank_key() < greedy_metrics.rank_key())
+
+        self.plan_comparison = {
+            "solver_status": solver_status,
+            "selected_plan": "optimal" if use_optimal else "greedy",
+            "greedy": greedy_metrics,
+            "optimal": optimal_metrics
+            }
+
+        comparison_log = log_plan_comparison(greedy_metrics, 
+                                             optimal_metrics, 
+                                             solver_status,
+                                             self.plan_comparison["selected_plan"])
+        phase_log_lines.append(comparison_log)
+        self.logger.info("Optimal solver: {}, selected {} plan", solver_status, self.plan_comparison["selected_plan"])
+
+        assignment_summary = None
+        if use_optimal:
+            generator_result = self._generate_production_schedule(
+                assigner_result.assigned_matrix,
+                self.mold_lead_times,
+                self.pending_status_data
+            )
+            assignment_summary = generator_result["result"].copy()
+            assignment_summary['Note'] = 'optimalBased'
+            phase_log_lines.extend(["Assignment summarization completed successfully!",
+                                    generator_result["log_str"]])
+
+        return {
+            "use_optimal": use_optimal,
+            "assigner_result": assigner_result,
+            "assignment_summary": assignment_summary,
+            "phase_log": "\n".join(phase_log_lines)
+            }
+
+    def _run_optimal_assigner(self,
+                              mold_machine_priority_matrix: pd.DataFrame,
+                              mold_lead_times: pd.DataFrame) -> Tuple[AssignerResult, str]:
+        
+        """Run the MILP-based assigner on all pending molds"""
+
+        self.logger.info("Running optimal assigner (time limit: {}s) ...", self.solver_time_limit)
+
+        from agents.autoPlanner.assigners.optimal_assigner import OptimalAssigner
+
+        assigner = OptimalAssigner(
+            mold_machine_priority_matrix,
+            mold_lead_times,
+            self.producing_status_data,
+            self.machine_info_df,
+            self._get_compatibility_matrix(),
+            self.max_load_threshold,
+            self.solver_time_limit
+        )
+
+        results = assigner.run_assign()
+
+        self.logger.info(
+            "\nOptimal - Assigned: {} molds, Unassigned: {} molds", 
+            len(results.assignments), 
+            len(results.unassigned_molds)
+        )
+
+        return results, assigner.solver_status
+
     def _combine_assignments(self, 
                              hist_based_df: pd.DataFrame, 
                              compatibility_based_df: pd.DataFrame) -> pd.DataFrame:
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 from typing import Dict, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
 from agents.utils import log_dict_as_table
 from loguru import logger
 
@@ -12,7 +13,9 @@ def calculate_feature_confidence_scores(
         n_bootstrap: int = 1000,
         confidence_level: float = 0.95,
         min_sample_size: int = 10,
-        sample_size_threshold: int = 50
+        sample_size_threshold: int = 50,
+        random_state: Optional[int] = 42,
+        max_workers: Optional[int] = 1
         ) -> Dict[str, Dict[str, float]]:
 
     """
@@ -26,140 +29,179 @@ def calculate_feature_confidence_scores(
         n_bootstrap (int): Number of bootstrap iterations (default: 1000).
         confidence_level (float): Desired confidence level (default: 0.95).
         min_sample_size (int): Minimum required sample size for valid confidence computation.
+        random_state (Optional[int]): Seed of the local random generator (default: 42 for reproducibility).
+        max_workers (Optional[int]): Number of threads used to score features in parallel (default: 1).
 
     Returns:
         Dict[str, Dict[str, float]]: A dictionary containing confidence scores and statistics per feature.
     """
 
-    results = {}
-    alpha = 1 - confidence_level
-
     features = list(targets.keys())
-    for feature in features:
-        if feature not in good_hist_df.columns or feature not in bad_hist_df.columns:
-            results[feature] = {
-                'good_confidence': 0.0,
-                'bad_confidence': 0.0,
-                'separation_confidence': 0.0,
-                'sample_size_good': 0,
-                'sample_size_bad': 0,
-                'warning': f'Feature {feature} not found in data'
-            }
-            continue
 
-        # Drop NaN values from both groups
-        good_data = good_hist_df[feature].dropna()
-        bad_data = bad_hist_df[feature].dropna()
-
-        sample_size_good = len(good_data)
-        sample_size_bad = len(bad_data)
-
-        # Check for minimum sample size
-        if sample_size_good < min_sample_size or sample_size_bad < min_sample_size:
-            results[feature] = {
-                'good_confidence': 0.5,  # Neutral confidence
-                'bad_confidence': 0.5,
-                'separation_confidence': 0.0,
-                'sample_size_good': sample_size_good,
-                'sample_size_bad': sample_size_bad,
-                'warning': f'Sample size too small (good: {sample_size_good}, bad: {sample_size_bad})'
-            }
-            continue
+    # One independent generator per feature: results do not depend on scheduling order
+    seeds = np.random.SeedSequence(random_state).spawn(len(features))
 
-        # Bootstrap sampling to estimate distributions
-        good_bootstrap_means = []
-        bad_bootstrap_means = []
+    def score(feature: str, seed: np.random.SeedSequence) -> Dict[str, float]:
+        return _calculate_single_feature_confidence(
+            good_hist_df, bad_hist_df, feature, targets[feature],
+            np.random.default_rng(seed), n_bootstrap, confidence_level,
+            min_sample_size, sample_size_threshold)
 
-        np.random.seed(42)  # For reproducibility
+    if max_workers is not None and max_workers > 1 and len(features) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(features))) as executor:
+            scores = list(executor.map(score, features, seeds))
+    else:
+        scores = [score(feature, seed) for feature, seed in zip(features, seeds)]
 
-        for _ in range(n_bootstrap):
-            good_sample = np.random.choice(good_data, size=min(len(good_data), 
-                                                                sample_size_threshold), replace=True)
-            bad_sample = np.random.choice(bad_data, size=min(len(bad_data), 
-                                                                sample_size_threshold), replace=True)
-            good_bootstrap_means.append(np.mean(good_sample))
-            bad_bootstrap_means.append(np.mean(bad_sample))
+    return dict(zip(features, scores))
 
-        good_bootstrap_means = np.array(good_bootstrap_means)
-        bad_bootstrap_means = np.array(bad_bootstrap_means)
+def bootstrap_means(values: np.ndarray,
+                    n_bootstrap: int,
+                    sample_size: int,
+                    rng: np.random.Generator,
+                    max_chunk_elements: int = 10_000_000) -> np.ndarray:
 
-        # Confidence intervals
-        good_ci_lower = np.percentile(good_bootstrap_means, (alpha / 2) * 100)
-        good_ci_upper = np.percentile(good_bootstrap_means, (1 - alpha / 2) * 100)
-        bad_ci_lower = np.percentile(bad_bootstrap_means, (alpha / 2) * 100)
-        bad_ci_upper = np.percentile(bad_bootstrap_means, (1 - alpha / 2) * 100)
+    """
+    Means of `n_bootstrap` resamples (with replacement) of `sample_size` values.
 
-        # Target-based confidence scoring
-        target_value = targets[feature]
+    All resample indices are drawn at once as an (n_bootstrap, sample_size) matrix and
+    reduced row-wise; very large requests are processed in chunks of bounded size.
+    """
 
-        if target_value == 'minimize':
-            # Smaller is better
-            good_target_achievement = np.mean(good_bootstrap_means < np.mean(bad_bootstrap_means))
-            bad_target_achievement = np.mean(bad_bootstrap_means > np.mean(good_bootstrap_means))
+    values = np.asarray(values, dtype='float64')
+    rows_per_chunk = max(1, max_chunk_elements // max(sample_size, 1))
 
-            good_distance_from_ideal = np.mean(np.abs(good_bootstrap_means))
-            bad_distance_from_ideal = np.mean(np.abs(bad_bootstrap_means))
-        else:
-            # Closer to the target is better
-            good_distance_from_target = np.mean(np.abs(good_bootstrap_means - target_value))
-            bad_distance_from_target = np.mean(np.abs(bad_bootstrap_means - target_value))
-
-            good_target_achievement = np.mean(
-                np.abs(good_bootstrap_means - target_value) <
-                np.abs(bad_bootstrap_means - target_value)
-            )
-            bad_target_achievement = 1 - good_target_achievement
-
-            good_distance_from_ideal = good_distance_from_target
-            bad_distance_from_ideal = bad_distance_from_target
-
-        # Separation confidence using CI overlap
-        overlap = max(0, min(good_ci_upper, bad_ci_upper) - max(good_ci_lower, bad_ci_lower))
-        total_range = max(good_ci_upper, bad_ci_upper) - min(good_ci_lower, bad_ci_lower)
-        separation_confidence = 1 - (overlap / max(total_range, 0.001))
-
-        # Statistical test (Mann-Whitney U) to detect significant difference
-        try:
-            stat, p_value = stats.mannwhitneyu(good_data, bad_data, alternative='two-sided')
-            statistical_significance = 1 - p_value
-        except:
-            statistical_significance = 0.5
-
-        # Final confidence score calculations
-        good_confidence = (
-            good_target_achievement * 0.4 +
-            separation_confidence * 0.3 +
-            statistical_significance * 0.2 +
-            (1 / (1 + good_distance_from_ideal)) * 0.1
-        )
-        bad_confidence = (
-            bad_target_achievement * 0.4 +
-            separation_confidence * 0.3 +
-            statistical_significance * 0.2 +
-            (1 / (1 + bad_distance_from_ideal)) * 0.1
-        )
+    means = np.empty(n_bootstrap, dtype='float64')
+    for start in range(0, n_bootstrap, rows_per_chunk):
+        stop = min(start + rows_per_chunk, n_bootstrap)
+        indices = rng.integers(0, len(values), size=(stop - start, sample_size))
+        means[start:stop] = values[indices].mean(axis=1)
+
+    return means
+
+def _calculate_single_feature_confidence(
+        good_hist_df: pd.DataFrame,
+        bad_hist_df: pd.DataFrame,
+        feature: str,
+        target_value: Union[float, str],
+        rng: np.random.Generator,
+        n_bootstrap: int,
+        confidence_level: float,
+        min_sample_size: int,
+        sample_size_threshold: int
+        ) -> Dict[str, float]:
+
+    """Confidence scores of one feature (see calculate_feature_confidence_scores)."""
+
+    alpha = 1 - confidence_level
 
-        # Ensure within [0, 1]
-        good_confidence = max(0, min(1, good_confidence))
-        bad_confidence = max(0, min(1, bad_confidence))
+    if feature not in good_hist_df.columns or feature not in bad_hist_df.columns:
+        return {
+            'good_confidence': 0.0,
+            'bad_confidence': 0.0,
+            'separation_confidence': 0.0,
+            'sample_size_good': 0,
+            'sample_size_bad': 0,
+            'warning': f'Feature {feature} not found in data'
+        }
+
+    # Drop NaN values from both groups
+    good_data = good_hist_df[feature].dropna()
+    bad_data = bad_hist_df[feature].dropna()
 
-        results[feature] = {
-            'good_confidence': round(good_confidence, 3),
-            'bad_confidence': round(bad_confidence, 3),
-            'separation_confidence': round(separation_confidence, 3),
-            'statistical_significance': round(statistical_significance, 3),
+    sample_size_good = len(good_data)
+    sample_size_bad = len(bad_data)
+
+    # Check for minimum sample size
+    if sample_size_good < min_sample_size or sample_size_bad < min_sample_size:
+        return {
+            'good_confidence': 0.5,  # Neutral confidence
+            'bad_confidence': 0.5,
+            'separation_confidence': 0.0,
             'sample_size_good': sample_size_good,
             'sample_size_bad': sample_size_bad,
-            'good_mean': round(np.mean(good_data), 4),
-            'bad_mean': round(np.mean(bad_data), 4),
-            'good_ci_lower': round(good_ci_lower, 4),
-            'good_ci_upper': round(good_ci_upper, 4),
-            'bad_ci_lower': round(bad_ci_lower, 4),
-            'bad_ci_upper': round(bad_ci_upper, 4),
-            'p_value': round(1 - statistical_significance, 4) if statistical_significance != 0.5 else 0.5
+            'warning': f'Sample size too small (good: {sample_size_good}, bad: {sample_size_bad})'
         }
 
-    return results
+    # Bootstrap sampling to estimate distributions
+    good_bootstrap_means = bootstrap_means(good_data.to_numpy(), n_bootstrap,
+                                           min(sample_size_good, sample_size_threshold), rng)
+    bad_bootstrap_means = bootstrap_means(bad_data.to_numpy(), n_bootstrap,
+                                          min(sample_size_bad, sample_size_threshold), rng)
+
+    # Confidence intervals
+    good_ci_lower = np.percentile(good_bootstrap_means, (alpha / 2) * 100)
+    good_ci_upper = np.percentile(good_bootstrap_means, (1 - alpha / 2) * 100)
+    bad_ci_lower = np.percentile(bad_bootstrap_means, (alpha / 2) * 100)
+    bad_ci_upper = np.percentile(bad_bootstrap_means, (1 - alpha / 2) * 100)
+
+    # Target-based confidence scoring
+    if target_value == 'minimize':
+        # Smaller is better
+        good_target_achievement = np.mean(good_bootstrap_means < np.mean(bad_bootstrap_means))
+        bad_target_achievement = np.mean(bad_bootstrap_means > np.mean(good_bootstrap_means))
+
+        good_distance_from_ideal = np.mean(np.abs(good_bootstrap_means))
+        bad_distance_from_ideal = np.mean(np.abs(bad_bootstrap_means))
+    else:
+        # Closer to the target is better
+        good_distance_from_target = np.mean(np.abs(good_bootstrap_means - target_value))
+        bad_distance_from_target = np.mean(np.abs(bad_bootstrap_means - target_value))
+
+        good_target_achievement = np.mean(
+            np.abs(good_bootstrap_means - target_value) <
+            np.abs(bad_bootstrap_means - target_value)
+        )
+        bad_target_achievement = 1 - good_target_achievement
+
+        good_distance_from_ideal = good_distance_from_target
+        bad_distance_from_ideal = bad_distance_from_target
+
+    # Separation confidence using CI overlap
+    overlap = max(0, min(good_ci_upper, bad_ci_upper) - max(good_ci_lower, bad_ci_lower))
+    total_range = max(good_ci_upper, bad_ci_upper) - min(good_ci_lower, bad_ci_lower)
+    separation_confidence = 1 - (overlap / max(total_range, 0.001))
+
+    # Statistical test (Mann-Whitney U) to detect significant difference
+    try:
+        stat, p_value = stats.mannwhitneyu(good_data, bad_data, alternative='two-sided')
+        statistical_significance = 1 - p_value
+    except:
+        statistical_significance = 0.5
+
+    # Final confidence score calculations
+    good_confidence = (
+        good_target_achievement * 0.4 +
+        separation_confidence * 0.3 +
+        statistical_significance * 0.2 +
+        (1 / (1 + good_distance_from_ideal)) * 0.1
+    )
+    bad_confidence = (
+        bad_target_achievement * 0.4 +
+        separation_confidence * 0.3 +
+        statistical_significance * 0.2 +
+        (1 / (1 + bad_distance_from_ideal)) * 0.1
+    )
+
+    # Ensure within [0, 1]
+    good_confidence = max(0, min(1, good_confidence))
+    bad_confidence = max(0, min(1, bad_confidence))
+
+    return {
+        'good_confidence': round(good_confidence, 3),
+        'bad_confidence': round(bad_confidence, 3),
+        'separation_confidence': round(separation_confidence, 3),
+        'statistical_significance': round(statistical_significance, 3),
+        'sample_size_good': sample_size_good,
+        'sample_size_bad': sample_size_bad,
+        'good_mean': round(np.mean(good_data), 4),
+        'bad_mean': round(np.mean(bad_data), 4),
+        'good_ci_lower': round(good_ci_lower, 4),
+        'good_ci_upper': round(good_ci_upper, 4),
+        'bad_ci_lower': round(bad_ci_lower, 4),
+        'bad_ci_upper': round(bad_ci_upper, 4),
+        'p_value': round(1 - statistical_significance, 4) if statistical_significance != 0.5 else 0.5
+    }
 
 def calculate_overall_confidence(
         confidence_scores: Dict[str, Dict[str, float]],
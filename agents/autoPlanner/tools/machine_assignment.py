@@ -1,6 +1,7 @@
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
+from agents.autoPlanner.assigners.configs.assigner_config import PlanMetrics
 
 # CompatibilityBasedAssigner helper functions
 def find_best_machine(suitable_machines: List[str],
@@ -31,26 +32,43 @@ def find_best_machine(suitable_machines: List[str],
 
     return machine_scores[0][0]
     
-def update_machine_dataframe_optimized(machine_df: pd.DataFrame,
-                                       machine_code: str,
-                                       mold_id: str,
-                                       lead_time: int
-                                       ) -> pd.DataFrame:
-    
-    """Update machine DataFrame with new assignment (optimized version)"""
-    
-    df = machine_df.copy()
-    
-    # Create new row efficiently
-    new_row_data = {col: 0 for col in df.columns}
-    new_row_data[machine_code] = lead_time
-    
-    new_row_df = pd.DataFrame([new_row_data], index=[mold_id])
-    
-    # Concatenate efficiently
-    df = pd.concat([df, new_row_df], ignore_index=False)
-    
-    return df
+def build_assigned_matrix(columns: pd.Index,
+                          assigned_rows: List[Tuple[str, str, int]]
+                          ) -> pd.DataFrame:
+
+    """
+    Build the mold-machine assignment matrix from (moldNo, machineCode, leadTime) rows
+    in one step, with the same layout as appending one row per assignment
+    (rows in assignment order, unseen machines appended as new columns).
+    """
+
+    assigned_matrix = pd.DataFrame(columns=columns)
+    if not assigned_rows:
+        return assigned_matrix
+
+    row_columns = list(columns)
+    known_columns = set(row_columns)
+    rows = []
+    for _, machine_code, lead_time in assigned_rows:
+        if machine_code not in known_columns:
+            row_columns.append(machine_code)
+            known_columns.add(machine_code)
+        row = dict.fromkeys(row_columns, 0)
+        row[machine_code] = lead_time
+        rows.append(row)
+
+    new_rows_df = pd.DataFrame(rows, index=[mold_id for mold_id, _, _ in assigned_rows])
+
+    return pd.concat([assigned_matrix, new_rows_df], ignore_index=False)
+
+def label_index_map(labels: pd.Index) -> Dict[str, int]:
+
+    """Map labels to integer positions (first occurrence wins)."""
+
+    index_map = {}
+    for position, label in enumerate(labels):
+        index_map.setdefault(label, position)
+    return index_map
 
 # HistoryBasedAssigner helper functions
 def create_binary_priority_matrix(
@@ -139,4 +157,53 @@ def create_candidate_lead_time_matrix(mold_machine_priority_matrix: pd.DataFrame
 
     candidate_lead_time_matrix = best_leadtime_matrix[~(best_leadtime_matrix == 0).all(axis=1)]
 
-    return candidate_lead_time_matrix
\ No newline at end of file
+    return candidate_lead_time_matrix
+
+# OptimalAssigner helper functions
+def producing_machine_load(producing_df: pd.DataFrame) -> Dict[str, int]:
+
+    """Remaining production time (days) per machine; empty if producing data has no remainTime."""
+
+    if producing_df is None or producing_df.empty or 'remainTime' not in producing_df.columns:
+        return {}
+
+    machine_load = {}
+    for _, machine_code, leadtime in convert_producing_leadtime(producing_df):
+        machine_load[machine_code] = machine_load.get(machine_code, 0) + leadtime
+
+    return machine_load
+
+def evaluate_assigned_plan(assigned_matrices: List[pd.DataFrame],
+                           total_molds: int,
+                           base_load: Dict[str, int],
+                           max_load_threshold: Optional[int] = None) -> PlanMetrics:
+
+    """
+    Measure an assignment plan given as (mold x machine) lead time matrices.
+
+    Machine load = producing load + assigned lead times; makespan is the highest machine load.
+    """
+
+    matrices = [matrix for matrix in assigned_matrices if matrix is not None and not matrix.empty]
+    if matrices:
+        plan = pd.concat(matrices, axis=0).apply(pd.to_numeric, errors='coerce').fillna(0)
+    else:
+        plan = pd.DataFrame(dtype='float64')
+
+    assigned_molds = plan.index[(plan > 0).any(axis=1)].unique()
+
+    machine_load = {machine: float(load) for machine, load in base_load.items()}
+    for machine, load in plan.sum(axis=0).items():
+        machine_load[machine] = machine_load.get(machine, 0.0) + float(load)
+
+    loads = np.array(list(machine_load.values()), dtype='float64')
+    overload = (float(np.clip(loads - max_load_threshold, 0, None).sum())
+                if max_load_threshold is not None and len(loads) else 0.0)
+
+    return PlanMetrics(
+        assigned_molds=len(assigned_molds),
+        unassigned_molds=max(total_molds - len(assigned_molds), 0),
+        makespan=float(loads.max()) if len(loads) else 0.0,
+        total_lead_time=float(plan.to_numpy().sum()),
+        overload=overload,
+        machine_load=machine_load)
@@ -35,13 +35,23 @@ def summarize_mold_machine_history(
         shiftCavities=('moldCavity', 'mean'),
     ).reset_index()
 
-    # Step 2: Merge with mold info
-    result_df = summary.merge(
-        capacity_mold_info_df[['moldNo', 'moldCavityStandard', 'moldSettingCycle', 
-                                'machineTonnage', 'balancedMoldHourCapacity']],
-        on='moldNo',
-        how='left'
-    )
+    return summarize_mold_machine_performance(summary, capacity_mold_info_df)
+
+def summarize_mold_machine_performance(
+        summary: pd.DataFrame,
+        capacity_mold_info_df: pd.DataFrame) -> pd.DataFrame:
+
+    """
+    Calculate performance metrics from per (moldNo, machineCode) aggregates.
+
+    Args:
+        summary (pd.DataFrame): One row per (moldNo, machineCode) with shiftsUsed, totalQuantity,
+            totalGoodQuantity, shiftShots and shiftCavities (as summarize_mold_machine_history groups them).
+        capacity_mold_info_df (pd.DataFrame): Mold information dataframe.
+
+    Returns:
+        pd.DataFrame: Performance statistics for each (moldNo, machineCode) pair.
+    """
 
     # Step 2: Merge with mold info
     result_df = summary.merge(
@@ -23,6 +23,9 @@ from configs.shared.agent_report_format import (
 # Import unified ExecutableWrapper
 from configs.shared.executable_wrapper import ExecutableWrapper
 
+from agents.dashboardBuilder.plotters.utils import setup_parallel_config
+from agents.dashboardBuilder.plotters.plotting_pool import get_plotting_pool
+
 # ============================================
 # DASHBOARD BUILDER
 # ============================================
@@ -120,6 +123,12 @@ class DashboardBuilder(ConfigReportMixin):
         # Store orchestrator result for visualization services
         self._orchestrator_result: Optional[ExecutionResult] = None
 
+    def _start_plotting_pool(self) -> None:
+        """Start the persistent plotting pool used by all visualization pipelines."""
+        enable_parallel, max_workers = setup_parallel_config()
+        if enable_parallel:
+            get_plotting_pool().start(max_workers)
+
     def build_dashboard(self) -> ExecutionResult:
         """
         Execute the complete dashboard builder pipeline.
@@ -146,6 +155,9 @@ class DashboardBuilder(ConfigReportMixin):
         # STEP 1: RUN ANALYTICS ORCHESTRATOR
         # ============================================
         if self.config.enable_analytics_orchestrator:
+            # Start the shared plotting workers now: they warm up while the analyzers run
+            self._start_plotting_pool()
+
             self.logger.info("📊 Running AnalyticsOrchestrator to generate data...")
             
             try:
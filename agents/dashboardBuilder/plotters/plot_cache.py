@@ -0,0 +1,306 @@
+"""
+Render cache of the visualization pipelines.
+
+Every dashboard build re-rendered all plots, even when the analyzer outputs behind them had
+not changed. A plot task (plot_single_chart) is now looked up by a fingerprint of:
+
+- its input data (DataFrames hashed by content, other arguments by value),
+- the visualization config file contents,
+- the plotter code version (source of the plotter module and of plotters/utils.py),
+- the plot name, kwargs and resolved render profile.
+
+On a hit, the files saved by the previous render are hard-linked (or copied) to the task's
+output paths instead of re-plotting. Entries are evicted by age (last use) and total size.
+
+Layout of the cache directory:
+
+    {cache_dir}/{fingerprint}/entry.json      output file name tails ("_page1.png", ".png"...)
+    {cache_dir}/{fingerprint}/{i}{suffix}     rendered files
+"""
+
+from loguru import logger
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import pandas as pd
+
+from agents.dashboardBuilder.plotters.utils import (
+    execute_tasks, load_render_profile, plot_single_chart)
+
+PLOT_CACHE_DIR_NAME = "plot_cache"  # Cache directory inside each visualization pipeline directory
+PLOT_CACHE_ENTRY_FILE = "entry.json"
+DEFAULT_MAX_AGE_DAYS = float(os.environ.get("OPTIMOLDIQ_PLOT_CACHE_MAX_AGE_DAYS", 7))
+DEFAULT_MAX_SIZE_MB = float(os.environ.get("OPTIMOLDIQ_PLOT_CACHE_MAX_SIZE_MB", 512))
+
+_UTILS_SOURCE = Path(__file__).with_name("utils.py")
+
+#--------------#
+# Fingerprints #
+#--------------#
+@lru_cache(maxsize=None)
+def _file_digest(path: str, mtime_ns: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def file_digest(path: Optional[str]) -> str:
+    """Digest of a file's contents ("missing" if it does not exist)."""
+    if not path or not os.path.isfile(path):
+        return "missing"
+    return _file_digest(str(path), os.stat(path).st_mtime_ns)
+
+def plotter_version(func: Callable) -> str:
+    """Code version of a plotter: its module source and the shared plotting helpers."""
+    try:
+        source_path = inspect.getsourcefile(func)
+    except TypeError:
+        source_path = None
+    return f"{file_digest(source_path)}:{file_digest(str(_UTILS_SOURCE))}"
+
+def _update_with_series(h: "hashlib._Hash", values: pd.Series | pd.Index) -> None:
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False)
+    except TypeError:
+        # Unhashable values (lists, dicts): hash their repr, as written to Excel
+        hashed = pd.util.hash_pandas_object(pd.Series(values).map(repr), index=False)
+    h.update(hashed.to_numpy().tobytes())
+
+def _frame_digest(df: pd.DataFrame) -> bytes:
+    h = hashlib.sha256()
+    h.update(f"DataFrame{df.shape}{list(df.columns)}{list(df.dtypes.astype(str))}".encode())
+    for i in range(df.shape[1]):
+        _update_with_series(h, df.iloc[:, i])
+    _update_with_series(h, df.index)
+    return h.digest()
+
+def _update_with_value(h: "hashlib._Hash", value: Any, frame_digests: Dict[int, bytes]) -> None:
+    if isinstance(value, pd.DataFrame):
+        # Several plots of a pipeline share the same frames: hash each one once
+        if id(value) not in frame_digests:
+            frame_digests[id(value)] = _frame_digest(value)
+        h.update(frame_digests[id(value)])
+    elif isinstance(value, pd.Series):
+        h.update(f"Series{value.name}{value.dtype}".encode())
+        _update_with_series(h, value)
+        _update_with_series(h, value.index)
+    elif isinstance(value, (tuple, list)):
+        h.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_with_value(h, item, frame_digests)
+    elif isinstance(value, dict):
+        h.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            h.update(repr(key).encode())
+            _update_with_value(h, value[key], frame_digests)
+    else:
+        h.update(repr(value).encode())
+
+def task_fingerprint(task: Tuple, frame_digests: Optional[Dict[int, bytes]] = None) -> str:
+    """
+    Fingerprint of a plot_single_chart task (independent of its output path).
+    `frame_digests` (id -> digest) can be shared by the tasks of one run, while their frames are alive.
+    """
+    data, config_path, name, func, path, timestamp_file, kwargs = task[:7]
+    render_profile = task[7] if len(task) > 7 else None
+    frame_digests = {} if frame_digests is None else frame_digests
+
+    h = hashlib.sha256()
+    _update_with_value(h, data, frame_digests)
+    _update_with_value(h, kwargs, frame_digests)
+    h.update(name.encode())
+    h.update(file_digest(config_path).encode())
+    h.update(f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}".encode())
+    h.update(plotter_version(func).encode())
+    h.update(json.dumps(load_render_profile(config_path, render_profile), sort_keys=True).encode())
+    return h.hexdigest()
+
+#-------#
+# Cache #
+#-------#
+class PlotRenderCache:
+    """Rendered plot files by task fingerprint, with age and size eviction"""
+
+    def __init__(self,
+                 cache_dir: Path | str,
+                 max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_days = max_age_days
+        self.max_size_mb = max_size_mb
+
+    def restore(self, fingerprint: str, path: str) -> Optional[List[str]]:
+        """Link the cached files of `fingerprint` to the output paths of `path`; None on a miss."""
+        entry_dir = self.cache_dir / fingerprint
+        try:
+            with open(entry_dir / PLOT_CACHE_ENTRY_FILE, "r", encoding="utf-8") as f:
+                tails = json.load(f)["tails"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+        target = Path(path)
+        restored = []
+        try:
+            for i, tail in enumerate(tails):
+                output_path = target.with_name(target.stem + tail)
+                _link_or_copy(entry_dir / _entry_file_name(i, tail), output_path)
+                restored.append(str(output_path))
+        except OSError as e:
+            logger.warning("Could not restore cached plot {}: {}", fingerprint[:12], e)
+            return None
+
+        # Last use time, for age eviction
+        os.utime(entry_dir / PLOT_CACHE_ENTRY_FILE)
+        return restored
+
+    def store(self, fingerprint: str, path: str, output_paths: List[str]) -> None:
+        """Add the rendered files of a task (written to a temporary entry, then renamed)."""
+        entry_dir = self.cache_dir / fingerprint
+        if entry_dir.exists():
+            return
+
+        stem = Path(path).stem
+        tails = []
+        for output_path in output_paths:
+            name = Path(output_path).name
+            if not name.startswith(stem):
+                logger.debug("Not caching plot with unexpected output name: {}", output_path)
+                return
+            tails.append(name[len(stem):])
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp_", dir=self.cache_dir))
+        try:
+            for i, (output_path, tail) in enumerate(zip(output_paths, tails)):
+                _link_or_copy(Path(output_path), tmp_dir / _entry_file_name(i, tail))
+            with open(tmp_dir / PLOT_CACHE_ENTRY_FILE, "w", encoding="utf-8") as f:
+                json.dump({"tails": tails}, f)
+            os.rename(tmp_dir, entry_dir)
+        except OSError as e:
+            # Entry added concurrently or files gone: the plot is just not cached
+            logger.debug("Could not cache plot {}: {}", fingerprint[:12], e)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def evict(self) -> int:
+        """Remove entries unused for max_age_days, then the least recently used above max_size_mb."""
+        if not self.cache_dir.is_dir():
+            return 0
+
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            entry_file = entry_dir / PLOT_CACHE_ENTRY_FILE
+            if not entry_file.is_file():
+                continue
+            size = sum(f.stat().st_size for f in entry_dir.iterdir() if f.is_file())
+            entries.append((entry_file.stat().st_mtime, size, entry_dir))
+
+        entries.sort()
+        max_age_cutoff = time.time() - self.max_age_days * 86400
+        max_size = self.max_size_mb * 1024 * 1024
+        total_size = sum(size for _, size, _ in entries)
+
+        removed = 0
+        for last_used, size, entry_dir in entries:
+            if last_used >= max_age_cutoff and total_size <= max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            removed += 1
+
+        if removed:
+            logger.debug("Evicted {} plot cache entries from {}", removed, self.cache_dir)
+        return removed
+
+def _entry_file_name(index: int, tail: str) -> str:
+    # Tails can be a bare extension (".png"), which Path would read as a hidden file name
+    return f"{index}{Path('plot' + tail).suffix}"
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+#-----------#
+# Execution #
+#-----------#
+def run_plot_tasks(tasks: List[Tuple],
+                   enable_parallel: bool,
+                   max_workers: int,
+                   plot_cache_dir: Optional[Path | str] = None
+                   ) -> Tuple[List[Tuple], List[str]]:
+    """
+    Run plot_single_chart tasks (as execute_tasks), reusing cached renders when
+    `plot_cache_dir` is set. Cached tasks are returned as successful results.
+    """
+    if plot_cache_dir is None:
+        return execute_tasks(
+            tasks=tasks,
+            worker_function=plot_single_chart,
+            enable_parallel=enable_parallel,
+            max_workers=max_workers,
+            executor_type="process",  # CPU-bound plotting operations
+            task_name_extractor=lambda task: task[2]  # Extract name from task
+        )
+
+    cache = PlotRenderCache(plot_cache_dir)
+    cached_results = []
+    pending: List[Tuple] = []
+    fingerprints: Dict[str, Tuple[str, str]] = {}  # output path key -> (fingerprint, output path)
+    frame_digests: Dict[int, bytes] = {}
+
+    for task in tasks:
+        name, path = task[2], task[4]
+        start_time = time.time()
+        try:
+            fingerprint = task_fingerprint(task, frame_digests)
+        except Exception as e:
+            logger.debug("Plot '{}' not cacheable: {}", name, e)
+            pending.append(task)
+            continue
+
+        restored = cache.restore(fingerprint, path)
+        if restored is None:
+            pending.append(task)
+            fingerprints[_output_key(path)] = (fingerprint, path)
+        else:
+            cached_results.append((True, name, restored, "", time.time() - start_time))
+
+    logger.info("Plot cache: {} cached, {} to render", len(cached_results), len(pending))
+    if not pending:
+        return cached_results, []
+
+    raw_results, failed_tasks = execute_tasks(
+        tasks=pending,
+        worker_function=plot_single_chart,
+        enable_parallel=enable_parallel,
+        max_workers=max_workers,
+        executor_type="process",
+        task_name_extractor=lambda task: task[2]
+    )
+
+    # Results arrive in completion order and plot names need not be unique:
+    # match them to their task by output path
+    for success, _, path_collection, _, _ in raw_results:
+        if not (success and path_collection):
+            continue
+        first_output = _output_key(path_collection[0])
+        for key in (first_output, re.sub(r"_page1$", "", first_output)):
+            if key in fingerprints:
+                cache.store(*fingerprints.pop(key), path_collection)
+                break
+    cache.evict()
+
+    return cached_results + raw_results, failed_tasks
+
+def _output_key(path: str) -> str:
+    # Output path without the extension (the render profile can change it)
+    return str(Path(path).with_suffix(""))
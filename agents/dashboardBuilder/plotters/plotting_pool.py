@@ -0,0 +1,222 @@
+"""
+Persistent plotting worker pool shared by all visualization pipelines.
+
+execute_tasks_parallel used to create a new ProcessPoolExecutor for every pipeline run, so
+each dashboard build paid for starting the workers (and their first matplotlib draw, font
+lookup and style setup) once per pipeline, and pickled the DataFrame of every task into
+the worker, once per task even when several plots share the same frame.
+
+PlottingPool keeps one process pool alive for the life of the process (DashboardBuilder
+runs, OptiMoldIQ sessions):
+
+- Workers are warmed up once when they start (warm_up_worker): Agg backend, seaborn,
+  adjustText and a first draw, which loads the font cache and text rendering.
+- DataFrames of a batch of tasks are written once to uncompressed Arrow IPC files (in
+  /dev/shm when available) and passed as SharedFrame handles. Workers memory-map them and
+  keep the last decoded frames, so plots sharing a frame decode it once per worker.
+  Frames Arrow cannot represent exactly are still passed inline (pickled).
+- The pool only grows: a request for more workers than it has restarts it while no batch
+  is running, otherwise the existing workers are used.
+"""
+
+from loguru import logger
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from pathlib import Path
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import pandas as pd
+import pyarrow as pa
+
+DEFAULT_SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Decoded shared frames kept per worker (plots of one pipeline share a few frames)
+WORKER_FRAME_CACHE_SIZE = 4
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Handle of a DataFrame written to an Arrow IPC file for the workers"""
+    path: str
+
+#-------------#
+# Worker side #
+#-------------#
+_worker_frames: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+def warm_up_worker() -> None:
+    """Load plotting libraries, fonts and text rendering once per worker process."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn  # noqa: F401 - imported by every plotter
+    try:
+        import adjustText  # noqa: F401 - optional, used by scatter labels
+    except ImportError:
+        pass
+
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot([0, 1], [0, 1], label="warm-up")
+    ax.set_title("warm-up")
+    ax.legend()
+    fig.canvas.draw()
+    plt.close(fig)
+
+def _load_shared_frame(handle: SharedFrame) -> pd.DataFrame:
+    df = _worker_frames.get(handle.path)
+    if df is None:
+        # The decoded buffers reference the mapping, which stays open while they are alive
+        df = pa.ipc.open_file(pa.memory_map(handle.path, "r")).read_all().to_pandas()
+        _worker_frames[handle.path] = df
+        while len(_worker_frames) > WORKER_FRAME_CACHE_SIZE:
+            _worker_frames.popitem(last=False)
+    else:
+        _worker_frames.move_to_end(handle.path)
+    # Plotters may add columns: keep the cached frame unchanged
+    return df.copy(deep=False)
+
+def _resolve(value: Any) -> Any:
+    if isinstance(value, SharedFrame):
+        return _load_shared_frame(value)
+    if isinstance(value, tuple):
+        return tuple(_resolve(v) for v in value)
+    return value
+
+def run_shared_task(worker_function: Callable, task: Any) -> Any:
+    """Worker entry point: replace SharedFrame handles by their frames, then run the task."""
+    return worker_function(_resolve(task))
+
+def _noop() -> None:
+    return None
+
+#-------------#
+# Parent side #
+#-------------#
+def _is_shareable(df: pd.DataFrame) -> bool:
+    """Arrow round-trips the frame with the same columns and dtypes (pandas metadata)."""
+    if not df.columns.is_unique or not all(isinstance(c, str) for c in df.columns):
+        return False
+    # Object columns (lists, dicts, mixed types...) may come back with other values or dtypes
+    return not any(dtype == object for dtype in df.dtypes)
+
+def share_frames(tasks: List[Any], batch_dir: Path | str) -> List[Any]:
+    """
+    Copy of `tasks` where every DataFrame (at the top level of a task tuple or inside a
+    tuple element) is written once to `batch_dir` and replaced by a SharedFrame handle.
+    """
+    batch_dir = Path(batch_dir)
+    handles: Dict[int, Any] = {}
+
+    def share(value: Any) -> Any:
+        if isinstance(value, tuple):
+            return tuple(share(v) for v in value)
+        if not isinstance(value, pd.DataFrame):
+            return value
+        key = id(value)
+        if key not in handles:
+            handles[key] = _write_frame(value, batch_dir / f"{len(handles)}.arrow")
+        return handles[key]
+
+    return [share(task) for task in tasks]
+
+def _write_frame(df: pd.DataFrame, path: Path) -> Any:
+    if not _is_shareable(df):
+        return df
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError):
+        return df
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return SharedFrame(str(path))
+
+class PlottingPool:
+    """Long-lived, pre-warmed ProcessPoolExecutor for plotting tasks"""
+
+    def __init__(self, shared_dir: Optional[str] = DEFAULT_SHARED_DIR):
+        self.shared_dir = shared_dir
+        self.max_workers = 0
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._active_batches = 0
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        with self._lock:
+            return self._executor is not None
+
+    def start(self, max_workers: int = 1) -> ProcessPoolExecutor:
+        """Return the running pool, starting (or growing) it to at least `max_workers` workers."""
+        with self._lock:
+            return self._start(max_workers)
+
+    def _start(self, max_workers: int) -> ProcessPoolExecutor:
+        if self._executor is not None and max_workers > self.max_workers:
+            if self._active_batches:
+                logger.debug("Plotting pool busy - keeping {} workers ({} requested)",
+                             self.max_workers, max_workers)
+            else:
+                logger.debug("Plotting pool growing from {} to {} workers", self.max_workers, max_workers)
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+        if self._executor is None:
+            self.max_workers = max(max_workers, self.max_workers, 1)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=warm_up_worker)
+            # Launch and warm up the workers now, before the first plots are submitted
+            self._executor.submit(_noop)
+            logger.info("Started plotting pool with {} workers", self.max_workers)
+
+        return self._executor
+
+    @contextmanager
+    def batch(self, tasks: List[Any], max_workers: int = 1) -> Iterator[List[Any]]:
+        """
+        Start the pool and share the DataFrames of `tasks` with the workers until the
+        block exits. Yields the tasks to submit (with SharedFrame handles).
+        """
+        with self._lock:
+            self._start(max_workers)
+            self._active_batches += 1
+
+        batch_dir = Path(tempfile.mkdtemp(prefix="optimoldiq_plots_", dir=self.shared_dir))
+        try:
+            yield share_frames(tasks, batch_dir)
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+            with self._lock:
+                self._active_batches -= 1
+
+    def submit(self, worker_function: Callable, task: Any) -> Future:
+        executor = self.start()
+        return executor.submit(run_shared_task, worker_function, task)
+
+    def reset(self) -> None:
+        """Drop a broken pool (a worker died); the next batch starts a new one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.warning("Plotting pool reset")
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self.max_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=wait)
+            logger.debug("Plotting pool shut down")
+
+_default_pool = PlottingPool()
+atexit.register(_default_pool.shutdown)
+
+def get_plotting_pool() -> PlottingPool:
+    """The process-wide pool used by execute_tasks_parallel."""
+    return _default_pool
@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 from PIL import Image
 import seaborn as sns
 import matplotlib.colors as mcolors
-from typing import Optional, Dict, Tuple, Any, Callable, List
+from typing import Optional, Dict, Tuple, Any, Callable, Iterator, List
 import json
 from matplotlib.colors import to_rgba, to_hex
 import multiprocessing as mp
@@ -12,7 +12,26 @@ import copy
 import psutil
 import time
 import traceback
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from agents.dashboardBuilder.plotters.plotting_pool import get_plotting_pool
+
+# Render profiles of the saved plots (plot_single_chart). A visualization config can override
+# them ("render_profiles") and pick the default one ("render_profile"); a pipeline or the
+# OPTIMOLDIQ_RENDER_PROFILE environment variable selects another one for a run.
+#   preview: screen quality PNG, no tight-bbox pass, fast compression (dashboards)
+#   print:   300 dpi PDF with tight bbox, generated on request
+RENDER_PROFILE_ENV = "OPTIMOLDIQ_RENDER_PROFILE"
+DEFAULT_RENDER_CONFIG = {
+    "render_profile": "preview",
+    "render_profiles": {
+        "preview": {"format": "png", "dpi": 96, "bbox_inches": None,
+                    "pil_kwargs": {"compress_level": 1}},
+        "print": {"format": "pdf", "dpi": 300, "bbox_inches": "tight", "pad_inches": 0.5},
+    }
+}
 
 def load_visualization_config(default_config, 
                               visualization_config_path: Optional[str] = None
@@ -202,6 +221,35 @@ def save_plot(fig,
     finally:
         plt.close(fig)
 
+def load_render_profile(visualization_config_path: Optional[str] = None,
+                        render_profile: Optional[str] = None) -> Dict:
+    """
+    Savefig options of a render profile.
+    Selection order: `render_profile`, OPTIMOLDIQ_RENDER_PROFILE, the config's "render_profile".
+    """
+    config = load_visualization_config(DEFAULT_RENDER_CONFIG, visualization_config_path)
+    profiles = config["render_profiles"]
+    name = render_profile or os.environ.get(RENDER_PROFILE_ENV) or config["render_profile"]
+    if name not in profiles:
+        raise ValueError(f"Unknown render profile: '{name}'. Available: {list(profiles)}")
+    return dict(profiles[name])
+
+def save_rendered_figure(fig,
+                         path: str,
+                         profile: Dict) -> str:
+    """Save and close a figure with a render profile; returns the path (with the profile's extension)."""
+    options = dict(profile)
+    file_format = options.pop("format", "png")
+    file_path = str(Path(path).with_suffix(f".{file_format}"))
+    if os.path.lexists(file_path):
+        # Replace rather than overwrite: the file may be hard-linked to a plot cache entry
+        os.remove(file_path)
+    try:
+        fig.savefig(file_path, format=file_format, **options)
+    finally:
+        plt.close(fig)
+    return file_path
+
 def setup_parallel_config(
         enable_parallel: bool = True,
         max_workers: Optional[int] = None,
@@ -272,18 +320,22 @@ def setup_parallel_config(
     
     return enable_parallel, max_workers
 
-def plot_single_chart(args: Tuple[Any, str, Callable, str, str, Dict]
+def plot_single_chart(args: Tuple[Any, str, str, Callable, str, str, Dict]
                       ) -> Tuple[bool, str, list, str, float]:
     """
     Worker function to create a single plot.
+    Args: (data, config_path, name, func, path, timestamp_file, kwargs[, render_profile])
     Returns: (success, plot_name, error_message, execution_time)
     """
-    data, config_path, name, func, path, timestamp_file, kwargs = args
+    data, config_path, name, func, path, timestamp_file, kwargs = args[:7]
+    render_profile = args[7] if len(args) > 7 else None
     start_time = time.time()
 
     path_collection = []
 
     try:
+        profile = load_render_profile(config_path, render_profile)
+
         # Create the plot - pass visualization_config_path as keyword argument
         if isinstance(data, tuple):
             result = func(*data, visualization_config_path=config_path, **kwargs)
@@ -299,21 +351,15 @@ def plot_single_chart(args: Tuple[Any, str, Callable, str, str, Dict]
                 # Multiple figures - save each one
                 for idx, fig in enumerate(fig_or_figs):
                     fig_path = path.replace('.png', f'_page{idx+1}.png')
-                    fig.savefig(fig_path, dpi=300, bbox_inches="tight", pad_inches=0.5)
-                    path_collection.append(fig_path)
-                    plt.close(fig)
+                    path_collection.append(save_rendered_figure(fig, fig_path, profile))
 
             else:
                 # Single figure
-                fig_or_figs.savefig(path, dpi=300, bbox_inches="tight", pad_inches=0.5)
-                path_collection.append(path)
-                plt.close(fig_or_figs)
+                path_collection.append(save_rendered_figure(fig_or_figs, path, profile))
 
         else:
             # Result is just a figure
-            result.savefig(path, dpi=300, bbox_inches="tight", pad_inches=0.5)
-            path_collection.append(path)
-            plt.close(result)
+            path_collection.append(save_rendered_figure(result, path, profile))
             
         execution_time = time.time() - start_time
         return True, name, path_collection, "", execution_time
@@ -331,31 +377,30 @@ def execute_tasks_parallel(
         task_name_extractor: Optional[Callable[[Any], str]] = None
     ) -> Tuple[List[Tuple], List[str]]:
     """
-    Execute tasks in parallel using ProcessPoolExecutor or ThreadPoolExecutor.
+    Execute tasks in parallel using the shared plotting pool or a ThreadPoolExecutor.
     
     Args:
         tasks: List of task arguments to pass to worker_function
         worker_function: Function that processes a single task
         max_workers: Maximum number of parallel workers
         executor_type: "process" or "thread" (default: "process" for CPU-bound tasks)
+                       Process tasks run on the persistent, pre-warmed PlottingPool; their
+                       DataFrames are shared with the workers instead of pickled per task
         task_name_extractor: Optional function to extract task name from task for logging
                             If None, uses index
     """
     successful_results = []
     failed_results = []
     
-    # Choose executor type
-    ExecutorClass = ProcessPoolExecutor if executor_type == "process" else ThreadPoolExecutor
-    
     logger.info("Starting parallel execution with {} workers for {} tasks (executor: {})",
              max_workers, len(tasks), executor_type)
     
     start_time = time.time()
     
     try:
-        with ExecutorClass(max_workers=max_workers) as executor:
+        with _task_submitter(tasks, worker_function, max_workers, executor_type) as submitted:
             # Submit all tasks
-            future_to_task = {executor.submit(worker_function, task): task for task in tasks}
+            future_to_task = {future: task for future, task in submitted}
             
             # Collect results as they complete
             for future in as_completed(future_to_task):
@@ -370,6 +415,8 @@ def execute_tasks_parallel(
                     logger.debug("✅ Completed task: {}", task_name)
                     
                 except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        get_plotting_pool().reset()
                     error_msg = f"Task execution failed for {task_name}: {str(e)}"
                     failed_results.append(error_msg)
                     logger.error("❌ {}", error_msg)
@@ -384,6 +431,21 @@ def execute_tasks_parallel(
     
     return successful_results, failed_results
 
+@contextmanager
+def _task_submitter(tasks: List[Any],
+                    worker_function: Callable,
+                    max_workers: int,
+                    executor_type: str) -> Iterator[List[Tuple[Future, Any]]]:
+    """Submit tasks; yields (future, original task) pairs, valid until the block exits."""
+    if executor_type == "process":
+        pool = get_plotting_pool()
+        with pool.batch(tasks, max_workers) as shared_tasks:
+            yield [(pool.submit(worker_function, shared), task)
+                   for shared, task in zip(shared_tasks, tasks)]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield [(executor.submit(worker_function, task), task) for task in tasks]
+
 def execute_tasks_sequential(
         tasks: List[Any],
         worker_function: Callable,
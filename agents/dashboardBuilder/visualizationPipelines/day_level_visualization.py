@@ -12,7 +12,8 @@ from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.dashboardBuilder.visualizationPipelines.configs.visualization_pipeline_config import VisualizationPipelineResult
 
-from agents.dashboardBuilder.plotters.utils import setup_parallel_config, plot_single_chart, execute_tasks, process_plot_results
+from agents.dashboardBuilder.plotters.utils import setup_parallel_config, process_plot_results
+from agents.dashboardBuilder.plotters.plot_cache import run_plot_tasks
 
 from agents.dashboardBuilder.plotters.day_level.change_times_all_types_plotter import change_times_all_types_plotter
 from agents.dashboardBuilder.plotters.day_level.item_based_overview_plotter import item_based_overview_plotter 
@@ -69,10 +70,18 @@ class DayLevelVisualizationPipeline(ConfigReportMixin):
                  default_dir: str = "agents/shared_db/DashboardBuilder/MultiLevelPerformanceVisualizationService/DayLevelVisualizationPipeline/newest/visualized_results",
                  visualization_config_path: str = None,
                  enable_parallel: bool = True,
-                 max_workers: int = None):
+                 max_workers: int = None,
+                 render_profile: str = None,
+                 plot_cache_dir: str = None):
 
         self._capture_init_args()
         self.logger = logger.bind(class_="DayLevelVisualizationPipeline")
+
+        # Render profile of the saved plots (None: the visualization config's default)
+        self.render_profile = render_profile
+
+        # Render cache directory (None: render every plot)
+        self.plot_cache_dir = plot_cache_dir
         
         # Load visualization config
         self.visualization_config_path = (
@@ -208,7 +217,8 @@ class DayLevelVisualizationPipeline(ConfigReportMixin):
         tasks = []
         for data, config_path, name, func, kwargs in plots_args:
             path = output_dir / f'{timestamp_file}_{name}_{self.requested_timestamp}.png'
-            tasks.append((data, config_path, name, func, str(path), timestamp_file, kwargs))
+            tasks.append((data, config_path, name, func, str(path), timestamp_file, kwargs,
+                          self.render_profile))
             
         return tasks
 
@@ -246,13 +256,11 @@ class DayLevelVisualizationPipeline(ConfigReportMixin):
 
         # Execute plotting (parallel or sequential)
         try:
-            raw_results, failed_tasks = execute_tasks(
+            raw_results, failed_tasks = run_plot_tasks(
                 tasks=tasks,
-                worker_function=plot_single_chart,
                 enable_parallel=self.enable_parallel,
                 max_workers=self.max_workers,
-                executor_type="process",  # CPU-bound plotting operations
-                task_name_extractor=lambda task: task[2]  # Extract name from task
+                plot_cache_dir=self.plot_cache_dir  # Reuse unchanged plots of previous runs
             )
 
             # Process results
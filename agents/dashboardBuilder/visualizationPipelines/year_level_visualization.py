@@ -11,7 +11,8 @@ from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.dashboardBuilder.visualizationPipelines.configs.visualization_pipeline_config import VisualizationPipelineResult
 
-from agents.dashboardBuilder.plotters.utils import setup_parallel_config, plot_single_chart, execute_tasks, process_plot_results
+from agents.dashboardBuilder.plotters.utils import setup_parallel_config, process_plot_results
+from agents.dashboardBuilder.plotters.plot_cache import run_plot_tasks
 
 from agents.dashboardBuilder.plotters.year_level.monthly_performance_plotter import monthly_performance_plotter
 from agents.dashboardBuilder.plotters.year_level.year_performance_plotter import year_performance_plotter
@@ -76,11 +77,19 @@ class YearLevelVisualizationPipeline(ConfigReportMixin):
                  default_dir: str = "agents/shared_db/DashboardBuilder/MultiLevelPerformanceVisualizationService/YearLevelVisualizationPipeline/newest/visualized_results",
                  visualization_config_path: str = None,
                  enable_parallel: bool = True,
-                 max_workers: int = None):
+                 max_workers: int = None,
+                 render_profile: str = None,
+                 plot_cache_dir: str = None):
 
         self._capture_init_args()
         self.logger = logger.bind(class_="YearLevelVisualizationPipeline")
 
+        # Render profile of the saved plots (None: the visualization config's default)
+        self.render_profile = render_profile
+
+        # Render cache directory (None: render every plot)
+        self.plot_cache_dir = plot_cache_dir
+
         # Setup config path
         self.visualization_config_path = (
             visualization_config_path
@@ -287,7 +296,8 @@ class YearLevelVisualizationPipeline(ConfigReportMixin):
         tasks = []
         for data, config_path, name, func, kwargs in plots_args:
             path = output_dir / f'{timestamp_file}_{name}_{self.requested_timestamp}.png'
-            tasks.append((data, config_path, name, func, str(path), timestamp_file, kwargs))
+            tasks.append((data, config_path, name, func, str(path), timestamp_file, kwargs,
+                          self.render_profile))
 
         return tasks
 
@@ -325,13 +335,11 @@ class YearLevelVisualizationPipeline(ConfigReportMixin):
 
         # Execute plotting using the reusable utility
         try:
-            raw_results, failed_tasks = execute_tasks(
+            raw_results, failed_tasks = run_plot_tasks(
                 tasks=tasks,
-                worker_function=plot_single_chart,
                 enable_parallel=self.enable_parallel,
                 max_workers=self.max_workers,
-                executor_type="process",  # CPU-bound plotting operations
-                task_name_extractor=lambda task: task[2]  # Extract name from task
+                plot_cache_dir=self.plot_cache_dir  # Reuse unchanged plots of previous runs
             )
 
             # Process results
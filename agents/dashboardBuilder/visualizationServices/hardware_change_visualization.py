@@ -8,6 +8,7 @@ from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.dashboardBuilder.visualizationServices.configs.change_visualization_service_config import ChangeVisualizationConfig
 from agents.dashboardBuilder.visualizationServices.configs.save_output_formatter import save_reports
+from agents.dashboardBuilder.plotters.plot_cache import PLOT_CACHE_DIR_NAME
 
 # Import agent report format components
 from configs.shared.agent_report_format import (
@@ -35,12 +36,14 @@ class  MachineLayoutVisualizationPhase(AtomicPhase):
     def __init__(self, 
                  config: ChangeVisualizationConfig,
                  data: ExecutionResult,
-                 visualization_results_dir: Path | str):
+                 visualization_results_dir: Path | str,
+                 plot_cache_dir: Path | str | None = None):
         super().__init__("MachineLayoutVisualizationPipeline")
 
         self.config = config
         self.data = data
         self.visualization_results_dir = visualization_results_dir
+        self.plot_cache_dir = plot_cache_dir
 
     def _execute_impl(self) -> Dict[str, Any]:
         """Run machine layout visualization logic"""
@@ -59,7 +62,8 @@ class  MachineLayoutVisualizationPhase(AtomicPhase):
             default_dir = self.visualization_results_dir,
             visualization_config_path = None,
             enable_parallel = True,
-            max_workers = None
+            max_workers = None,
+            plot_cache_dir = self.plot_cache_dir
             )
 
         machine_level_visualization_results = visualization_pipeline.run_pipeline()
@@ -90,12 +94,14 @@ class  MoldMachinePairVisualizationPhase(AtomicPhase):
     def __init__(self, 
                  config: ChangeVisualizationConfig,
                  data: ExecutionResult,
-                 visualization_results_dir: Path | str):
+                 visualization_results_dir: Path | str,
+                 plot_cache_dir: Path | str | None = None):
         super().__init__("MoldMachinePairVisualizationPipeline")
 
         self.config = config
         self.data = data
         self.visualization_results_dir = visualization_results_dir
+        self.plot_cache_dir = plot_cache_dir
         
     def _execute_impl(self) -> Dict[str, Any]:
         """Run mold machine pair visualization logic"""
@@ -113,7 +119,8 @@ class  MoldMachinePairVisualizationPhase(AtomicPhase):
             default_dir = self.visualization_results_dir,
             visualization_config_path = None,
             enable_parallel = True,
-            max_workers = None
+            max_workers = None,
+            plot_cache_dir = self.plot_cache_dir
             )
 
         mold_level_visualization_results = visualization_pipeline.run_pipeline()
@@ -236,7 +243,8 @@ class HardwareChangeVisualizationService(ConfigReportMixin):
                 "change_log_header": config_header
                 })
             visualization_results_dir=f"{self.config.shared_source_config.machine_layout_visualization_pipeline_dir}/{dir_name}"
-            phases.append(MachineLayoutVisualizationPhase(self.config, self.data, visualization_results_dir))
+            plot_cache_dir=f"{self.config.shared_source_config.machine_layout_visualization_pipeline_dir}/{PLOT_CACHE_DIR_NAME}"
+            phases.append(MachineLayoutVisualizationPhase(self.config, self.data, visualization_results_dir, plot_cache_dir))
 
         # Phase 2: Mold-Machine Pair Visualization (optional)
         if self.config.enable_mold_machine_pair_visualization:
@@ -244,7 +252,8 @@ class HardwareChangeVisualizationService(ConfigReportMixin):
                 "change_log_header": config_header
                 })
             visualization_results_dir=f"{self.config.shared_source_config.mold_machine_pair_visualization_pipeline_dir}/{dir_name}"
-            phases.append(MoldMachinePairVisualizationPhase(self.config, self.data, visualization_results_dir))
+            plot_cache_dir=f"{self.config.shared_source_config.mold_machine_pair_visualization_pipeline_dir}/{PLOT_CACHE_DIR_NAME}"
+            phases.append(MoldMachinePairVisualizationPhase(self.config, self.data, visualization_results_dir, plot_cache_dir))
 
         # ============================================
         # EXECUTE USING COMPOSITE AGENT
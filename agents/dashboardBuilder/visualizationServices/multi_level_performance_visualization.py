@@ -6,10 +6,12 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List, NoReturn
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.utils import load_annotation_path
+from agents.database_loader import load_database, schema_dtypes
 
 from agents.dashboardBuilder.visualizationServices.configs.performance_visualization_service_config import PerformanceVisualizationConfig
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
 from agents.dashboardBuilder.visualizationServices.configs.save_output_formatter import save_reports
+from agents.dashboardBuilder.plotters.plot_cache import PLOT_CACHE_DIR_NAME
 
 # Import agent report format components
 from configs.shared.agent_report_format import (
@@ -52,7 +54,8 @@ class DataLoadingPhase(AtomicPhase):
             raise FileNotFoundError(f"Failed to load {name}: {e}")
     
     def _load_dataframes(self,
-                         path_annotation: Dict) -> Dict[str, Any]:
+                         path_annotation: Dict,
+                         databaseSchemas_data: Dict) -> Dict[str, Any]:
         
         # Define dataframes to load
         dataframes_to_load = [
@@ -76,7 +79,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -107,7 +110,7 @@ class DataLoadingPhase(AtomicPhase):
         )
         
         logger.info("📊 Loading DataFrames from parquet files...")
-        loaded_dfs = self._load_dataframes(path_annotation)
+        loaded_dfs = self._load_dataframes(path_annotation, databaseSchemas_data)
 
         self.data_container.update({
             'databaseSchemas_data': databaseSchemas_data,
@@ -149,13 +152,15 @@ class  DayLevelVisualizationPhase(AtomicPhase):
                  config: PerformanceVisualizationConfig,
                  data_container: Dict[str, Any],
                  visualization_data: ExecutionResult,
-                 visualization_results_dir: Path | str):
+                 visualization_results_dir: Path | str,
+                 plot_cache_dir: Path | str | None = None):
         super().__init__("DayLevelVisualizationPipeline")
 
         self.config = config
         self.loaded_data = data_container
         self.visualization_data = visualization_data
         self.visualization_results_dir = visualization_results_dir
+        self.plot_cache_dir = plot_cache_dir
 
     def _execute_impl(self) -> Dict[str, Any]:
         """Run day-level data processor logic"""
@@ -179,7 +184,8 @@ class  DayLevelVisualizationPhase(AtomicPhase):
             default_dir = self.visualization_results_dir,
             visualization_config_path = None,
             enable_parallel = True,
-            max_workers = None
+            max_workers = None,
+            plot_cache_dir = self.plot_cache_dir
         )
 
         day_level_visualization_results = visualization_pipeline.run_pipeline()
@@ -211,13 +217,15 @@ class  MonthLevelVisualizationPhase(AtomicPhase):
                  config: PerformanceVisualizationConfig,
                  data_container: Dict[str, Any],
                  visualization_data: ExecutionResult,
-                 visualization_results_dir: Path | str):
+                 visualization_results_dir: Path | str,
+                 plot_cache_dir: Path | str | None = None):
         super().__init__("MonthLevelVisualizationPipeline")
 
         self.config = config
         self.loaded_data = data_container
         self.visualization_data = visualization_data
         self.visualization_results_dir = visualization_results_dir
+        self.plot_cache_dir = plot_cache_dir
         
     def _execute_impl(self) -> Dict[str, Any]:
         """Run month-level data processor logic"""
@@ -244,7 +252,8 @@ class  MonthLevelVisualizationPhase(AtomicPhase):
             default_dir = self.visualization_results_dir,
             visualization_config_path = None,
             enable_parallel = True,
-            max_workers = None
+            max_workers = None,
+            plot_cache_dir = self.plot_cache_dir
         )
 
         month_level_visualization_results = visualization_pipeline.run_pipeline()
@@ -276,13 +285,15 @@ class YearLevelVisualizationPhase(AtomicPhase):
                  config: PerformanceVisualizationConfig,
                  data_container: Dict[str, Any],
                  visualization_data: ExecutionResult,
-                 visualization_results_dir: Path | str):
+                 visualization_results_dir: Path | str,
+                 plot_cache_dir: Path | str | None = None):
         super().__init__("YearLevelVisualizationPipeline")
 
         self.config = config
         self.loaded_data = data_container
         self.visualization_data = visualization_data
         self.visualization_results_dir = visualization_results_dir
+        self.plot_cache_dir = plot_cache_dir
         
     def _execute_impl(self) -> Dict[str, Any]:
         """Run year-level data processor logic"""
@@ -309,7 +320,8 @@ class YearLevelVisualizationPhase(AtomicPhase):
             default_dir = self.visualization_results_dir,
             visualization_config_path = None,
             enable_parallel = True,
-            max_workers = None
+            max_workers = None,
+            plot_cache_dir = self.plot_cache_dir
         )
 
         year_level_visualization_results = visualization_pipeline.run_pipeline()
@@ -471,7 +483,8 @@ class MultiLevelPerformanceVisualizationService(ConfigReportMixin):
                 "change_log_header": config_header
                 })
             visualization_results_dir=f"{self.config.shared_source_config.day_level_visualization_pipeline_dir}/{dir_name}"
-            phases.append(DayLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir))
+            plot_cache_dir=f"{self.config.shared_source_config.day_level_visualization_pipeline_dir}/{PLOT_CACHE_DIR_NAME}"
+            phases.append(DayLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir, plot_cache_dir))
 
         # Phase 3: Month Level Visualization (optional)
         if self.config.enable_month_level_visualization:
@@ -479,7 +492,8 @@ class MultiLevelPerformanceVisualizationService(ConfigReportMixin):
                 "change_log_header": config_header
                 })
             visualization_results_dir=f"{self.config.shared_source_config.month_level_visualization_pipeline_dir}/{dir_name}"
-            phases.append(MonthLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir))
+            plot_cache_dir=f"{self.config.shared_source_config.month_level_visualization_pipeline_dir}/{PLOT_CACHE_DIR_NAME}"
+            phases.append(MonthLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir, plot_cache_dir))
 
         # Phase 4: Year Level Visualization (optional)
         if self.config.enable_year_level_visualization:
@@ -487,7 +501,8 @@ class MultiLevelPerformanceVisualizationService(ConfigReportMixin):
                 "change_log_header": config_header
                 })
             visualization_results_dir=f"{self.config.shared_source_config.year_level_visualization_pipeline_dir}/{dir_name}"
-            phases.append(YearLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir))
+            plot_cache_dir=f"{self.config.shared_source_config.year_level_visualization_pipeline_dir}/{PLOT_CACHE_DIR_NAME}"
+            phases.append(YearLevelVisualizationPhase(self.config, shared_data, self.data, visualization_results_dir, plot_cache_dir))
 
         # ============================================
         # EXECUTE USING COMPOSITE AGENT
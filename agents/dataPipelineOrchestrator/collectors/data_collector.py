@@ -4,14 +4,20 @@ from agents.dataPipelineOrchestrator.configs.output_formats import DataProcessin
 
 from agents.dataPipelineOrchestrator.processors.dynamic_data_processor import DynamicDataProcessor
 from agents.dataPipelineOrchestrator.processors.static_data_processor import StaticDataProcessor
+from agents.dataPipelineOrchestrator.processors.processor_utils import resolve_worker_count, to_transport, from_transport
 
 from configs.shared.config_report_format import ConfigReportMixin
+from concurrent.futures import ProcessPoolExecutor
 from loguru import logger
 from datetime import datetime
 from typing import Dict, Any
 import pandas as pd
 import copy
 
+def _process_static_database(db_name: str, database_schema: Dict) -> DataProcessingReport:
+    """Process-pool entry point: read one static database and return an Arrow-backed report."""
+    return to_transport(StaticDataProcessor(db_name, database_schema).process_data())
+
 class DataCollector(ConfigReportMixin):
 
     """
@@ -21,7 +27,9 @@ class DataCollector(ConfigReportMixin):
 
     def __init__(self, 
                  database_type: str,
-                 database_schema: Dict | None = None):
+                 database_schema: Dict | None = None,
+                 ingestion_cache_dir: str | None = None,
+                 max_workers: int | None = 1):
 
         # Capture initialization arguments for reporting
         self._capture_init_args()
@@ -30,6 +38,11 @@ class DataCollector(ConfigReportMixin):
         self.logger = logger.bind(class_="DataCollector")
         
         self.database_type = database_type
+        self.ingestion_cache_dir = ingestion_cache_dir
+
+        # Worker processes for Excel parsing: source files of each dynamic database,
+        # or the static databases themselves (1 = sequential, None/0 = one per CPU core)
+        self.max_workers = max_workers
 
         if not database_schema:
             self.database_schema = {}
@@ -98,9 +111,7 @@ class DataCollector(ConfigReportMixin):
             #-------------------------------------------------#
 
             # Process each database
-            for db_name in self.database_schema:
-                processor = processor_class(db_name, self.database_schema)
-                processor_result = processor.process_data()
+            for db_name, processor_result in self._process_databases(processor_class):
                         
                 # processor_class using DataProcessingReport format, 
                 # .status only in [ProcessingStatus.ERROR, ProcessingStatus.SUCCESS, 
@@ -189,4 +200,33 @@ class DataCollector(ConfigReportMixin):
                 error_type=ErrorType.DATA_PROCESSING_ERROR, 
                 error_message=error_msg,
                 metadata=build_metadata(datetime.now())
-                )
\ No newline at end of file
+                )
+    
+    def _process_databases(self, processor_class):
+        """
+        Yield (db_name, DataProcessingReport) for every database in schema order.
+
+        Dynamic databases parallelize across their source files inside DynamicDataProcessor.
+        Static databases are single files, so they are read concurrently in worker processes.
+        """
+
+        n_workers = resolve_worker_count(self.max_workers, len(self.database_schema))
+
+        if self.database_type == "dynamicDB":
+            for db_name in self.database_schema:
+                processor = processor_class(db_name, self.database_schema, 
+                                            self.ingestion_cache_dir, self.max_workers)
+                yield db_name, processor.process_data()
+
+        elif n_workers == 1:
+            for db_name in self.database_schema:
+                yield db_name, processor_class(db_name, self.database_schema).process_data()
+
+        else:
+            self.logger.info("Reading {} static databases with {} workers", 
+                             len(self.database_schema), n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {db_name: pool.submit(_process_static_database, db_name, self.database_schema)
+                           for db_name in self.database_schema}
+                for db_name, future in futures.items():
+                    yield db_name, from_transport(future.result())
@@ -0,0 +1,268 @@
+# agents/dataPipelineOrchestrator/configs/change_detection.py
+
+"""
+Row-level change detection for the versioned databases written by save_databases.
+
+Every parquet snapshot in newest/ gets a sidecar `{stem}.rowhash.parquet` holding one
+64-bit hash per row (plus a schema signature). A new collection is compared against the
+sidecar only, so the previous snapshot is never reloaded in full:
+
+- inserted rows: hashes present in the new data but not in the stored version
+- deleted rows:  hashes present in the stored version but not in the new data
+- updated rows:  inserted/deleted rows sharing a business key (see ROW_KEYS)
+
+Rows are compared as multisets (duplicate rows are counted), without sorting.
+On change, historical_db/ receives a delta file (deleted + inserted rows) instead of a
+full copy of the previous snapshot; `restore_version` rebuilds any recorded version.
+"""
+
+from agents.database_loader import dataset_files
+
+from loguru import logger
+from dataclasses import dataclass, field
+from typing import Dict, List, Any
+from pathlib import Path
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ROW_HASH_SUFFIX = ".rowhash.parquet"
+DELTA_SUFFIX = ".delta.parquet"
+CHANGE_COLUMN = "__change__"
+
+# Business keys used to classify inserted/deleted pairs as updates
+ROW_KEYS = {
+    "purchaseOrders": ["poNo"],
+    "itemInfo": ["itemCode"],
+    "moldInfo": ["moldNo"],
+    "resinInfo": ["resinCode"],
+    "moldSpecificationSummary": ["itemCode"],
+}
+
+@dataclass
+class RowDiff:
+    """Result of comparing a DataFrame against a stored version"""
+    schema_changed: bool = False
+    inserted: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))  # mask over new rows
+    deleted: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))   # mask over stored rows
+    updated_count: int = 0
+
+    @property
+    def inserted_count(self) -> int:
+        return int(self.inserted.sum())
+
+    @property
+    def deleted_count(self) -> int:
+        return int(self.deleted.sum())
+
+    @property
+    def has_changes(self) -> bool:
+        return self.schema_changed or self.inserted_count > 0 or self.deleted_count > 0
+
+#--------------------#
+# Hashes & sidecars  #
+#--------------------#
+def schema_signature(df: pd.DataFrame) -> str:
+    """Order-independent signature of column names and dtypes."""
+    items = sorted((str(col), str(dtype)) for col, dtype in df.dtypes.items())
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+def compute_row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """One uint64 hash per row, independent of column order."""
+    if df.empty:
+        return np.zeros(0, dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[sorted(df.columns)], index=False).to_numpy()
+
+def row_hash_path(parquet_path: Path | str) -> Path:
+    parquet_path = Path(parquet_path)
+    return parquet_path.with_name(parquet_path.stem + ROW_HASH_SUFFIX)
+
+def write_row_hashes(parquet_path: Path | str,
+                     df: pd.DataFrame,
+                     hashes: np.ndarray | None = None) -> Path:
+    """
+    Write the row-hash sidecar of a parquet snapshot.
+    `df` (or precomputed `hashes`) must follow the stored row order.
+    """
+    if hashes is None:
+        hashes = compute_row_hashes(df)
+    table = pa.table({"row_hash": pa.array(hashes, type=pa.uint64())})
+    table = table.replace_schema_metadata({
+        b"schema_signature": schema_signature(df).encode("utf-8"),
+        b"rows": str(len(df)).encode("utf-8"),
+    })
+    sidecar = row_hash_path(parquet_path)
+    pq.write_table(table, sidecar)
+    return sidecar
+
+def read_row_hashes(parquet_path: Path | str) -> tuple[np.ndarray, str]:
+    """
+    Return (row hashes, schema signature) of a stored snapshot.
+    Falls back to hashing the snapshot itself when the sidecar is missing (legacy versions).
+    """
+    sidecar = row_hash_path(parquet_path)
+    if sidecar.exists():
+        table = pq.read_table(sidecar)
+        signature = (table.schema.metadata or {}).get(b"schema_signature", b"").decode("utf-8")
+        return table.column("row_hash").to_numpy(), signature
+
+    logger.debug("No row-hash sidecar for {}, hashing snapshot", parquet_path)
+    df = pd.read_parquet(parquet_path)
+    return compute_row_hashes(df), schema_signature(df)
+
+#-------#
+# Diff  #
+#-------#
+def _unmatched_mask(hashes: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """
+    Multiset difference: mark occurrences in `hashes` exceeding their count in `other`.
+    (the k-th duplicate of a row is unmatched if `other` holds fewer than k copies)
+    """
+    if len(hashes) == 0:
+        return np.zeros(0, dtype=bool)
+    if len(other) == 0:
+        return np.ones(len(hashes), dtype=bool)
+
+    occurrence = pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+    other_counts = pd.Series(other).value_counts()
+    available = pd.Series(hashes).map(other_counts).fillna(0).to_numpy()
+    return occurrence >= available
+
+def diff_rows(new_df: pd.DataFrame,
+              stored_hashes: np.ndarray,
+              stored_signature: str,
+              new_hashes: np.ndarray | None = None) -> RowDiff:
+    """Compare a DataFrame with a stored version given its row hashes and schema signature."""
+
+    if new_hashes is None:
+        new_hashes = compute_row_hashes(new_df)
+
+    if schema_signature(new_df) != stored_signature and not (new_df.empty and len(stored_hashes) == 0):
+        return RowDiff(schema_changed=True,
+                       inserted=np.ones(len(new_hashes), dtype=bool),
+                       deleted=np.ones(len(stored_hashes), dtype=bool))
+
+    return RowDiff(inserted=_unmatched_mask(new_hashes, stored_hashes),
+                   deleted=_unmatched_mask(stored_hashes, new_hashes))
+
+def _read_file_rows(parquet_file: pq.ParquetFile, positions: np.ndarray) -> pa.Table:
+    starts = np.cumsum([0] + [parquet_file.metadata.row_group(i).num_rows
+                              for i in range(parquet_file.num_row_groups)])
+    groups = np.unique(np.searchsorted(starts, positions, side="right") - 1)
+    table = parquet_file.read_row_groups(groups.tolist())
+
+    # Map absolute positions to offsets inside the concatenated row groups
+    group_offsets = np.cumsum([0] + [starts[g + 1] - starts[g] for g in groups])
+    group_index = np.searchsorted(groups, np.searchsorted(starts, positions, side="right") - 1)
+    local = positions - starts[groups[group_index]] + group_offsets[group_index]
+    return table.take(pa.array(local))
+
+def read_rows(parquet_path: Path | str, positions: np.ndarray) -> pd.DataFrame:
+    """
+    Read only the given row positions of a stored database (parquet file or partitioned
+    dataset), loading just the files and row groups that contain them.
+    """
+    parquet_files = [pq.ParquetFile(f) for f in dataset_files(parquet_path)]
+    if len(positions) == 0:
+        return parquet_files[0].schema_arrow.empty_table().to_pandas()
+
+    positions = np.sort(np.asarray(positions))
+    file_starts = np.cumsum([0] + [f.metadata.num_rows for f in parquet_files])
+
+    tables = []
+    for i, parquet_file in enumerate(parquet_files):
+        in_file = positions[(positions >= file_starts[i]) & (positions < file_starts[i + 1])]
+        if len(in_file):
+            tables.append(_read_file_rows(parquet_file, in_file - file_starts[i]))
+    return pa.concat_tables(tables).to_pandas()
+
+def count_updates(db_name: str, inserted_df: pd.DataFrame, deleted_df: pd.DataFrame) -> int:
+    """Number of inserted rows whose business key also appears among deleted rows."""
+    keys = ROW_KEYS.get(db_name)
+    if not keys or inserted_df.empty or deleted_df.empty:
+        return 0
+    if not all(k in inserted_df.columns and k in deleted_df.columns for k in keys):
+        return 0
+    deleted_keys = pd.MultiIndex.from_frame(deleted_df[keys].astype(str))
+    inserted_keys = pd.MultiIndex.from_frame(inserted_df[keys].astype(str))
+    return int(inserted_keys.isin(deleted_keys).sum())
+
+#------------------#
+# Version manifest #
+#------------------#
+def manifest_path(historical_dir: Path | str, db_name: str) -> Path:
+    return Path(historical_dir) / f"{db_name}_versions.json"
+
+def load_manifest(historical_dir: Path | str, db_name: str) -> List[Dict[str, Any]]:
+    path = manifest_path(historical_dir, db_name)
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def append_manifest(historical_dir: Path | str, db_name: str, entry: Dict[str, Any]) -> None:
+    """Record a superseded version (newest entry last); written atomically."""
+    entries = load_manifest(historical_dir, db_name)
+    entries.append(entry)
+    path = manifest_path(historical_dir, db_name)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, indent=4)
+    tmp_path.replace(path)
+
+def write_delta(historical_dir: Path | str,
+                version_name: str,
+                inserted_df: pd.DataFrame,
+                deleted_df: pd.DataFrame) -> Path:
+    """Write the rows needed to step from a version back to its predecessor."""
+    delta_df = pd.concat([
+        deleted_df.assign(**{CHANGE_COLUMN: "deleted"}),
+        inserted_df.assign(**{CHANGE_COLUMN: "inserted"}),
+    ], ignore_index=True)
+    delta_path = Path(historical_dir) / f"{version_name}{DELTA_SUFFIX}"
+    delta_df.to_parquet(delta_path, engine='pyarrow', compression='snappy', index=False)
+    return delta_path
+
+def restore_version(database_dir: Path | str, db_name: str, version: str) -> pd.DataFrame:
+    """
+    Rebuild a superseded version of a database from the current snapshot and the deltas
+    recorded in historical_db/{db_name}_versions.json.
+
+    Args:
+        database_dir: Directory passed to save_databases
+        db_name: Database name
+        version: File name of the superseded snapshot (e.g. "20250101_120000_itemInfo.parquet")
+
+    Returns:
+        DataFrame with the rows of that version (row order is not preserved)
+    """
+    database_dir = Path(database_dir)
+    historical_dir = database_dir / "historical_db"
+    entries = load_manifest(historical_dir, db_name)
+
+    names = [entry["version"] for entry in entries]
+    if version not in names:
+        raise KeyError(f"Version {version} of {db_name} not found in manifest")
+    target = names.index(version)
+
+    # Start from the snapshot that replaced the newest superseded version
+    latest = entries[-1]
+    df = pd.read_parquet(database_dir / "newest" / latest["replaced_by"])
+
+    for entry in reversed(entries[target:]):
+        if entry["kind"] == "snapshot":
+            df = pd.read_parquet(historical_dir / entry["file"])
+            continue
+
+        delta_df = pd.read_parquet(historical_dir / entry["file"])
+        change = delta_df.pop(CHANGE_COLUMN)
+        inserted_df = delta_df[change == "inserted"].reset_index(drop=True)
+        deleted_df = delta_df[change == "deleted"].reset_index(drop=True)
+
+        keep = _unmatched_mask(compute_row_hashes(df), compute_row_hashes(inserted_df))
+        df = pd.concat([df[keep], deleted_df], ignore_index=True)
+
+    return df
@@ -0,0 +1,119 @@
+# agents/dataPipelineOrchestrator/configs/partitioned_dataset.py
+
+"""
+Writers for the database layouts read by agents.database_loader.
+
+Large dynamic databases are stored as month-partitioned datasets (one parquet file per
+year/month of their date column, plus a manifest) so consumers that only need a day or
+a month can skip the other partitions. All other databases keep a single parquet file.
+"""
+
+from agents.database_loader import DATASET_MANIFEST_NAME, UNDATED_PARTITION
+
+from datetime import datetime
+from loguru import logger
+from typing import Dict
+from pathlib import Path
+import json
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Databases written as month-partitioned datasets, with their partition column
+PARTITIONED_DATABASES: Dict[str, str] = {
+    "productRecords": "recordDate",
+    "purchaseOrders": "poReceivedDate",
+}
+
+def partition_keys(dates: pd.Series) -> pd.Series:
+    """'YYYY-MM' partition key of each row ('undated' for missing dates)."""
+    dates = pd.to_datetime(dates, errors="coerce")
+    return dates.dt.strftime("%Y-%m").fillna(UNDATED_PARTITION).astype(object)
+
+def write_partitioned_dataset(path: Path | str,
+                              df: pd.DataFrame,
+                              db_name: str,
+                              partition_column: str) -> pd.DataFrame:
+    """
+    Write `df` as a month-partitioned dataset directory.
+
+    All partitions share the Arrow schema of the full frame, so reading any subset
+    returns the same dtypes.
+
+    Returns:
+        `df` reordered by partition, i.e. in the row order a full read returns
+    """
+    path = Path(path)
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    keys = partition_keys(df[partition_column]).to_numpy()
+    order = np.argsort(keys, kind="stable")
+    stored_df = df.iloc[order].reset_index(drop=True)
+    sorted_keys = keys[order]
+
+    table = pa.Table.from_pandas(stored_df, preserve_index=False)
+    dates = pd.to_datetime(stored_df[partition_column], errors="coerce")
+
+    partitions = []
+    unique_keys, starts = np.unique(sorted_keys, return_index=True)
+    bounds = list(starts) + [len(stored_df)]
+    if len(unique_keys) == 0:
+        # Keep the schema of an empty database
+        unique_keys, bounds = np.array([UNDATED_PARTITION]), [0, 0]
+
+    for i, key in enumerate(unique_keys):
+        begin, stop = bounds[i], bounds[i + 1]
+        file_name = f"{key}.parquet"
+        pq.write_table(table.slice(begin, stop - begin), path / file_name, compression="snappy")
+
+        key_dates = dates.iloc[begin:stop]
+        has_dates = key != UNDATED_PARTITION and stop > begin
+        partitions.append({
+            "key": str(key),
+            "file": file_name,
+            "rows": int(stop - begin),
+            "min": key_dates.min().isoformat() if has_dates else None,
+            "max": key_dates.max().isoformat() if has_dates else None,
+        })
+
+    manifest = {
+        "database": db_name,
+        "partition_column": partition_column,
+        "granularity": "month",
+        "rows": len(stored_df),
+        "created_at": datetime.now().isoformat(),
+        "partitions": partitions,
+    }
+    with open(path / DATASET_MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=4)
+
+    logger.debug("Wrote {} as {} month partitions: {}", db_name, len(partitions), path)
+    return stored_df
+
+def write_database(path: Path | str, db_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Write a database in its configured layout.
+
+    Returns:
+        The frame in stored row order (row hashes must follow this order)
+    """
+    partition_column = PARTITIONED_DATABASES.get(db_name)
+    if partition_column is not None and partition_column in df.columns:
+        return write_partitioned_dataset(path, df, db_name, partition_column)
+
+    if partition_column is not None:
+        logger.warning("{} has no column '{}' - saving as a single parquet file", db_name, partition_column)
+    df.to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+    return df
+
+def remove_database(path: Path | str) -> None:
+    """Delete a stored database (single file or dataset directory)."""
+    path = Path(path)
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
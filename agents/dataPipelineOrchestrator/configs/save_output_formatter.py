@@ -1,4 +1,8 @@
-from agents.dataPipelineOrchestrator.utils import dataframes_equal_fast
+from agents.dataPipelineOrchestrator.configs.change_detection import (
+    compute_row_hashes, read_row_hashes, write_row_hashes, row_hash_path, 
+    diff_rows, read_rows, count_updates, write_delta, append_manifest)
+from agents.dataPipelineOrchestrator.configs.partitioned_dataset import write_database, remove_database
+from agents.database_loader import remove_arrow_mirrors
 from configs.shared.agent_report_format import update_change_log
 
 from datetime import datetime
@@ -7,7 +11,7 @@ from typing import Dict, Any
 from pathlib import Path
 import json
 import shutil
-import pandas as pd
+import numpy as np
 import os
 
 def save_collected_data(input_dict: Dict) -> Dict:
@@ -65,6 +69,14 @@ def save_databases(
 
     """
     Save databases with versioning based on annotations.
+
+    Changes are detected from per-row hashes stored next to each parquet version
+    (see change_detection). A changed database gets a new full snapshot in newest/,
+    while historical_db/ only receives the delta against the previous version and
+    an entry in {db_name}_versions.json.
+
+    Databases listed in PARTITIONED_DATABASES (see partitioned_dataset) are saved as
+    month-partitioned dataset directories; all others as a single parquet file.
     
     Args:
         database_dir: Directory to store databases
@@ -113,10 +125,11 @@ def save_databases(
                 # First run: save everything without comparison
                 log_entries.append(f"  ⤷ First run - saving without comparison")
                 
-                # Save new dataframe
+                # Save new dataframe (+ row hashes for later change detection)
                 new_filename = f"{timestamp_file}_{db_name}.parquet"
                 new_path = newest_dir / new_filename
-                db_df.to_parquet(new_path, engine='pyarrow', compression='snappy', index=False)
+                stored_df = write_database(new_path, db_name, db_df)
+                write_row_hashes(new_path, stored_df)
 
                 # Update path annotation
                 path_annotation[db_name] = str(new_path)
@@ -124,42 +137,74 @@ def save_databases(
                 logger.info("Saved new file: {}", new_path)
                 
             else:
-                # Not first run: compare with existing data
+                # Not first run: compare with the row hashes of the existing version
                 existed_df_path = path_annotation.get(db_name)
+                has_existing = bool(existed_df_path) and os.path.exists(existed_df_path)
+                new_hashes = compute_row_hashes(db_df)
                 
-                if existed_df_path and os.path.exists(existed_df_path):
-                    log_entries.append(f"  ⤷ Loading existing data from: {Path(existed_df_path).name}")
-                    existed_db_df = pd.read_parquet(existed_df_path)
+                if has_existing:
+                    log_entries.append(f"  ⤷ Comparing current data with: {Path(existed_df_path).name}")
+                    stored_hashes, stored_signature = read_row_hashes(existed_df_path)
+                    diff = diff_rows(db_df, stored_hashes, stored_signature, new_hashes)
+                    has_changes = diff.has_changes
                 else:
                     log_entries.append(f"  ⤷ No existing data found (new database)")
-                    existed_db_df = pd.DataFrame()
-                
-                # Compare dataframes
-                log_entries.append(f"  ⤷ Comparing current vs existing data...")
-                are_equal = dataframes_equal_fast(db_df, existed_db_df)
+                    diff = None
+                    has_changes = not db_df.empty
 
-                if are_equal:
+                if not has_changes:
                     log_entries.append(f"  ⤷ ✓ No changes detected - data is up to date")
-                else:
-                    log_entries.append(f"  ⤷ ✓ Data has changed - saving new version")
-                    
-                    # Move old file to historical if exists
-                    if existed_df_path and os.path.exists(existed_df_path):
-                        old_filename = Path(existed_df_path).name
-                        historical_path = historical_dir / old_filename
-                        shutil.move(str(existed_df_path), str(historical_path))
-                        log_entries.append(f"  ⤷ Archived: {old_filename} → historical_db/")
-                        logger.info("Moved old file {} → {}", existed_df_path, historical_path)
-
-                    # Save new dataframe
-                    new_filename = f"{timestamp_file}_{db_name}.parquet"
-                    new_path = newest_dir / new_filename
-                    db_df.to_parquet(new_path, engine='pyarrow', compression='snappy', index=False)
-
-                    # Update path annotation
-                    path_annotation[db_name] = str(new_path)
-                    log_entries.append(f"  ⤷ Saved: {new_filename}")
-                    logger.info("Saved new file: {}", new_path)
+                    if has_existing and not row_hash_path(existed_df_path).exists():
+                        # Upgrade versions saved before row hashes existed
+                        write_row_hashes(existed_df_path, db_df, stored_hashes)
+                    continue
+
+                log_entries.append(f"  ⤷ ✓ Data has changed - saving new version")
+
+                # Save new dataframe
+                new_filename = f"{timestamp_file}_{db_name}.parquet"
+                new_path = newest_dir / new_filename
+                stored_df = write_database(new_path, db_name, db_df)
+                write_row_hashes(new_path, stored_df)
+
+                # Archive the old version as a delta (or a full copy if the schema changed)
+                if has_existing:
+                    old_path = Path(existed_df_path)
+                    entry = {
+                        "version": old_path.name,
+                        "replaced_by": new_filename,
+                        "archived_at": timestamp_now.isoformat(),
+                    }
+
+                    if diff.schema_changed:
+                        historical_path = historical_dir / old_path.name
+                        shutil.move(str(old_path), str(historical_path))
+                        entry.update(kind="snapshot", file=historical_path.name)
+                        log_entries.append(f"  ⤷ Schema changed - archived full copy: {old_path.name} → historical_db/")
+                        logger.info("Moved old file {} → {}", old_path, historical_path)
+                    else:
+                        inserted_df = db_df[diff.inserted]
+                        deleted_df = read_rows(old_path, np.flatnonzero(diff.deleted))
+                        diff.updated_count = count_updates(db_name, inserted_df, deleted_df)
+                        delta_path = write_delta(historical_dir, old_path.stem, inserted_df, deleted_df)
+                        remove_database(old_path)
+                        entry.update(kind="delta", file=delta_path.name,
+                                     inserted=diff.inserted_count, deleted=diff.deleted_count,
+                                     updated=diff.updated_count)
+                        log_entries.append(
+                            f"  ⤷ Changes: {diff.inserted_count} inserted, {diff.deleted_count} deleted "
+                            f"({diff.updated_count} updated by key)")
+                        log_entries.append(f"  ⤷ Archived delta: {delta_path.name} → historical_db/")
+                        logger.info("Archived delta of {} → {}", old_path, delta_path)
+
+                    row_hash_path(old_path).unlink(missing_ok=True)
+                    remove_arrow_mirrors(old_path)
+                    append_manifest(historical_dir, db_name, entry)
+
+                # Update path annotation
+                path_annotation[db_name] = str(new_path)
+                log_entries.append(f"  ⤷ Saved: {new_filename}")
+                logger.info("Saved new file: {}", new_path)
 
     # Save updated path annotations (works for both first run and updates)
     try:
@@ -316,7 +316,12 @@ class DataPipelineProcessor(ConfigReportMixin):
         # Process each database type independently
         for db_type in schema_data:
             # Initialize DataCollector for this specific database type
-            collector = DataCollector(db_type, schema_data.get(db_type, {}))
+            collector = DataCollector(
+                db_type, 
+                schema_data.get(db_type, {}),
+                ingestion_cache_dir=(self.config.ingestion_cache_dir 
+                                     if self.config.incremental_ingestion else None),
+                max_workers=self.config.ingestion_max_workers)
 
             self.log_entries.append(f"Data collecting for {db_type}...")
             collector_result = collector.process_data()
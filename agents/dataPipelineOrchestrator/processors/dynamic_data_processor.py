@@ -1,6 +1,7 @@
 # agents/dataPipelineOrchestrator/processors/dynamic_data_processor.py
 
-from agents.dataPipelineOrchestrator.processors.processor_utils import get_source_files, merge_and_process_dfs, process_single_file
+from agents.dataPipelineOrchestrator.processors.processor_utils import get_source_files, merge_and_process_dfs, read_source_files
+from agents.dataPipelineOrchestrator.processors.ingestion_cache import IngestionCache
 from agents.dataPipelineOrchestrator.configs.output_formats import DataProcessingReport, ProcessingStatus, ErrorType
 
 from configs.shared.config_report_format import ConfigReportMixin
@@ -94,12 +95,27 @@ class DynamicDataProcessor(ConfigReportMixin):
 
     def __init__(self,
                  data_name: str,
-                 database_schema: Dict | None = None):
+                 database_schema: Dict | None = None,
+                 ingestion_cache_dir: str | None = None,
+                 max_workers: int | None = 1):
+        
+        """
+        Args:
+            data_name: Dynamic database name (e.g. "productRecords")
+            database_schema: Schema overrides for the dynamic databases
+            ingestion_cache_dir: Directory of the per-file ingestion cache. 
+                If provided, only new or modified source files are parsed (incremental mode);
+                unchanged files are loaded from the cache. If None, every file is parsed.
+            max_workers: Number of worker processes used to parse source files 
+                (1 = sequential, None/0 = one per CPU core)
+        """
         
         self._capture_init_args()
         self.logger = logger.bind(class_="DynamicDataProcessor")
 
         self.data_name = data_name
+        self.ingestion_cache_dir = ingestion_cache_dir
+        self.max_workers = max_workers
 
         if not database_schema:
             self.database_schema = {}
@@ -227,10 +243,34 @@ class DynamicDataProcessor(ConfigReportMixin):
             success_files = [] # Successfully processed dataframes
             failed_files = [] # Files that failed processing
 
+            ingestion_cache = None
+            if self.ingestion_cache_dir:
+                ingestion_cache = IngestionCache(self.ingestion_cache_dir, self.data_name, 
+                                                 self.sheet_name, self.file_extension, 
+                                                 self.required_fields)
+                removed = ingestion_cache.prune(source_file_list)
+                if removed:
+                    log_entries.append(f"  ⤷ Removed {len(removed)} deleted file(s) from ingestion manifest: {removed}")
+
+            # Reuse cached frames, then parse the remaining files (in parallel if configured)
+            file_results = {}
+            if ingestion_cache is not None:
+                for file_path in source_file_list:
+                    cached_result = ingestion_cache.lookup(file_path)
+                    if cached_result is not None:
+                        file_results[file_path] = cached_result
+
+            pending_files = [f for f in source_file_list if f not in file_results]
+            parsed_results = read_source_files(pending_files, self.sheet_name, self.file_extension, 
+                                               self.required_fields, self.max_workers)
+            for file_path, file_result in zip(pending_files, parsed_results):
+                if ingestion_cache is not None:
+                    file_result = ingestion_cache.store(file_path, file_result)
+                file_results[file_path] = file_result
+
             for idx, file_path in enumerate(source_file_list, 1):
                 log_entries.append(f"    [{idx}/{len(source_file_list)}] Processing: {file_path}\n")
-                file_result = process_single_file(file_path, self.sheet_name, 
-                                                  self.file_extension, self.required_fields)
+                file_result = file_results[file_path]
 
                 # process_single_file using DataProcessingReport format, 
                 # .status only in [ProcessingStatus.ERROR, ProcessingStatus.SUCCESS]
@@ -245,6 +285,12 @@ class DynamicDataProcessor(ConfigReportMixin):
             # Summary of file processing
             log_entries.append(f"  ⤷ Files processed: {len(success_files)}/{len(source_file_list)} successful")
 
+            if ingestion_cache is not None:
+                ingestion_cache.save_manifest()
+                log_entries.append(
+                    f"  ⤷ Incremental ingestion: {ingestion_cache.stats['parsed']} parsed, "
+                    f"{ingestion_cache.stats['reused']} reused from cache")
+
             #----------------------------------------------------------#
             # Q: Is there any source file were processed successfully? #
             #----------------------------------------------------------#
@@ -316,6 +362,8 @@ class DynamicDataProcessor(ConfigReportMixin):
                         'folder_path': self.folder_path,
                         'success_files_count': len(success_files),
                         'failed_files_count': len(failed_files),
+                        'parsed_files_count': (ingestion_cache.stats['parsed'] 
+                                               if ingestion_cache is not None else len(success_files)),
                         'records_processed': records_processed,
                         'log': "\n".join(log_entries)
                         }
@@ -0,0 +1,210 @@
+# agents/dataPipelineOrchestrator/processors/ingestion_cache.py
+
+from agents.dataPipelineOrchestrator.configs.output_formats import DataProcessingReport, ProcessingStatus
+from agents.dataPipelineOrchestrator.processors.processor_utils import process_single_file
+
+from datetime import datetime
+from loguru import logger
+from typing import Dict, List, Any
+from pathlib import Path
+import hashlib
+import json
+import pandas as pd
+
+class IngestionCache:
+
+    """
+    Manifest + per-file cache of parsed source files for one dynamic database.
+
+    Layout:
+        {cache_dir}/{data_name}/manifest.json
+        {cache_dir}/{data_name}/files/{source_stem}.parquet (or .pkl)
+
+    A source file is re-parsed only if it is new or its content changed:
+    - size and mtime unchanged          -> cached frame is reused
+    - size/mtime changed, same sha256   -> cached frame is reused (manifest refreshed)
+    - otherwise                         -> file is parsed and the cache entry replaced
+
+    Parsed frames are stored as parquet when they have no object columns.
+    Raw Excel columns often mix numbers and text (e.g. resin codes), which Arrow
+    rejects or coerces; those frames are pickled so values round-trip exactly
+    for merge_and_process_dfs.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self,
+                 cache_dir: Path | str,
+                 data_name: str,
+                 sheet_name: str,
+                 file_extension: str,
+                 required_fields: List[str]):
+
+        self.logger = logger.bind(class_="IngestionCache")
+
+        self.data_dir = Path(cache_dir) / data_name
+        self.files_dir = self.data_dir / "files"
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.data_dir / self.MANIFEST_NAME
+
+        self.sheet_name = sheet_name
+        self.file_extension = file_extension
+        self.required_fields = list(required_fields)
+
+        # Entries parsed with a different reader configuration are never reused
+        self.reader_key = hashlib.sha256(
+            json.dumps([sheet_name, file_extension, self.required_fields]).encode("utf-8")
+        ).hexdigest()[:16]
+
+        self.manifest = self._load_manifest()
+        self.stats = {"reused": 0, "parsed": 0, "removed": 0}
+
+    #----------#
+    # Manifest #
+    #----------#
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable ingestion manifest {}: {}", self.manifest_path, e)
+            return {}
+
+    def save_manifest(self) -> None:
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=4)
+        tmp_path.replace(self.manifest_path)
+
+    @staticmethod
+    def _file_hash(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    #---------------#
+    # Cache lookups #
+    #---------------#
+    def _is_unchanged(self, file_path: Path, entry: Dict[str, Any]) -> bool:
+        if entry.get("reader_key") != self.reader_key:
+            return False
+        cache_file = entry.get("cache_file")
+        if not cache_file or not (self.files_dir / cache_file).exists():
+            return False
+
+        stat = file_path.stat()
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+
+        # Touched but possibly identical (e.g. re-copied) -> confirm by content
+        if stat.st_size == entry.get("size") and self._file_hash(file_path) == entry.get("sha256"):
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return True
+
+        return False
+
+    def _read_cached(self, entry: Dict[str, Any]) -> pd.DataFrame:
+        cache_path = self.files_dir / entry["cache_file"]
+        if cache_path.suffix == ".parquet":
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+
+    def _write_cached(self, file_path: Path, df: pd.DataFrame) -> str:
+        parquet_path = self.files_dir / f"{file_path.stem}.parquet"
+        pickle_path = self.files_dir / f"{file_path.stem}.pkl"
+        # object columns may hold mixed Python types that parquet would coerce
+        if not (df.dtypes == object).any():
+            try:
+                df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+                pickle_path.unlink(missing_ok=True)
+                return parquet_path.name
+            except Exception:
+                parquet_path.unlink(missing_ok=True)
+        df.to_pickle(pickle_path)
+        return pickle_path.name
+
+    #------------#
+    # Public API #
+    #------------#
+    def lookup(self, file_path: Path | str) -> DataProcessingReport | None:
+        """
+        Return the cached frame of an unchanged source file, or None if it must be parsed.
+        """
+        file_path = Path(file_path)
+        entry = self.manifest.get(file_path.name)
+
+        if entry is None or not self._is_unchanged(file_path, entry):
+            return None
+
+        try:
+            df = self._read_cached(entry)
+        except Exception as e:
+            self.logger.warning("Cached frame for {} unreadable, re-parsing: {}", file_path.name, e)
+            return None
+
+        self.stats["reused"] += 1
+        return DataProcessingReport(
+            status=ProcessingStatus.SUCCESS,
+            data=df,
+            metadata={
+                "file_path": file_path,
+                "sheet_name": self.sheet_name,
+                "file_extension": self.file_extension,
+                "from_cache": True
+                }
+            )
+
+    def store(self, file_path: Path | str, file_result: DataProcessingReport) -> DataProcessingReport:
+        """
+        Record a freshly parsed file (result of process_single_file) in the cache.
+        Failed results are not cached.
+        """
+        file_path = Path(file_path)
+        file_result.metadata["from_cache"] = False
+
+        if file_result.status != ProcessingStatus.SUCCESS:
+            return file_result
+
+        self.stats["parsed"] += 1
+        try:
+            stat = file_path.stat()
+            self.manifest[file_path.name] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": self._file_hash(file_path),
+                "reader_key": self.reader_key,
+                "cache_file": self._write_cached(file_path, file_result.data),
+                "rows": len(file_result.data),
+                "ingested_at": datetime.now().isoformat()
+            }
+        except Exception as e:
+            # Caching is an optimization: never fail ingestion because of it
+            self.logger.warning("Could not cache parsed frame for {}: {}", file_path.name, e)
+
+        return file_result
+
+    def load_file(self, file_path: Path | str) -> DataProcessingReport:
+        """
+        Return the parsed frame for a source file, parsing it only if needed.
+        Same contract as process_single_file; metadata['from_cache'] tells which path was used.
+        """
+        cached = self.lookup(file_path)
+        if cached is not None:
+            return cached
+        return self.store(file_path, process_single_file(file_path, self.sheet_name,
+                                                         self.file_extension, self.required_fields))
+
+    def prune(self, source_files: List[Path | str]) -> List[str]:
+        """Drop manifest entries (and cached frames) for source files that no longer exist."""
+        current = {Path(f).name for f in source_files}
+        removed = [name for name in self.manifest if name not in current]
+        for name in removed:
+            entry = self.manifest.pop(name)
+            if entry.get("cache_file"):
+                (self.files_dir / entry["cache_file"]).unlink(missing_ok=True)
+        self.stats["removed"] += len(removed)
+        return removed
@@ -3,9 +3,11 @@
 from agents.dataPipelineOrchestrator.configs.output_formats import DataProcessingReport, ProcessingStatus, ErrorType
 
 from typing import Dict, List,  Any
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import os
 
 #-------#
@@ -28,6 +30,59 @@ def safe_convert(x) -> str:
         return str(int(x))
     return str(x)
 
+def normalize_code_column(series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of `series.map(safe_convert)`.
+
+    Numeric values (Python/NumPy ints and floats, as read from Excel) become the string of
+    their integer part, other non-null values are converted with str(), nulls are kept.
+    Codes repeat heavily, so only the distinct values are normalized and then broadcast back.
+
+    Args:
+        series: Material code column (usually object dtype, mixed numbers and text)
+
+    Returns:
+        Series of normalized codes (same values and dtype as the map-based version)
+    """
+
+    # Equal numbers (1, 1.0, True) share a code and also share their normalized string
+    codes, uniques = pd.factorize(series.astype(object), use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+    normalized = uniques.copy()
+
+    # Type masks computed once per distinct type
+    unique_types = pd.Series(uniques, dtype=object).map(type)
+    numeric_types = [t for t in unique_types.unique() if issubclass(t, (int, float))]
+    is_numeric = unique_types.isin(numeric_types).to_numpy()
+
+    if is_numeric.any():
+        try:
+            normalized[is_numeric] = uniques[is_numeric].astype("int64").astype(str)
+        except OverflowError:
+            # Integers beyond int64 keep Python's arbitrary precision
+            normalized[is_numeric] = [str(int(x)) for x in uniques[is_numeric]]
+    if (~is_numeric).any():
+        normalized[~is_numeric] = uniques[~is_numeric].astype(str)
+
+    values = series.to_numpy(dtype=object).copy()
+    not_null = codes >= 0
+    values[not_null] = normalized[codes[not_null]]
+
+    # Same dtype inference as Series.map
+    return pd.Series(values, index=series.index, name=series.name, dtype=object).infer_objects()
+
+def excel_serial_to_datetime(series: pd.Series) -> pd.Series:
+    """
+    Vectorized conversion of Excel serial day numbers to datetimes
+    (equivalent to `timedelta(days=x) + datetime(1899, 12, 30)` per value; nulls become NaT).
+    """
+
+    days = pd.to_timedelta(pd.to_numeric(series, errors="coerce"), unit="D")
+    if not pd.api.types.is_integer_dtype(series):
+        # timedelta() keeps microsecond resolution for fractional days
+        days = days.dt.round("us")
+    return pd.Timestamp(1899, 12, 30) + days
+
 def check_null_str(df: pd.DataFrame) -> List:
     """
     Check for string values that should be treated as null/NaN.
@@ -41,12 +96,148 @@ def check_null_str(df: pd.DataFrame) -> List:
 
     suspect_values = ['nan', "null", "none", "", "n/a", "na"]
     nan_values = []
-    for col in df.columns:
-        for uniq in df[col].unique():
-            if str(uniq).lower() in suspect_values:
-                nan_values.append(uniq)
+
+    # Text-like columns: distinct values of all columns checked in one vectorized string pass
+    text_cols = df.select_dtypes(include=["object", "string", "category"]).columns
+    if len(text_cols):
+        uniques = np.concatenate([np.asarray(df[col].unique(), dtype=object) for col in text_cols])
+        lowered = np.char.lower(uniques.astype(str))
+        nan_values.extend(uniques[np.isin(lowered, suspect_values)])
+
+    # Other columns can only contribute NaN (str(nan) == 'nan'): float columns with missing values
+    float_cols = [col for col, dtype in df.dtypes.items()
+                  if isinstance(dtype, np.dtype) and dtype.kind == "f"]
+    if float_cols and df[float_cols].isna().to_numpy().any():
+        nan_values.append(np.nan)
+
     return list(set(nan_values))
 
+def resolve_worker_count(max_workers: int | None, n_tasks: int) -> int:
+    """
+    Resolve the number of worker processes for a parsing batch.
+
+    Args:
+        max_workers: Configured worker count (None or <= 0 means one per CPU core)
+        n_tasks: Number of files/databases to read
+
+    Returns:
+        Number of workers to use, never more than n_tasks (1 means sequential)
+    """
+
+    if max_workers is None or max_workers <= 0:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(max_workers, n_tasks))
+
+# Schema metadata keys used by the Arrow transport of worker results
+_MIXED_COLUMNS_KEY = b"mixed_object_columns"   # object columns split into typed parts
+_ENCODED_COLUMNS_KEY = b"dictionary_columns"   # string columns sent dictionary-encoded
+_MIXED_PARTS = ("int", "float", "str")
+
+def _split_mixed_column(series: pd.Series) -> Dict[str, pd.Series] | None:
+    """
+    Split an object column holding Python ints/floats/strings into one typed column per kind
+    (values missing in a part are null). Returns None if the column holds other types.
+    """
+
+    kinds = series.map(lambda x: "null" if pd.isna(x)
+                       else "int" if isinstance(x, int) and not isinstance(x, bool)
+                       else "float" if isinstance(x, float)
+                       else "str" if isinstance(x, str)
+                       else "other")
+    if (kinds == "other").any():
+        return None
+    return {
+        "int": series.where(kinds == "int").astype("Int64"),
+        "float": series.where(kinds == "float").astype("Float64"),
+        "str": series.where(kinds == "str").astype("string"),
+    }
+
+def to_transport(report: DataProcessingReport) -> DataProcessingReport:
+    """
+    Convert a worker report's DataFrame into an Arrow table before it is sent back
+    to the parent process (columnar buffers are cheaper to transfer than a pickled frame;
+    repeated strings such as machine/item codes are dictionary-encoded).
+
+    Raw Excel columns often mix numbers and text (e.g. material codes), which Arrow cannot
+    store in one column; those are split into int/float/str parts and rebuilt exactly by
+    `from_transport`. Frames with other unsupported values are sent unchanged.
+    """
+
+    df = report.data
+    if not isinstance(df, pd.DataFrame) or df.empty or not df.columns.is_unique:
+        return report
+
+    columns = {}
+    mixed_columns = []
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object:
+            try:
+                pa.array(series, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                parts = _split_mixed_column(series)
+                if parts is None:
+                    return report
+                mixed_columns.append(str(col))
+                columns.update({f"{col}::{kind}": parts[kind] for kind in _MIXED_PARTS})
+                continue
+        columns[col] = series
+
+    try:
+        table = pa.Table.from_pandas(pd.DataFrame(columns), preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return report
+
+    encoded_columns = [name for name, column in zip(table.column_names, table.columns)
+                       if pa.types.is_string(column.type) or pa.types.is_large_string(column.type)]
+    metadata = {**(table.schema.metadata or {}),
+                _MIXED_COLUMNS_KEY: "\x1f".join(mixed_columns).encode("utf-8"),
+                _ENCODED_COLUMNS_KEY: "\x1f".join(encoded_columns).encode("utf-8")}
+    table = pa.table(
+        [column.dictionary_encode() if name in encoded_columns else column
+         for name, column in zip(table.column_names, table.columns)],
+        names=table.column_names,
+        metadata=metadata)
+
+    report.data = table
+    return report
+
+def from_transport(report: DataProcessingReport) -> DataProcessingReport:
+    """Restore the DataFrame of a report produced by `to_transport`."""
+
+    table = report.data
+    if not isinstance(table, pa.Table):
+        return report
+
+    def column_list(key: bytes) -> List[str]:
+        encoded = (table.schema.metadata or {}).get(key)
+        return encoded.decode("utf-8").split("\x1f") if encoded else []
+
+    # Decode dictionaries first so to_pandas restores the original dtypes
+    encoded_columns = column_list(_ENCODED_COLUMNS_KEY)
+    table = pa.table(
+        [column.cast(column.type.value_type) if name in encoded_columns else column
+         for name, column in zip(table.column_names, table.columns)],
+        names=table.column_names,
+        metadata=table.schema.metadata)
+
+    mixed_columns = column_list(_MIXED_COLUMNS_KEY)
+    df = table.to_pandas()
+
+    for col in mixed_columns:
+        parts = [f"{col}::{kind}" for kind in _MIXED_PARTS]
+        int_part, float_part, str_part = (df[name].astype(object) for name in parts)
+        restored = pd.Series(np.nan, index=df.index, dtype=object)
+        for part, caster in ((str_part, str), (float_part, float), (int_part, int)):
+            mask = part.notna()
+            restored[mask] = [caster(v) for v in part[mask]]
+        position = df.columns.get_loc(parts[0])
+        df = df.drop(columns=parts)
+        df.insert(position, col, restored)
+
+    report.data = df
+    return report
+
 #---------------------#
 # StaticDataProcessor #
 #---------------------#
@@ -81,7 +272,7 @@ def process_static_database(
             try:
                 for c in spec_cases:
                     if c in df.columns:
-                        df[c] = df[c].map(safe_convert)
+                        df[c] = normalize_code_column(df[c])
             except Exception as e:
                 return DataProcessingReport(
                     status=ProcessingStatus.PARTIAL_SUCCESS,
@@ -263,6 +454,68 @@ def process_single_file(
                     }
         )
 
+def _read_file_worker(file_path: Path | str,
+                      sheet_name: str,
+                      file_extension: str,
+                      required_fields: List[str]) -> DataProcessingReport:
+    """Process-pool entry point: parse one file and return an Arrow-backed report."""
+    return to_transport(process_single_file(file_path, sheet_name, file_extension, required_fields))
+
+def read_source_files(
+        file_paths: List[Path | str],
+        sheet_name: str,
+        file_extension: str,
+        required_fields: List[str],
+        max_workers: int | None = 1) -> List[DataProcessingReport]:
+
+    """
+    Parse several source files, in parallel worker processes when max_workers > 1.
+
+    Excel parsing (pyxlsb/openpyxl) is CPU-bound pure Python, so files are read in a
+    process pool rather than threads. Workers return Arrow tables that are converted
+    back to DataFrames here.
+
+    Args:
+        file_paths: Files to parse
+        sheet_name: Name of the sheet to read from
+        file_extension: File extension (.xlsb or .xlsx)
+        required_fields: List of required column names
+        max_workers: Number of worker processes (1 = sequential, None/0 = one per CPU core)
+
+    Returns:
+        One DataProcessingReport per file, in the order of file_paths
+    """
+
+    n_workers = resolve_worker_count(max_workers, len(file_paths))
+
+    if n_workers == 1:
+        return [process_single_file(file_path, sheet_name, file_extension, required_fields)
+                for file_path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_read_file_worker, file_path, sheet_name, 
+                               file_extension, required_fields)
+                   for file_path in file_paths]
+        
+        reports = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                reports.append(from_transport(future.result()))
+            except Exception as e:
+                # Worker crashed (e.g. killed or result not transferable)
+                reports.append(DataProcessingReport(
+                    status=ProcessingStatus.ERROR,
+                    data=pd.DataFrame(),
+                    error_type=ErrorType.FILE_READ_ERROR,
+                    error_message=f"Failed to read file {file_path}: {str(e)}",
+                    metadata={
+                        "file_path": file_path,
+                        "sheet_name": sheet_name,
+                        "file_extension": file_extension,
+                        }
+                    ))
+        return reports
+
 def merge_and_process_dfs(
         db_name: str, 
         merged_dfs: List[pd.DataFrame], 
@@ -326,8 +579,7 @@ def merge_and_process_dfs(
             # - Assumes recordDate is Excel serial (int64) from .xlsb
             # - Faster & explicit, not universal by design
             if 'recordDate' in processed_df.columns:
-                processed_df['recordDate'] = processed_df['recordDate'].apply(
-                    lambda x: timedelta(days=x) + datetime(1899,12,30))
+                processed_df['recordDate'] = excel_serial_to_datetime(processed_df['recordDate'])
             
         if db_name == "purchaseOrders":
             # Convert date columns to datetime
@@ -339,7 +591,7 @@ def merge_and_process_dfs(
             try:
                 for c in spec_cases:
                     if c in processed_df.columns:
-                        processed_df[c] = processed_df[c].map(safe_convert)
+                        processed_df[c] = normalize_code_column(processed_df[c])
             except Exception as e:
                 return DataProcessingReport(
                     status=ProcessingStatus.PARTIAL_SUCCESS,
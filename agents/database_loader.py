@@ -0,0 +1,271 @@
+# agents/database_loader.py
+
+"""
+Shared reader for the databases published by the data pipeline (DataCollector/newest).
+
+A database entry in path_annotations.json points either to a single parquet file or to a
+month-partitioned dataset directory:
+
+    {timestamp}_{db_name}.parquet/
+        _manifest.json        partition column + one entry per partition (file, rows, min, max)
+        2018-11.parquet       rows whose partition date falls in 2018-11
+        2018-12.parquet
+        undated.parquet       rows with a missing partition date
+
+Both layouts can still be read in full with `pd.read_parquet(path)` (files starting with
+"_" are ignored by pyarrow). `load_database` additionally supports partition pruning
+(`start` / `end` / `partitions`) and column projection (`columns`).
+
+Full reads made while an agents.dataframe_store session is open are served from the
+shared in-memory store, so modules of one workflow run decode each database once.
+
+Backends (`backend=` or the OPTIMOLDIQ_DB_BACKEND environment variable):
+    pandas   decode the parquet files into fresh pandas objects (default)
+    arrow    memory-map an uncompressed Arrow IPC mirror of each parquet file
+             (_{stem}.arrow, written on first use) and wrap its buffers without copying;
+             strings stay `string[pyarrow]`. Processes loading the same database share
+             the mapped pages through the OS page cache.
+"""
+
+from agents.dataframe_store import get_dataframe_store
+
+from loguru import logger
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+from pathlib import Path
+import os
+import json
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATASET_MANIFEST_NAME = "_manifest.json"
+UNDATED_PARTITION = "undated"
+
+LOADER_BACKENDS = ("pandas", "arrow")
+DEFAULT_BACKEND = os.environ.get("OPTIMOLDIQ_DB_BACKEND", "pandas")
+
+# databaseSchemas.json dtype -> Arrow-backed pandas dtype
+_ARROW_SCHEMA_DTYPES = {"string": "string[pyarrow]"}
+
+#----------#
+# Manifest #
+#----------#
+def is_partitioned_dataset(path: Path | str) -> bool:
+    return (Path(path) / DATASET_MANIFEST_NAME).is_file()
+
+def read_dataset_manifest(path: Path | str) -> Optional[Dict[str, Any]]:
+    """Return the manifest of a partitioned dataset, or None for a single parquet file."""
+    manifest_path = Path(path) / DATASET_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def dataset_files(path: Path | str) -> List[Path]:
+    """Parquet files making up a database, in stored row order."""
+    path = Path(path)
+    manifest = read_dataset_manifest(path)
+    if manifest is None:
+        return [path]
+    return [path / partition["file"] for partition in manifest["partitions"]]
+
+def database_date_bounds(path: Path | str,
+                         date_column: Optional[str] = None) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    (min, max) of the partition date of a database.
+    Served from the manifest for partitioned datasets; single files only read `date_column`.
+    """
+    manifest = read_dataset_manifest(path)
+    if manifest is not None:
+        dated = [p for p in manifest["partitions"] if p["key"] != UNDATED_PARTITION]
+        if not dated:
+            return pd.NaT, pd.NaT
+        return (min(pd.Timestamp(p["min"]) for p in dated),
+                max(pd.Timestamp(p["max"]) for p in dated))
+
+    if date_column is None:
+        raise ValueError(f"date_column is required for non-partitioned database {path}")
+    dates = pd.read_parquet(path, columns=[date_column])[date_column]
+    return dates.min(), dates.max()
+
+#---------------#
+# Arrow mirrors #
+#---------------#
+def arrow_mirror_path(parquet_file: Path | str) -> Path:
+    """Arrow IPC mirror of a parquet file ("_" prefix: ignored by parquet dataset discovery)."""
+    parquet_file = Path(parquet_file)
+    return parquet_file.with_name(f"_{parquet_file.stem}.arrow")
+
+def remove_arrow_mirrors(path: Path | str) -> None:
+    """Delete the Arrow mirror of a single-file database (dataset mirrors live inside it)."""
+    path = Path(path)
+    if not path.is_dir():
+        arrow_mirror_path(path).unlink(missing_ok=True)
+
+def _map_arrow_mirror(parquet_file: Path) -> pa.Table:
+    mirror = arrow_mirror_path(parquet_file)
+    if not mirror.exists() or mirror.stat().st_mtime_ns < parquet_file.stat().st_mtime_ns:
+        table = pq.read_table(parquet_file)
+        # Write aside and rename, so concurrent processes never map a partial file
+        tmp_path = mirror.with_name(f"{mirror.name}.{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, mirror)
+        logger.debug("Wrote Arrow mirror {}", mirror)
+
+    # The returned buffers reference the mapping, which stays open while they are alive
+    return pa.ipc.open_file(pa.memory_map(str(mirror), "r")).read_all()
+
+def _read_table(parquet_file: Path, columns: Optional[List[str]], backend: str) -> pa.Table:
+    if backend == "arrow":
+        table = _map_arrow_mirror(parquet_file)
+        return table.select(columns) if columns is not None else table
+    return pq.read_table(parquet_file, columns=columns)
+
+def _arrow_types_mapper(arrow_type: pa.DataType):
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+def _apply_schema_dtypes(df: pd.DataFrame, dtypes: Dict[str, str], backend: str) -> pd.DataFrame:
+    conversions = {}
+    for column, dtype in dtypes.items():
+        if column not in df.columns:
+            continue
+        if backend == "arrow":
+            dtype = _ARROW_SCHEMA_DTYPES.get(dtype, dtype)
+        if df[column].dtype != pd.api.types.pandas_dtype(dtype):
+            conversions[column] = dtype
+    return df.astype(conversions) if conversions else df
+
+#---------#
+# Loading #
+#---------#
+def schema_dtypes(database_schemas: Dict[str, Any], db_name: str) -> Optional[Dict[str, str]]:
+    """`dtypes` declared for a database in databaseSchemas.json (dynamicDB or staticDB), if any."""
+    for db_type in ("dynamicDB", "staticDB"):
+        spec = (database_schemas or {}).get(db_type, {}).get(db_name)
+        if spec:
+            return spec.get("dtypes")
+    return None
+
+def _select_partitions(manifest: Dict[str, Any],
+                       start: Optional[pd.Timestamp],
+                       end: Optional[pd.Timestamp],
+                       partitions: Optional[Iterable[str]]) -> List[Dict[str, Any]]:
+    selected = manifest["partitions"]
+
+    if partitions is not None:
+        keys = set(partitions)
+        selected = [p for p in selected if p["key"] in keys]
+
+    if start is not None or end is not None:
+        # Undated rows can never match a date range
+        selected = [p for p in selected if p["key"] != UNDATED_PARTITION]
+        if start is not None:
+            selected = [p for p in selected if pd.Timestamp(p["max"]) >= start]
+        if end is not None:
+            selected = [p for p in selected if pd.Timestamp(p["min"]) <= end]
+
+    return selected
+
+def load_database(path: Path | str,
+                  columns: Optional[List[str]] = None,
+                  start: Optional[Any] = None,
+                  end: Optional[Any] = None,
+                  partitions: Optional[Iterable[str]] = None,
+                  date_column: Optional[str] = None,
+                  dtypes: Optional[Dict[str, str]] = None,
+                  backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load a database written by the data pipeline.
+
+    Args:
+        path: Database path from path_annotations.json (parquet file or dataset directory)
+        columns: Columns to read (None = all)
+        start: Keep rows whose date is >= start (inclusive)
+        end: Keep rows whose date is <= end (inclusive)
+        partitions: Partition keys ("YYYY-MM" or "undated") to read; ignored for single files
+        date_column: Column used by start/end; defaults to the dataset's partition column
+            (required when filtering a single parquet file)
+        dtypes: Column dtypes to enforce (the `dtypes` of databaseSchemas.json); with the
+            arrow backend "string" maps to `string[pyarrow]`
+        backend: "pandas" or "arrow" (None = DEFAULT_BACKEND)
+
+    Returns:
+        DataFrame in stored row order, with the dtypes of the saved frame
+    """
+    path = Path(path)
+    backend = backend or DEFAULT_BACKEND
+    if backend not in LOADER_BACKENDS:
+        raise ValueError(f"Unknown loader backend: '{backend}'. Available: {list(LOADER_BACKENDS)}")
+
+    is_full_read = columns is None and start is None and end is None and partitions is None
+    store = get_dataframe_store()
+    if is_full_read and store.active:
+        # Stored once per backend and dtypes: consumers never get another variant's frame
+        variant = f"{backend}:{json.dumps(dtypes or {}, sort_keys=True)}"
+        return store.get(path,
+                         lambda: _typed(_read_database(path, backend=backend), dtypes, backend),
+                         variant)
+
+    df = _read_database(path, columns, start, end, partitions, date_column, backend)
+    return _typed(df, dtypes, backend)
+
+def _typed(df: pd.DataFrame, dtypes: Optional[Dict[str, str]], backend: str) -> pd.DataFrame:
+    return _apply_schema_dtypes(df, dtypes, backend) if dtypes else df
+
+def _read_database(path: Path,
+                   columns: Optional[List[str]] = None,
+                   start: Optional[Any] = None,
+                   end: Optional[Any] = None,
+                   partitions: Optional[Iterable[str]] = None,
+                   date_column: Optional[str] = None,
+                   backend: str = "pandas") -> pd.DataFrame:
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    has_range = start is not None or end is not None
+
+    manifest = read_dataset_manifest(path)
+    if manifest is not None:
+        date_column = date_column or manifest["partition_column"]
+    elif has_range and date_column is None:
+        raise ValueError(f"date_column is required to filter non-partitioned database {path}")
+
+    # The date column must be read to filter rows, even if it is not projected
+    read_columns = columns
+    if columns is not None and has_range and date_column not in columns:
+        read_columns = list(columns) + [date_column]
+
+    types_mapper = _arrow_types_mapper if backend == "arrow" else None
+
+    if manifest is None and backend == "pandas":
+        df = pd.read_parquet(path, columns=read_columns)
+    elif manifest is None:
+        df = _read_table(path, read_columns, backend).to_pandas(types_mapper=types_mapper)
+    else:
+        selected = _select_partitions(manifest, start, end, partitions)
+        logger.debug("{}: reading {}/{} partitions", path.name, len(selected), len(manifest["partitions"]))
+
+        if selected:
+            tables = [_read_table(path / p["file"], read_columns, backend) for p in selected]
+            table = pa.concat_tables(tables)
+        else:
+            first_file = path / manifest["partitions"][0]["file"]
+            table = pq.read_schema(first_file).empty_table()
+            if read_columns is not None:
+                table = table.select(read_columns)
+        df = table.to_pandas(types_mapper=types_mapper)
+
+    if has_range:
+        mask = df[date_column].notna()
+        if start is not None:
+            mask &= df[date_column] >= start
+        if end is not None:
+            mask &= df[date_column] <= end
+        df = df[mask].reset_index(drop=True)
+
+    if columns is not None and read_columns is not columns:
+        df = df[list(columns)]
+
+    return df
@@ -0,0 +1,211 @@
+# agents/dataframe_store.py
+
+"""
+Process-wide store of decoded shared databases.
+
+Within one workflow run (WorkflowExecutor.execute) or chain (OptiMoldIQ.execute_chain)
+every agent loads the same tables from path_annotations.json. While a session is open,
+`agents.database_loader.load_database` serves full reads from this store, so the chain
+decodes each database version once instead of once per module.
+
+- Entries are keyed by (resolved database path, file version, variant), the variant being
+  the loader backend and dtypes; a new version written by the data pipeline gets a new
+  key and the entries of older versions are dropped.
+- Sessions belong to the context that opened them (a contextvars.ContextVar: the run's
+  thread, and the module threads it submits with a copied context). A session holds a
+  reference to the entries loaded in its context only, so overlapping runs (concurrent
+  API jobs) do not pin each other's databases.
+- Referenced entries are never evicted. Unreferenced entries are evicted
+  least-recently-used first once the memory budget is exceeded; a warning is logged
+  when the entries pinned by open sessions alone exceed it.
+- Consumers receive shallow copies under pandas copy-on-write (default from pandas 3)
+  and deep copies otherwise, so in-place edits never leak into the shared copy.
+"""
+
+from loguru import logger
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+from pathlib import Path
+import os
+import threading
+import pandas as pd
+
+DEFAULT_MEMORY_BUDGET_BYTES = int(os.environ.get("OPTIMOLDIQ_DF_STORE_BUDGET_MB", "1024")) * 1024 * 1024
+
+StoreKey = Tuple[str, str, str]
+
+def _copy_on_write() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+@dataclass
+class StoreEntry:
+    """One decoded database version"""
+    df: pd.DataFrame
+    size_bytes: int
+    sessions: Set[int] = field(default_factory=set)
+
+    @property
+    def ref_count(self) -> int:
+        return len(self.sessions)
+
+def file_version(path: Path | str) -> str:
+    """
+    Version token of a stored database: size/mtime of the parquet file, or of the
+    dataset manifest for partitioned datasets (rewritten with every version).
+    """
+    path = Path(path)
+    target = path / "_manifest.json" if path.is_dir() else path
+    stat = target.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+class DataFrameStore:
+    """Reference-counted LRU cache of decoded DataFrames under a memory budget"""
+
+    def __init__(self, memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES):
+        self.memory_budget_bytes = memory_budget_bytes
+
+        self._entries: "OrderedDict[StoreKey, StoreEntry]" = OrderedDict()
+        self._next_session = 0
+
+        # Sessions opened by the current context (nested sessions: execute_chain -> execute)
+        self._context_sessions: ContextVar[Tuple[int, ...]] = ContextVar(
+            f"dataframe_store_sessions_{id(self)}", default=())
+        self._lock = threading.RLock()
+
+        # Per-key locks so concurrent modules decode a database only once
+        self._load_locks: Dict[StoreKey, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    #----------#
+    # Sessions #
+    #----------#
+    @property
+    def active(self) -> bool:
+        """A session is open in the current context."""
+        return bool(self._context_sessions.get())
+
+    @contextmanager
+    def session(self) -> Iterator[int]:
+        """Share decoded databases between every load made in this context until the block exits."""
+        with self._lock:
+            session_id = self._next_session
+            self._next_session += 1
+        token = self._context_sessions.set(self._context_sessions.get() + (session_id,))
+        try:
+            yield session_id
+        finally:
+            self._context_sessions.reset(token)
+            self._release(session_id)
+
+    def _release(self, session_id: int) -> None:
+        """Drop the references of a closed session, then enforce the budget."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.sessions.discard(session_id)
+            self._evict()
+
+    #---------#
+    # Lookups #
+    #---------#
+    def get(self,
+            path: Path | str,
+            loader: Callable[[], pd.DataFrame],
+            variant: str = "") -> pd.DataFrame:
+        """
+        Return the database at `path`, decoding it with `loader` only if the current
+        version is not stored yet for `variant` (how `loader` decodes it: backend, dtypes).
+        Referenced by the sessions of the current context.
+        """
+        resolved = str(Path(path).resolve())
+        key = (resolved, file_version(resolved), variant)
+        sessions = self._context_sessions.get()
+
+        with self._lock:
+            entry = self._hit(key, sessions)
+            if entry is None:
+                load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        if entry is None:
+            with load_lock:
+                with self._lock:
+                    entry = self._hit(key, sessions)
+                if entry is None:
+                    df = loader()
+                    with self._lock:
+                        entry = self._insert(key, df, sessions)
+                        self._load_locks.pop(key, None)
+
+        return entry.df.copy(deep=not _copy_on_write())
+
+    def _hit(self, key: StoreKey, sessions: Tuple[int, ...]) -> Optional[StoreEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        entry.sessions.update(sessions)
+        logger.debug("DataFrameStore hit: {}", Path(key[0]).name)
+        return entry
+
+    def _insert(self, key: StoreKey, df: pd.DataFrame, sessions: Tuple[int, ...]) -> StoreEntry:
+        self.misses += 1
+
+        # Older versions of the same database can never be requested again
+        for stale in [k for k in self._entries if k[0] == key[0] and k[1] != key[1]]:
+            del self._entries[stale]
+
+        entry = StoreEntry(df=df,
+                           size_bytes=int(df.memory_usage(deep=True).sum()),
+                           sessions=set(sessions))
+        self._entries[key] = entry
+        logger.debug("DataFrameStore stored {} ({:.1f} MB)", Path(key[0]).name, entry.size_bytes / 1e6)
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Evict unreferenced entries, least recently used first, until within budget."""
+        total = self.size_bytes
+        for key in list(self._entries):
+            if total <= self.memory_budget_bytes:
+                break
+            entry = self._entries[key]
+            if entry.ref_count:
+                continue
+            del self._entries[key]
+            total -= entry.size_bytes
+            logger.debug("DataFrameStore evicted {}", Path(key[0]).name)
+
+        if total > self.memory_budget_bytes:
+            logger.warning("DataFrameStore over budget: {:.1f}/{:.1f} MB pinned by open sessions",
+                           total / 1e6, self.memory_budget_bytes / 1e6)
+
+    #-------#
+    # Stats #
+    #-------#
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+_default_store = DataFrameStore()
+
+def get_dataframe_store() -> DataFrameStore:
+    """The process-wide store used by load_database."""
+    return _default_store
@@ -0,0 +1,143 @@
+# agents/incremental_state.py
+
+"""
+Shared helpers of the agents that persist state between runs and resume over
+append-only history (history sweeps, incremental feature extraction, progress tracking).
+
+State folded from the rows up to a watermark can only be resumed while those rows are
+unchanged. A row count is not enough (a corrected quantity keeps the count), so the
+state stores `rows_digest` of the folded rows and compares it on the next run.
+
+FoldedState is persisted as a directory of parquet tables plus a JSON metadata file
+(save_state_files / load_state_files).
+"""
+
+from loguru import logger
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+import json
+import os
+import numpy as np
+import pandas as pd
+
+def rows_digest(df: pd.DataFrame, columns: Optional[List[str]] = None) -> str:
+    """
+    Order-independent digest of the rows of `df` (restricted to `columns`): the sum of
+    per-row content hashes, so re-sorted rows keep it and any edited value changes it.
+    """
+    if columns is not None:
+        df = df[columns]
+    try:
+        hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # Unhashable values (lists, dicts): hash their repr
+        df = df.apply(lambda s: s.map(repr) if s.dtype == object else s)
+        hashes = pd.util.hash_pandas_object(df, index=False)
+    total = hashes.to_numpy(dtype=np.uint64).sum(dtype=np.uint64)
+    return f"{len(df)}:{int(total):016x}"
+
+#-------------------------------------------#
+# State folded up to a watermark            #
+#-------------------------------------------#
+def folded_mask(watermarks: pd.Series, watermark: pd.Timestamp) -> pd.Series:
+    """Rows a state with this watermark covers; rows without one are included so that new ones force a recompute."""
+    return (watermarks <= watermark) | watermarks.isna()
+
+def count_folded_rows(watermarks: pd.Series, watermark: pd.Timestamp) -> int:
+    return int(folded_mask(watermarks, watermark).sum())
+
+def folded_rows_digest(records: pd.DataFrame,
+                       watermarks: pd.Series,
+                       watermark: pd.Timestamp,
+                       columns: Optional[List[str]] = None) -> str:
+    """rows_digest of the rows a state with this watermark covers."""
+    return rows_digest(records.loc[folded_mask(watermarks, watermark)], columns)
+
+def make_settings_key(settings: Optional[Dict[str, Any]]) -> str:
+    """Fingerprint of the settings a state was folded with."""
+    return json.dumps(settings or {}, sort_keys=True, default=str)
+
+@dataclass
+class FoldedState:
+    """State folded from the records whose watermark column is up to `watermark`"""
+    watermark: str
+    rows_folded: int
+    settings_key: str
+    # folded_rows_digest at the watermark (None: written before digests, never resumed)
+    rows_digest: Optional[str] = None
+
+    @property
+    def since(self) -> pd.Timestamp:
+        return pd.Timestamp(self.watermark)
+
+    def covers(self,
+               records: pd.DataFrame,
+               watermarks: pd.Series,
+               settings_key: str,
+               columns: Optional[List[str]] = None) -> bool:
+        """
+        True if the state can be updated with records after the watermark: the same rows,
+        with the same values, are up to it (history was only appended to) and the settings
+        are unchanged. `watermarks` holds the watermark column of `records`.
+        """
+        return (self.rows_digest is not None and
+                settings_key == self.settings_key and
+                count_folded_rows(watermarks, self.since) == self.rows_folded and
+                folded_rows_digest(records, watermarks, self.since, columns) == self.rows_digest)
+
+def load_state_files(state_dir: Path | str,
+                     meta_file_name: str) -> Optional[Tuple[Dict[str, Any], Dict[str, pd.DataFrame]]]:
+    """
+    Read the files written by save_state_files: the FoldedState fields and the tables.
+    None if missing or unreadable.
+    """
+    state_dir = Path(state_dir)
+    meta_path = state_dir / meta_file_name
+    if not meta_path.is_file():
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        fields = {"watermark": meta["watermark"],
+                  "rows_folded": meta["rows_folded"],
+                  "settings_key": meta["settings_key"],
+                  "rows_digest": meta.get("rows_digest")}
+        tables = {name: pd.read_parquet(state_dir / f"{name}.parquet") for name in meta["tables"]}
+        return fields, tables
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable state {}: {}", meta_path, e)
+        return None
+
+def save_state_files(state_dir: Path | str,
+                     meta_file_name: str,
+                     state: FoldedState,
+                     tables: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write the tables, then the metadata (each via tmp file + replace).
+    The metadata is removed first and written last: an interrupted save leaves no loadable state.
+    """
+    state_dir = Path(state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+
+    meta_path = state_dir / meta_file_name
+    if meta_path.exists():
+        os.remove(meta_path)
+
+    for name, table in tables.items():
+        _replace_parquet(table, state_dir / f"{name}.parquet")
+
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"watermark": state.watermark,
+                   "rows_folded": int(state.rows_folded),
+                   "rows_digest": state.rows_digest,
+                   "settings_key": state.settings_key,
+                   "tables": list(tables)}, f, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+    logger.debug("Saved {} at {} ({})", state.__class__.__name__, state.watermark, state_dir)
+
+def _replace_parquet(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
@@ -6,8 +6,11 @@ import pandas as pd
 from typing import Dict, Any, NoReturn, List
 from configs.shared.config_report_format import ConfigReportMixin
 from agents.utils import load_annotation_path, read_change_log
+from agents.database_loader import load_database, schema_dtypes
+from agents.result_store import read_result
 from configs.shared.shared_source_config import SharedSourceConfig
 from agents.orderProgressTracker.save_output_formatter import save_tracking_data
+from agents.orderProgressTracker.tracking_state import load_tracking_state, save_tracking_state
 
 # Import agent report format components
 from configs.shared.agent_report_format import (
@@ -90,7 +93,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -165,7 +168,7 @@ class DependencyDataLoadingPhase(AtomicPhase):
             logger.info("No change log file found")
             raise FileNotFoundError("No validation change log found")
         
-        # Read all sheets from the Excel file
+        # Read all sheets of the validation result
         validation_data = self._collect_validation_data(excel_file_path)
 
         self.dependency_data_container.update({"validation_data": validation_data})
@@ -175,14 +178,9 @@ class DependencyDataLoadingPhase(AtomicPhase):
         return {"validation_data": validation_data}
     
     def _collect_validation_data(self, excel_file_path: str) -> Dict[str, pd.DataFrame]:
-        """Read all sheets from the Excel file"""
+        """Read all sheets of the validation result (result store, or Excel for older results)"""
         try:
-            result = {}
-            xls = pd.ExcelFile(excel_file_path)
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(excel_file_path, sheet_name=sheet_name)
-                result[sheet_name] = df
-            return result
+            return read_result(excel_file_path, sheet_name=None)
         except Exception as e:
             logger.error(f"Error processing validation report: {e}")
             raise FileNotFoundError(f"Error processing validation report: {e}")
@@ -195,6 +193,44 @@ class DependencyDataLoadingPhase(AtomicPhase):
 
         return {"validation_data": {}}
 
+# ============================================
+# TRACKING STATE LOADING PHASE
+# ============================================
+class TrackingStateLoadingPhase(AtomicPhase):
+    """Phase for loading the tracking state of the previous run (incremental tracking)"""
+
+    RECOVERABLE_ERRORS = (OSError, ValueError, KeyError)
+    CRITICAL_ERRORS = (MemoryError, KeyboardInterrupt)
+    FALLBACK_FAILURE_IS_CRITICAL = False  # Without a state, the full history is aggregated
+
+    def __init__(self,
+                 config: SharedSourceConfig,
+                 state_container: Dict[str, Any]):
+        super().__init__("TrackingStateLoading")
+        self.config = config
+        self.state_container = state_container
+
+    def _execute_impl(self) -> Dict[str, Any]:
+        """Load the previous tracking state (checked against the records by ProgressTracker)"""
+        state_dir = self.config.progress_tracker_state_dir
+        logger.info("📂 Loading tracking state from {}...", state_dir)
+
+        state = load_tracking_state(state_dir)
+
+        if state is None:
+            logger.info("No tracking state found, the full history will be aggregated")
+        else:
+            logger.info("✓ Tracking state loaded up to {}", state.watermark)
+
+        self.state_container['previous_state'] = state
+
+        return {"watermark": state.watermark if state is not None else None}
+
+    def _fallback(self) -> Dict[str, Any]:
+        """Aggregate the full history"""
+        self.state_container['previous_state'] = None
+        return {"watermark": None}
+
 # ============================================
 # PHASE 3: PROGRESS TRACKING
 # ============================================
@@ -207,10 +243,12 @@ class ProgressTrackingPhase(AtomicPhase):
     
     def __init__(self, 
                  data_container: Dict[str, Any], 
-                 dependency_data_container: Dict[str, Any]):
+                 dependency_data_container: Dict[str, Any],
+                 state_container: Dict[str, Any]):
         super().__init__("ProgressTracker")
         self.loaded_data = data_container
         self.dependency_data = dependency_data_container
+        self.state_container = state_container
     
     def _execute_impl(self) -> Dict[str, Any]:
         """Run progress tracking logic"""
@@ -235,7 +273,8 @@ class ProgressTrackingPhase(AtomicPhase):
             validation_data
         )
         
-        tracker_result = tracker.run_tracking()
+        tracker_result = tracker.run_tracking(self.state_container.get('previous_state'))
+        self.state_container['tracking_state'] = tracker_result.pop('tracking_state')
         logger.info("✓ Progress tracking completed")
         
         return {
@@ -255,6 +294,40 @@ class ProgressTrackingPhase(AtomicPhase):
             "ProgressTracker cannot fallback."
         )
 
+# ============================================
+# TRACKING STATE SAVING PHASE
+# ============================================
+class TrackingStateSavingPhase(AtomicPhase):
+    """Phase for saving the aggregates of this run, so the next run can be incremental"""
+
+    RECOVERABLE_ERRORS = (OSError, ValueError, KeyError)
+    CRITICAL_ERRORS = (MemoryError, KeyboardInterrupt)
+    FALLBACK_FAILURE_IS_CRITICAL = False  # The next run falls back to the full history
+
+    def __init__(self,
+                 config: SharedSourceConfig,
+                 state_container: Dict[str, Any]):
+        super().__init__("TrackingStateSaving")
+        self.config = config
+        self.state_container = state_container
+
+    def _execute_impl(self) -> Dict[str, Any]:
+        """Save the aggregates covering all loaded records"""
+        state = self.state_container.get('tracking_state')
+        if state is None:
+            raise ValueError("Records have no valid shift, state not saved")
+
+        state_dir = self.config.progress_tracker_state_dir
+        save_tracking_state(state_dir, state)
+        logger.info("✓ Tracking state saved up to {} ({})", state.watermark, state_dir)
+
+        return {"watermark": state.watermark, "saved": True}
+
+    def _fallback(self) -> Dict[str, Any]:
+        """Skip saving: the next run aggregates the full history"""
+        logger.warning("Tracking state not saved, the next run will aggregate the full history")
+        return {"watermark": None, "saved": False}
+
 # ============================================
 # MAIN AGENT: ORDER PROGRESS TRACKER
 # ============================================
@@ -273,7 +346,9 @@ class OrderProgressTracker(ConfigReportMixin):
         'validation_change_log_path': str,
         'progress_tracker_dir': str,
         'progress_tracker_change_log_path': str,
-        'progress_tracker_constant_config_path': str
+        'progress_tracker_constant_config_path': str,
+        'progress_tracker_state_dir': str,
+        'incremental_tracking': bool
     }
     
     def __init__(self, config: SharedSourceConfig):
@@ -288,6 +363,8 @@ class OrderProgressTracker(ConfigReportMixin):
                 - progress_tracker_dir (str): Default directory for output and temporary files.
                 - progress_tracker_change_log_path (str): Path to the OrderProgressTracker change log.
                 - progress_tracker_constant_config_path (str): Path to the OrderProgressTracker constant config.
+                - progress_tracker_state_dir (str): Directory of the persisted per-PO aggregates.
+                - incremental_tracking (bool): Aggregate only records from shifts after the saved tracking state.
         """
         
         # Capture initialization arguments for reporting
@@ -334,6 +411,7 @@ class OrderProgressTracker(ConfigReportMixin):
         # ============================================
         shared_data = {}  # This will be populated by DataLoadingPhase
         dependency_data = {} # This will be populated by DependencyDataLoadingPhase
+        tracking_state = {} # This will be populated by TrackingStateLoadingPhase and ProgressTrackingPhase
         # ============================================
         # BUILD PHASE LIST WITH SHARED CONTAINER
         # ============================================
@@ -345,8 +423,16 @@ class OrderProgressTracker(ConfigReportMixin):
         # Phase 2: Dependency data Loading (always required)
         phases.append(DependencyDataLoadingPhase(self.config, dependency_data))
 
+        # Incremental tracking: aggregates of the previous run (full history otherwise)
+        if self.config.incremental_tracking:
+            phases.append(TrackingStateLoadingPhase(self.config, tracking_state))
+
         # Phase 3: Progress Tracking
-        phases.append(ProgressTrackingPhase(shared_data, dependency_data))
+        phases.append(ProgressTrackingPhase(shared_data, dependency_data, tracking_state))
+
+        # Save the aggregates for the next incremental run
+        if self.config.incremental_tracking:
+            phases.append(TrackingStateSavingPhase(self.config, tracking_state))
 
         # ============================================
         # EXECUTE USING COMPOSITE AGENT
@@ -3,6 +3,7 @@ from typing import Dict, List, Tuple, Optional, Any
 
 from loguru import logger
 from agents.utils import read_change_log
+from agents.result_store import read_result, result_sheet_names
 
 class ProcessDashboardReports:
 
@@ -51,9 +52,8 @@ class ProcessDashboardReports:
 
         try:
             self.logger.info("Start load data from source path {}", self.excel_file_path)
-            excel_file = pd.ExcelFile(self.excel_file_path)
-            self.sheet_names = excel_file.sheet_names
-            excel_file.close()  # Properly close the file
+            # Result store of the tracker result (Excel for results saved without one)
+            self.sheet_names = result_sheet_names(self.excel_file_path)
         except FileNotFoundError:
             self.logger.error("Excel file not found: {}", self.excel_file_path)
             raise FileNotFoundError(f"Excel file not found: {self.excel_file_path}")
@@ -81,7 +81,7 @@ class ProcessDashboardReports:
                 self.logger.error("Sheet '{}' not found in Excel file", sheet_name)
                 raise ValueError(f"Sheet '{sheet_name}' not found in Excel file")
 
-            df = pd.read_excel(self.excel_file_path, sheet_name=sheet_name)
+            df = read_result(self.excel_file_path, sheet_name=sheet_name)
             self.logger.info("Successfully loaded sheet '{}' with {} rows", sheet_name, len(df))
             return df
         except Exception as e:
@@ -123,42 +123,42 @@ class ProcessDashboardReports:
             "sheet_names": self.sheet_names,
             "sheet_details": {
                 "productionStatus": {"Description": "Main production status tracking",
-                                     "Dataframe review": pd.read_excel(
+                                     "Dataframe review": read_result(
                                         self.excel_file_path,
                                         sheet_name='productionStatus').head().to_dict()
                                     },
                 "materialComponentMap": {"Description": "Material and component mappings",
-                                         "Dataframe review": pd.read_excel(
+                                         "Dataframe review": read_result(
                                             self.excel_file_path,
                                             sheet_name='materialComponentMap').head().to_dict()
                                          },
                 "moldShotMap": {"Description": "Mold shot tracking and equipment usage",
-                                "Dataframe review": pd.read_excel(
+                                "Dataframe review": read_result(
                                     self.excel_file_path,
                                     sheet_name='moldShotMap').head().to_dict()
                                 },
                 "machineQuantityMap": {"Description": "Machine capacity and quantity mappings",
-                                       "Dataframe review": pd.read_excel(
+                                       "Dataframe review": read_result(
                                            self.excel_file_path,
                                            sheet_name='machineQuantityMap').head().to_dict()
                                        },
                 "dayQuantityMap": {"Description": "Daily production quantity tracking",
-                                   "Dataframe review": pd.read_excel(
+                                   "Dataframe review": read_result(
                                        self.excel_file_path,
                                        sheet_name='dayQuantityMap').head().to_dict()
                                    },
                 "notWorkingStatus": {"Description": "Non-working time and downtime tracking",
-                                     "Dataframe review": pd.read_excel(
+                                     "Dataframe review": read_result(
                                         self.excel_file_path,
                                         sheet_name='notWorkingStatus').head().to_dict()
                                      },
                 "item_invalid_warnings": {"Description": "Data validation warnings for items",
-                                          "Dataframe review": pd.read_excel(
+                                          "Dataframe review": read_result(
                                             self.excel_file_path,
                                             sheet_name='item_invalid_warnings').head().to_dict()
                                           },
                 "po_mismatch_warnings": {"Description": "Purchase order mismatch alerts",
-                                         "Dataframe review": pd.read_excel(
+                                         "Dataframe review": read_result(
                                             self.excel_file_path,
                                             sheet_name='po_mismatch_warnings').head().to_dict()
                 },
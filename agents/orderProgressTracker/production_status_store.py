@@ -0,0 +1,60 @@
+"""
+Typed productionStatus sheet of the tracker result.
+
+Excel keeps the per-PO lists and maps of productionStatus as Python-repr strings
+("{'M001': 1200}"), which every reader had to parse back row by row. The result store
+(agents.result_store) keeps them as Arrow types instead:
+
+- machineHist, moldHist:       list<string>
+- moldCavity:                  list<int64>
+- *QuantityMap, moldShotMap:   map<string, int64>
+- materialComponentMap:        list<struct<plasticResinCode, colorMasterbatchCode, additiveMasterbatchCode>>
+
+Readers get Python lists and dicts back, as produced by ProgressTracker. Results saved
+before the result store existed have a `.production_status.parquet` sidecar or only
+the Excel file (see load_production_status).
+"""
+
+from typing import Optional
+from pathlib import Path
+import pandas as pd
+import pyarrow as pa
+
+from agents.result_store import has_result_store, read_result, read_sheet_file, result_excel_path
+
+PRODUCTION_STATUS_SHEET = "productionStatus"
+PRODUCTION_STATUS_SIDECAR_SUFFIX = ".production_status.parquet"
+
+_QUANTITY_MAP_TYPE = pa.map_(pa.string(), pa.int64())
+
+NESTED_FIELD_TYPES = {
+    'machineHist': pa.list_(pa.string()),
+    'moldHist': pa.list_(pa.string()),
+    'moldCavity': pa.list_(pa.int64()),
+    'moldShotMap': _QUANTITY_MAP_TYPE,
+    'machineQuantityMap': _QUANTITY_MAP_TYPE,
+    'dayQuantityMap': _QUANTITY_MAP_TYPE,
+    'shiftQuantityMap': _QUANTITY_MAP_TYPE,
+    'materialComponentMap': pa.list_(pa.struct([('plasticResinCode', pa.string()),
+                                                ('colorMasterbatchCode', pa.string()),
+                                                ('additiveMasterbatchCode', pa.string())])),
+}
+
+# column_types of the tracker result (save_output_with_versioning)
+PRODUCTION_STATUS_COLUMN_TYPES = {PRODUCTION_STATUS_SHEET: NESTED_FIELD_TYPES}
+
+def production_status_sidecar_path(result_path: Path | str) -> Path:
+    """Sidecar location of a tracker result saved before the result store (same directory and stem)."""
+    excel_path = result_excel_path(result_path)
+    return excel_path.with_name(excel_path.stem + PRODUCTION_STATUS_SIDECAR_SUFFIX)
+
+def load_production_status(result_path: Path | str) -> Optional[pd.DataFrame]:
+    """productionStatus with native lists/maps; None if the result was only saved as Excel."""
+    if has_result_store(result_path):
+        return read_result(result_path, sheet_name=PRODUCTION_STATUS_SHEET)
+
+    sidecar_path = production_status_sidecar_path(result_path)
+    if sidecar_path.is_file():
+        return read_sheet_file(sidecar_path)
+
+    return None
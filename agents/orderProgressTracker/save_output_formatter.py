@@ -3,6 +3,7 @@ from configs.shared.agent_report_format import update_change_log
 from loguru import logger
 from typing import Dict
 from pathlib import Path
+from agents.orderProgressTracker.production_status_store import PRODUCTION_STATUS_COLUMN_TYPES
 
 def save_tracking_data(input_dict: Dict) -> Dict:
     
@@ -31,7 +32,8 @@ def save_tracking_data(input_dict: Dict) -> Dict:
             data=excel_data,
             output_dir=Path(output_dir),
             filename_prefix=camel_to_snake(agent_id),
-            report_text=tracking_summary
+            report_text=tracking_summary,
+            column_types=PRODUCTION_STATUS_COLUMN_TYPES
         )
         logger.info("Results exported successfully!")
 
@@ -58,4 +60,4 @@ def save_tracking_data(input_dict: Dict) -> Dict:
         metadata['summary'] = ''
         metadata['status'] = 'failed'
 
-    return metadata
\ No newline at end of file
+    return metadata
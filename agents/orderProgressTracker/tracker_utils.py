@@ -1,13 +1,15 @@
 from agents.decorators import validate_init_dataframes
 from loguru import logger
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_object_dtype
-from datetime import datetime, timedelta
+from datetime import datetime
 import ast
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from configs.shared.config_report_format import ConfigReportMixin
+from agents.orderProgressTracker.tracking_state import TrackingState, build_tracking_state, make_settings_key
 
 # Decorator to validate DataFrames are initialized with the correct schema
 @validate_init_dataframes(lambda self: {
@@ -25,6 +27,24 @@ class ProgressTracker(ConfigReportMixin):
     - Analyze production data by shift, machine, mold
     """
 
+    # Per-PO aggregation maps: map name -> (key field, summed value field)
+    AGGREGATION_MAP_FIELDS = {
+        'mold_map': ('moldNo', 'moldShot'),
+        'machine_map': ('machineHist', 'itemGoodQuantity'),
+        'date_map': ('recordDate', 'itemGoodQuantity'),
+        'shift_map': ('dateShiftCombined', 'itemGoodQuantity'),
+    }
+
+    MATERIAL_FIELDS = ['plasticResinCode', 'colorMasterbatchCode', 'additiveMasterbatchCode']
+
+    # Per-PO distinct value lists: output field -> source field
+    PO_VALUE_FIELDS = {
+        'machineHist': 'machineHist',
+        'moldHist': 'moldNo',
+        'moldCavity': 'moldCavity',
+        **{field: field for field in MATERIAL_FIELDS},
+    }
+
     def __init__(self, 
                  pro_status_schema: Dict,
                  databaseSchemas_data: Dict, 
@@ -60,7 +80,8 @@ class ProgressTracker(ConfigReportMixin):
         self.purchaseOrders_df = purchaseOrders_df
         self.moldSpecificationSummary_df = moldSpecificationSummary_df
 
-    def run_tracking(self) -> Dict[str, Any]:
+    def run_tracking(self, 
+                     previous_state: Optional[TrackingState] = None) -> Dict[str, Any]:
 
         """
         Main function to process and generate production status report
@@ -70,6 +91,13 @@ class ProgressTracker(ConfigReportMixin):
         2. Extract and summarize production data
         3. Process production status
         4. Add warning information
+
+        Args:
+            previous_state: Tracking state of an earlier run. If the records it covers are unchanged,
+                            only records from later shifts are aggregated and folded into it.
+
+        Returns:
+            dict: result, tracking_summary, log_str and tracking_state (state for the next run, may be None)
         """
 
         self.logger.info("Starting ProgressTracker ...")
@@ -93,9 +121,16 @@ class ProgressTracker(ConfigReportMixin):
             # - Aggregated production data by poNote, 
             # - List of POs currently in production, 
             # - DataFrame of records without production
+            aggregates, tracking_state, records_aggregated = self._track_product_records(
+                self.productRecords_df,
+                self.pro_status_schema['shift_start_map'],
+                previous_state)
+            tracking_log_lines.append(f"Records aggregated: {records_aggregated}/{len(self.productRecords_df)}\n")
+
             agg_df, producing_po_list, notWorking_productRecords_df = self._extract_product_records(
                 self.productRecords_df, 
-                self.pro_status_schema['shift_start_map'])
+                self.pro_status_schema['shift_start_map'],
+                aggregates)
 
             # Step 3: Generate production status report
             # Process production status information and handle data type conversions.
@@ -113,17 +148,14 @@ class ProgressTracker(ConfigReportMixin):
             
             # Mark pending POs as paused if they haven't been updated in the latest shift
             pro_status_df = self._mark_paused_pending_pos(
-                self.productRecords_df,
-                pro_status_df,
-                self.pro_status_schema['shift_start_map']
+                aggregates['latest_working_shifts'],
+                pro_status_df
                 )
 
             # Get the latest machine information for each machine based on working shift timestamp.
             # Includes machines that were not working (poNote is null) in the most recent shift.
             lastest_info_df = self._get_latest_po_info(
-                self.productRecords_df,
-                self.pro_status_schema['shift_start_map'],
-                keys=['machineNo', 'moldNo']
+                aggregates['latest_po_records']
                 )
             
             # Merge latest machine information into production status DataFrame
@@ -171,7 +203,8 @@ class ProgressTracker(ConfigReportMixin):
             return {
                 "result": final_result, 
                 "tracking_summary": tracking_summary,
-                "log_str": tracking_log_str}
+                "log_str": tracking_log_str,
+                "tracking_state": tracking_state}
         
         except Exception as e:
             self.logger.error("Failed to process ProgressTracker: {}", str(e))
@@ -191,9 +224,50 @@ class ProgressTracker(ConfigReportMixin):
     #---------------------------------------------------------------#
     # STEP 2: EXTRACT AND AGGREGATE PRODUCT RECORD INFORMATION      #
     #---------------------------------------------------------------#
+    def _track_product_records(self,
+                               productRecords_df: pd.DataFrame,
+                               shift_start_map: Dict,
+                               previous_state: Optional[TrackingState] = None
+                               ) -> Tuple[Dict[str, pd.DataFrame], Optional[TrackingState], int]:
+
+        """
+        Aggregate product records per PO, folding only records from new shifts into a previous state.
+
+        Args:
+            productRecords_df: DataFrame containing production records
+            shift_start_map: Dictionary mapping shift codes to start times
+            previous_state: Tracking state of an earlier run (None = aggregate the full history)
+
+        Returns:
+            Dict[str, pd.DataFrame]: Running per-PO aggregates covering all records
+            Optional[TrackingState]: State for the next run (None if no record has a valid shift)
+            int: Number of records aggregated in this run
+        """
+
+        shift_starts = ProgressTracker._get_shift_starts(productRecords_df, shift_start_map)
+        settings_key = make_settings_key(shift_start_map)
+
+        if previous_state is not None and previous_state.is_resumable(productRecords_df, shift_starts, settings_key):
+            new_records_df = productRecords_df[shift_starts > previous_state.since]
+            self.logger.info("Folding {} records from shifts after {}", len(new_records_df), previous_state.watermark)
+            aggregates = previous_state.aggregates
+            if not new_records_df.empty:
+                aggregates = ProgressTracker.combine_aggregates(
+                    aggregates, 
+                    ProgressTracker._aggregate_product_records(new_records_df, shift_start_map))
+        else:
+            if previous_state is not None:
+                self.logger.info("Records up to {} or shift start map changed, tracking the full history",
+                                 previous_state.watermark)
+            new_records_df = productRecords_df
+            aggregates = ProgressTracker._aggregate_product_records(productRecords_df, shift_start_map)
+
+        return aggregates, build_tracking_state(productRecords_df, shift_starts, settings_key, aggregates), len(new_records_df)
+
     def _extract_product_records(self, 
                                  productRecords_df: pd.DataFrame,
-                                 shift_start_map: Dict
+                                 shift_start_map: Dict,
+                                 aggregates: Optional[Dict[str, pd.DataFrame]] = None
                                  ) -> Tuple[pd.DataFrame, List, pd.DataFrame]:
 
         """
@@ -202,6 +276,8 @@ class ProgressTracker(ConfigReportMixin):
         Args:
             productRecords_df: DataFrame containing production records
             shift_start_map: Dictionary mapping shift codes to start times
+            aggregates: Running per-PO aggregates covering productRecords_df 
+                        (aggregated from productRecords_df if None)
 
         Returns:
             pd.DataFrame: Aggregated production data by poNote
@@ -215,254 +291,472 @@ class ProgressTracker(ConfigReportMixin):
             raise ValueError("Empty productRecords_df provided.")
 
         # Create derived columns
-        productRecords_df = productRecords_df.copy()
-
-        # Combine date and shift into a string identifier
-        productRecords_df['dateShiftCombined'] = (productRecords_df['recordDate'].dt.strftime('%Y-%m-%d') + 
-                                                  '_shift_' + productRecords_df['workingShift']
-                                                  )
-
-        # Create a unique machine history identifier
-        productRecords_df['machineHist'] = productRecords_df['machineNo'] + '_' + productRecords_df['machineCode']
+        productRecords_df = ProgressTracker._with_derived_columns(productRecords_df)
         self.logger.debug("Total records => {}: {}", 
                      productRecords_df.shape, productRecords_df.columns.to_list()
                      )
 
         # Split records into those with no production and those with actual production
-        not_working_mask = (productRecords_df['itemTotalQuantity'].isna() | 
-                            (productRecords_df['itemTotalQuantity'] == 0)
-                            )
+        not_working_mask = ProgressTracker._not_working_mask(productRecords_df)
 
         # DataFrame for records without production
         notWorking_productRecords_df = productRecords_df[not_working_mask].copy()
         notWorking_productRecords_df['recordDate'] = notWorking_productRecords_df['recordDate'].dt.strftime('%Y-%m-%d')
 
-        # DataFrame for records with production
-        haveWorking_productRecords_df = productRecords_df[~not_working_mask].copy()
-
         self.logger.debug("Not working => {}: {}", 
                      notWorking_productRecords_df.shape, notWorking_productRecords_df.columns.to_list()
                      )
-        self.logger.debug("Have working => {}: {}", 
-                     haveWorking_productRecords_df.shape, haveWorking_productRecords_df.columns.to_list()
-                     )
+        self.logger.debug("Have working => {} rows", int((~not_working_mask).sum()))
 
-        if haveWorking_productRecords_df.empty:
+        if not_working_mask.all():
             self.logger.error("No working production records found")
             raise ValueError("No working production records found.")
 
-        # Determine the latest production time based on working shift start times
-        time_to_shift = {datetime.strptime(v, "%H:%M").time(): k for k, v in shift_start_map.items()}
-
-        # Calculate shift start time for each record
-        shift_starts = haveWorking_productRecords_df.apply(
-            lambda row: ProgressTracker._get_shift_start(row, shift_start_map), axis=1)
-        latest_shift_start = shift_starts.max()
+        if aggregates is None:
+            aggregates = ProgressTracker._aggregate_product_records(productRecords_df, shift_start_map)
 
+        # Latest production time based on working shift start times
+        latest_shift_start = aggregates['latest_shift']['shiftStart'].max()
         if pd.isna(latest_shift_start):
             logger.error("Could not determine latest shift start")
             raise ValueError("Could not determine latest shift start.")
 
-        else:
-            # Determine the latest date and shift
-            latest_date = latest_shift_start.date().strftime("%Y-%m-%d")
-            latest_shift = time_to_shift.get(latest_shift_start.time())
-            logger.debug("Latest date: {}, Latest shift: {}", latest_date, latest_shift)
-
-        # Get POs still being produced in the latest shift
-        latest_shift_mask = (
-            (haveWorking_productRecords_df['recordDate'] == latest_date) &
-            (haveWorking_productRecords_df['workingShift'] == str(latest_shift))
-            )
-
         # Get a list of poNotes that are still being produced in the latest shift
-        producing_po_list = haveWorking_productRecords_df[latest_shift_mask]['poNote'].tolist()
+        producing_po_list = aggregates['producing_pos']['poNote'].tolist()
         logger.debug(f"Producing PO list: {producing_po_list}")
 
-        # Extract material codes
-        resin_code_map = ProgressTracker._extract_material_codes(haveWorking_productRecords_df)
+        # Aggregated production data by poNote
+        agg_df = ProgressTracker._build_po_aggregates(aggregates)
+
+        # Rename poNote to poNo for consistency
+        agg_df = agg_df.rename(columns={'poNote': 'poNo'})
+
+        return agg_df, producing_po_list, notWorking_productRecords_df
+
+    @staticmethod
+    def _with_derived_columns(productRecords_df: pd.DataFrame) -> pd.DataFrame:
+
+        """Copy of the records with dateShiftCombined and machineHist columns."""
+
+        productRecords_df = productRecords_df.copy()
+
+        # Combine date and shift into a string identifier
+        productRecords_df['dateShiftCombined'] = (productRecords_df['recordDate'].dt.strftime('%Y-%m-%d') + 
+                                                  '_shift_' + productRecords_df['workingShift']
+                                                  )
+
+        # Create a unique machine history identifier
+        productRecords_df['machineHist'] = productRecords_df['machineNo'] + '_' + productRecords_df['machineCode']
+
+        return productRecords_df
+
+    @staticmethod
+    def _not_working_mask(productRecords_df: pd.DataFrame) -> pd.Series:
+
+        """Records without production (no or zero total quantity)."""
+
+        return (productRecords_df['itemTotalQuantity'].isna() | 
+                (productRecords_df['itemTotalQuantity'] == 0))
+
+    #----------------------------#
+    # Running per-PO aggregates  #
+    #----------------------------#
+    @staticmethod
+    def _aggregate_product_records(productRecords_df: pd.DataFrame,
+                                   shift_start_map: Dict) -> Dict[str, pd.DataFrame]:
+
+        """
+        Aggregate production records into running per-PO tables.
+
+        Aggregates of newer records can be folded in with combine_aggregates():
+            po_totals               sums, date range and shift count per poNote
+            mold_map ... shift_map  long-format (poNote, key, value) tables
+            <field>_values          distinct values per poNote, in order of first appearance
+            material_combinations   distinct material combinations per poNote
+            latest_shift            start of the latest working shift
+            producing_pos           poNote of the records in the latest working shift
+            latest_working_shifts   latest working shift start per poNote (paused POs)
+            latest_po_records       records of the latest shift per poNote (latest machine/mold)
+
+        Args:
+            productRecords_df: DataFrame containing production records
+            shift_start_map: Dictionary mapping shift codes to start times
+
+        Returns:
+            dict: Table name -> DataFrame
+        """
+
+        if 'machineHist' not in productRecords_df.columns:
+            productRecords_df = ProgressTracker._with_derived_columns(productRecords_df)
+        working_df = productRecords_df[~ProgressTracker._not_working_mask(productRecords_df)]
 
         # Aggregate multiple production metrics by poNote
-        agg_df = haveWorking_productRecords_df.groupby('poNote').agg(
-
-            moldedQuantity=('itemGoodQuantity', 'sum'),
-            totalMoldShot=('moldShot', 'sum'),
-            startedDate=('recordDate', 'min'),
-            endDate=('recordDate', 'max'),
-            totalDay=('recordDate', 'nunique'),
-            totalShift=('dateShiftCombined', 'count'),
-            machineHist=('machineHist', lambda x: x.dropna().unique().tolist()),
-            moldHist=('moldNo', lambda x: x.dropna().unique().tolist()),
-            moldCavity=('moldCavity', lambda x: x.dropna().unique().tolist()),
-            plasticResinCode=('plasticResinCode', lambda x: x.dropna().unique().tolist()),
-            colorMasterbatchCode=('colorMasterbatchCode', lambda x: x.dropna().unique().tolist()),
-            additiveMasterbatchCode=('additiveMasterbatchCode', lambda x: x.dropna().unique().tolist()),
-
-            ).reset_index()
-
-        # Create aggregation maps
-        maps = ProgressTracker._create_aggregation_maps(haveWorking_productRecords_df)
+        aggregates = {
+            'po_totals': working_df.groupby('poNote').agg(
+                moldedQuantity=('itemGoodQuantity', 'sum'),
+                totalMoldShot=('moldShot', 'sum'),
+                startedDate=('recordDate', 'min'),
+                endDate=('recordDate', 'max'),
+                totalShift=('dateShiftCombined', 'count'),
+                ).reset_index()
+        }
+
+        # Create aggregation tables
+        aggregates.update(ProgressTracker._create_aggregation_tables(working_df))
+
+        # Distinct values and material combinations per poNote
+        for field_name, source_field in ProgressTracker.PO_VALUE_FIELDS.items():
+            aggregates[f'{field_name}_values'] = ProgressTracker._unique_values_table(working_df, source_field)
+        aggregates['material_combinations'] = ProgressTracker._material_combinations(working_df)
+
+        # Latest shifts
+        aggregates.update(ProgressTracker._latest_shift_tables(working_df, shift_start_map))
+        aggregates['latest_working_shifts'] = ProgressTracker._latest_working_shifts(productRecords_df, 
+                                                                                     shift_start_map)
+        aggregates['latest_po_records'] = ProgressTracker._latest_po_records(productRecords_df, 
+                                                                             shift_start_map)
+
+        return aggregates
+
+    @staticmethod
+    def combine_aggregates(previous: Dict[str, pd.DataFrame],
+                           new: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+
+        """
+        Fold the aggregates of records from newer shifts into previous aggregates.
+        Distinct value lists keep the order of first appearance as long as records are appended shift by shift.
+
+        Args:
+            previous: Aggregates covering records up to a shift
+            new: Aggregates of records from later shifts
+
+        Returns:
+            dict: Aggregates covering both
+        """
+
+        def concat(name: str) -> pd.DataFrame:
+            tables = [table for table in (previous[name], new[name]) if not table.empty]
+            if not tables:
+                return previous[name]
+            return pd.concat(tables, ignore_index=True)
+
+        combined = {
+            'po_totals': concat('po_totals').groupby('poNote').agg(
+                moldedQuantity=('moldedQuantity', 'sum'),
+                totalMoldShot=('totalMoldShot', 'sum'),
+                startedDate=('startedDate', 'min'),
+                endDate=('endDate', 'max'),
+                totalShift=('totalShift', 'sum'),
+                ).reset_index()
+        }
+
+        for map_name, (key_field, value_field) in ProgressTracker.AGGREGATION_MAP_FIELDS.items():
+            combined[map_name] = concat(map_name).groupby(['poNote', key_field])[value_field].sum().reset_index()
+
+        # Previous values first: lists keep the order of first appearance
+        for name in [f'{field_name}_values' for field_name in ProgressTracker.PO_VALUE_FIELDS] + ['material_combinations']:
+            combined[name] = concat(name).drop_duplicates(ignore_index=True)
+
+        # Newer records come from later shifts: their latest working shift replaces the previous one
+        previous_latest = previous['latest_shift']['shiftStart'].max()
+        new_latest = new['latest_shift']['shiftStart'].max()
+        latest_source = new if pd.notna(new_latest) and not (new_latest <= previous_latest) else previous
+        combined['latest_shift'] = latest_source['latest_shift']
+        combined['producing_pos'] = latest_source['producing_pos']
+
+        combined['latest_working_shifts'] = (
+            concat('latest_working_shifts').groupby('poNote')['shiftStartTimestamp'].max().reset_index())
+        combined['latest_po_records'] = ProgressTracker._keep_latest_rows(concat('latest_po_records'))
+
+        return combined
+
+    @staticmethod
+    def _build_po_aggregates(aggregates: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+
+        """
+        Build the per-PO production data (one row per poNote) from running aggregates.
+
+        Args:
+            aggregates: Running per-PO aggregates (see _aggregate_product_records)
+
+        Returns:
+            pd.DataFrame: Aggregated production data by poNote, with list and map columns
+        """
+
+        agg_df = aggregates['po_totals'].sort_values('poNote', ignore_index=True)
+
+        # Number of distinct working days
+        day_counts = aggregates['date_map'].groupby('poNote').size()
+        agg_df.insert(agg_df.columns.get_loc('endDate') + 1, 'totalDay',
+                      agg_df['poNote'].map(day_counts).fillna(0).astype('int64'))
+
+        # Distinct values per poNote (in order of first appearance)
+        for field_name in ProgressTracker.PO_VALUE_FIELDS:
+            table = aggregates[f'{field_name}_values']
+            unique_values = ProgressTracker._group_values(table['poNote'], table['value'])
+            agg_df[field_name] = [unique_values.get(po, []) for po in agg_df['poNote']]
 
         # Add mapping columns
+        maps = {map_name: ProgressTracker._table_to_map(aggregates[map_name])
+                for map_name in ProgressTracker.AGGREGATION_MAP_FIELDS}
         agg_df['moldShotMap'] = agg_df['poNote'].map(maps['mold_map'])
         agg_df['machineQuantityMap'] = agg_df['poNote'].map(maps['machine_map'])
         agg_df['dayQuantityMap'] = agg_df['poNote'].map(maps['date_map'])
         agg_df['shiftQuantityMap'] = agg_df['poNote'].map(maps['shift_map'])
-        agg_df['materialComponentMap'] = agg_df['poNote'].map(resin_code_map)
+        agg_df['materialComponentMap'] = agg_df['poNote'].map(
+            ProgressTracker._material_map(aggregates['material_combinations']))
 
-        # Rename poNote to poNo for consistency
-        agg_df = agg_df.rename(columns={'poNote': 'poNo'})
-
-        return agg_df, producing_po_list, notWorking_productRecords_df
+        return agg_df
     
     @staticmethod
-    def _get_shift_start(row: pd.Series, 
-                         shift_start_map: Dict,
-                         date_field_name: str ='recordDate',
-                         shift_field_name: str ='workingShift') -> pd.Timestamp:
+    def _get_shift_starts(df: pd.DataFrame,
+                          shift_start_map: Dict,
+                          date_field_name: str = 'recordDate',
+                          shift_field_name: str = 'workingShift') -> pd.Series:
 
         """
-        Calculate the shift start datetime for a given row.
+        Calculate the shift start datetime for each row: record date + shift start time.
 
         Args:
-            row: DataFrame row containing date and shift information
+            df: DataFrame containing date and shift information
             shift_start_map: Dictionary mapping shift codes to start times (HH:MM format)
-            date_field_name: Name of the date field in the row
-            shift_field_name: Name of the shift field in the row
+            date_field_name: Name of the date field
+            shift_field_name: Name of the shift field
 
         Returns:
-            pd.Timestamp: Shift start datetime or pd.NaT if invalid
+            pd.Series: Shift start datetimes (pd.NaT for invalid dates or shift codes)
         """
 
-        try:
-            # Convert date to datetime format
-            date = pd.to_datetime(row[date_field_name])
-            shift = str(row[shift_field_name])
-            start_time_str = shift_start_map.get(shift)
+        shift_offsets = {shift: pd.to_timedelta(f"{start_time}:00")
+                         for shift, start_time in shift_start_map.items()}
+
+        dates = pd.to_datetime(df[date_field_name], errors='coerce').dt.normalize()
+        shifts = df[shift_field_name].astype(str)
+        offsets = pd.to_timedelta(shifts.map(shift_offsets))
 
-            # Check if the shift code is valid
-            if not start_time_str:
-                logger.warning(f"Invalid shift code: {shift}")
-                return pd.NaT
+        # Check if the shift codes are valid
+        invalid_shifts = offsets.isna()
+        if invalid_shifts.any():
+            logger.warning("Invalid shift codes in {} rows: {}",
+                           int(invalid_shifts.sum()), shifts[invalid_shifts].unique().tolist())
 
-            # Extract hours and minutes from string
-            hour, minute = map(int, start_time_str.split(":"))
+        return dates + offsets
 
-            # Create datetime combining shift start date and time
-            start_datetime = datetime.combine(
-                date.date(), 
-                datetime.min.time()) + timedelta(hours=hour, minutes=minute)
+    @staticmethod
+    def _latest_shift_tables(working_df: pd.DataFrame,
+                             shift_start_map: Dict) -> Dict[str, pd.DataFrame]:
 
-            return pd.Timestamp(start_datetime)
+        """
+        Determine the latest working shift and the POs produced in it.
 
-        except Exception as e:
-            logger.error(f"Error calculating shift start for row: {e}")
-            return pd.NaT
+        Returns:
+            dict: 'latest_shift' (shiftStart, one row) and 'producing_pos' (poNote of each record in that shift)
+        """
+
+        # Determine the latest production time based on working shift start times
+        time_to_shift = {datetime.strptime(v, "%H:%M").time(): k for k, v in shift_start_map.items()}
+
+        # Calculate shift start time for each record
+        latest_shift_start = ProgressTracker._get_shift_starts(working_df, shift_start_map).max()
+        producing_df = working_df.iloc[:0]
+
+        if pd.notna(latest_shift_start):
+            # Determine the latest date and shift
+            latest_date = latest_shift_start.date().strftime("%Y-%m-%d")
+            latest_shift = time_to_shift.get(latest_shift_start.time())
+            logger.debug("Latest date: {}, Latest shift: {}", latest_date, latest_shift)
+
+            # Get POs still being produced in the latest shift
+            latest_shift_mask = (
+                (working_df['recordDate'] == latest_date) &
+                (working_df['workingShift'] == str(latest_shift))
+                )
+            producing_df = working_df[latest_shift_mask]
+
+        return {
+            'latest_shift': pd.DataFrame({'shiftStart': pd.Series([latest_shift_start], dtype='datetime64[ns]')}),
+            'producing_pos': producing_df[['poNote']].reset_index(drop=True)
+        }
 
     @staticmethod
-    def _extract_material_codes(df: pd.DataFrame) -> Dict:
+    def _shift_start_timestamps(df: pd.DataFrame, 
+                                shift_start_map: Dict) -> pd.Series:
+
+        """Shift start timestamps for latest-shift lookups (unknown shift codes start at 00:00)."""
+
+        shift_time = df['workingShift'].astype(str).map(shift_start_map).fillna("00:00")
+
+        # Combine date and time into timestamp
+        return pd.to_datetime(df['recordDate'].astype(str) + ' ' + shift_time,
+                              format='%Y-%m-%d %H:%M',
+                              errors='coerce')
+
+    @staticmethod
+    def _latest_working_shifts(df: pd.DataFrame, 
+                               shift_start_map: Dict) -> pd.DataFrame:
+
+        """Most recent production timestamp (records with item quantity > 0) for each poNote."""
+
+        df_work = df[df['itemTotalQuantity'] > 0]
+        df_work = df_work[['poNote']].assign(
+            shiftStartTimestamp=ProgressTracker._shift_start_timestamps(df_work, shift_start_map))
+
+        return df_work.groupby('poNote')['shiftStartTimestamp'].max().reset_index()
+
+    @staticmethod
+    def _latest_po_records(df: pd.DataFrame, 
+                           shift_start_map: Dict,
+                           keys: List = ['machineNo', 'moldNo']) -> pd.DataFrame:
+
+        """Records of the most recent shift of each poNote (poNote, shiftStartTimestamp and keys)."""
+
+        df_work = df[['poNote'] + keys].assign(
+            shiftStartTimestamp=ProgressTracker._shift_start_timestamps(df, shift_start_map))
+
+        return ProgressTracker._keep_latest_rows(df_work[['poNote', 'shiftStartTimestamp'] + keys])
+
+    @staticmethod
+    def _keep_latest_rows(df: pd.DataFrame) -> pd.DataFrame:
+
+        """Keep the rows at the latest shiftStartTimestamp of their poNote."""
+
+        latest_indices = df.groupby('poNote')['shiftStartTimestamp'].max().reset_index()
+        return df.merge(latest_indices, on=['poNote', 'shiftStartTimestamp'], how='inner')
+
+    @staticmethod
+    def _unique_values_table(df: pd.DataFrame, 
+                             field_name: str) -> pd.DataFrame:
         """
-        Extract material component combinations for each poNote.
+        Distinct non-null values of a field for each poNote, in order of first appearance.
 
         Args:
             df: DataFrame with production records
+            field_name: Field to collect
 
         Returns:
-            dict: Dictionary mapping poNote to list of material component combinations
+            pd.DataFrame: (poNote, value) rows
         """
 
-        def extract_material_combinations(group: pd.DataFrame) -> List:
-            """
-            Extract list of material component combinations from a group
-            """
-            combinations = []
+        values = df.loc[df['poNote'].notna() & df[field_name].notna(), ['poNote', field_name]].drop_duplicates()
+        return values.rename(columns={field_name: 'value'}).reset_index(drop=True)
 
-            for _, row in group.iterrows():
+    @staticmethod
+    def _group_values(keys: pd.Series, 
+                      values: pd.Series) -> Dict:
 
-                combination = {
-                    'plasticResinCode': row.get('plasticResinCode') if pd.notna(row.get('plasticResinCode')) else None,
-                    'colorMasterbatchCode': row.get('colorMasterbatchCode') if pd.notna(row.get('colorMasterbatchCode')) else None,
-                    'additiveMasterbatchCode': row.get('additiveMasterbatchCode') if pd.notna(row.get('additiveMasterbatchCode')) else None
-                }
+        """Group values into lists by key, keeping their order."""
 
-                # Validation
-                if combination['plasticResinCode'] == None:
-                    logger.error("The material combination is required to include at least one component of plasticResinCode")
-                    raise ValueError("The material combination is required to include at least one component of plasticResinCode")
+        grouped = {}
+        for key, value in zip(keys.tolist(), values.tolist()):
+            grouped.setdefault(key, []).append(value)
 
-                if combination not in combinations:
-                    combinations.append(combination)
+        return grouped
 
-            return combinations
+    @staticmethod
+    def _material_combinations(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Distinct material component combinations for each poNote, in order of first appearance.
 
-        return (
-            df.groupby('poNote')
-            .apply(extract_material_combinations, include_groups=False)
-            .to_dict()
-        )
+        Args:
+            df: DataFrame with production records
+
+        Returns:
+            pd.DataFrame: (poNote, plasticResinCode, colorMasterbatchCode, additiveMasterbatchCode) rows
+        """
+
+        records = df.loc[df['poNote'].notna(), ['poNote'] + ProgressTracker.MATERIAL_FIELDS]
+
+        # Validation
+        if records['plasticResinCode'].isna().any():
+            logger.error("The material combination is required to include at least one component of plasticResinCode")
+            raise ValueError("The material combination is required to include at least one component of plasticResinCode")
+
+        return records.drop_duplicates(ignore_index=True)
+
+    @staticmethod
+    def _material_map(combinations: pd.DataFrame) -> Dict:
+
+        """Map poNote to its list of material combinations (dicts, missing components as None)."""
+
+        # Sorted by poNote (stable sort keeps the order of first appearance)
+        combinations = combinations.sort_values('poNote', kind='stable')
+        material_fields = ProgressTracker.MATERIAL_FIELDS
+        component_values = [combinations[field].astype(object).where(combinations[field].notna(), None).tolist()
+                            for field in material_fields]
+
+        material_map = {}
+        for po, *components in zip(combinations['poNote'].tolist(), *component_values):
+            material_map.setdefault(po, []).append(dict(zip(material_fields, components)))
+
+        return material_map
+
+    @staticmethod
+    def _extract_material_codes(df: pd.DataFrame) -> Dict:
+        """
+        Extract material component combinations for each poNote.
+
+        Args:
+            df: DataFrame with production records
+
+        Returns:
+            dict: Dictionary mapping poNote to list of material component combinations
+                  (in order of first appearance)
+        """
+
+        return ProgressTracker._material_map(ProgressTracker._material_combinations(df))
     
     @staticmethod
-    def _create_aggregation_maps(df: pd.DataFrame) -> Dict:
+    def _create_aggregation_tables(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
 
         """
-        Create aggregation maps for molds, machines, dates, and shifts.
+        Create long-format aggregation tables for molds, machines, dates, and shifts.
 
         Args:
             df: DataFrame with production records
 
         Returns:
-            dict: Dictionary containing various aggregation maps
+            dict: Map name -> DataFrame (poNote, key field, summed value field), sorted by poNote and key
         """
 
-        maps = {}
+        tables = {}
 
-        # Map summarizes the number of mold shots by mold for each PO
-        maps['mold_map'] = (
-            df.groupby(['poNote', 'moldNo'])['moldShot']
-            .sum()
-            .reset_index()
-            .groupby('poNote')[['moldNo', 'moldShot']]
-            .apply(lambda x: {k: int(v) for k, v in zip(x['moldNo'], x['moldShot'])})
-            .to_dict()
-        )
+        for map_name, (key_field, value_field) in ProgressTracker.AGGREGATION_MAP_FIELDS.items():
+            table = df.groupby(['poNote', key_field])[value_field].sum().reset_index()
 
-        # Map good quantity summary by machine for each PO
-        maps['machine_map'] = (
-            df.groupby(['poNote', 'machineHist'])['itemGoodQuantity']
-            .sum()
-            .reset_index()
-            .groupby('poNote')[['machineHist', 'itemGoodQuantity']]
-            .apply(lambda x: {k: int(v) for k, v in zip(x['machineHist'], x['itemGoodQuantity'])})
-            .to_dict()
-        )
+            # Dates are keyed by their '%Y-%m-%d' string
+            if key_field == 'recordDate':
+                table[key_field] = table[key_field].dt.strftime('%Y-%m-%d')
 
-        # Map sums up good quantity by day for each PO
-        maps['date_map'] = (
-            df.groupby(['poNote', 'recordDate'])['itemGoodQuantity']
-            .sum()
-            .reset_index()
-            .groupby('poNote')[['recordDate', 'itemGoodQuantity']]
-            .apply(lambda x: {
-                k.strftime('%Y-%m-%d'): int(v)
-                for k, v in zip(x['recordDate'], x['itemGoodQuantity'])
-            })
-            .to_dict()
-        )
+            tables[map_name] = table
 
-        # Map sums up good quantity by shift+day for each PO
-        maps['shift_map'] = (
-            df.groupby(['poNote', 'dateShiftCombined'])['itemGoodQuantity']
-            .sum()
-            .reset_index()
-            .groupby('poNote')[['dateShiftCombined', 'itemGoodQuantity']]
-            .apply(lambda x: {
-                k: int(v)
-                for k, v in zip(x['dateShiftCombined'], x['itemGoodQuantity'])
-            })
-            .to_dict()
-        )
+        return tables
+
+    @staticmethod
+    def _table_to_map(table: pd.DataFrame) -> Dict:
 
-        return maps
+        """Fold a (poNote, key, value) table into {poNote: {key: value}}."""
+
+        po_map = {}
+        for po, key, value in zip(*(table[col].tolist() for col in table.columns)):
+            po_map.setdefault(po, {})[key] = int(value)
+
+        return po_map
+
+    @staticmethod
+    def _create_aggregation_maps(df: pd.DataFrame) -> Dict:
+
+        """
+        Create aggregation maps for molds, machines, dates, and shifts.
+
+        Args:
+            df: DataFrame with production records
+
+        Returns:
+            dict: Dictionary containing various aggregation maps ({poNote: {key: value}})
+        """
+
+        return {map_name: ProgressTracker._table_to_map(table)
+                for map_name, table in ProgressTracker._create_aggregation_tables(df).items()}
 
     #---------------------------------------------------------------#
     # STEP 3: GENERATE PRODUCTION STATUS REPORT                     #
@@ -574,23 +868,18 @@ class ProgressTracker(ConfigReportMixin):
         return pro_status_df[pro_status_fields]
 
     @staticmethod
-    def _mark_paused_pending_pos(df: pd.DataFrame, 
-                                 proStatus_df: pd.DataFrame, 
-                                 shift_start_map: Dict) -> pd.DataFrame:
-        """Mark pending POs as paused if they haven't been updated in the latest shift."""
-        # Filter only production records with item quantity > 0
-        df_work = df[df['itemTotalQuantity'] > 0].copy()
-
-        # Ensure workingShift is a string and map it to shift start time
-        df_work['workingShift'] = df_work['workingShift'].astype(str)
-        df_work['shift_time'] = df_work['workingShift'].map(shift_start_map).fillna("00:00")
-
-        # Create a full datetime column by combining recordDate and shift start time
-        df_work['shiftStartTimestamp'] = pd.to_datetime(
-            df_work['recordDate'].astype(str) + ' ' + df_work['shift_time'],
-            format='%Y-%m-%d %H:%M',
-            errors='coerce'
-        )
+    def _mark_paused_pending_pos(latest_working_shifts: pd.DataFrame, 
+                                 proStatus_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Mark pending POs as paused if they haven't been updated in the latest shift.
+
+        Args:
+            latest_working_shifts: Most recent production timestamp for each poNote
+            proStatus_df: Production status DataFrame
+
+        Returns:
+            pd.DataFrame: proStatus_df with paused POs marked as 'PAUSED'
+        """
 
         # Extract list of pending POs from proStatus_df where itemRemain > 0 and status is 'PENDING'
         pending_list = proStatus_df[
@@ -598,15 +887,11 @@ class ProgressTracker(ConfigReportMixin):
             (proStatus_df['proStatus'] == 'PENDING')
         ]['poNo'].tolist()
 
-        # Filter records of those pending POs
-        df_pending = df_work[df_work['poNote'].isin(pending_list)]
-
         # Get the most recent production timestamp for each pending PO
-        pending_latest_shift = df_pending.groupby('poNote')['shiftStartTimestamp'].max().reset_index()
+        pending_latest_shift = latest_working_shifts[latest_working_shifts['poNote'].isin(pending_list)]
 
         # Get the most recent production timestamp for all POs
-        total_latest_shift = df_work.groupby('poNote')['shiftStartTimestamp'].max().reset_index()
-        latest_shift_start = total_latest_shift['shiftStartTimestamp'].max()
+        latest_shift_start = latest_working_shifts['shiftStartTimestamp'].max()
 
         # Identify pending POs that have not been updated until the most recent production timestamp
         paused_mask = pending_latest_shift['shiftStartTimestamp'] < latest_shift_start
@@ -618,43 +903,20 @@ class ProgressTracker(ConfigReportMixin):
         return proStatus_df
 
     @staticmethod
-    def _get_latest_po_info(df: pd.DataFrame, 
-                            shift_start_map: Dict, 
-                            keys: List =['machineNo', 'moldNo']) -> pd.DataFrame:
+    def _get_latest_po_info(latest_po_records: pd.DataFrame) -> pd.DataFrame:
 
         """
-        Get the latest machine information for each machine based on working shift timestamp.
-        Includes machines that were not working (poNote is null) in the most recent shift.
+        Get the latest machine and mold information for each PO based on working shift timestamp.
 
         Args:
-            df: DataFrame containing product record data
-            shift_start_map: Dictionary mapping working shift codes to start times
-            keys: List of additional columns to include in the output
+            latest_po_records: Records of the most recent shift of each poNote 
+                               (poNote, shiftStartTimestamp, machineNo, moldNo)
 
         Returns:
-            DataFrame with the latest machine information per machine (poNo may be null)
+            DataFrame with the latest machine information per PO
         """
 
-        df_work = df.copy()
-
-        # Create shift timestamp (vectorized)
-        df_work['workingShift'] = df_work['workingShift'].astype(str)
-        df_work['shift_time'] = df_work['workingShift'].map(shift_start_map).fillna("00:00")
-
-        # Combine date and time into timestamp
-        df_work['shiftStartTimestamp'] = pd.to_datetime(
-            df_work['recordDate'].astype(str) + ' ' + df_work['shift_time'],
-            format='%Y-%m-%d %H:%M',
-            errors='coerce'
-        )
-
-        # Get the most recent record for each machine (including idle machines)
-        latest_indices = df_work.groupby('poNote')['shiftStartTimestamp'].max().reset_index()
-        latest_per_po = df_work.merge(latest_indices, on=['poNote', 'shiftStartTimestamp'], how='inner')
-
-        # Select and rename columns
-        result_columns = ['poNote', 'shiftStartTimestamp'] + keys
-        result = latest_per_po[result_columns].copy()
+        result = latest_po_records[['poNote', 'shiftStartTimestamp', 'machineNo', 'moldNo']].copy()
 
         # Rename columns (avoid duplicate column names)
         new_column_names = ['poNo', 'lastestRecordTime', 'lastestMachineNo', 'lastestMoldNo']
@@ -903,26 +1165,21 @@ class ProgressTracker(ConfigReportMixin):
         second_col = name_mapping[second_element]
         count_col = f'numOf{first_element.capitalize()}'
 
-        rows = []
+        info_data = filtered_df[field_name].map(ProgressTracker._safe_literal_eval)
 
-        for _, row in filtered_df.iterrows():
-            info_data = ProgressTracker._safe_literal_eval(row[field_name])
-
-            # Skip if not a dict or is empty
-            if not isinstance(info_data, dict) or not info_data:
-                continue
+        # Skip if not a dict or is empty
+        is_valid = info_data.map(lambda info: isinstance(info, dict) and len(info) > 0).to_numpy(dtype=bool)
+        if not is_valid.any():
+            return pd.DataFrame()
 
-            num_of_info = len(info_data)
-            base_row = {col: row[col] for col in columns_to_keep}  # Create base row once
+        infos = info_data[is_valid].tolist()
+        num_of_info = np.fromiter((len(info) for info in infos), dtype='int64', count=len(infos))
 
-            # Create rows for each item in the dict
-            for first_info, second_info in info_data.items():
-                new_row = base_row.copy()
-                new_row.update({
-                    first_col: first_info,
-                    second_col: second_info,
-                    count_col: num_of_info
-                })
-                rows.append(new_row)
+        # One row for each item in the dicts
+        result = filtered_df.loc[is_valid, columns_to_keep].iloc[np.repeat(np.arange(len(infos)), num_of_info)]
+        result = result.reset_index(drop=True)
+        result[first_col] = [first_info for info in infos for first_info in info.keys()]
+        result[second_col] = [second_info for info in infos for second_info in info.values()]
+        result[count_col] = np.repeat(num_of_info, num_of_info)
 
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
\ No newline at end of file
+        return result
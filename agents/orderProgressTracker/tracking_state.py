@@ -0,0 +1,58 @@
+"""
+Persisted tracking state for incremental ProgressTracker runs.
+
+A TrackingState keeps the running per-PO aggregates of productRecords (see
+ProgressTracker._aggregate_product_records), covering every record up to a watermark
+(the latest shift start folded in).
+
+The next incremental run only aggregates records from shifts after the watermark and folds
+them in. The state is discarded (full recompute) when records up to the watermark changed
+(row count or rows_digest) or the shift start map the shifts are derived from is different.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from pathlib import Path
+import pandas as pd
+
+from agents.incremental_state import (
+    FoldedState, count_folded_rows, folded_rows_digest, load_state_files, make_settings_key, save_state_files)
+
+_META_FILE_NAME = "tracking_state.json"
+
+@dataclass
+class TrackingState(FoldedState):
+    """Per-PO aggregates covering productRecords up to the shift starting at `watermark`"""
+    aggregates: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def is_resumable(self, records: pd.DataFrame, shift_starts: pd.Series, settings_key: str) -> bool:
+        """True if the aggregates can be updated with `records` (shift starts `shift_starts`) after the watermark."""
+        return self.covers(records, shift_starts, settings_key)
+
+def build_tracking_state(records: pd.DataFrame,
+                         shift_starts: pd.Series,
+                         settings_key: str,
+                         aggregates: Dict[str, pd.DataFrame]) -> Optional[TrackingState]:
+    """State covering all records with a shift start; None if no record has one."""
+    watermark = shift_starts.max()
+    if pd.isna(watermark):
+        return None
+    watermark = pd.Timestamp(watermark)
+    return TrackingState(
+        watermark=watermark.isoformat(),
+        rows_folded=count_folded_rows(shift_starts, watermark),
+        settings_key=settings_key,
+        rows_digest=folded_rows_digest(records, shift_starts, watermark),
+        aggregates=aggregates)
+
+def load_tracking_state(state_dir: Path | str) -> Optional[TrackingState]:
+    """Read a state written by save_tracking_state; None if missing or unreadable."""
+    loaded = load_state_files(state_dir, _META_FILE_NAME)
+    if loaded is None:
+        return None
+    fields, tables = loaded
+    return TrackingState(**fields, aggregates=tables)
+
+def save_tracking_state(state_dir: Path | str, state: TrackingState) -> None:
+    """Write the aggregate tables and their metadata (see save_state_files)."""
+    save_state_files(state_dir, _META_FILE_NAME, state, state.aggregates)
@@ -0,0 +1,280 @@
+# agents/result_store.py
+
+"""
+Columnar store of the versioned agent results (save_output_with_versioning).
+
+Every result is saved as one parquet file per sheet plus a manifest, next to the
+(optional) Excel export and archived together with it:
+
+    {timestamp}_{prefix}_result.manifest.json          sheet order, files, rows, columns
+    {timestamp}_{prefix}_result.{sheet}.parquet        one file per sheet
+    {timestamp}_{prefix}_result.xlsx                   Excel export for human readers
+
+Downstream agents read results with `read_result`, which takes the path recorded in a
+change log (Excel or manifest path) and mirrors `pd.read_excel` (`sheet_name=0` / name /
+list / None). Results saved before the store existed are still read from Excel.
+
+Sheets keep their dtypes, except that (as with Excel) integer columns with missing values
+come back as float64. Columns holding lists/dicts are stored as Python-repr strings, as in
+the Excel file, unless the writer declares an Arrow type for them (`column_types`); those
+come back as Python lists/dicts.
+
+Excel export (`excel_export=` or the OPTIMOLDIQ_EXCEL_EXPORT environment variable):
+    eager    write the Excel file with every result (default)
+    lazy     only write the store; `export_result_excel` generates the Excel file on demand
+"""
+
+from loguru import logger
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+import os
+import json
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+RESULT_MANIFEST_SUFFIX = ".manifest.json"
+DEFAULT_SHEET_NAME = "Sheet1"  # Sheet name of a single DataFrame (as written by pandas)
+
+EXCEL_EXPORT_MODES = ("eager", "lazy")
+DEFAULT_EXCEL_EXPORT = os.environ.get("OPTIMOLDIQ_EXCEL_EXPORT", "eager")
+
+# sheet name -> column -> Arrow type of a list/map/struct column
+ColumnTypes = Dict[str, Dict[str, pa.DataType]]
+
+#-------#
+# Paths #
+#-------#
+def result_excel_path(result_path: Path | str) -> Path:
+    """Excel path of a result, given its Excel or manifest path."""
+    result_path = Path(result_path)
+    if result_path.name.endswith(RESULT_MANIFEST_SUFFIX):
+        return result_path.with_name(result_path.name[:-len(RESULT_MANIFEST_SUFFIX)] + ".xlsx")
+    return result_path
+
+def result_manifest_path(result_path: Path | str) -> Path:
+    """Manifest path of a result, given its Excel or manifest path."""
+    excel_path = result_excel_path(result_path)
+    return excel_path.with_name(excel_path.stem + RESULT_MANIFEST_SUFFIX)
+
+def has_result_store(result_path: Path | str) -> bool:
+    return result_manifest_path(result_path).is_file()
+
+def read_result_manifest(result_path: Path | str) -> Optional[Dict[str, Any]]:
+    """Return the manifest of a result, or None for results only saved as Excel."""
+    manifest_path = result_manifest_path(result_path)
+    if not manifest_path.is_file():
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def resolve_excel_export(excel_export: Optional[str] = None) -> str:
+    excel_export = excel_export or DEFAULT_EXCEL_EXPORT
+    if excel_export not in EXCEL_EXPORT_MODES:
+        raise ValueError(f"Unknown Excel export mode: '{excel_export}'. Available: {list(EXCEL_EXPORT_MODES)}")
+    return excel_export
+
+#---------#
+# Writing #
+#---------#
+def write_result_store(result_path: Path | str,
+                       data: Dict[str, pd.DataFrame] | pd.DataFrame,
+                       column_types: Optional[ColumnTypes] = None) -> str:
+    """
+    Write the sheets of a result, then its manifest (each via tmp file + replace).
+    The manifest is removed first and written last: an interrupted save leaves no readable store.
+
+    Args:
+        result_path: Excel path of the result (the store is written next to it)
+        data: Single DataFrame or dict of sheet name -> DataFrame (as for write_excel_data)
+        column_types: Arrow types of list/map/struct columns, per sheet
+
+    Returns:
+        Log line of the saved manifest
+    """
+    excel_path = result_excel_path(result_path)
+    sheets = {DEFAULT_SHEET_NAME: data} if isinstance(data, pd.DataFrame) else data
+
+    if not isinstance(sheets, dict) or not all(
+            isinstance(k, str) and isinstance(v, pd.DataFrame) for k, v in sheets.items()):
+        logger.error("❌ Expected dict[str, pd.DataFrame] or DataFrame but got: {}", type(data))
+        raise TypeError(f"Expected dict[str, pd.DataFrame] or pd.DataFrame but got: {type(data)}")
+
+    column_types = column_types or {}
+    manifest_path = result_manifest_path(excel_path)
+    if manifest_path.exists():
+        os.remove(manifest_path)
+
+    entries = []
+    for sheet_name, df in sheets.items():
+        file_name = f"{excel_path.stem}.{sheet_name}.parquet"
+        table = sheet_to_table(df, column_types.get(sheet_name, {}))
+        write_sheet_file(table, excel_path.with_name(file_name))
+        entries.append({
+            "name": sheet_name,
+            "file": file_name,
+            "rows": table.num_rows,
+            "columns": table.column_names,
+        })
+
+    manifest = {
+        "result": excel_path.name,
+        "format": "parquet",
+        "created_at": datetime.now().isoformat(),
+        "sheets": entries,
+    }
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, manifest_path)
+
+    logger.info("✓ Saved result store: {} ({} sheets)", manifest_path, len(entries))
+    return f"  ⤷ Saved result store: {manifest_path}"
+
+def sheet_to_table(df: pd.DataFrame,
+                   nested_types: Optional[Dict[str, pa.DataType]] = None) -> pa.Table:
+    """
+    Arrow table of a sheet (without index, as written to Excel).
+    Columns of `nested_types` keep their lists/dicts (anything else becomes null);
+    other lists/dicts are stored as their Python repr, as in the Excel file.
+    """
+    nested_types = nested_types or {}
+    arrays = []
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i]
+        if col in nested_types:
+            arrays.append(pa.array([value if isinstance(value, (list, dict)) else None
+                                    for value in values.tolist()], type=nested_types[col]))
+            continue
+
+        if values.dtype == object:
+            values = values.map(lambda v: str(v) if isinstance(v, (list, dict, tuple, set)) else v)
+        try:
+            arrays.append(pa.Array.from_pandas(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed value types (e.g. numbers and text) have no Arrow type: keep them as text
+            logger.debug("Storing mixed-type column '{}' as text", col)
+            arrays.append(pa.array([None if pd.isna(v) else str(v) for v in values.tolist()],
+                                   type=pa.string()))
+
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+def write_sheet_file(table: pa.Table, path: Path | str) -> None:
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(table, tmp_path, compression="snappy")
+    os.replace(tmp_path, path)
+
+#---------#
+# Reading #
+#---------#
+def _is_nested(arrow_type: pa.DataType) -> bool:
+    return (pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type)
+            or pa.types.is_map(arrow_type) or pa.types.is_struct(arrow_type))
+
+def read_sheet_file(path: Path | str) -> pd.DataFrame:
+    """Read a sheet file: flat columns as pandas dtypes, nested columns as Python lists/dicts."""
+    table = pq.ParquetFile(path).read()
+    nested = [name for name, arrow_type in zip(table.column_names, table.schema.types)
+              if _is_nested(arrow_type)]
+
+    # No pandas metadata: same dtypes as pd.read_excel (int with nulls -> float64)
+    df = table.drop_columns(nested).to_pandas(ignore_metadata=True)
+    if not nested:
+        return df
+
+    for col in nested:
+        df[col] = pd.Series(table.column(col).to_pylist(maps_as_pydicts="strict"), dtype=object)
+    return df[table.column_names]
+
+def result_sheet_names(result_path: Path | str) -> List[str]:
+    """Sheet names of a result, in saved order."""
+    manifest = read_result_manifest(result_path)
+    if manifest is not None:
+        return [sheet["name"] for sheet in manifest["sheets"]]
+
+    excel_file = pd.ExcelFile(result_excel_path(result_path))
+    try:
+        return list(excel_file.sheet_names)
+    finally:
+        excel_file.close()
+
+def read_result(result_path: Path | str,
+                sheet_name: int | str | List[int | str] | None = 0
+                ) -> pd.DataFrame | Dict[str, pd.DataFrame]:
+    """
+    Read a saved result, like `pd.read_excel(result_path, sheet_name=sheet_name)`.
+
+    Args:
+        result_path: Excel or manifest path of the result (as recorded in the change log)
+        sheet_name: Sheet position or name, a list of them, or None for all sheets
+
+    Returns:
+        DataFrame for a single sheet, otherwise dict of sheet name -> DataFrame
+
+    Raises:
+        ValueError: If a requested sheet does not exist
+    """
+    manifest = read_result_manifest(result_path)
+    if manifest is None:
+        return pd.read_excel(result_excel_path(result_path), sheet_name=sheet_name)
+
+    sheets = manifest["sheets"]
+    base_dir = result_manifest_path(result_path).parent
+
+    def read_sheet(key: int | str) -> tuple:
+        if isinstance(key, int):
+            if not 0 <= key < len(sheets):
+                raise ValueError(f"Worksheet index {key} is invalid, {len(sheets)} worksheets found")
+            sheet = sheets[key]
+        else:
+            sheet = next((s for s in sheets if s["name"] == key), None)
+            if sheet is None:
+                raise ValueError(f"Worksheet named '{key}' not found")
+        return sheet["name"], read_sheet_file(base_dir / sheet["file"])
+
+    if sheet_name is None:
+        return dict(read_sheet(i) for i in range(len(sheets)))
+    if isinstance(sheet_name, list):
+        return dict(read_sheet(key) for key in sheet_name)
+    return read_sheet(sheet_name)[1]
+
+def result_sheet_digest(result_path: Path | str, sheet_name: str) -> str:
+    """
+    Content digest of one sheet of a result. It is the same for unchanged sheets saved by
+    different runs (sheet files are written deterministically). For results only saved as
+    Excel, it is the digest of the whole workbook.
+    """
+    manifest = read_result_manifest(result_path)
+    if manifest is None:
+        path = result_excel_path(result_path)
+    else:
+        sheet = next((s for s in manifest["sheets"] if s["name"] == sheet_name), None)
+        if sheet is None:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        path = result_manifest_path(result_path).parent / sheet["file"]
+
+    h = hashlib.sha256(sheet_name.encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+#--------------#
+# Excel export #
+#--------------#
+def export_result_excel(result_path: Path | str) -> Path:
+    """Excel file of a result, written from the store on first request (lazy export)."""
+    from agents.utils import write_excel_data
+
+    excel_path = result_excel_path(result_path)
+    if excel_path.is_file():
+        return excel_path
+
+    if not has_result_store(excel_path):
+        raise FileNotFoundError(f"No saved result at {excel_path}")
+
+    write_excel_data(excel_path, read_result(excel_path, sheet_name=None))
+    return excel_path
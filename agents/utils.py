@@ -10,6 +10,8 @@ from tabulate import tabulate
 from typing import Dict, Any, Optional, List, Iterable
 import inspect
 from dataclasses import fields, is_dataclass
+from agents.result_store import (
+    ColumnTypes, resolve_excel_export, result_manifest_path, write_result_store)
 
 def load_json(json_path: str):
     """Load JSON file with error handling"""
@@ -47,9 +49,24 @@ def save_output_with_versioning(
         data: dict[str, pd.DataFrame] | pd.DataFrame,
         output_dir: str | Path,
         filename_prefix: str,
-        report_text: str | None = None
+        report_text: str | None = None,
+        column_types: ColumnTypes | None = None,
+        excel_export: str | None = None
     ):  
 
+    """
+    Save a result into output_dir/newest (archiving the previous one to historical_db).
+
+    The result is written to the columnar result store read by downstream agents
+    (agents.result_store); the Excel file is written as well unless the export mode
+    is "lazy", in which case the change log records the manifest path instead.
+
+    Args:
+        column_types: Arrow types of list/map/struct columns, per sheet (see result_store)
+        excel_export: "eager" or "lazy" (None = OPTIMOLDIQ_EXCEL_EXPORT, default "eager")
+    """
+    excel_export = resolve_excel_export(excel_export)
+
     output_dir = Path(output_dir)
     timestamp_now = datetime.now()
     timestamp_str = timestamp_now.strftime("%Y-%m-%d %H:%M:%S")
@@ -66,9 +83,18 @@ def save_output_with_versioning(
     archive_logs = archive_old_files(newest_dir, historical_dir)
     log_entries.append(archive_logs)
     
-    # Save excel file
+    # Save result store (read by downstream agents)
     excel_path = newest_dir / f"{timestamp_file}_{filename_prefix}_result.xlsx"
-    write_excel_log = write_excel_data(excel_path, data)
+    write_store_log = write_result_store(excel_path, data, column_types)
+    log_entries.append(write_store_log)
+
+    # Save excel file (lazy: generated on demand by export_result_excel)
+    if excel_export == "eager":
+        write_excel_log = write_excel_data(excel_path, data)
+    else:
+        manifest_path = result_manifest_path(excel_path)
+        write_excel_log = f"  ⤷ Saved new file: {manifest_path}"
+        logger.info("✓ Saved new file: {} (Excel export deferred)", manifest_path)
     log_entries.append(write_excel_log)
     
     # Save report text if provided
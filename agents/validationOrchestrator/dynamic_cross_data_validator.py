@@ -1,10 +1,12 @@
 from agents.decorators import validate_init_dataframes
 from loguru import logger
 import pandas as pd
-from typing import Dict, Tuple, Any, List
+from typing import Dict, Tuple, Any, List, Callable
 from datetime import datetime
 from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
+from agents.validationOrchestrator.warning_builder import (
+    row_values, as_text, as_date_text, join_text, build_warning_frame, concat_warning_frames)
 
 # Decorator to validate DataFrames are initialized with the correct schema
 @validate_init_dataframes(lambda self: {
@@ -154,10 +156,10 @@ class DynamicCrossDataValidator(ConfigReportMixin):
             raise
     
     @staticmethod
-    def _build_component_string(row: pd.Series) -> str:
+    def _build_component_string(df: pd.DataFrame) -> pd.Series:
         
         """
-        Build a standardized component string from material composition data.
+        Build standardized component strings from material composition data.
         
         This method creates a consistent format for item compositions by combining:
         - Plastic Resin (required): code_name format
@@ -165,32 +167,44 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         - Additive Masterbatch (optional): code_name format
         
         Components are separated by " | " for easy parsing.
+        The strings are assembled column-wise (one pass per component) instead of per row.
 
         Args:
-            row: DataFrame row containing component information
+            df: DataFrame containing component information
 
         Returns:
-            Formatted component string (e.g., "PR001_PET | CM002_Blue | AM003_UV")
-            Returns pd.NA if required plastic resin fields are missing
+            Series of formatted component strings (e.g., "PR001_PET | CM002_Blue | AM003_UV"),
+            missing where the required plastic resin fields are missing
         """
 
-        parts = []
+        if df.empty:
+            # Same empty result dtype as the former apply(axis=1)
+            return pd.Series(index=df.index, dtype=float)
 
-        # Plastic Resin is required - return pd.NA if missing
-        if pd.notna(row.get('plasticResin')) and pd.notna(row.get('plasticResinCode')):
-            parts.append(f"{row['plasticResinCode']}_{row['plasticResin']}")
-        else:
-            return pd.NA
+        component_cols = ['plasticResinCode', 'plasticResin', 'colorMasterbatchCode', 'colorMasterbatch',
+                          'additiveMasterbatchCode', 'additiveMasterbatch']
+        values = row_values(df, [col for col in component_cols if col in df.columns])
+        missing = pd.Series([None] * len(df), dtype=object)
+
+        def component(code_col: str, name_col: str):
+            code = values.get(code_col, missing)
+            name = values.get(name_col, missing)
+            present = (code.notna() & name.notna()).to_numpy()
+            return present, join_text([as_text(code), '_', as_text(name)])
+
+        # Plastic Resin is required - missing if absent
+        has_resin, compositions = component('plasticResinCode', 'plasticResin')
 
-        # Color Masterbatch is optional - add if present
-        if pd.notna(row.get('colorMasterbatch')) and pd.notna(row.get('colorMasterbatchCode')):
-            parts.append(f"{row['colorMasterbatchCode']}_{row['colorMasterbatch']}")
+        # Color / Additive Masterbatch are optional - appended if present
+        for code_col, name_col in [('colorMasterbatchCode', 'colorMasterbatch'),
+                                   ('additiveMasterbatchCode', 'additiveMasterbatch')]:
+            present, part = component(code_col, name_col)
+            compositions = compositions.where(~present, join_text([compositions, ' | ', part]))
 
-        # Additive Masterbatch is optional - add if present
-        if pd.notna(row.get('additiveMasterbatch')) and pd.notna(row.get('additiveMasterbatchCode')):
-            parts.append(f"{row['additiveMasterbatchCode']}_{row['additiveMasterbatch']}")
+        compositions = compositions.where(has_resin, pd.NA)
 
-        return " | ".join(parts)
+        # Rebuild from a list so the dtype is inferred as it was for apply(axis=1)
+        return pd.Series(compositions.tolist(), index=df.index)
     
     #---------------------------------#
     # STEP 1: PREPARE PRODUCTION DATA #
@@ -223,9 +237,7 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         self.logger.debug("Filtered product records: {:,} rows", len(product_df))
 
         # Build standardized item composition strings
-        product_df['item_composition'] = product_df.apply(
-            self._build_component_string, axis=1
-        )
+        product_df['item_composition'] = self._build_component_string(product_df)
 
         # Select only columns needed for validation to reduce memory usage
         product_cols = [
@@ -315,9 +327,7 @@ class DynamicCrossDataValidator(ConfigReportMixin):
 
         # Step 4: Process item compositions
         item_comp_df = itemCompositionSummary_df.copy()
-        item_comp_df['item_composition'] = item_comp_df.apply(
-            self._build_component_string, axis=1
-        )
+        item_comp_df['item_composition'] = self._build_component_string(item_comp_df)
 
         # Group compositions by item to handle multiple compositions per item
         item_comp_grouped = (
@@ -468,7 +478,7 @@ class DynamicCrossDataValidator(ConfigReportMixin):
     # STEP 4: GENERATE WARNINGS        #
     #----------------------------------#
     @staticmethod
-    def _generate_warnings(results: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    def _generate_warnings(results: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
 
         """
         Generate warnings for all mismatch types found during validation.
@@ -480,15 +490,15 @@ class DynamicCrossDataValidator(ConfigReportMixin):
             results: Dictionary containing mismatch analysis results from validation
 
         Returns:
-            Dictionary with categorized warnings organized by warning type
+            Dictionary with categorized warning DataFrames organized by warning type
         """
 
-        # Initialize warning dictionary with empty lists for each category
+        # Initialize warning dictionary with empty frames for each category
         warnings = {
-            'item_warnings': [],          # Warnings for item-related mismatches
-            'mold_warnings': [],          # Warnings for mold-related mismatches
-            'machine_warnings': [],       # Warnings for machine-related mismatches
-            'composition_warnings': [],   # Warnings for composition-related mismatches
+            'item_warnings': concat_warning_frames([]),          # Warnings for item-related mismatches
+            'mold_warnings': concat_warning_frames([]),          # Warnings for mold-related mismatches
+            'machine_warnings': concat_warning_frames([]),       # Warnings for machine-related mismatches
+            'composition_warnings': concat_warning_frames([]),   # Warnings for composition-related mismatches
         }
 
         # Extract records that didn't match validation criteria
@@ -531,49 +541,69 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         return warnings
 
     @staticmethod
-    def _process_item_warnings(mismatches_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _mismatch_context(mismatches_df: pd.DataFrame, extra_fields: List[str]) -> Tuple[Dict[str, pd.Series], pd.Series]:
         
         """
-        Process item information warnings for production records with invalid items.
-        
-        This method generates warnings for production records where the item
-        (itemCode, itemName) combination doesn't exist in the reference data.
+        Extract production context columns shared by all mismatch warnings.
+
+        Returns:
+            Tuple of (text columns by field name, context_info column)
+            where context_info is "poNote, recordDate, workingShift, machineNo, itemCode, itemName[, extra fields]"
         """
 
-        results = []
+        text_fields = ['poNote', 'workingShift', 'machineNo', 'itemCode', 'itemName'] + extra_fields
+        values = row_values(mismatches_df, text_fields)
+        text = {field: as_text(values[field]) for field in text_fields}
+        text['recordDate'] = as_date_text(mismatches_df['recordDate'])
+
+        context_fields = ['poNote', 'recordDate', 'workingShift', 'machineNo', 'itemCode', 'itemName'] + extra_fields
+        context_info = join_text([text[field] for field in context_fields], sep=', ')
+        text['poNo'] = values['poNote']
+        return text, context_info
 
-        for _, row in mismatches_df.iterrows():
-            # Extract production context information
-            po_no = row.get('poNote', 'N/A')
-            record_date = row['recordDate'].strftime('%Y-%m-%d') if pd.notna(row['recordDate']) else 'N/A'
-            working_shift = row.get('workingShift', 'N/A')
-            machine_no = row.get('machineNo', 'N/A')
-            item_code = row.get('itemCode', 'N/A')
-            item_name = row.get('itemName', 'N/A')
-            context_info = f"{po_no}, {record_date}, {working_shift}, {machine_no}, {item_code}, {item_name}"
+    @staticmethod
+    def _build_mismatch_warnings(mismatches_df: pd.DataFrame,
+                                 extra_fields: List[str],
+                                 mismatch_type_parts: Callable[[Dict[str, pd.Series]], List[Any]],
+                                 warning_type: str,
+                                 mismatch_type: str,
+                                 required_action: str) -> pd.DataFrame:
+        
+        """
+        Build mismatch warnings column-wise.
 
-            # Generate warning details
-            mismatch_type = f'({item_code}, {item_name})_not_matched'
-            required_action = 'update_itemInfo_or_double_check_productRecords'
+        `mismatch_type_parts` maps the text columns to the parts of the per-record
+        mismatch type; the message is "(context_info) - Mismatch: {mismatch}. Please {required_action}".
+        """
 
-            # Create human-readable message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
+        text, context_info = DynamicCrossDataValidator._mismatch_context(mismatches_df, extra_fields)
+        mismatch = join_text(mismatch_type_parts(text))
 
-            # Create structured warning entry
-            entry = {
-                'poNo': po_no,
-                'warningType': 'item_warnings',
-                'mismatchType': 'item_info_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
+        # Create human-readable messages
+        message = join_text(['(', context_info, ') - Mismatch: ', mismatch, f'. Please {required_action}'])
 
-            results.append(entry)
+        return build_warning_frame(text['poNo'], warning_type, mismatch_type, required_action, message)
 
-        return results
+    @staticmethod
+    def _process_item_warnings(mismatches_df: pd.DataFrame) -> pd.DataFrame:
+        
+        """
+        Process item information warnings for production records with invalid items.
+        
+        This method generates warnings for production records where the item
+        (itemCode, itemName) combination doesn't exist in the reference data.
+        """
+
+        return DynamicCrossDataValidator._build_mismatch_warnings(
+            mismatches_df,
+            extra_fields=[],
+            mismatch_type_parts=lambda t: ['(', t['itemCode'], ', ', t['itemName'], ')_not_matched'],
+            warning_type='item_warnings',
+            mismatch_type='item_info_not_matched',
+            required_action='update_itemInfo_or_double_check_productRecords')
     
     @staticmethod
-    def _process_mold_warnings(mismatches_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _process_mold_warnings(mismatches_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Process mold warnings for production records with invalid item-mold combinations.
@@ -582,41 +612,16 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         combination is not valid according to the reference data.
         """
 
-        results = []
-
-        for _, row in mismatches_df.iterrows():
-            # Extract production context information
-            po_no = row.get('poNote', 'N/A')
-            record_date = row['recordDate'].strftime('%Y-%m-%d') if pd.notna(row['recordDate']) else 'N/A'
-            working_shift = row.get('workingShift', 'N/A')
-            machine_no = row.get('machineNo', 'N/A')
-            item_code = row.get('itemCode', 'N/A')
-            item_name = row.get('itemName', 'N/A')
-            mold_no = row.get('moldNo', 'N/A')
-            context_info = f"{po_no}, {record_date}, {working_shift}, {machine_no}, {item_code}, {item_name}, {mold_no}"
-
-            # Generate warning details
-            mismatch_type = f'{mold_no}_and_({item_code},{item_name})_not_matched'
-            required_action = 'update_moldInfo_or_double_check_productRecords'
-
-            # Create human-readable message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
-
-            # Create structured warning entry
-            entry = {
-                'poNo': po_no,
-                'warningType': 'item_mold_warnings',
-                'mismatchType': 'item_and_mold_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-
-            results.append(entry)
-
-        return results
+        return DynamicCrossDataValidator._build_mismatch_warnings(
+            mismatches_df,
+            extra_fields=['moldNo'],
+            mismatch_type_parts=lambda t: [t['moldNo'], '_and_(', t['itemCode'], ',', t['itemName'], ')_not_matched'],
+            warning_type='item_mold_warnings',
+            mismatch_type='item_and_mold_not_matched',
+            required_action='update_moldInfo_or_double_check_productRecords')
 
     @staticmethod
-    def _process_machine_warnings(mismatches_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _process_machine_warnings(mismatches_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Process machine tonnage warnings for invalid mold-machine combinations.
@@ -625,42 +630,16 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         tonnage combination is not valid according to the reference data.
         """
 
-        results = []
-
-        for _, row in mismatches_df.iterrows():
-            # Extract production context information
-            po_no = row.get('poNote', 'N/A')
-            record_date = row['recordDate'].strftime('%Y-%m-%d') if pd.notna(row['recordDate']) else 'N/A'
-            working_shift = row.get('workingShift', 'N/A')
-            machine_no = row.get('machineNo', 'N/A')
-            item_code = row.get('itemCode', 'N/A')
-            item_name = row.get('itemName', 'N/A')
-            mold_no = row.get('moldNo', 'N/A')
-            machine_tonnage = row.get('machineTonnage', 'N/A')
-            context_info = f"{po_no}, {record_date}, {working_shift}, {machine_no}, {item_code}, {item_name}, {mold_no}, {machine_tonnage}"
-
-            # Generate warning details
-            mismatch_type = f'{machine_tonnage}_and_{mold_no}_not_matched'
-            required_action = 'update_moldSpecificationSummary_or_double_check_productRecords'
-
-            # Create human-readable message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
-
-            # Create structured warning entry
-            entry = {
-                'poNo': po_no,
-                'warningType': 'mold_machine_tonnage_warnings',
-                'mismatchType': 'mold_and_machine_tonnage_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-
-            results.append(entry)
-
-        return results
+        return DynamicCrossDataValidator._build_mismatch_warnings(
+            mismatches_df,
+            extra_fields=['moldNo', 'machineTonnage'],
+            mismatch_type_parts=lambda t: [t['machineTonnage'], '_and_', t['moldNo'], '_not_matched'],
+            warning_type='mold_machine_tonnage_warnings',
+            mismatch_type='mold_and_machine_tonnage_not_matched',
+            required_action='update_moldSpecificationSummary_or_double_check_productRecords')
 
     @staticmethod
-    def _process_composition_warnings(mismatches_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _process_composition_warnings(mismatches_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Process item composition warnings for invalid item-composition combinations.
@@ -669,38 +648,13 @@ class DynamicCrossDataValidator(ConfigReportMixin):
         combination is not valid according to the reference data.
         """
 
-        results = []
-
-        for _, row in mismatches_df.iterrows():
-            # Extract production context information
-            po_no = row.get('poNote', 'N/A')
-            record_date = row['recordDate'].strftime('%Y-%m-%d') if pd.notna(row['recordDate']) else 'N/A'
-            working_shift = row.get('workingShift', 'N/A')
-            machine_no = row.get('machineNo', 'N/A')
-            item_code = row.get('itemCode', 'N/A')
-            item_name = row.get('itemName', 'N/A')
-            item_composition = row.get('item_composition', 'N/A')
-            context_info = f"{po_no}, {record_date}, {working_shift}, {machine_no}, {item_code}, {item_name}, {item_composition}"
-
-            # Generate warning details
-            mismatch_type = f'({item_code},{item_name})_and_{item_composition}_not_matched'
-            required_action = 'update_itemCompositionSummary_or_double_check_productRecords'
-
-            # Create human-readable message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
-
-            # Create structured warning entry
-            entry = {
-                'poNo': po_no,
-                'warningType': 'item_composition_warnings',
-                'mismatchType': 'item_and_item_composition_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-
-            results.append(entry)
-
-        return results
+        return DynamicCrossDataValidator._build_mismatch_warnings(
+            mismatches_df,
+            extra_fields=['item_composition'],
+            mismatch_type_parts=lambda t: ['(', t['itemCode'], ',', t['itemName'], ')_and_', t['item_composition'], '_not_matched'],
+            warning_type='item_composition_warnings',
+            mismatch_type='item_and_item_composition_not_matched',
+            required_action='update_itemCompositionSummary_or_double_check_productRecords')
 
     @staticmethod
     def _process_invalid_item_warnings(invalid_details: Dict[str, Dict[str, List[str]]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -782,12 +736,11 @@ class DynamicCrossDataValidator(ConfigReportMixin):
             final_results['invalid_warnings'] = DynamicCrossDataValidator._create_empty_warning_dataframe('invalid')
 
         # Process mismatch warnings by combining all warning types
-        all_mismatch_warnings = []
-        for warning_type, warnings in results['mismatch_warnings'].items():
-            all_mismatch_warnings.extend(warnings)
+        all_mismatch_warnings = [warnings for warnings in results['mismatch_warnings'].values()
+                                 if not warnings.empty]
 
         if all_mismatch_warnings:
-            final_results['mismatch_warnings'] = pd.DataFrame(all_mismatch_warnings)
+            final_results['mismatch_warnings'] = concat_warning_frames(all_mismatch_warnings)
         else:
             final_results['mismatch_warnings'] = DynamicCrossDataValidator._create_empty_warning_dataframe('mismatch')
 
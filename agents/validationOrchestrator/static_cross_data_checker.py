@@ -5,6 +5,8 @@ from typing import List, Dict, Any
 from datetime import datetime
 from configs.shared.config_report_format import ConfigReportMixin
 from configs.shared.dict_based_report_generator import DictBasedReportGenerator
+from agents.validationOrchestrator.warning_builder import (
+    row_values, as_text, as_date_text, join_text, build_warning_frame, concat_warning_frames)
 
 # Decorator to validate DataFrames are initialized with the correct schema
 @validate_init_dataframes(lambda self: {
@@ -120,14 +122,13 @@ class StaticCrossDataChecker(ConfigReportMixin):
                 composition_warnings = self._check_composition_matches(df_name, checking_df)
                 
                 # Combine all warnings (PORequiredCriticalValidator pattern)
-                all_warnings = item_warnings + resin_warnings + composition_warnings
+                all_warnings = concat_warning_frames([item_warnings, resin_warnings, composition_warnings])
                 
                 # Calculate total warnings
                 total_warnings = len(all_warnings)
                 
                 # Store results in final_results dictionary
-                final_result[df_name] = pd.DataFrame(all_warnings) if all_warnings else pd.DataFrame(
-                    columns=['poNo', 'warningType', 'mismatchType', 'requiredAction', 'message'])
+                final_result[df_name] = all_warnings
                 
                 # Log summary information for user review
                 validation_log_entries.append(f"Validation Summary for {df_name}:")
@@ -195,7 +196,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
     #-------------------------------------------------#
     def _check_item_info_matches(self, 
                                  df_name: str, 
-                                 checking_df: pd.DataFrame) -> List:
+                                 checking_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Check for itemCode + itemName matches in itemInfo reference table.
@@ -208,7 +209,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
             checking_df: DataFrame to validate
             
         Returns:
-            list: List of warning dictionaries for mismatched items
+            pd.DataFrame: Warnings for mismatched items
         """
 
         self.logger.debug("Checking item info matches for {}", df_name)
@@ -226,7 +227,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
         po_subset = checking_df[subset_fields].dropna(subset=['itemCode', 'itemName']).copy()
         
         if po_subset.empty:
-            return []
+            return concat_warning_frames([])
         
         # Create reference lookup from itemInfo table
         item_pairs = self.itemInfo_df[['itemCode', 'itemName']].drop_duplicates()
@@ -236,76 +237,80 @@ class StaticCrossDataChecker(ConfigReportMixin):
         mismatches = merged[merged['_merge'] == 'left_only'].drop('_merge', axis=1)
         
         if mismatches.empty:
-            return []
+            return concat_warning_frames([])
         
         # Process and format warnings
         return self._process_item_warnings(mismatches, df_name)
     
+    @staticmethod
+    def _context_fields(df_name: str) -> List[str]:
+        
+        """Text fields of the warning context for the source dataframe (recordDate is formatted separately)."""
+
+        if df_name == "productRecords":
+          return ['poNo', 'workingShift', 'machineNo']
+        elif df_name == "purchaseOrders":
+          return ['poNo']
+        else:
+          logger.error("Unknown df_name: {}", df_name)
+          raise ValueError(f"Unknown df_name: {df_name}")
+
+    @staticmethod
+    def _context_info(mismatches_df: pd.DataFrame, 
+                      values: Dict[str, pd.Series], 
+                      df_name: str, 
+                      detail_fields: List[str]) -> pd.Series:
+        
+        """
+        Build the context column of a warning message for the source dataframe:
+        "poNo, recordDate, workingShift, machineNo, ..." for productRecords and
+        "poNo, ..." for purchaseOrders, followed by `detail_fields`.
+        """
+
+        parts = [as_text(values[field]) for field in StaticCrossDataChecker._context_fields(df_name)]
+        if df_name == "productRecords":
+          parts.insert(1, as_date_text(mismatches_df['recordDate'], na_text=None))
+
+        parts += [as_text(values[field]) for field in detail_fields]
+        return join_text(parts, sep=', ')
+
     @staticmethod
     def _process_item_warnings(mismatches_df: pd.DataFrame, 
-                               df_name: str) -> List:
+                               df_name: str) -> pd.DataFrame:
         
         """
         Process item info warnings following PORequiredCriticalValidator pattern.
         
         Converts item mismatch data into standardized warning format with
-        contextual information and recommended actions.
+        contextual information and recommended actions (built column-wise).
         
         Args:
             mismatches_df: DataFrame containing mismatched item records
             df_name: Name of the source dataframe
             
         Returns:
-            list: List of formatted warning dictionaries
+            pd.DataFrame: Formatted warnings
         """
 
-        results = []
+        values = row_values(mismatches_df, StaticCrossDataChecker._context_fields(df_name) + ['itemCode', 'itemName'])
+        context_info = StaticCrossDataChecker._context_info(mismatches_df, values, df_name, ['itemCode', 'itemName'])
         
-        for _, row in mismatches_df.iterrows():
-            # Build context information based on dataframe type
-            if df_name == "productRecords":
-              poNo = row['poNo']
-              recordDate = row['recordDate'].strftime('%Y-%m-%d')
-              workingShift = row['workingShift']
-              machineNo = row['machineNo']
-              itemCode = row['itemCode']
-              itemName = row['itemName']
-              context_info = f"{poNo}, {recordDate}, {workingShift}, {machineNo}, {itemCode}, {itemName}"
-            elif df_name == "purchaseOrders":
-              poNo = row['poNo']
-              itemCode = row['itemCode']
-              itemName = row['itemName']
-              context_info = f"{poNo}, {itemCode}, {itemName}"
-            else:
-              logger.error("Unknown df_name: {}", df_name)
-              raise ValueError(f"Unknown df_name: {df_name}")
-            
-            # Define mismatch type and required action
-            mismatch_type = f'{itemCode}_and_{itemName}_not_matched'
-            required_action = f'update_itemInfo_or_double_check_{df_name}'
-            
-            # Create comprehensive warning message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
-            
-            # Create standardized warning entry
-            entry = {
-                'poNo': poNo,
-                'warningType': 'item_info_warnings',
-                'mismatchType': 'item_code_and_name_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-            
-            results.append(entry)
+        # Define mismatch type and required action
+        mismatch_type = join_text([as_text(values['itemCode']), '_and_', as_text(values['itemName']), '_not_matched'])
+        required_action = f'update_itemInfo_or_double_check_{df_name}'
+        
+        # Create comprehensive warning messages
+        message = join_text(['(', context_info, ') - Mismatch: ', mismatch_type, f'. Please {required_action}'])
         
-        return results
+        return build_warning_frame(values['poNo'], 'item_info_warnings', 'item_code_and_name_not_matched',
+                                   required_action, message)
 
     #-------------------------------------------------#
     # 2. RESIN INFO MATCHING                          #
     #-------------------------------------------------#
     def _check_resin_info_matches(self, 
                                   df_name: str, 
-                                  checking_df: pd.DataFrame) -> List:
+                                  checking_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Check for resinCode + resinName matches in resinInfo reference table.
@@ -320,7 +325,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
             checking_df: DataFrame to validate
             
         Returns:
-            list: List of warning dictionaries for mismatched resin info
+            pd.DataFrame: Warnings for mismatched resin info
         """
 
         self.logger.debug("Checking resin info matches for {}", df_name)
@@ -369,75 +374,47 @@ class StaticCrossDataChecker(ConfigReportMixin):
                 # Add plastic type context for clearer error messages
                 mismatches['plasticType'] = name_field
                 warnings = self._process_resin_warnings(mismatches, df_name)
-                all_resin_warnings.extend(warnings)
+                all_resin_warnings.append(warnings)
         
-        return all_resin_warnings
+        return concat_warning_frames(all_resin_warnings)
 
     @staticmethod
     def _process_resin_warnings(mismatches_df: pd.DataFrame, 
-                                df_name: str) -> List:
+                                df_name: str) -> pd.DataFrame:
         
         """
         Process resin info warnings following PORequiredCriticalValidator pattern.
         
         Converts resin mismatch data into standardized warning format with
-        contextual information and recommended actions.
+        contextual information and recommended actions (built column-wise).
         
         Args:
             mismatches_df: DataFrame containing mismatched resin records
             df_name: Name of the source dataframe
             
         Returns:
-            list: List of formatted warning dictionaries
+            pd.DataFrame: Formatted warnings
         """
 
-        results = []
+        values = row_values(mismatches_df, StaticCrossDataChecker._context_fields(df_name) + ['resinCode', 'resinName'])
+        context_info = StaticCrossDataChecker._context_info(mismatches_df, values, df_name, ['resinCode', 'resinName'])
         
-        for _, row in mismatches_df.iterrows():
-            # Build context information based on dataframe type
-            if df_name == "productRecords":
-              poNo = row['poNo']
-              recordDate = row['recordDate'].strftime('%Y-%m-%d')
-              workingShift = row['workingShift']
-              machineNo = row['machineNo']
-              resinCode = row['resinCode']
-              resinName = row['resinName']
-              context_info = f"{poNo}, {recordDate}, {workingShift}, {machineNo}, {resinCode}, {resinName}"
-            elif df_name == "purchaseOrders":
-              poNo = row['poNo']
-              resinCode = row['resinCode']
-              resinName = row['resinName']
-              context_info = f"{poNo}, {resinCode}, {resinName}"
-            else:
-              logger.error("Unknown df_name: {}", df_name)
-              raise ValueError(f"Unknown df_name: {df_name}")
-            
-            # Define mismatch type and required action
-            mismatch_type = f'{resinCode}_and_{resinName}_not_matched'
-            required_action = f'update_resinInfo_or_double_check_{df_name}'
-            
-            # Create comprehensive warning message
-            message = f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}"
-            
-            # Create standardized warning entry
-            entry = {
-                'poNo': poNo,
-                'warningType': 'resin_info_warnings',
-                'mismatchType': 'resin_code_and_name_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-            
-            results.append(entry)
+        # Define mismatch type and required action
+        mismatch_type = join_text([as_text(values['resinCode']), '_and_', as_text(values['resinName']), '_not_matched'])
+        required_action = f'update_resinInfo_or_double_check_{df_name}'
+        
+        # Create comprehensive warning messages
+        message = join_text(['(', context_info, ') - Mismatch: ', mismatch_type, f'. Please {required_action}'])
         
-        return results
+        return build_warning_frame(values['poNo'], 'resin_info_warnings', 'resin_code_and_name_not_matched',
+                                   required_action, message)
 
     #-------------------------------------------------#
     # 3. COMPOSITION MATCHING                         #
     #-------------------------------------------------#
     def _check_composition_matches(self, 
                                    df_name: str, 
-                                   checking_df: pd.DataFrame) -> List:
+                                   checking_df: pd.DataFrame) -> pd.DataFrame:
         
         """
         Check for complete item composition matches in itemCompositionSummary reference table.
@@ -450,7 +427,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
             checking_df: DataFrame to validate
             
         Returns:
-            list: List of warning dictionaries for mismatched compositions
+            pd.DataFrame: Warnings for mismatched compositions
         """
 
         self.logger.debug("Checking composition matches for {}", df_name)
@@ -475,7 +452,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
         po_subset = checking_df[subset_fields + composition_cols].dropna(subset=composition_cols, how='all').copy()
         
         if po_subset.empty:
-            return []
+            return concat_warning_frames([])
         
         # Create reference lookup from itemCompositionSummary table
         composition_pairs = self.itemCompositionSummary_df[composition_cols].drop_duplicates()
@@ -485,7 +462,7 @@ class StaticCrossDataChecker(ConfigReportMixin):
         mismatches = merged[merged['_merge'] == 'left_only'].drop('_merge', axis=1)
         
         if mismatches.empty:
-            return []
+            return concat_warning_frames([])
         
         # Process and format composition warnings
         return self._process_composition_warnings(mismatches, df_name, composition_cols)
@@ -493,13 +470,13 @@ class StaticCrossDataChecker(ConfigReportMixin):
     @staticmethod
     def _process_composition_warnings(mismatches_df: pd.DataFrame, 
                                       df_name: str, 
-                                      composition_fields: List) -> List:
+                                      composition_fields: List) -> pd.DataFrame:
         
         """
         Process composition warnings following PORequiredCriticalValidator pattern.
         
         Converts composition mismatch data into standardized warning format with
-        contextual information and recommended actions.
+        contextual information and recommended actions (built column-wise).
         
         Args:
             mismatches_df: DataFrame containing mismatched composition records
@@ -507,45 +484,21 @@ class StaticCrossDataChecker(ConfigReportMixin):
             composition_fields: List of fields that make up the composition
             
         Returns:
-            list: List of formatted warning dictionaries
+            pd.DataFrame: Formatted warnings
         """
 
-        results = []
-        for _, row in mismatches_df.iterrows():
-            # Build context information based on dataframe type
-            if df_name == "productRecords":
-              poNo = row['poNo']
-              recordDate = row['recordDate'].strftime('%Y-%m-%d')
-              workingShift = row['workingShift']
-              machineNo = row['machineNo']
-              context_info = f"{poNo}, {recordDate}, {workingShift}, {machineNo}"
-              detail_info = ", ".join([row[field] if pd.notna(row[field]) else '' for field in composition_fields])
-              
-            elif df_name == "purchaseOrders":
-              poNo = row['poNo']
-              context_info = f"{poNo}"
-              detail_info = ", ".join([row[field] if pd.notna(row[field]) else '' for field in composition_fields])
-              
-            else:
-              logger.error("Unknown df_name: {}", df_name)
-              raise ValueError(f"Unknown df_name: {df_name}")
-            
-            # Define mismatch type and required action
-            mismatch_type = f'{detail_info}_not_matched'
-            required_action = f'update_itemCompositionSummary_or_double_check_{df_name}'
-            
-            # Create comprehensive warning message
-            message = f"({context_info}) - Mismatch: {mismatch_type} - Please: {required_action}"
-            
-            # Create standardized warning entry
-            entry = {
-                'poNo': poNo,
-                'warningType': 'composition_warnings',
-                'mismatchType': 'item_composition_not_matched',
-                'requiredAction': required_action,
-                'message': message
-            }
-            
-            results.append(entry)
+        values = row_values(mismatches_df, StaticCrossDataChecker._context_fields(df_name) + composition_fields)
+        context_info = StaticCrossDataChecker._context_info(mismatches_df, values, df_name, [])
+
+        # Missing composition fields are left blank
+        detail_info = join_text([values[field].where(values[field].notna(), '') for field in composition_fields], sep=', ')
+        
+        # Define mismatch type and required action
+        mismatch_type = join_text([detail_info, '_not_matched'])
+        required_action = f'update_itemCompositionSummary_or_double_check_{df_name}'
+        
+        # Create comprehensive warning messages
+        message = join_text(['(', context_info, ') - Mismatch: ', mismatch_type, f' - Please: {required_action}'])
         
-        return results
\ No newline at end of file
+        return build_warning_frame(values['poNo'], 'composition_warnings', 'item_composition_not_matched',
+                                   required_action, message)
@@ -11,6 +11,7 @@ import os
 import traceback
 from agents.validationOrchestrator.save_output_formatter import save_validatation_data
 from agents.utils import load_annotation_path, camel_to_snake
+from agents.database_loader import load_database, schema_dtypes
 from agents.validationOrchestrator.dynamic_cross_data_validator import DynamicCrossDataValidator
 from agents.validationOrchestrator.static_cross_data_checker import StaticCrossDataChecker
 from agents.validationOrchestrator.po_required_critical_validator import PORequiredCriticalValidator
@@ -97,7 +98,7 @@ class DataLoadingPhase(AtomicPhase):
                 continue
             
             try:
-                df = pd.read_parquet(path)
+                df = load_database(path, dtypes=schema_dtypes(databaseSchemas_data, path_key))
                 loaded_dfs[attr_name] = df
                 logger.debug("{}: {} - {}", path_key, df.shape, list(df.columns))
             except Exception as e:
@@ -0,0 +1,111 @@
+"""
+Columnar warning generation shared by DynamicCrossDataValidator and StaticCrossDataChecker.
+
+Warnings are assembled column-wise (Arrow string kernels) instead of iterrows() + per-row
+dicts. Values are rendered exactly as the former row loops saw them: iterrows() and
+apply(axis=1) read rows from the interleaved `DataFrame.values`, where a missing value
+shows up as a frame-dependent marker (nan, <NA>, None, NaT) and every field goes through str().
+"""
+
+from loguru import logger
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Dict, List, Optional
+
+WARNING_COLUMNS = ['poNo', 'warningType', 'mismatchType', 'requiredAction', 'message']
+
+TextPart = pd.Series | str
+
+def row_values(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, pd.Series]:
+
+    """
+    Column values as iterrows() yields them (object dtype, same missing markers),
+    without interleaving the whole frame.
+    """
+
+    values = {}
+    for col in (columns if columns is not None else df.columns):
+        column = df[col].reset_index(drop=True)
+        col_values = column.to_numpy(dtype=object).copy()
+
+        missing = column.isna().to_numpy()
+        if missing.any():
+            # The marker depends on the dtypes of the whole frame: read it from a one-row slice
+            first_missing = int(np.flatnonzero(missing)[0])
+            col_values[missing] = df.iloc[[first_missing]].values[0, df.columns.get_loc(col)]
+
+        values[col] = pd.Series(col_values, dtype=object)
+    return values
+
+def _to_arrow(part: TextPart):
+    if isinstance(part, str):
+        return pa.scalar(part, type=pa.large_string())
+    if isinstance(part.dtype, pd.StringDtype) and part.dtype.storage == "pyarrow":
+        return pa.array(part).cast(pa.large_string())
+    return pa.array(part.to_numpy(dtype=object), type=pa.large_string())
+
+def _from_arrow(array) -> pd.Series:
+    return pd.Series(pd.array(array, dtype=pd.StringDtype("pyarrow")))
+
+def as_text(values: pd.Series) -> pd.Series:
+    """Format each value with str(), as an f-string placeholder would."""
+    values = pd.Series(values.to_numpy(dtype=object), dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        values = values.map(str)
+    return _from_arrow(pa.array(values.to_numpy(dtype=object), type=pa.large_string()))
+
+def as_date_text(dates: pd.Series, na_text: Optional[str] = 'N/A') -> pd.Series:
+
+    """
+    Format timestamps as YYYY-MM-DD (each distinct date is formatted once).
+
+    Missing dates become `na_text`; with na_text=None they raise like Timestamp.strftime on NaT.
+    """
+
+    codes, uniques = pd.factorize(pd.to_datetime(dates.reset_index(drop=True)).dt.normalize())
+    missing = codes < 0
+    if na_text is None and missing.any():
+        raise ValueError("NaTType does not support strftime")
+
+    labels = np.append(pd.DatetimeIndex(uniques).strftime('%Y-%m-%d').to_numpy(dtype=object), na_text)
+    return _from_arrow(pa.array(labels[codes], type=pa.large_string()))
+
+def join_text(parts: List[TextPart], sep: str = '') -> pd.Series:
+    """Concatenate text columns and literals element-wise."""
+    return _from_arrow(pc.binary_join_element_wise(*[_to_arrow(part) for part in parts], _to_arrow(sep)))
+
+def build_warning_frame(po_no: pd.Series,
+                        warning_type: str,
+                        mismatch_type: str,
+                        required_action: str,
+                        message: pd.Series) -> pd.DataFrame:
+
+    """
+    Build a warning DataFrame with the standard columns.
+
+    Columns are created from lists so dtypes are inferred exactly as
+    pd.DataFrame(list_of_warning_dicts) did.
+    """
+
+    n_rows = len(message)
+    warnings_df = pd.DataFrame({
+        'poNo': po_no.tolist(),
+        'warningType': [warning_type] * n_rows,
+        'mismatchType': [mismatch_type] * n_rows,
+        'requiredAction': [required_action] * n_rows,
+        'message': message.tolist(),
+    }, columns=WARNING_COLUMNS)
+
+    logger.debug("Built {} {} entries", n_rows, warning_type)
+    return warnings_df
+
+def concat_warning_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Stack warning frames; empty input gives an empty frame with the standard columns."""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=WARNING_COLUMNS)
+    if len(frames) == 1:
+        return frames[0]
+    return pd.DataFrame({col: [v for frame in frames for v in frame[col].tolist()] for col in WARNING_COLUMNS})
@@ -1,7 +1,9 @@
 from typing import Optional
 from optiMoldMaster.opti_mold_master import OptiMoldIQ
+from api.job_scheduler import JobScheduler
 
 _orchestrator: Optional[OptiMoldIQ] = None
+_job_scheduler: Optional[JobScheduler] = None
 
 def init_orchestrator(instance: OptiMoldIQ):
     global _orchestrator
@@ -10,4 +12,13 @@ def init_orchestrator(instance: OptiMoldIQ):
 def get_orchestrator() -> OptiMoldIQ:
     if _orchestrator is None:
         raise RuntimeError("Orchestrator not initialized")
-    return _orchestrator
\ No newline at end of file
+    return _orchestrator
+
+def init_job_scheduler(instance: JobScheduler):
+    global _job_scheduler
+    _job_scheduler = instance
+
+def get_job_scheduler() -> JobScheduler:
+    if _job_scheduler is None:
+        raise RuntimeError("Job scheduler not initialized")
+    return _job_scheduler
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Scheduler of the workflow jobs started from the API.
+
+execute_workflow used to start a daemon thread per request and keep every job in an
+unbounded dict, so concurrent requests ran the same heavy workflow several times at once
+over the same shared_db files, and jobs were lost on restart. JobScheduler:
+
+- runs jobs on a bounded thread pool (max_workers, default 1: workflows share the
+  shared_db files, so they run one after the other unless configured otherwise),
+- keeps at most one active (pending or running) job per workflow: identical requests
+  are coalesced onto it and get its job_id instead of queueing duplicate work,
+- persists every state change to a local SQLite file; jobs left active by a previous
+  process are marked failed when it is reopened,
+- expires finished jobs after ttl_hours (from memory and from the file).
+
+A job runs `runner(workflow_name, report)`, which calls report(**fields) to publish its
+progress (status, modules, execution_id, viz_status...). The job is finished when the
+runner returns; an exception marks it failed. A runner with work still reporting in the
+background (viz extraction) returns `settle(finish)` instead: the worker is released
+right away, and the job is finished when that work calls finish().
+"""
+
+from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+JOB_DB_ENV = "OPTIMOLDIQ_API_JOB_DB"
+DEFAULT_JOB_DB_PATH = os.environ.get(JOB_DB_ENV, "agents/shared_db/api_jobs.sqlite")
+DEFAULT_MAX_WORKERS = int(os.environ.get("OPTIMOLDIQ_API_JOB_WORKERS", 1))
+DEFAULT_JOB_TTL_HOURS = float(os.environ.get("OPTIMOLDIQ_API_JOB_TTL_HOURS", 24))
+
+ACTIVE_STATUSES = ("pending", "running")
+
+JOB_FIELDS = ("job_id", "workflow_name", "status", "modules", "execution_id", "viz_status",
+              "error", "requests", "created_at", "started_at", "finished_at")
+_JSON_FIELDS = ("modules",)
+
+Settle = Callable[[Callable[[], None]], None]
+Runner = Callable[[str, Callable[..., None]], Optional[Settle]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    workflow_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    modules TEXT,
+    execution_id TEXT,
+    viz_status TEXT,
+    error TEXT,
+    requests INTEGER NOT NULL DEFAULT 1,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+)
+"""
+
+def is_job_finished(job: Dict[str, Any]) -> bool:
+    """The runner of the job has returned (no more updates will be published)."""
+    return job.get("finished_at") is not None
+
+class JobScheduler:
+    """Bounded, deduplicating and persistent queue of workflow jobs"""
+
+    def __init__(self,
+                 runner: Runner,
+                 db_path: Path | str = DEFAULT_JOB_DB_PATH,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 ttl_hours: float = DEFAULT_JOB_TTL_HOURS):
+        self.runner = runner
+        self.db_path = Path(db_path)
+        self.max_workers = max(1, max_workers)
+        self.ttl_hours = ttl_hours
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._active_by_workflow: Dict[str, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._load()
+
+    #-------------#
+    # Persistence #
+    #-------------#
+    def _load(self) -> None:
+        now = time.time()
+        with self._lock, self._db:
+            interrupted = self._db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Interrupted by a server restart', "
+                "finished_at = ? WHERE finished_at IS NULL", (now,)).rowcount
+            cursor = self._db.execute(f"SELECT {', '.join(JOB_FIELDS)} FROM jobs")
+            for row in cursor.fetchall():
+                job = dict(zip(JOB_FIELDS, row))
+                for field in _JSON_FIELDS:
+                    job[field] = json.loads(job[field]) if job[field] else {}
+                self._jobs[job["job_id"]] = job
+        if interrupted:
+            logger.warning("Marked {} interrupted jobs as failed in {}", interrupted, self.db_path)
+        self.expire()
+
+    def _save(self, job: Dict[str, Any]) -> None:
+        # Called with self._lock held
+        values = [json.dumps(job[f], default=str) if f in _JSON_FIELDS else job[f] for f in JOB_FIELDS]
+        with self._db:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO jobs ({', '.join(JOB_FIELDS)}) "
+                f"VALUES ({', '.join('?' * len(JOB_FIELDS))})", values)
+
+    #------#
+    # Jobs #
+    #------#
+    def submit(self, workflow_name: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue a run of `workflow_name`, or coalesce onto its pending or running job.
+        Returns (job, coalesced).
+        """
+        self.expire()
+        with self._lock:
+            active_id = self._active_by_workflow.get(workflow_name)
+            if active_id is not None:
+                job = self._jobs[active_id]
+                job["requests"] += 1
+                self._save(job)
+                logger.info("Request for '{}' coalesced onto job {} ({})",
+                            workflow_name, active_id, job["status"])
+                return dict(job), True
+
+            job = {field: None for field in JOB_FIELDS}
+            job.update(job_id=uuid.uuid4().hex[:8], workflow_name=workflow_name, status="pending",
+                       modules={}, requests=1, created_at=time.time())
+            self._jobs[job["job_id"]] = job
+            self._active_by_workflow[workflow_name] = job["job_id"]
+            self._save(job)
+            snapshot = dict(job)
+
+        self._executor.submit(self._run, job["job_id"])
+        logger.info("Queued job {} for workflow '{}'", job["job_id"], workflow_name)
+        return snapshot, False
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            workflow_name = self._jobs[job_id]["workflow_name"]
+        self._update(job_id, status="running", started_at=time.time())
+        settle = None
+        try:
+            settle = self.runner(workflow_name, lambda **fields: self._update(job_id, **fields))
+            if settle is not None:
+                # Finished by the background work, without holding this worker
+                settle(lambda: self._finish(job_id))
+        except Exception as e:
+            logger.error("Job {} ('{}') failed: {}", job_id, workflow_name, e)
+            self._update(job_id, status="failed", error=str(e))
+            settle = None
+        finally:
+            if settle is None:
+                self._finish(job_id)
+
+    def _finish(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            if job["finished_at"] is not None:
+                return
+            if job["status"] in ACTIVE_STATUSES:
+                job["status"] = "failed"
+                job["error"] = job["error"] or "Runner returned without a final status"
+            job["finished_at"] = time.time()
+            self._release(job)
+            self._save(job)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        unknown = set(fields) - set(JOB_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {sorted(unknown)}")
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields)
+            if job["status"] not in ACTIVE_STATUSES:
+                # New requests start a new run, even while this one still reports (viz)
+                self._release(job)
+            self._save(job)
+
+    def _release(self, job: Dict[str, Any]) -> None:
+        if self._active_by_workflow.get(job["workflow_name"]) == job["job_id"]:
+            del self._active_by_workflow[job["workflow_name"]]
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def list_jobs(self, workflow_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Known jobs, newest first."""
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values()
+                    if workflow_name is None or job["workflow_name"] == workflow_name]
+        return sorted(jobs, key=lambda job: job["created_at"], reverse=True)
+
+    def expire(self) -> int:
+        """Remove jobs finished more than ttl_hours ago."""
+        cutoff = time.time() - self.ttl_hours * 3600
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job["finished_at"] is not None and job["finished_at"] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+            with self._db:
+                self._db.execute("DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                                 (cutoff,))
+        if expired:
+            logger.debug("Expired {} jobs", len(expired))
+        return len(expired)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+        with self._lock:
+            self._db.close()
@@ -1,57 +1,86 @@
 from fastapi import APIRouter, Depends, HTTPException
-from api.dependencies import get_orchestrator
-import threading
-import uuid
+from fastapi.responses import StreamingResponse
+from api.dependencies import get_orchestrator, get_job_scheduler
+from api.job_scheduler import is_job_finished
+import asyncio
+import json
 
 router = APIRouter(prefix="/api", tags=["execute"])
 
-# In-memory job store — fine for single-process local tool
-_jobs: dict = {}
-_jobs_lock = threading.Lock()
+# Progress stream: job snapshots are compared at this interval (in memory, no I/O)
+EVENT_POLL_INTERVAL = 0.25
+EVENT_KEEPALIVE_INTERVAL = 15.0
 
 
-def _run_job(job_id: str, workflow_name: str, orc):
-    with _jobs_lock:
-        _jobs[job_id]["status"] = "running"
-    try:
+def make_workflow_runner(orc):
+    """
+    Job runner of the scheduler: run the workflow and report its result. The job is
+    finished once its viz data is published, without holding the scheduler worker.
+    """
+    def run(workflow_name: str, report):
         record = orc.execute(workflow_name)
-        with _jobs_lock:
-            _jobs[job_id].update({
-                "status": record.status,
-                "modules": record.summary.get("modules", {}),
-                "execution_id": record.execution_id,
-            })
-    except Exception as e:
-        with _jobs_lock:
-            _jobs[job_id].update({
-                "status": "failed",
-                "error": str(e),
-            })
+        report(
+            status=record.status,
+            modules=record.summary.get("modules", {}),
+            execution_id=record.execution_id,
+            viz_status=orc.get_viz_status(record.execution_id),
+        )
+
+        def settle(finish):
+            def publish(viz_status: str):
+                try:
+                    report(viz_status=viz_status)
+                finally:
+                    finish()
+            orc.on_viz_published(record.execution_id, publish)
+        return settle
+    return run
 
 
 @router.post("/execute/{workflow_name}")
-def execute_workflow(workflow_name: str, orc=Depends(get_orchestrator)):
-    # Validate workflow exists before spawning thread
+def execute_workflow(workflow_name: str,
+                     orc=Depends(get_orchestrator),
+                     scheduler=Depends(get_job_scheduler)):
+    # Validate workflow exists before queueing
     if workflow_name not in orc.list_workflows():
         raise HTTPException(status_code=404, detail=f"Workflow '{workflow_name}' not found")
 
-    job_id = uuid.uuid4().hex[:8]
-    with _jobs_lock:
-        _jobs[job_id] = {"status": "pending", "modules": {}}
-
-    thread = threading.Thread(
-        target=_run_job,
-        args=(job_id, workflow_name, orc),
-        daemon=True  # won't block process shutdown
-    )
-    thread.start()
-    return {"job_id": job_id}
+    job, coalesced = scheduler.submit(workflow_name)
+    return {"job_id": job["job_id"], "status": job["status"], "coalesced": coalesced}
 
 
 @router.get("/execute/{job_id}/status")
-def job_status(job_id: str):
-    with _jobs_lock:
-        job = _jobs.get(job_id)
+def job_status(job_id: str, scheduler=Depends(get_job_scheduler)):
+    job = scheduler.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
\ No newline at end of file
+    return job
+
+
+@router.get("/execute/{job_id}/events")
+async def job_events(job_id: str, scheduler=Depends(get_job_scheduler)):
+    """Server-sent events: the job snapshot on every change, until the job is finished."""
+    if scheduler.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def stream():
+        last_job, idle = None, 0.0
+        while True:
+            job = scheduler.get_job(job_id)
+            if job is None:
+                yield "event: expired\ndata: {}\n\n"
+                return
+            if job != last_job:
+                yield f"data: {json.dumps(job, default=str)}\n\n"
+                last_job, idle = job, 0.0
+            elif idle >= EVENT_KEEPALIVE_INTERVAL:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            if is_job_finished(job):
+                yield "event: end\ndata: {}\n\n"
+                return
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+            idle += EVENT_POLL_INTERVAL
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
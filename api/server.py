@@ -4,11 +4,14 @@ from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from api.routes import workflows, execute, viz
+from api.job_scheduler import DEFAULT_JOB_DB_PATH, JobScheduler
 
 
-def create_app(orchestrator) -> FastAPI:
-    from api.dependencies import init_orchestrator
+def create_app(orchestrator, job_db_path: str = DEFAULT_JOB_DB_PATH) -> FastAPI:
+    from api.dependencies import init_orchestrator, init_job_scheduler
     init_orchestrator(orchestrator)
+    init_job_scheduler(JobScheduler(runner=execute.make_workflow_runner(orchestrator),
+                                    db_path=job_db_path))
 
     app = FastAPI(title="OptiMoldIQ API", version="1.0.0")
 
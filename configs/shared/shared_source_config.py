@@ -24,6 +24,9 @@ class SharedSourceConfig:
     annotation_path: Optional[str] = None
     manual_review_notifications_dir: Optional[str] = None
     shared_database_dir: Optional[str] = None
+    ingestion_cache_dir: Optional[str] = None
+    incremental_ingestion: bool = False
+    ingestion_max_workers: Optional[int] = 1
 
     #------------------------#
     # ValidationOrchestrator #
@@ -38,6 +41,8 @@ class SharedSourceConfig:
     progress_tracker_dir: Optional[str] = None
     progress_tracker_change_log_path: Optional[str] = None
     progress_tracker_constant_config_path: Optional[str] = None
+    progress_tracker_state_dir: Optional[str] = None
+    incremental_tracking: bool = False
 
     #-------------#
     # AutoPlanner #
@@ -161,6 +166,8 @@ class SharedSourceConfig:
             self.annotation_path or f"{self.data_pipeline_dir}/DataCollector")
         self.annotation_path = (
             self.annotation_path or f"{self.data_pipeline_dir}/DataCollector/newest/path_annotations.json")
+        self.ingestion_cache_dir = (
+            self.ingestion_cache_dir or f"{self.data_pipeline_dir}/IngestionCache")
         
         #------------------------#
         # ValidationOrchestrator #
@@ -179,6 +186,8 @@ class SharedSourceConfig:
             self.progress_tracker_change_log_path or f"{self.progress_tracker_dir}/change_log.txt")
         self.progress_tracker_constant_config_path = (
             self.progress_tracker_constant_config_path or "agents/orderProgressTracker/pro_status_schema.json")
+        self.progress_tracker_state_dir = (
+            self.progress_tracker_state_dir or f"{self.progress_tracker_dir}/TrackingState")
 
         #-------------#
         # AutoPlanner #
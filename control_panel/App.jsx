@@ -10,7 +10,22 @@ import AnalyticsViz        from "./analytics_module/analytics_module.jsx";
 const USE_MOCK = import.meta.env.DEV;
 const API_BASE = import.meta.env.DEV ? "http://localhost:8000" : "";
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
 // ── API layer ─────────────────────────────────────────────────────────────────
+// Job snapshots from the /status endpoint until the job is finished (event stream fallback)
+async function pollJob(jobId, onJob) {
+  for (;;) {
+    const r = await fetch(`${API_BASE}/api/execute/${jobId}/status`);
+    if (r.status === 404) throw new Error("Job expired");
+    if (!r.ok) throw new Error(`Job status unavailable (HTTP ${r.status})`);
+    const job = await r.json();
+    onJob(job);
+    if (job.finished_at != null) return job;
+    await new Promise((res) => setTimeout(res, JOB_POLL_INTERVAL_MS));
+  }
+}
+
 const api = USE_MOCK
   ? {
       workflows: () => Promise.resolve(MOCK_WORKFLOWS),
@@ -23,6 +38,19 @@ const api = USE_MOCK
       allViz: () => fetch(`${API_BASE}/api/viz`).then((r) => r.json()),
       execute: (name) => fetch(`${API_BASE}/api/execute/${name}`, { method: "POST" }).then((r) => r.json()),
       jobStatus: (jobId) => fetch(`${API_BASE}/api/execute/${jobId}/status`).then((r) => r.json()),
+      // Server-sent job snapshots until the job (and its viz extraction) is finished
+      jobEvents: (jobId, onJob) => new Promise((resolve, reject) => {
+        const source = new EventSource(`${API_BASE}/api/execute/${jobId}/events`);
+        let last = null;
+        source.onmessage = (e) => { last = JSON.parse(e.data); onJob(last); };
+        source.addEventListener("end", () => { source.close(); resolve(last); });
+        source.addEventListener("expired", () => { source.close(); reject(new Error("Job expired")); });
+        // Transient errors: EventSource reconnects by itself. Once it gives up, poll the job status
+        source.onerror = () => {
+          if (source.readyState !== EventSource.CLOSED) return;
+          pollJob(jobId, onJob).then(resolve, reject);
+        };
+      }),
     };
 
 // ╔══════════════════════════════════════════════════════════════════════════════
@@ -289,8 +317,8 @@ export default function App() {
     push(`Executing workflow: ${selected.workflow_name}`, "info");
 
     try {
-      const { job_id } = await api.execute(selected.workflow_name);
-      push(`Job dispatched — ID: ${job_id}`, "info");
+      const { job_id, coalesced } = await api.execute(selected.workflow_name);
+      push(coalesced ? `Joined running job — ID: ${job_id}` : `Job dispatched — ID: ${job_id}`, "info");
 
       // Simulate module-by-module progress for mock
       if (USE_MOCK) {
@@ -306,28 +334,29 @@ export default function App() {
         const newViz = await api.allViz();
         setVizCache(newViz);
       } else {
-        let done = false;
-        while (!done) {
-          await new Promise((r) => setTimeout(r, 600));
-          const job = await api.jobStatus(job_id);
-          if (job.modules) {
-            Object.entries(job.modules).forEach(([modId, status]) => {
-              setModuleStatuses((s) => ({ ...s, [modId]: status }));
-              if (status === "success") push(`[${modId}] completed`, "success");
-              if (status === "failed") push(`[${modId}] FAILED`, "error");
-            });
-          }
-          if (job.status === "success") {
-            push(`Workflow "${selected.workflow_name}" — SUCCESS`, "success");
-            setSuccessCount((c) => c + 1);
-            const newViz = await api.allViz();
-            setVizCache(newViz);
-            done = true;
-          } else if (job.status === "failed") {
-            push(`Workflow "${selected.workflow_name}" — FAILED`, "error");
-            setFailCount((c) => c + 1);
-            done = true;
+        const seen = {};
+        let reported = false;
+        const job = await api.jobEvents(job_id, (job) => {
+          Object.entries(job.modules || {}).forEach(([modId, status]) => {
+            if (seen[modId] === status) return;
+            seen[modId] = status;
+            setModuleStatuses((s) => ({ ...s, [modId]: status }));
+            if (status === "success") push(`[${modId}] completed`, "success");
+            if (status === "failed") push(`[${modId}] FAILED`, "error");
+          });
+          if (job.status === "running" && !reported) {
+            push(`Job ${job_id} running`, "info");
+            reported = true;
           }
+        });
+        if (job?.status === "success") {
+          push(`Workflow "${selected.workflow_name}" — SUCCESS`, "success");
+          setSuccessCount((c) => c + 1);
+          const newViz = await api.allViz();
+          setVizCache(newViz);
+        } else {
+          push(`Workflow "${selected.workflow_name}" — FAILED${job?.error ? `: ${job.error}` : ""}`, "error");
+          setFailCount((c) => c + 1);
         }
       }
     } catch (err) {
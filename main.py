@@ -7,7 +7,8 @@ from api.server import create_app
 registry = ModuleRegistry()
 orchestrator = OptiMoldIQ(
     module_registry=registry,
-    workflows_dir="workflows/definitions"
+    workflows_dir="workflows/definitions",
+    cache_dir="agents/shared_db/.execution_cache"
 )
 
 app = create_app(orchestrator)
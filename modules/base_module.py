@@ -33,6 +33,9 @@ class BaseModule(ABC):
     """
     
     DEFAULT_CONFIG_PATH: str = None
+
+    # Bump when module logic changes so persisted execution results are invalidated
+    MODULE_VERSION: str = "1"
     
     def __init__(self, config_path: Optional[str] = None):
         self.config = self.load_config(config_path)
@@ -115,6 +118,27 @@ class BaseModule(ABC):
             'ValidationModule': "./ValidationOrchestrator/change_log.txt"}
         """
         return {}
+
+    @property
+    def cache_inputs(self) -> List[str]:
+        """
+        Input resources fingerprinted by the persistent execution cache.
+
+        Defaults to the dependency resources; path_annotations.json entries are
+        expanded to the parquet files they reference. Override for modules that
+        read sources outside their dependencies (e.g. raw Excel databases).
+        """
+        return list(self.dependencies.values())
+
+    @property
+    def cache_outputs(self) -> List[str]:
+        """
+        Resources the module writes for later modules (the ones they list in `dependencies`).
+
+        A persisted result is only reused while these still exist (path_annotations.json
+        entries are expanded like cache_inputs); otherwise the module runs again.
+        """
+        return []
     
     def safe_execute(self) -> ModuleResult:
         """
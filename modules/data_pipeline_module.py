@@ -1,7 +1,7 @@
 # modules/data_pipeline_module.py
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from modules.base_module import BaseModule, ModuleResult
 from loguru import logger
 from agents.dataPipelineOrchestrator.data_pipeline_orchestrator import SharedSourceConfig, DataPipelineOrchestrator
@@ -55,6 +55,19 @@ class DataPipelineModule(BaseModule):
     def dependencies(self) -> Dict[str, str]:
         """No dependencies - this is typically the first module"""
         return {}
+
+    @property
+    def cache_inputs(self) -> List[str]:
+        """Raw source databases and their schema"""
+        return [
+            self.shared_config.databaseSchemas_path,
+            self.shared_config.db_dir,
+        ]
+
+    @property
+    def cache_outputs(self) -> List[str]:
+        """Path annotations (and the parquet files they reference) read by later modules"""
+        return [self.shared_config.annotation_path]
     
     def execute(self) -> ModuleResult:
         """
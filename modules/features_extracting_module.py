@@ -1,7 +1,7 @@
 # modules/validation_module.py
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from modules.base_module import BaseModule, ModuleResult
 from loguru import logger
 from configs.shared.shared_source_config import SharedSourceConfig
@@ -76,6 +76,11 @@ class FeaturesExtractingModule(BaseModule):
             'ProgressTrackingModule': self.extractor_config.shared_source_config.progress_tracker_change_log_path
             }
     
+    @property
+    def cache_outputs(self) -> List[str]:
+        """HistoricalFeaturesExtractor change log read by later modules"""
+        return [self.extractor_config.shared_source_config.features_extractor_change_log_path]
+
     def execute(self) -> ModuleResult:
         
         """
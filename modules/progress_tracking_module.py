@@ -1,7 +1,7 @@
 # modules/progress_tracking_module.py
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from modules.base_module import BaseModule, ModuleResult
 from loguru import logger
 from agents.orderProgressTracker.order_progress_tracker import SharedSourceConfig, OrderProgressTracker
@@ -62,6 +62,11 @@ class ProgressTrackingModule(BaseModule):
             'ValidationModule': self.shared_config.validation_change_log_path, 
         }
         
+    @property
+    def cache_outputs(self) -> List[str]:
+        """OrderProgressTracker change log read by later modules"""
+        return [self.shared_config.progress_tracker_change_log_path]
+
     def execute(self) -> ModuleResult:
         """
         Execute OrderProgressTracker.
@@ -76,6 +81,8 @@ class ProgressTrackingModule(BaseModule):
                     - progress_tracker_dir (str): Default directory for output and temporary files.
                     - progress_tracker_change_log_path (str): Path to the OrderProgressTracker change log.
                     - progress_tracker_constant_config_path (str): Path to the OrderProgressTracker constant config.   
+                    - progress_tracker_state_dir (str): Directory of the persisted per-PO aggregates.
+                    - incremental_tracking (bool): Aggregate only records from shifts after the saved tracking state.
         Returns:
             ModuleResult with pipeline execution results
         """
@@ -1,7 +1,7 @@
 # modules/validation_module.py
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from modules.base_module import BaseModule, ModuleResult
 from loguru import logger
 from agents.validationOrchestrator.validation_orchestrator import SharedSourceConfig, ValidationOrchestrator
@@ -58,6 +58,11 @@ class ValidationModule(BaseModule):
             'DataPipelineModule': self.shared_config.annotation_path, 
         }
 
+    @property
+    def cache_outputs(self) -> List[str]:
+        """ValidationOrchestrator change log read by later modules"""
+        return [self.shared_config.validation_change_log_path]
+
     def execute(self) -> ModuleResult:
         """
         Execute ValidationOrchestrator.
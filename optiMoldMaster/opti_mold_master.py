@@ -1,7 +1,7 @@
 # optiMoldMaster/optim_mold_master.py
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from loguru import logger
 import json
 import time
@@ -12,9 +12,14 @@ import pandas as pd
 from workflows.registry.registry import ModuleRegistry
 from workflows.executor import WorkflowExecutor, WorkflowExecutorResult
 from workflows.dependency_policies.factory import DependencyPolicyFactory
+from workflows.cache.execution_cache import ExecutionCache
+from agents.dataframe_store import get_dataframe_store
+from agents.orderProgressTracker.production_status_store import load_production_status
+from agents.result_store import read_result, result_sheet_digest
 
 import uuid
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 @dataclass
@@ -108,7 +113,10 @@ class OptiMoldIQ:
     - Lazy load workflow executor
     - Support workflow chaining
     - Centralized workflow management
-    - Viz cache: processed Excel data snapshots for control panel display
+    - Viz cache: processed result snapshots for control panel display, extracted after
+      each run in the background (parallel sheet reads, unchanged sheets reused)
+    - Optional persistent execution cache (cache_dir) shared by all executors:
+      module results are reused across restarts while their inputs are unchanged
     """
 
     def __init__(
@@ -117,10 +125,25 @@ class OptiMoldIQ:
         workflows_dir: str = "workflows/definitions",
         change_log_params: Optional[Dict] = None,
         sheet_name_params: Optional[Dict] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: Optional[int] = 128,
+        cache_ttl_seconds: Optional[float] = None,
+        async_viz: bool = True,
+        viz_workers: int = 4,
     ):
         self.module_registry = module_registry
         self.workflows_dir = Path(workflows_dir)
 
+        # Persistent, content-addressed module result cache (disabled if no cache_dir)
+        self._result_cache: Optional[ExecutionCache] = (
+            ExecutionCache(
+                cache_dir=cache_dir,
+                max_entries=cache_max_entries,
+                ttl_seconds=cache_ttl_seconds
+            )
+            if cache_dir else None
+        )
+
         # Viz params — use defaults if not provided via constructor
         self._change_log_params = change_log_params or _DEFAULT_CHANGE_LOG_PARAMS
         self._sheet_name_params = sheet_name_params or _DEFAULT_SHEET_NAME_PARAMS
@@ -128,9 +151,21 @@ class OptiMoldIQ:
         # Cache executors (1 executor per workflow type)
         self._executors: Dict[str, WorkflowExecutor] = {}
 
-        # Viz cache: processed viz data per workflow (None if extraction failed)
+        # Viz cache: processed viz data per run (None if extraction failed)
         self._viz_cache: Dict[str, Optional[Dict[str, Any]]] = {}
 
+        # Viz extraction runs after the workflow (async_viz) and publishes into _viz_cache
+        self._async_viz = async_viz
+        self._viz_workers = max(1, viz_workers)
+        self._viz_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="viz")
+        self._viz_futures: Dict[str, Future] = {}
+        # Callbacks waiting for the viz data of a run (see on_viz_published)
+        self._viz_listeners: Dict[str, List[Callable[[str], None]]] = {}
+
+        # Processed sheets by (module, result directory, sheet) -> (content digest, records)
+        self._sheet_cache: Dict[tuple, tuple] = {}
+        self._sheet_cache_lock = threading.Lock()
+
         self._available_workflows = self._discover_workflows()
         logger.info(f"📋 Orchestrator initialized with {len(self._available_workflows)} workflows")
 
@@ -179,6 +214,10 @@ class OptiMoldIQ:
         if clear_cache:
             logger.info(f"🗑️  Clearing execution cache for: {workflow_name}")
             executor._execution_cache.clear()
+            if self._result_cache is not None:
+                workflow_modules = executor.get_workflow_info(workflow_name).get("modules", [])
+                for module_cfg in workflow_modules:
+                    self._result_cache.invalidate(module_cfg.get("module"))
 
         result = executor.execute(workflow_name=workflow_name)
 
@@ -193,27 +232,65 @@ class OptiMoldIQ:
         #         result = executor.execute(workflow_name=workflow_name)
         #-------------------------------------------#
 
-        viz_data = None
-
         #-------------------------------------------#
         # Only extract viz if final result succeeded —
         # mirrors notebook logic and avoids complications of partial/failed executions.
         #-------------------------------------------#
+        viz_data_paths = None
         if not result.is_failed():
             try:
                 viz_data_paths = self._get_data_paths(workflow_name, result)
-                viz_data = self._process_viz_data(workflow_name, viz_data_paths)
             except Exception as e:
                 logger.warning(f"⚠️ Viz extraction failed for '{workflow_name}' | run={execution_id}: {e}")
 
-        #-------------------------------------------#
-        # Always write cache once — atomic lifecycle
-        #-------------------------------------------#
-        with self._run_lock:
-            self._viz_cache[execution_id] = viz_data
+        if viz_data_paths is None:
+            self._publish_viz(execution_id, None)
+        elif self._async_viz:
+            # Reading the results runs after the workflow: the run record is returned now
+            # and its viz data is published when ready
+            future = self._viz_executor.submit(
+                self._extract_viz, workflow_name, execution_id, viz_data_paths)
+            with self._run_lock:
+                # Unless the extraction already published (it would stay pending forever)
+                if execution_id not in self._viz_cache:
+                    self._viz_futures[execution_id] = future
+        else:
+            self._extract_viz(workflow_name, execution_id, viz_data_paths)
 
         return result
 
+    def _extract_viz(
+            self,
+            workflow_name: str,
+            execution_id: str,
+            viz_data_paths: Dict[str, Any]
+        ) -> None:
+        viz_data = None
+        try:
+            viz_data = self._process_viz_data(workflow_name, viz_data_paths)
+        except Exception as e:
+            logger.warning(f"⚠️ Viz extraction failed for '{workflow_name}' | run={execution_id}: {e}")
+
+        self._publish_viz(execution_id, viz_data)
+
+    def _publish_viz(self, execution_id: str, viz_data: Optional[Dict[str, Any]]) -> None:
+        """Write the viz cache once per run — atomic lifecycle (also updates a registered run record)."""
+        with self._run_lock:
+            self._viz_cache[execution_id] = viz_data
+            self._viz_futures.pop(execution_id, None)
+            record = self._run_records.get(execution_id)
+            if record is not None:
+                record.viz_data = viz_data
+            listeners = self._viz_listeners.pop(execution_id, [])
+        for listener in listeners:
+            self._notify_viz(listener, execution_id)
+
+    def _notify_viz(self, listener: Callable[[str], None], execution_id: str) -> None:
+        try:
+            listener(self.get_viz_status(execution_id))
+        except Exception as e:
+            logger.warning(f"⚠️ Viz listener failed | run={execution_id}: {e}")
+
     def execute(
         self,
         workflow_name: str,
@@ -230,9 +307,6 @@ class OptiMoldIQ:
         summary = self._build_summary(result)
         status = "failed" if result.is_failed() else "success"
 
-        with self._run_lock:
-            viz_data = self._viz_cache.get(execution_id)
-
         record = WorkflowRunRecord(
             execution_id=execution_id,
             workflow_name=workflow_name,
@@ -240,10 +314,12 @@ class OptiMoldIQ:
             timestamp=end_time,
             duration=round(end_time - start_time, 3),
             summary=summary,
-            viz_data=viz_data
+            viz_data=None
         )
 
+        # Viz data may still be extracting: _publish_viz fills the registered record
         with self._run_lock:
+            record.viz_data = self._viz_cache.get(execution_id)
             self._run_records[execution_id] = record
             self._latest_run_per_workflow[workflow_name] = execution_id
 
@@ -259,13 +335,15 @@ class OptiMoldIQ:
 
         results = {}
 
-        for workflow_name in workflow_names:
-            run = self.execute(workflow_name)
-            results[workflow_name] = run
+        # Keep decoded databases alive across the whole chain, not just one workflow
+        with get_dataframe_store().session():
+            for workflow_name in workflow_names:
+                run = self.execute(workflow_name)
+                results[workflow_name] = run
 
-            if stop_on_failure and run.status == "failed":
-                logger.error(f"❌ Chain stopped at: {workflow_name}")
-                break
+                if stop_on_failure and run.status == "failed":
+                    logger.error(f"❌ Chain stopped at: {workflow_name}")
+                    break
 
         return results
 
@@ -295,6 +373,12 @@ class OptiMoldIQ:
         errors = []
         if "modules" not in workflow_def:
             errors.append("Missing 'modules' field")
+        execution_mode = workflow_def.get("execution_mode")
+        if execution_mode is not None and execution_mode not in WorkflowExecutor.EXECUTION_MODES:
+            errors.append(
+                f"Unknown execution_mode: '{execution_mode}'. "
+                f"Available: {list(WorkflowExecutor.EXECUTION_MODES)}"
+            )
         for idx, module_cfg in enumerate(workflow_def.get("modules", [])):
             module_name = module_cfg.get("module", f"module_{idx}")
             if "module" not in module_cfg:
@@ -338,7 +422,8 @@ class OptiMoldIQ:
             logger.debug(f"Creating new executor for: {workflow_name}")
             self._executors[workflow_name] = WorkflowExecutor(
                 registry=self.module_registry,
-                workflows_dir=str(self.workflows_dir)
+                workflows_dir=str(self.workflows_dir),
+                result_cache=self._result_cache
             )
         return self._executors[workflow_name]
 
@@ -420,7 +505,10 @@ class OptiMoldIQ:
         viz = self._viz_cache.get(latest_run.execution_id)
 
         if viz is None:
-            logger.warning(f"⚠️  Viz data missing in cache for run '{latest_run.execution_id}'")
+            if self.get_viz_status(latest_run.execution_id) == "pending":
+                logger.info(f"⏳ Viz data still extracting for run '{latest_run.execution_id}'")
+            else:
+                logger.warning(f"⚠️  Viz data missing in cache for run '{latest_run.execution_id}'")
             viz = latest_run.viz_data
 
         return viz
@@ -449,6 +537,38 @@ class OptiMoldIQ:
     def get_viz_data_by_run(self, execution_id: str) -> Optional[Dict[str, Any]]:
         return self._viz_cache.get(execution_id)
 
+    def get_viz_status(self, execution_id: str) -> str:
+        """'pending' while extracting, then 'ok' or 'failed/empty' ('unknown' for other runs)."""
+        with self._run_lock:
+            if execution_id in self._viz_futures:
+                return "pending"
+            if execution_id not in self._viz_cache:
+                return "unknown"
+            return "ok" if self._viz_cache[execution_id] is not None else "failed/empty"
+
+    def on_viz_published(self, execution_id: str, listener: Callable[[str], None]) -> None:
+        """
+        Call `listener(viz_status)` once the viz data of a run is published
+        (right away if it is not pending), without blocking the caller.
+        """
+        with self._run_lock:
+            if execution_id in self._viz_futures:
+                self._viz_listeners.setdefault(execution_id, []).append(listener)
+                return
+        self._notify_viz(listener, execution_id)
+
+    def wait_for_viz(
+        self,
+        execution_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for the viz extraction of a run and return its viz data."""
+        with self._run_lock:
+            future = self._viz_futures.get(execution_id)
+        if future is not None:
+            wait([future], timeout=timeout)
+        return self._viz_cache.get(execution_id)
+
     # ------------------------------------------------------------------
     # Cache Management
     # ------------------------------------------------------------------
@@ -483,11 +603,12 @@ class OptiMoldIQ:
                 name: len(executor._execution_cache)
                 for name, executor in self._executors.items()
             },
+            "persistent": (
+                self._result_cache.stats() if self._result_cache is not None else None
+            ),
             "viz": {
-                wf: (
-                    "ok" if self.get_viz_data(wf) is not None else "failed/empty"
-                )
-                for wf in self._latest_run_per_workflow
+                wf: self.get_viz_status(run_id)
+                for wf, run_id in self._latest_run_per_workflow.items()
             },
             "runs": len(self._run_records)
         }
@@ -498,11 +619,17 @@ class OptiMoldIQ:
             logger.info(f"🗑️  Clearing execution cache: {workflow_name}")
             executor._execution_cache.clear()
 
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
         with self._run_lock:
             self._viz_cache.clear()
             self._run_records.clear()
             self._latest_run_per_workflow.clear()
 
+        with self._sheet_cache_lock:
+            self._sheet_cache.clear()
+
         logger.info("🗑️  All caches cleared")
 
     # ------------------------------------------------------------------
@@ -510,11 +637,11 @@ class OptiMoldIQ:
     # ------------------------------------------------------------------
     @staticmethod
     def _safe_mean(x) -> Optional[float]:
-        """Return mean of x, handling NaN and string-encoded lists."""
-        if pd.isna(x):
-            return None
+        """Return mean of a list, handling missing values and string-encoded lists (Excel-only results)."""
         if isinstance(x, str):
             x = ast.literal_eval(x)
+        if not isinstance(x, list) or not x:
+            return None
         return float(np.mean(x))
 
     def _process_tracker_result(self, tracker_df: pd.DataFrame) -> Dict[str, Any]:
@@ -558,11 +685,14 @@ class OptiMoldIQ:
             for col in df.select_dtypes(include=["datetime64[ns]"]).columns:
                 df[col] = df[col].dt.strftime("%Y-%m-%d")
 
+        # Maps/lists are native when read from the typed sidecar;
+        # results saved to Excel only hold them as string-encoded dicts/lists
+
         # string-encoded dict → dict
         for col in ["moldShotMap", "machineQuantityMap", "dayQuantityMap",
                     "shiftQuantityMap", "materialComponentMap"]:
             tracking_df[col] = tracking_df[col].apply(
-                lambda x: ast.literal_eval(x) if pd.notna(x) else None
+                lambda x: ast.literal_eval(x) if isinstance(x, str) else x
             )
 
         # string-encoded list → list
@@ -583,14 +713,15 @@ class OptiMoldIQ:
         viz_data_paths: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Read Excel files from resolved paths and process each sheet
+        Read result files from resolved paths and process each sheet
         into a display-ready dict. Only processes modules present in
-        sheet_name_params.
+        sheet_name_params. Sheets are read in parallel.
 
         Returns:
             Nested dict: { sub_name: { sheet_name: records } }
         """
         viz_data = {}
+        sheet_jobs = []
 
         # viz_data_paths = { last_module_name: Path | { sub_name: Path } }
         module_name, module_paths = list(viz_data_paths.items())[0]
@@ -602,7 +733,7 @@ class OptiMoldIQ:
             sheet_names = sheet_params[agent_key]
             viz_data[agent_key] = {}
             for sheet_name in sheet_names:
-                self._read_sheet_into(viz_data[agent_key], module_name, module_paths, sheet_name)
+                sheet_jobs.append((viz_data[agent_key], module_name, module_paths, sheet_name))
 
         else:
             # Multi-agent: module_paths = { sub_name: Path }
@@ -610,7 +741,15 @@ class OptiMoldIQ:
                 sheet_names = sheet_params.get(sub_name, [])
                 viz_data[sub_name] = {}
                 for sheet_name in sheet_names:
-                    self._read_sheet_into(viz_data[sub_name], module_name, newest_path, sheet_name)
+                    sheet_jobs.append((viz_data[sub_name], module_name, newest_path, sheet_name))
+
+        # Keep the configured sheet order whatever order the reads complete in
+        for target, _, _, sheet_name in sheet_jobs:
+            target[sheet_name] = None
+
+        with ThreadPoolExecutor(max_workers=min(self._viz_workers, max(1, len(sheet_jobs)))) as pool:
+            # list() re-raises the first failed read
+            list(pool.map(lambda job: self._read_sheet_into(*job), sheet_jobs))
 
         return viz_data
 
@@ -622,14 +761,31 @@ class OptiMoldIQ:
         sheet_name: str
     ):
         """
-        Read a single Excel sheet, apply module-specific processing if needed,
+        Read a single result sheet, apply module-specific processing if needed,
         and store the result in the target dict keyed by sheet_name.
+        Sheets with the same content as in the previous run reuse its processed records.
         """
-        df = pd.read_excel(path, sheet_name=sheet_name)
+        cache_key = (module_name, str(Path(path).parent), sheet_name)
+        digest = result_sheet_digest(path, sheet_name)
+        with self._sheet_cache_lock:
+            cached = self._sheet_cache.get(cache_key)
+        if cached is not None and cached[0] == digest:
+            logger.debug(f"Viz sheet unchanged, reusing: {sheet_name} ({Path(path).name})")
+            target[sheet_name] = cached[1]
+            return
 
         if module_name == "ProgressTrackingModule" and sheet_name == "productionStatus":
-            target[sheet_name] = self._process_tracker_result(df)
+            # Typed lists/maps from the result store; Excel for results saved without one
+            df = load_production_status(path)
+            if df is None:
+                df = read_result(path, sheet_name=sheet_name)
+            records = self._process_tracker_result(df)
         else:
+            df = read_result(path, sheet_name=sheet_name)
             for col in df.select_dtypes(include=["datetime64[ns]", "datetime64"]).columns:
                 df[col] = df[col].astype(str)
-            target[sheet_name] = df.where(df.notna(), None).to_dict(orient="records")
+            records = df.where(df.notna(), None).to_dict(orient="records")
+
+        with self._sheet_cache_lock:
+            self._sheet_cache[cache_key] = (digest, records)
+        target[sheet_name] = records
@@ -0,0 +1,122 @@
+# tests/agents_tests/business_logic_tests/calculators/test_feature_state.py
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.autoPlanner.calculators.mold_machine_feature_weight_calculator import MoldMachineFeatureWeightCalculator
+from agents.autoPlanner.calculators.configs.feature_weight_config import FeatureWeightConfig
+from agents.autoPlanner.featureExtractor.initial.historicalFeaturesExtractor.feature_state import (
+    build_feature_state, load_feature_state, make_settings_key, save_feature_state)
+from tests.agents_tests.business_logic_tests.calculators.test_mold_stability_index_calculator import (
+    make_calculator, make_inputs)
+
+def make_product_records(n_rows: int = 4_000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    po_numbers = [f'PO{i:04d}' for i in range(200)]
+    po_molds = dict(zip(po_numbers, rng.choice([f'M{i:03d}' for i in range(20)], 200)))
+    po_machines = dict(zip(po_numbers, rng.choice([f'MC{i:02d}' for i in range(10)], 200)))
+
+    po = rng.choice(po_numbers, n_rows)
+    return pd.DataFrame({
+        'poNo': po,
+        'recordDate': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 300, n_rows), 'D'),
+        'workingShift': rng.choice(['1', '2', '3', None], n_rows),
+        'machineNo': 'NO.01',
+        'machineCode': [po_machines[p] for p in po],
+        'itemCode': 'ITEM',
+        'itemName': 'item',
+        'moldNo': [po_molds[p] for p in po],
+        'moldShot': rng.choice([0, 500, 900, np.nan], n_rows),
+        'moldCavity': rng.choice([1, 2, 4, np.nan], n_rows),
+        'itemTotalQuantity': rng.choice([0, 800, 1200, np.nan], n_rows),
+        'itemGoodQuantity': rng.choice([0, 700, 1100, np.nan], n_rows),
+    })
+
+def aggregate(records: pd.DataFrame) -> pd.DataFrame:
+    schemas = {'dynamicDB': {'productRecords': {'dtypes': {c: 'object' for c in records.columns}}},
+               'staticDB': {'moldInfo': {'dtypes': {}}}}
+    shared_schemas = {'pro_status': {'dtypes': {}}, 'mold_estimated_capacity': {'dtypes': {}}}
+    calculator = MoldMachineFeatureWeightCalculator(
+        schemas, shared_schemas, records, pd.DataFrame(), pd.DataFrame(), pd.DataFrame(),
+        FeatureWeightConfig(efficiency=0.85, loss=0.03))
+    return calculator._aggregate_po_statistics(records)
+
+class TestPoStatistics:
+
+    def test_combine_matches_full_aggregation(self):
+        records = make_product_records()
+        since = pd.Timestamp('2020-06-01')
+
+        combined = MoldMachineFeatureWeightCalculator.combine_po_statistics(
+            aggregate(records[records['recordDate'] <= since]),
+            aggregate(records[records['recordDate'] > since]))
+
+        pd.testing.assert_frame_equal(combined, aggregate(records))
+
+    def test_combine_with_empty_side(self):
+        statistics = aggregate(make_product_records())
+
+        combined = MoldMachineFeatureWeightCalculator.combine_po_statistics(statistics, statistics.iloc[:0])
+
+        pd.testing.assert_frame_equal(combined, statistics)
+
+class TestFeatureState:
+
+    @pytest.fixture
+    def state(self):
+        records, mold_info = make_inputs()
+        result = make_calculator(records, mold_info).process()
+        return records, build_feature_state(records, make_settings_key({'efficiency': 0.85}),
+                                            result.mold_statistics, aggregate(make_product_records()))
+
+    def test_round_trip(self, state, tmp_path):
+        records, saved = state
+        save_feature_state(tmp_path, saved)
+
+        loaded = load_feature_state(tmp_path)
+
+        assert loaded.watermark == records['recordDate'].max().isoformat()
+        assert loaded.rows_folded == len(records)
+        pd.testing.assert_frame_equal(loaded.mold_statistics, saved.mold_statistics, check_dtype=False)
+        pd.testing.assert_frame_equal(loaded.po_statistics, saved.po_statistics, check_dtype=False)
+
+    def test_missing_state(self, tmp_path):
+        assert load_feature_state(tmp_path / "feature_state") is None
+
+    def test_appended_records_are_resumable(self, state):
+        records, saved = state
+        new_records = records.iloc[:10].assign(recordDate=records['recordDate'].max() + pd.Timedelta(days=1))
+
+        assert saved.is_resumable(pd.concat([records, new_records]), make_settings_key({'efficiency': 0.85}))
+
+    def test_rewritten_history_or_settings_are_not_resumable(self, state):
+        records, saved = state
+        settings_key = make_settings_key({'efficiency': 0.85})
+
+        assert not saved.is_resumable(records.iloc[1:], settings_key)
+        assert not saved.is_resumable(records, make_settings_key({'efficiency': 0.9}))
+
+    def test_corrected_record_is_not_resumable(self, state, tmp_path):
+        records, saved = state
+        settings_key = make_settings_key({'efficiency': 0.85})
+        save_feature_state(tmp_path, saved)
+        loaded = load_feature_state(tmp_path)
+        assert loaded.is_resumable(records.sample(frac=1, random_state=0), settings_key)
+
+        # Same row count, one corrected shot count
+        corrected = records.copy()
+        corrected.iloc[0, corrected.columns.get_loc('moldShot')] += 1
+        assert not loaded.is_resumable(corrected, settings_key)
+
+    def test_interrupted_save_leaves_no_state(self, state, tmp_path, monkeypatch):
+        _, saved = state
+        save_feature_state(tmp_path, saved)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(pd.DataFrame, "to_parquet", fail)
+
+        with pytest.raises(OSError):
+            save_feature_state(tmp_path, saved)
+        assert load_feature_state(tmp_path) is None
@@ -0,0 +1,194 @@
+# tests/agents_tests/business_logic_tests/calculators/test_mold_stability_index_calculator.py
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.autoPlanner.calculators.mold_stability_index_calculator import MoldStabilityIndexCalculator
+from agents.autoPlanner.calculators.configs.mold_stability_config import MoldStabilityConfig
+
+CALC = MoldStabilityIndexCalculator
+
+def make_inputs(n_molds: int = 60, n_rows: int = 3_000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    molds = [f'M{i:05d}' for i in range(n_molds)]
+    standard_cavity = rng.choice([1, 2, 4, 8], n_molds)
+
+    records = pd.DataFrame({
+        'moldNo': rng.choice(molds + [None], n_rows),
+        'recordDate': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 400, n_rows), 'D'),
+        'moldShot': rng.choice([0, 100, 500, 900, 1200, 2000, np.nan], n_rows),
+    })
+    expected_cavity = records['moldNo'].map(dict(zip(molds, standard_cavity))).fillna(4).to_numpy()
+    records['moldCavity'] = np.where(rng.random(n_rows) < 0.8, expected_cavity,
+                                     np.maximum(expected_cavity - rng.integers(0, 3, n_rows), 0)).astype(float)
+
+    mold_info = pd.DataFrame({
+        'moldNo': molds,
+        'moldName': [f'name{i}' for i in range(n_molds)],
+        'moldCavityStandard': standard_cavity,
+        'moldSettingCycle': rng.choice([20.0, 30.0, 45.5, 60.0], n_molds),
+        'acquisitionDate': pd.Timestamp('2018-01-01'),
+        'machineTonnage': rng.choice(['50', '100/130'], n_molds),
+    })
+    return records, mold_info
+
+def make_calculator(records, mold_info):
+    schemas = {'dynamicDB': {'productRecords': {'dtypes': {c: 'object' for c in records.columns}}},
+               'staticDB': {'moldInfo': {'dtypes': {c: 'object' for c in mold_info.columns}}}}
+    return MoldStabilityIndexCalculator(schemas, records, mold_info, MoldStabilityConfig())
+
+def calculate(records, mold_info):
+    calculator = make_calculator(records, mold_info)
+    return calculator._calculate_stability_index(calculator._stability_index_input_processing())
+
+#------------------------------------------------------#
+# Former per-mold loop implementation (reference only) #
+#------------------------------------------------------#
+def legacy_stability_indices(records, mold_info, config=MoldStabilityConfig()):
+    filtered = records[records['moldShot'] > 0].copy()
+    filtered['moldCycle'] = (CALC.PRODUCTION_WINDOW_SECONDS / filtered['moldShot']).round(2)
+    df = filtered.groupby(['moldNo', 'recordDate'])[['moldCavity', 'moldCycle']].agg(list).reset_index()
+    df = df.merge(mold_info, how='left', on='moldNo')
+    df = df[(df['moldCavityStandard'] > 0) & (df['moldSettingCycle'] > 0)]
+
+    cavity_w, cycle_w = CALC.CAVITY_STABILITY_WEIGHTS, CALC.CYCLE_STABILITY_WEIGHTS
+    rows = []
+    for mold_no in df['moldNo'].unique():
+        mold_data = df[df['moldNo'] == mold_no]
+        standard_cavity = mold_data.iloc[0]['moldCavityStandard']
+        standard_cycle = mold_data.iloc[0]['moldSettingCycle']
+        cavities = [int(v) for values in mold_data['moldCavity'] for v in values]
+        cycles = [float(v) for values in mold_data['moldCycle'] for v in values]
+        total_records = len(mold_data)
+        completeness = min(1.0, total_records / config.total_records_threshold)
+
+        if len(set(cavities)) == 1:
+            cavity_consistency = 1.0
+        else:
+            cavity_consistency = max(0, 1 - np.std(cavities) / np.mean(cavities)) if np.mean(cavities) > 0 else 0
+        cavity_stability = min(1.0, max(0.0,
+            sum(1 for v in cavities if v == standard_cavity) / len(cavities) * cavity_w['accuracy_rate_weight'] +
+            cavity_consistency * cavity_w['consistency_score_weight'] +
+            min(1.0, np.mean(cavities) / standard_cavity) * cavity_w['utilization_rate_weight'] +
+            completeness * cavity_w['data_completeness_weight']))
+
+        deviations = [abs(v - standard_cycle) / standard_cycle for v in cycles]
+        cycle_stability = min(1.0, max(0.0,
+            max(0, 1 - np.mean(deviations)) * cycle_w['accuracy_score_weight'] +
+            max(0, 1 - np.std(cycles) / np.mean(cycles)) * cycle_w['consistency_score_weight'] +
+            sum(1 for d in deviations if d <= CALC.CYCLE_TIME_TOLERANCE) / len(cycles)
+            * cycle_w['range_compliance_weight'] +
+            max(0, 1 - sum(1 for d in deviations if d > CALC.EXTREME_DEVIATION_THRESHOLD) / len(cycles))
+            * cycle_w['outlier_penalty_weight'] +
+            completeness * cycle_w['data_completeness_weight']))
+
+        theoretical = CALC.SECONDS_PER_HOUR / standard_cycle * standard_cavity
+        effective = theoretical * (cavity_stability * config.cavity_stability_threshold +
+                                   cycle_stability * config.cycle_stability_threshold)
+        estimated = theoretical * (config.efficiency - config.loss)
+        alpha = max(CALC.MIN_HISTORICAL_TRUST, min(CALC.MAX_HISTORICAL_TRUST,
+                                                   total_records / config.total_records_threshold))
+        rows.append({
+            'moldNo': mold_no,
+            'cavityStabilityIndex': round(cavity_stability, 2),
+            'cycleStabilityIndex': round(cycle_stability, 2),
+            'balancedMoldHourCapacity': round(alpha * effective + (1 - alpha) * estimated, 2),
+            'totalRecords': total_records,
+            'totalCavityMeasurements': len(cavities),
+        })
+    return pd.DataFrame(rows)
+
+class TestMoldStabilityIndexCalculator:
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_per_mold_version(self, seed):
+        records, mold_info = make_inputs(seed=seed)
+
+        result = calculate(records, mold_info)
+        expected = legacy_stability_indices(records, mold_info)
+
+        assert result['moldNo'].tolist() == expected['moldNo'].tolist()
+        for col in expected.columns.drop('moldNo'):
+            # Python round() at .xx5 boundaries: values must match exactly
+            assert result[col].tolist() == expected[col].tolist(), col
+
+    def test_output_columns(self):
+        result = calculate(*make_inputs())
+
+        assert result.columns.tolist() == [
+            'moldNo', 'moldName', 'acquisitionDate', 'machineTonnage',
+            'moldCavityStandard', 'moldSettingCycle',
+            'cavityStabilityIndex', 'cycleStabilityIndex',
+            'theoreticalMoldHourCapacity', 'effectiveMoldHourCapacity',
+            'estimatedMoldHourCapacity', 'balancedMoldHourCapacity',
+            'totalRecords', 'totalCavityMeasurements', 'totalCycleMeasurements',
+            'firstRecordDate', 'lastRecordDate']
+        assert result['cavityStabilityIndex'].between(0, 1).all()
+        assert result['cycleStabilityIndex'].between(0, 1).all()
+
+    def test_invalid_mold_info_is_filtered(self):
+        records, mold_info = make_inputs()
+        mold_info.loc[:2, 'moldSettingCycle'] = 0
+        mold_info.loc[3:4, 'moldCavityStandard'] = np.nan
+
+        result = calculate(records, mold_info)
+
+        assert not set(mold_info['moldNo'].iloc[:5]) & set(result['moldNo'])
+        assert result['moldNo'].tolist() == legacy_stability_indices(records, mold_info)['moldNo'].tolist()
+
+    def test_duplicate_mold_info_uses_first_row(self):
+        records, mold_info = make_inputs()
+        duplicate = mold_info.iloc[[7]].assign(moldSettingCycle=33.0)
+        mold_info_with_duplicate = pd.concat([mold_info, duplicate], ignore_index=True)
+
+        result = calculate(records, mold_info_with_duplicate).set_index('moldNo')
+
+        assert result.index.is_unique
+        assert result.loc['M00007', 'moldSettingCycle'] == mold_info.loc[7, 'moldSettingCycle']
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_incremental_update_matches_full_recompute(self, seed):
+        records, mold_info = make_inputs(seed=seed)
+        since = pd.Timestamp('2020-09-01')
+        # Mold info changes between runs: the affected molds are rebuilt from history
+        updated_info = mold_info.copy()
+        updated_info.loc[3, 'moldSettingCycle'] = 25.0
+        updated_info.loc[5, 'moldCavityStandard'] = 0
+
+        previous = make_calculator(records[records['recordDate'] <= since], mold_info).process()
+        incremental = make_calculator(records, updated_info).process(previous.mold_statistics, since)
+        full = make_calculator(records, updated_info).process()
+
+        pd.testing.assert_frame_equal(incremental.mold_stability_index, full.mold_stability_index)
+
+    def test_incremental_update_requires_since(self):
+        records, mold_info = make_inputs()
+        previous = make_calculator(records, mold_info).process()
+
+        with pytest.raises(RuntimeError, match="since"):
+            make_calculator(records, mold_info).process(previous.mold_statistics)
+
+    def test_empty_input_raises(self):
+        records, mold_info = make_inputs()
+        calculator = make_calculator(records.assign(moldShot=0), mold_info)
+
+        with pytest.raises(ValueError):
+            calculator._calculate_stability_index(calculator._stability_index_input_processing())
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestMoldStabilityIndexBenchmark:
+    """Micro-benchmark: stability indices for a few thousand molds"""
+
+    def test_two_thousand_molds(self):
+        records, mold_info = make_inputs(n_molds=2_000, n_rows=200_000)
+
+        start = time.perf_counter()
+        result = calculate(records, mold_info)
+        elapsed = time.perf_counter() - start
+
+        assert len(result) == 2_000
+        # The former per-mold loop needed about ten seconds for this input
+        assert elapsed < 3
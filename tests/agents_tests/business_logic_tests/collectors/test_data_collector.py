@@ -1,6 +1,7 @@
 # tests/agents_tests/business_logic_tests/collectors/test_data_collector.py
 
 import pytest
+import json
 import pandas as pd
 from unittest.mock import MagicMock, patch
 
@@ -129,4 +130,18 @@ def test_exception_during_processing(mock_processor_cls):
 
     assert result.status == ProcessingStatus.ERROR
     assert result.error_type == ErrorType.DATA_PROCESSING_ERROR
-    assert "Unexpected error" in result.error_message
\ No newline at end of file
+    assert "Unexpected error" in result.error_message
+
+# TEST 6 — staticDB read in worker processes matches sequential read
+def test_static_db_parallel_matches_sequential():
+    with open("tests/mock_database/databaseSchemas.json", "r", encoding="utf-8") as f:
+        schema = json.load(f)["staticDB"]
+
+    sequential = DataCollector("staticDB", schema, max_workers=1).process_data()
+    parallel = DataCollector("staticDB", schema, max_workers=3).process_data()
+
+    assert sequential.status == ProcessingStatus.SUCCESS
+    assert parallel.status == ProcessingStatus.SUCCESS
+    assert list(parallel.data) == list(sequential.data)
+    for db_name, df in sequential.data.items():
+        pd.testing.assert_frame_equal(df, parallel.data[db_name])
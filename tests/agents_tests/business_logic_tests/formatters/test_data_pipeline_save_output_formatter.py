@@ -0,0 +1,142 @@
+# tests/agents_tests/business_logic_tests/formatters/test_data_pipeline_save_output_formatter.py
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from agents.dataPipelineOrchestrator.configs.save_output_formatter import save_databases
+from agents.dataPipelineOrchestrator.configs.change_detection import (
+    compute_row_hashes,
+    diff_rows,
+    read_rows,
+    restore_version,
+    row_hash_path,
+    schema_signature,
+    load_manifest,
+)
+
+def sort_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+@pytest.fixture
+def item_info():
+    return pd.DataFrame({
+        "itemCode": pd.Series(["I1", "I2", "I3", "I4"], dtype="string"),
+        "itemName": pd.Series(["Cup", "Lid", "Tray", "Box"], dtype="string"),
+    })
+
+@pytest.fixture
+def database_dir(tmp_path):
+    return tmp_path / "DataCollector"
+
+@pytest.fixture
+def later_clock(monkeypatch):
+    """Call to make the next save use a later timestamp (and therefore a new file name)"""
+    import agents.dataPipelineOrchestrator.configs.save_output_formatter as formatter
+    real_datetime = formatter.datetime
+
+    class LaterDatetime(real_datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return real_datetime(2100, 1, 1, 0, 0, 0)
+
+    return lambda: monkeypatch.setattr(formatter, "datetime", LaterDatetime)
+
+def run_save(database_dir: Path, df: pd.DataFrame) -> dict:
+    annotations_path = database_dir / "newest" / "path_annotations.json"
+    path_annotation = {}
+    if annotations_path.exists():
+        path_annotation = json.loads(annotations_path.read_text(encoding="utf-8"))
+    save_databases(database_dir, {"staticDB": {"itemInfo": df}}, path_annotation, annotations_path)
+    return json.loads(annotations_path.read_text(encoding="utf-8"))
+
+class TestRowDiff:
+
+    def test_detects_inserted_and_deleted_rows(self, item_info):
+        changed = pd.concat([item_info.iloc[1:], item_info.iloc[[1]]], ignore_index=True)
+        diff = diff_rows(changed, compute_row_hashes(item_info), schema_signature(item_info))
+
+        assert not diff.schema_changed
+        assert diff.inserted.tolist() == [False, False, False, True]  # duplicated I2 row
+        assert diff.deleted.tolist() == [True, False, False, False]   # I1 removed
+
+    def test_row_order_is_ignored(self, item_info):
+        shuffled = item_info.iloc[::-1].reset_index(drop=True)
+        diff = diff_rows(shuffled, compute_row_hashes(item_info), schema_signature(item_info))
+        assert not diff.has_changes
+
+    def test_dtype_change_is_schema_change(self, item_info):
+        diff = diff_rows(item_info.astype(object), compute_row_hashes(item_info), schema_signature(item_info))
+        assert diff.schema_changed
+
+    def test_read_rows_across_row_groups(self, tmp_path):
+        df = pd.DataFrame({"a": np.arange(100)})
+        path = tmp_path / "data.parquet"
+        df.to_parquet(path, index=False, row_group_size=7)
+        positions = np.array([0, 6, 7, 50, 99])
+        assert read_rows(path, positions)["a"].tolist() == positions.tolist()
+
+class TestSaveDatabasesVersioning:
+
+    def test_first_run_writes_row_hashes(self, database_dir, item_info):
+        annotation = run_save(database_dir, item_info)
+        assert row_hash_path(annotation["itemInfo"]).exists()
+
+    def test_unchanged_data_keeps_version(self, database_dir, item_info):
+        first = run_save(database_dir, item_info)
+        second = run_save(database_dir, item_info.iloc[::-1].reset_index(drop=True))
+
+        assert first == second
+        assert list((database_dir / "historical_db").iterdir()) == []
+
+    def test_change_archives_delta_only(self, database_dir, item_info, later_clock):
+        first = run_save(database_dir, item_info)
+
+        changed = item_info.copy()
+        changed.loc[1, "itemName"] = "Lid v2"                       # update (same key)
+        changed = changed[changed["itemCode"] != "I4"]              # delete
+        changed = pd.concat([changed, pd.DataFrame({                # insert
+            "itemCode": pd.Series(["I5"], dtype="string"),
+            "itemName": pd.Series(["Bowl"], dtype="string")})], ignore_index=True)
+
+        later_clock()
+
+        second = run_save(database_dir, changed)
+
+        old_path = Path(first["itemInfo"])
+        new_path = Path(second["itemInfo"])
+        assert new_path != old_path
+        assert not old_path.exists()
+        pd.testing.assert_frame_equal(pd.read_parquet(new_path), changed)
+
+        historical = sorted(p.name for p in (database_dir / "historical_db").iterdir())
+        assert historical == [f"{old_path.stem}.delta.parquet", "itemInfo_versions.json"]
+
+        entry = load_manifest(database_dir / "historical_db", "itemInfo")[-1]
+        assert entry["kind"] == "delta"
+        assert (entry["inserted"], entry["deleted"], entry["updated"]) == (2, 2, 1)
+
+        restored = restore_version(database_dir, "itemInfo", old_path.name)
+        pd.testing.assert_frame_equal(sort_frame(restored), sort_frame(item_info))
+
+    def test_schema_change_archives_full_copy(self, database_dir, item_info, later_clock):
+        first = run_save(database_dir, item_info)
+
+        later_clock()
+
+        run_save(database_dir, item_info.assign(itemType="A"))
+
+        old_name = Path(first["itemInfo"]).name
+        assert (database_dir / "historical_db" / old_name).exists()
+        assert load_manifest(database_dir / "historical_db", "itemInfo")[-1]["kind"] == "snapshot"
+
+    def test_legacy_version_without_row_hashes(self, database_dir, item_info):
+        first = run_save(database_dir, item_info)
+        row_hash_path(first["itemInfo"]).unlink()
+
+        second = run_save(database_dir, item_info)
+
+        assert first == second
+        assert row_hash_path(first["itemInfo"]).exists()
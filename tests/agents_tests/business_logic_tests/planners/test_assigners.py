@@ -0,0 +1,198 @@
+# tests/agents_tests/business_logic_tests/planners/test_assigners.py
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.autoPlanner.assigners.history_based_assigner import HistoryBasedAssigner
+from agents.autoPlanner.assigners.compatibility_based_assigner import CompatibilityBasedAssigner
+from agents.autoPlanner.assigners.optimal_assigner import OptimalAssigner
+from agents.autoPlanner.tools.machine_assignment import (
+    build_assigned_matrix, evaluate_assigned_plan, producing_machine_load)
+
+MACHINES = ['MC1', 'MC2', 'MC3']
+
+def make_history_inputs(priority_rows, lead_times):
+    priority_matrix = pd.DataFrame(
+        priority_rows,
+        index=pd.Index([f'MOLD{i + 1}' for i in range(len(priority_rows))], name='moldNo'),
+        columns=pd.Index(MACHINES, name='machineCode')).astype('Int64')
+    mold_lead_times = pd.DataFrame({
+        'itemCode': [f'ITEM{i + 1}' for i in range(len(lead_times))],
+        'moldNo': list(lead_times),
+        'totalQuantity': [1000] * len(lead_times),
+        'moldLeadTime': list(lead_times.values()),
+    })
+    producing = pd.DataFrame({'itemCode': ['MOLDX'], 'machineCode': ['MC1'],
+                              'remainTime': pd.to_timedelta(['5 days'])})
+    machine_info = pd.DataFrame({'machineNo': ['NO.01', 'NO.02', 'NO.03'], 'machineCode': MACHINES})
+    return priority_matrix, mold_lead_times, producing, machine_info
+
+def make_random_history_inputs(n_molds, n_machines=40, seed=0):
+    rng = np.random.default_rng(seed)
+    machines = [f'MC{i:03d}' for i in range(n_machines)]
+    molds = [f'M{i:05d}' for i in range(n_molds)]
+    priority = rng.integers(1, 4, (n_molds, n_machines)) * (rng.random((n_molds, n_machines)) < 0.15)
+    priority_matrix = pd.DataFrame(priority, index=pd.Index(molds, name='moldNo'),
+                                   columns=pd.Index(machines, name='machineCode')).astype('Int64')
+    mold_lead_times = pd.DataFrame({'moldNo': molds,
+                                    'totalQuantity': rng.integers(100, 20000, n_molds),
+                                    'moldLeadTime': rng.integers(1, 12, n_molds)})
+    producing = pd.DataFrame({'itemCode': [molds[0]], 'machineCode': [machines[0]],
+                              'remainTime': pd.to_timedelta(['4 days'])})
+    machine_info = pd.DataFrame({'machineCode': machines})
+    return priority_matrix, mold_lead_times, producing, machine_info
+
+class TestHistoryBasedAssigner:
+
+    def test_round_one_assigns_constrained_machines_first(self):
+        # MOLD1 only fits MC1; MOLD2 is the only mold for MC3; MOLD3 is left to round 2
+        inputs = make_history_inputs(
+            [[1, 0, 0], [1, 1, 1], [0, 1, 0], [1, 1, 0]],
+            {'MOLD1': 3, 'MOLD2': 4, 'MOLD3': 2, 'MOLD4': 5})
+
+        result = HistoryBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+        matrix = result.assigned_matrix
+
+        assert matrix.loc['MOLD1'].tolist() == [3, 0, 0]
+        assert matrix.loc['MOLD2', 'MC3'] == 4
+        assert sorted(result.assignments) == ['MOLD1', 'MOLD2', 'MOLD3', 'MOLD4']
+        assert result.unassigned_molds == []
+
+    def test_round_two_prefers_lowest_load_under_threshold(self):
+        # MC1 already carries 5 days of production, and pending candidates count
+        # towards the load until they are placed: both molds go to MC2
+        inputs = make_history_inputs([[1, 1, 0], [1, 1, 0]], {'MOLD1': 4, 'MOLD2': 4})
+
+        result = HistoryBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+        matrix = result.assigned_matrix
+
+        assert result.assignments == ['MOLD1', 'MOLD2']
+        assert matrix.loc['MOLD1'].tolist() == [0, 4, 0]
+        assert matrix.loc['MOLD2'].tolist() == [0, 4, 0]
+
+    def test_round_two_falls_back_to_lowest_load(self):
+        inputs = make_history_inputs([[1, 1, 0], [1, 1, 0]], {'MOLD1': 40, 'MOLD2': 40})
+
+        result = HistoryBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+
+        # Nothing fits under the threshold: the least loaded machine still gets the mold
+        assert result.assignments == ['MOLD1', 'MOLD2']
+        assert (result.assigned_matrix.astype(bool).sum(axis=1) == 1).all()
+
+class TestCompatibilityBasedAssigner:
+
+    @pytest.fixture
+    def inputs(self):
+        assigned = pd.DataFrame([[10, 0, 0]], index=['MOLD0'], columns=MACHINES)
+        compatibility = pd.DataFrame([[1, 1, 0], [1, 0, 0], [0, 0, 1]],
+                                     index=['MOLD1', 'MOLD2', 'MOLD3'], columns=MACHINES)
+        lead_times = pd.DataFrame({'moldNo': ['MOLD1', 'MOLD2', 'MOLD3', 'MOLD4'],
+                                   'moldLeadTime': [5, 8, 25, 2]})
+        return assigned, lead_times, compatibility
+
+    def test_assigns_least_loaded_compatible_machine(self, inputs):
+        result = CompatibilityBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+        matrix = result.assigned_matrix
+
+        # MOLD4 is not in the compatibility matrix
+        assert result.unassigned_molds == ['MOLD4']
+        assert matrix.loc['MOLD1'].tolist() == [0, 5, 0]
+        assert matrix.loc['MOLD2'].tolist() == [8, 0, 0]
+        assert matrix.loc['MOLD3'].tolist() == [0, 0, 25]
+        assert matrix.index.name == 'moldNo'
+
+    def test_overloaded_machines_are_reported(self, inputs):
+        result = CompatibilityBasedAssigner(*inputs, max_load_threshold=9).run_assign()
+
+        assert 'MOLD2' in result.unassigned_molds
+        assert 'MC1' in result.overloaded_machines
+
+    def test_build_assigned_matrix_appends_unknown_machines(self):
+        matrix = build_assigned_matrix(pd.Index(MACHINES), [('MOLD1', 'MC2', 5), ('MOLD2', 'MC9', 3)])
+
+        assert list(matrix.columns) == MACHINES + ['MC9']
+        assert matrix.loc['MOLD2', 'MC9'] == 3
+        assert pd.isna(matrix.loc['MOLD1', 'MC9'])
+
+class TestOptimalAssigner:
+
+    def test_balances_load_across_machines(self):
+        # MC1 carries 5 days of production: the optimal plan splits the molds over MC1/MC2
+        inputs = make_history_inputs([[1, 1, 0], [1, 1, 0], [1, 1, 0]],
+                                     {'MOLD1': 6, 'MOLD2': 4, 'MOLD3': 5})
+
+        result = OptimalAssigner(*inputs, max_load_threshold=30).run_assign()
+        metrics = evaluate_assigned_plan([result.assigned_matrix], 3,
+                                         producing_machine_load(inputs[2]), 30)
+
+        assert sorted(result.assignments) == ['MOLD1', 'MOLD2', 'MOLD3']
+        assert (result.assigned_matrix.astype(bool).sum(axis=1) == 1).all()
+        assert metrics.makespan == 10
+        assert metrics.total_lead_time == 15
+
+    def test_load_cap_is_soft(self):
+        inputs = make_history_inputs([[1, 0, 0], [1, 1, 0]], {'MOLD1': 40, 'MOLD2': 10})
+
+        result = OptimalAssigner(*inputs, max_load_threshold=30).run_assign()
+
+        # MOLD1 only fits MC1 and overloads it; MOLD2 avoids adding to that overload
+        assert result.assigned_matrix.loc['MOLD1'].tolist() == [40, 0, 0]
+        assert result.assigned_matrix.loc['MOLD2'].tolist() == [0, 10, 0]
+        assert result.overloaded_machines == {'MC1'}
+
+    def test_molds_without_history_use_compatibility(self):
+        priority_matrix, lead_times, producing, machine_info = make_history_inputs(
+            [[1, 0, 0]], {'MOLD1': 3, 'MOLD2': 4, 'MOLD3': 2})
+        compatibility = pd.DataFrame([[1, 1, 1], [0, 0, 1]], index=['MOLD2', 'MOLD3'], columns=MACHINES)
+
+        assigner = OptimalAssigner(priority_matrix, lead_times, producing, machine_info,
+                                   compatibility, max_load_threshold=30)
+        result = assigner.run_assign()
+
+        assert assigner.solver_status == 'optimal'
+        assert result.assigned_matrix.loc['MOLD1', 'MC1'] == 3
+        assert result.assigned_matrix.loc['MOLD3', 'MC3'] == 2
+        # MC1 already runs 5 + 3 days: MOLD2 goes to one of the idle machines
+        assert result.assigned_matrix.loc['MOLD2', 'MC1'] == 0
+        assert result.assigned_matrix.loc['MOLD2'].sum() == 4
+        assert result.unassigned_molds == []
+
+    def test_no_candidates(self):
+        inputs = make_history_inputs([[0, 0, 0]], {'MOLD1': 3})
+
+        assigner = OptimalAssigner(*inputs)
+        result = assigner.run_assign()
+
+        assert not assigner.has_solution
+        assert result.assignments == []
+        assert result.unassigned_molds == ['MOLD1']
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestAssignerBenchmark:
+    """Micro-benchmark: history-based planning for a few thousand pending molds"""
+
+    def test_three_thousand_molds(self):
+        inputs = make_random_history_inputs(3_000)
+
+        start = time.perf_counter()
+        result = HistoryBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+        elapsed = time.perf_counter() - start
+
+        assert len(result.assignments) + len(result.unassigned_molds) > 0
+        # The former DataFrame-scanning version needed tens of seconds for this input
+        assert elapsed < 5
+
+    def test_optimal_plan_vs_greedy(self):
+        inputs = make_random_history_inputs(3_000)
+        base_load = producing_machine_load(inputs[2])
+
+        greedy = HistoryBasedAssigner(*inputs, max_load_threshold=30).run_assign()
+        optimal = OptimalAssigner(*inputs, max_load_threshold=30, time_limit=20).run_assign()
+
+        greedy_metrics = evaluate_assigned_plan([greedy.assigned_matrix], 3_000, base_load, 30)
+        optimal_metrics = evaluate_assigned_plan([optimal.assigned_matrix], 3_000, base_load, 30)
+
+        assert optimal_metrics.assigned_molds >= greedy_metrics.assigned_molds
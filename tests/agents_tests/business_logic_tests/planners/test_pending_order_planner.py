@@ -579,4 +579,82 @@ class TestCompileFinalResults:
         summary, result = planner._compile_final_results(None, comp)
         
         assert summary['Note'].iloc[0] == 'compatibilityBased'
-        assert result == comp['assigner_result']
\ No newline at end of file
+        assert result == comp['assigner_result']
+
+class TestOptimalPhase:
+    """Test optimal solver mode - greedy plan kept unless the optimal plan is better"""
+
+    @pytest.fixture
+    def planner(self, schemas, simple_data):
+        return PendingOrderPlanner(
+            databaseSchemas_data=schemas['databaseSchemas'],
+            sharedDatabaseSchemas_data=schemas['sharedSchemas'],
+            generator_constant_config={},
+            moldInfo_df=simple_data['molds'],
+            machineInfo_df=simple_data['machines'],
+            producing_status_data=simple_data['producing'],
+            pending_status_data=simple_data['pending'],
+            mold_estimated_capacity=simple_data['capacity'],
+            mold_machine_priority_matrix=simple_data['priority_matrix'],
+            solver_mode="optimal"
+        )
+
+    @pytest.fixture
+    def greedy_phase(self):
+        from agents.autoPlanner.assigners.configs.assigner_config import AssignerResult, AssignerStats
+
+        # Greedy plan: only MOLD2 assigned
+        matrix = pd.DataFrame([[24, 0, 0]], index=pd.Index(['MOLD2'], name='moldNo'), columns=['M1', 'M2', 'M3'])
+        return {
+            'assigner_result': AssignerResult(matrix, ['MOLD2'], ['MOLD3'], AssignerStats()),
+            'assignment_summary': pd.DataFrame({'col': [1]})
+        }
+
+    @pytest.fixture
+    def mold_lead_times(self):
+        return pd.DataFrame({'moldNo': ['MOLD2', 'MOLD3'],
+                             'itemCode': ['ITEM2', 'ITEM3'],
+                             'moldLeadTime': [24, 20]})
+
+    def test_invalid_solver_mode(self, schemas, simple_data):
+        with pytest.raises(ValueError, match="Invalid solver mode"):
+            PendingOrderPlanner(
+                databaseSchemas_data=schemas['databaseSchemas'],
+                sharedDatabaseSchemas_data=schemas['sharedSchemas'],
+                generator_constant_config={},
+                moldInfo_df=simple_data['molds'],
+                machineInfo_df=simple_data['machines'],
+                producing_status_data=simple_data['producing'],
+                pending_status_data=simple_data['pending'],
+                mold_estimated_capacity=simple_data['capacity'],
+                mold_machine_priority_matrix=simple_data['priority_matrix'],
+                solver_mode="fastest"
+            )
+
+    def test_solver_failure_keeps_greedy_plan(self, planner, greedy_phase, mold_lead_times):
+        with patch.object(planner, '_run_optimal_assigner', side_effect=RuntimeError("solver crashed")):
+            result = planner._process_optimal_phase(
+                planner.mold_machine_priority_matrix, mold_lead_times, greedy_phase, None)
+
+        assert result['use_optimal'] is False
+        assert planner.plan_comparison['selected_plan'] == 'greedy'
+        assert planner.plan_comparison['greedy'].assigned_molds == 1
+        assert 'solver crashed' in planner.plan_comparison['solver_status']
+
+    def test_better_optimal_plan_is_selected(self, planner, greedy_phase, mold_lead_times):
+        from agents.autoPlanner.assigners.configs.assigner_config import AssignerResult, AssignerStats
+
+        matrix = pd.DataFrame([[24, 0, 0], [0, 20, 0]],
+                              index=pd.Index(['MOLD2', 'MOLD3'], name='moldNo'), columns=['M1', 'M2', 'M3'])
+        optimal = AssignerResult(matrix, ['MOLD2', 'MOLD3'], [], AssignerStats())
+
+        with patch.object(planner, '_run_optimal_assigner', return_value=(optimal, 'optimal')), \
+             patch.object(planner, '_generate_production_schedule',
+                          return_value={'result': pd.DataFrame({'col': [1, 2]}), 'log_str': ''}):
+            result = planner._process_optimal_phase(
+                planner.mold_machine_priority_matrix, mold_lead_times, greedy_phase, None)
+
+        assert result['use_optimal'] is True
+        assert result['assignment_summary']['Note'].eq('optimalBased').all()
+        assert planner.plan_comparison['optimal'].makespan == 24
+        assert planner.plan_comparison['optimal'].total_lead_time == 44
@@ -2,6 +2,7 @@
 
 import pytest
 import pandas as pd
+import pyarrow as pa
 import tempfile
 import os
 from pathlib import Path
@@ -9,6 +10,7 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
 from agents.dataPipelineOrchestrator.processors.dynamic_data_processor import DynamicDataProcessor
+from agents.dataPipelineOrchestrator.processors.processor_utils import to_transport, from_transport
 from agents.dataPipelineOrchestrator.configs.output_formats import (
     DataProcessingReport,
     ProcessingStatus,
@@ -291,6 +293,134 @@ class TestDynamicDataProcessorProcessData:
             assert result.status == ProcessingStatus.ERROR
             assert result.error_type == ErrorType.FILE_READ_ERROR
 
+class TestDynamicDataProcessorIncrementalIngestion:
+    """Test cases for incremental ingestion via ingestion_cache_dir"""
+
+    @pytest.fixture
+    def product_folder(self):
+        """Folder with two monthly report files"""
+        required_fields = DynamicDataProcessor.DATA_TYPES['productRecords']['required_fields']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for month, start in [('202401', 44927), ('202402', 44957)]:
+                dtypes = DynamicDataProcessor.DATA_TYPES['productRecords']['dtypes']
+                df = pd.DataFrame({
+                    field: [10, 20] if dtypes.get(field) == 'Int64' else ['X1', 'X2']
+                    for field in required_fields
+                })
+                df['recordDate'] = [start, start + 1]
+                df['workingShift'] = ['1', '2']
+                df['plasticResineCode'] = [101, '101104FJ']  # mixed types, as in real reports
+                file_path = Path(tmpdir) / f'monthlyReports_{month}_data.xlsx'
+                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+                    df.to_excel(writer, sheet_name='Sheet1', index=False)
+            yield tmpdir
+
+    @staticmethod
+    def _make_processor(folder, cache_dir):
+        schema = {
+            'productRecords': {
+                'path': str(folder),
+                'file_extension': '.xlsx',
+            }
+        }
+        return DynamicDataProcessor(
+            data_name='productRecords',
+            database_schema=schema,
+            ingestion_cache_dir=str(cache_dir)
+        )
+
+    def test_second_run_reuses_cached_files(self, product_folder, tmp_path):
+        """Unchanged files are loaded from cache and the merged output is identical"""
+        first = self._make_processor(product_folder, tmp_path).process_data()
+        second = self._make_processor(product_folder, tmp_path).process_data()
+
+        assert first.status == ProcessingStatus.SUCCESS
+        assert second.status == ProcessingStatus.SUCCESS
+        assert first.metadata['parsed_files_count'] == 2
+        assert second.metadata['parsed_files_count'] == 0
+        pd.testing.assert_frame_equal(first.data, second.data)
+
+    def test_modified_file_is_reparsed(self, product_folder, tmp_path):
+        """Only the changed file is parsed again"""
+        self._make_processor(product_folder, tmp_path).process_data()
+
+        changed = Path(product_folder) / 'monthlyReports_202402_data.xlsx'
+        df = pd.read_excel(changed, sheet_name='Sheet1')
+        df.loc[0, 'itemTotalQuantity'] = 9999
+        with pd.ExcelWriter(changed, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Sheet1', index=False)
+
+        result = self._make_processor(product_folder, tmp_path).process_data()
+
+        assert result.status == ProcessingStatus.SUCCESS
+        assert result.metadata['parsed_files_count'] == 1
+        assert 9999 in result.data['itemTotalQuantity'].tolist()
+
+    def test_deleted_file_is_pruned(self, product_folder, tmp_path):
+        """Removed source files drop out of the manifest and the output"""
+        self._make_processor(product_folder, tmp_path).process_data()
+        os.remove(Path(product_folder) / 'monthlyReports_202401_data.xlsx')
+
+        result = self._make_processor(product_folder, tmp_path).process_data()
+
+        assert len(result.data) == 2
+        manifest = (tmp_path / 'productRecords' / 'manifest.json').read_text()
+        assert 'monthlyReports_202401_data.xlsx' not in manifest
+
+
+class TestDynamicDataProcessorParallelParsing:
+    """Test cases for process-pool file parsing (max_workers > 1)"""
+
+    def test_parallel_matches_sequential(self):
+        """Parallel parsing of the mock monthly reports gives the same merged frame"""
+        schema = {'productRecords': {'path': 'tests/mock_database/dynamicDatabase/monthlyReports_history'}}
+        sequential = DynamicDataProcessor('productRecords', schema, max_workers=1).process_data()
+        parallel = DynamicDataProcessor('productRecords', schema, max_workers=2).process_data()
+
+        assert sequential.status == ProcessingStatus.SUCCESS
+        assert parallel.status == ProcessingStatus.SUCCESS
+        assert parallel.metadata['success_files_count'] == sequential.metadata['success_files_count']
+        pd.testing.assert_frame_equal(sequential.data, parallel.data)
+
+    def test_transport_roundtrip_mixed_columns(self):
+        """Mixed int/float/str object columns survive the Arrow transport unchanged"""
+        df = pd.DataFrame({
+            'plasticResineCode': [101, '101104FJ', 102.0, float('nan')],  # as read by read_excel
+            'machineNo': ['M1', 'M1', 'M2', 'M2'],
+            'moldShot': [1.0, 2.0, None, 4.0],
+        })
+        report = to_transport(DataProcessingReport(status=ProcessingStatus.SUCCESS, data=df.copy()))
+
+        assert isinstance(report.data, pa.Table)
+        restored = from_transport(report).data
+        pd.testing.assert_frame_equal(restored, df)
+        assert list(restored['plasticResineCode'].map(type)) == list(df['plasticResineCode'].map(type))
+
+    def test_parallel_reports_failed_files(self, tmp_path):
+        """A corrupted file fails on its own without aborting the other workers"""
+        required_fields = DynamicDataProcessor.DATA_TYPES['purchaseOrders']['required_fields']
+        df = pd.DataFrame({field: ['A'] for field in required_fields})
+        df['poReceivedDate'] = ['2024-01-01']
+        df['poETA'] = ['2024-02-01']
+        df['itemQuantity'] = [100]
+        for qty_col in ['plasticResinQuantity', 'colorMasterbatchQuantity', 'additiveMasterbatchQuantity']:
+            df[qty_col] = [1.5]
+        with pd.ExcelWriter(tmp_path / 'purchaseOrder_202401.xlsx', engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Sheet1', index=False)
+        (tmp_path / 'purchaseOrder_202402.xlsx').write_text("not an excel file")
+
+        processor = DynamicDataProcessor(
+            data_name='purchaseOrders',
+            database_schema={'purchaseOrders': {'path': str(tmp_path)}},
+            max_workers=2
+        )
+        result = processor.process_data()
+
+        assert result.status == ProcessingStatus.PARTIAL_SUCCESS
+        assert result.metadata['success_files_count'] == 1
+        assert result.metadata['failed_files_count'] == 1
+
+
 class TestDynamicDataProcessorFailMethod:
     """Test cases for _fail helper method"""
     
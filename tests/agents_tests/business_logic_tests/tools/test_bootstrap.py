@@ -0,0 +1,131 @@
+# tests/agents_tests/business_logic_tests/tools/test_bootstrap.py
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from agents.autoPlanner.tools.bootstrap import bootstrap_means, calculate_feature_confidence_scores
+
+TARGETS = {
+    'shiftNGRate': 'minimize',
+    'shiftCavityRate': 1.0,
+    'shiftCycleTimeRate': 1.0,
+    'shiftCapacityRate': 1.0,
+}
+
+def make_groups(n_good=400, n_bad=300, seed=0):
+    rng = np.random.default_rng(seed)
+    good = pd.DataFrame({
+        'shiftNGRate': rng.gamma(2.0, 0.01, n_good),
+        'shiftCavityRate': rng.normal(0.98, 0.03, n_good),
+        'shiftCycleTimeRate': rng.normal(1.0, 0.05, n_good),
+        'shiftCapacityRate': rng.normal(0.95, 0.06, n_good),
+    })
+    bad = pd.DataFrame({
+        'shiftNGRate': rng.gamma(2.0, 0.03, n_bad),
+        'shiftCavityRate': rng.normal(0.85, 0.08, n_bad),
+        'shiftCycleTimeRate': rng.normal(1.2, 0.10, n_bad),
+        'shiftCapacityRate': rng.normal(0.75, 0.12, n_bad),
+    })
+    return good, bad
+
+#-----------------------------------------------------#
+# Former per-iteration implementation (reference only) #
+#-----------------------------------------------------#
+def legacy_bootstrap_means(values, n_bootstrap, sample_size, seed=42):
+    np.random.seed(seed)
+    return np.array([np.mean(np.random.choice(values, size=sample_size, replace=True))
+                     for _ in range(n_bootstrap)])
+
+class TestBootstrapMeans:
+
+    def test_shape_and_reproducibility(self):
+        values = np.arange(100, dtype=float)
+
+        first = bootstrap_means(values, 1_000, 50, np.random.default_rng(7))
+        second = bootstrap_means(values, 1_000, 50, np.random.default_rng(7))
+
+        assert first.shape == (1_000,)
+        np.testing.assert_array_equal(first, second)
+
+    def test_chunked_draws_match_distribution(self):
+        values = np.random.default_rng(1).normal(10, 2, 500)
+
+        chunked = bootstrap_means(values, 4_000, 50, np.random.default_rng(2), max_chunk_elements=1_000)
+
+        assert len(chunked) == 4_000
+        # Same sampling distribution as the former loop (KS test on the means)
+        assert stats.ks_2samp(chunked, legacy_bootstrap_means(values, 4_000, 50)).pvalue > 0.001
+
+    def test_statistically_equivalent_to_loop(self):
+        values = np.random.default_rng(3).exponential(1.5, 300)
+        batched = bootstrap_means(values, 5_000, 50, np.random.default_rng(42))
+        legacy = legacy_bootstrap_means(values, 5_000, 50)
+
+        # Standard error of the bootstrap mean is ~std/sqrt(50)
+        standard_error = values.std() / np.sqrt(50)
+        assert abs(batched.mean() - legacy.mean()) < 0.1 * standard_error
+        assert batched.std() == pytest.approx(legacy.std(), rel=0.05)
+        assert np.percentile(batched, 2.5) == pytest.approx(np.percentile(legacy, 2.5), abs=0.25 * standard_error)
+        assert np.percentile(batched, 97.5) == pytest.approx(np.percentile(legacy, 97.5), abs=0.25 * standard_error)
+
+class TestFeatureConfidenceScores:
+
+    def test_does_not_touch_global_random_state(self):
+        good, bad = make_groups()
+        np.random.seed(123)
+        expected = np.random.random()
+
+        np.random.seed(123)
+        calculate_feature_confidence_scores(good, bad, TARGETS, n_bootstrap=200)
+
+        assert np.random.random() == expected
+
+    def test_parallel_matches_serial(self):
+        good, bad = make_groups()
+
+        serial = calculate_feature_confidence_scores(good, bad, TARGETS, n_bootstrap=500)
+        parallel = calculate_feature_confidence_scores(good, bad, TARGETS, n_bootstrap=500, max_workers=4)
+
+        assert serial == parallel
+        assert list(parallel) == list(TARGETS)
+
+    def test_scores_separate_groups(self):
+        good, bad = make_groups()
+
+        scores = calculate_feature_confidence_scores(good, bad, TARGETS, n_bootstrap=1_000)
+
+        for feature in TARGETS:
+            assert scores[feature]['good_confidence'] > scores[feature]['bad_confidence']
+            assert scores[feature]['good_ci_lower'] <= scores[feature]['good_mean'] <= scores[feature]['good_ci_upper']
+
+    def test_small_and_missing_features(self):
+        good, bad = make_groups(n_good=5)
+
+        scores = calculate_feature_confidence_scores(good, bad, {**TARGETS, 'unknown': 1.0})
+
+        assert 'Sample size too small' in scores['shiftNGRate']['warning']
+        assert 'not found' in scores['unknown']['warning']
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestBootstrapBenchmark:
+    """Micro-benchmark: batched resampling vs the former per-iteration loop"""
+
+    @pytest.mark.parametrize("n_bootstrap", [1_000, 10_000])
+    def test_speedup(self, n_bootstrap):
+        values = np.random.default_rng(0).normal(1.0, 0.1, 2_000)
+
+        start = time.perf_counter()
+        legacy_bootstrap_means(values, n_bootstrap, 50)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bootstrap_means(values, n_bootstrap, 50, np.random.default_rng(42))
+        batched_time = time.perf_counter() - start
+
+        print(f"\nn_bootstrap={n_bootstrap}: loop {legacy_time:.3f}s, batched {batched_time:.4f}s "
+              f"({legacy_time / batched_time:.0f}x)")
+        assert batched_time * 5 < legacy_time
@@ -0,0 +1,187 @@
+# tests/agents_tests/business_logic_tests/trackers/test_history_sweep.py
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.analyticsOrchestrator.trackers.history_sweep import (
+    HistorySweep,
+    LayoutSweep,
+    MoldMachineSweep,
+    load_checkpoint,
+    save_checkpoint,
+)
+from agents.analyticsOrchestrator.trackers.machine_layout_tracker import MachineLayoutTracker
+
+def make_records(n_rows: int = 3_000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'recordDate': pd.Timestamp('2019-01-01') + pd.to_timedelta(rng.integers(0, 120, n_rows), 'D'),
+        'machineNo': pd.Series(rng.choice([f'NO.{i:02d}' for i in range(8)], n_rows), dtype='string'),
+        'machineCode': pd.Series(rng.choice([f'MD{i}-000' for i in range(12)], n_rows), dtype='string'),
+        'moldNo': pd.Series(rng.choice([f'{i}M-001' for i in range(30)], n_rows), dtype='string'),
+    })
+    return df.sort_values('recordDate')
+
+#--------------------------------------------------#
+# Former per-date implementations (reference only) #
+#--------------------------------------------------#
+def legacy_layout_changes(df):
+    change_dates = (df.sort_values('recordDate')
+                    .drop_duplicates(['machineNo', 'machineCode'], keep='first')['recordDate'].unique())
+    changes = {}
+    for date in sorted(change_dates):
+        active = df[df['recordDate'] <= date].drop_duplicates('machineNo', keep='last')
+        changes[date.isoformat()] = dict(zip(active['machineNo'], active['machineCode']))
+    return changes
+
+def legacy_mold_machines(df):
+    change_dates = (df.sort_values('recordDate')
+                    .drop_duplicates(['machineCode', 'moldNo'], keep='first')['recordDate'].unique())
+    changes = {}
+    for date in sorted(change_dates):
+        mapping = (df[df['recordDate'] <= date].groupby('moldNo')['machineCode']
+                   .apply(lambda x: sorted(list(x.unique()))).to_dict())
+        changes[date.isoformat()] = {str(k): [str(v) for v in vals] for k, vals in mapping.items()}
+    return changes
+
+class TestHistorySweep:
+
+    @pytest.fixture
+    def records(self):
+        return make_records()
+
+    def test_layout_matches_per_date_version(self, records):
+        changes = LayoutSweep().sweep(records)
+        expected = legacy_layout_changes(records)
+
+        assert changes == expected
+        # Same machine order as drop_duplicates(keep='last')
+        assert [list(layout) for layout in changes.values()] == [list(layout) for layout in expected.values()]
+
+    def test_mold_machines_match_per_date_version(self, records):
+        assert MoldMachineSweep().sweep(records) == legacy_mold_machines(records)
+
+    def test_resume_from_checkpoint(self, records, tmp_path):
+        cutoff = pd.Timestamp('2019-02-15')
+        path = tmp_path / "checkpoint.json"
+
+        first = MoldMachineSweep()
+        first_changes = first.sweep(records[records['recordDate'] <= cutoff])
+        save_checkpoint(path, first.checkpoint(records[records['recordDate'] <= cutoff]))
+
+        resumed = MoldMachineSweep(load_checkpoint(path))
+        assert resumed.is_resumable(records)
+        resumed_changes = resumed.sweep(records)
+
+        assert {**first_changes, **resumed_changes} == legacy_mold_machines(records)
+        assert min(resumed_changes) > cutoff.isoformat()
+
+    def test_rewritten_history_is_not_resumable(self, records):
+        sweep = LayoutSweep()
+        sweep.sweep(records)
+
+        assert not sweep.is_resumable(records.iloc[1:])
+
+    def test_edited_history_is_not_resumable(self, records):
+        first = LayoutSweep()
+        first.sweep(records)
+        resumed = LayoutSweep(first.checkpoint(records))
+        assert resumed.is_resumable(records.sample(frac=1, random_state=0))
+
+        # Same row count, one corrected machine code
+        edited = records.copy()
+        edited.iloc[10, edited.columns.get_loc('machineCode')] = 'MD99-000'
+        assert not resumed.is_resumable(edited)
+
+    def test_rows_without_key_or_value_are_skipped(self, records):
+        with_nulls = records.copy()
+        with_nulls.iloc[::7, with_nulls.columns.get_loc('moldNo')] = pd.NA
+        with_nulls.iloc[3::11, with_nulls.columns.get_loc('machineNo')] = pd.NA
+        with_nulls.iloc[5::13, with_nulls.columns.get_loc('machineCode')] = pd.NA
+
+        layout = LayoutSweep()
+        assert layout.sweep(with_nulls) == legacy_layout_changes(
+            with_nulls.dropna(subset=['machineNo', 'machineCode']))
+        assert LayoutSweep(layout.checkpoint(with_nulls)).is_resumable(with_nulls)
+
+        molds = MoldMachineSweep()
+        assert molds.sweep(with_nulls) == legacy_mold_machines(
+            with_nulls.dropna(subset=['moldNo', 'machineCode']))
+        assert MoldMachineSweep(molds.checkpoint(with_nulls)).is_resumable(with_nulls)
+
+    def test_sweep_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            HistorySweep()
+
+    def test_delta_mode_lists_new_machines(self, records):
+        deltas = MoldMachineSweep().sweep(records, emit='delta')
+        first_date = min(deltas)
+        first_day = records[records['recordDate'] == pd.Timestamp(first_date)]
+
+        assert sum(len(machines) for machines in deltas[first_date].values()) == \
+            len(first_day.drop_duplicates(['moldNo', 'machineCode']))
+
+    def test_unknown_emit_mode(self, records):
+        with pytest.raises(ValueError):
+            LayoutSweep().sweep(records, emit='diff')
+
+class TestTrackerCheckpoint:
+
+    @pytest.fixture
+    def schemas(self):
+        return {'dynamicDB': {'productRecords': {'dtypes': {
+            'recordDate': 'datetime64[ns]', 'machineNo': 'string', 'machineCode': 'string'}}}}
+
+    def test_layout_at_date_resumes_checkpoint(self, schemas, tmp_path):
+        records = make_records()[['recordDate', 'machineNo', 'machineCode']]
+        path = tmp_path / "checkpoint.json"
+        cutoff = pd.Timestamp('2019-03-01')
+
+        tracker = MachineLayoutTracker(records[records['recordDate'] <= cutoff], schemas, checkpoint_path=str(path))
+        tracker._prepare_data()
+        tracker.detect_all_layout_changes()
+        assert json.loads(path.read_text(encoding='utf-8'))['last_date'] <= cutoff.isoformat()
+
+        tracker = MachineLayoutTracker(records, schemas, checkpoint_path=str(path))
+        tracker._prepare_data()
+        latest_date = records['recordDate'].max()
+        layout = tracker._get_layout_at_date(latest_date)
+
+        expected = tracker.record_df.drop_duplicates('machineNo', keep='last')
+        assert layout == dict(zip(expected['machineNo'], expected['machineCode']))
+        assert load_checkpoint(path).last_date == latest_date.isoformat()
+
+    def test_detect_all_resumes_checkpoint(self, schemas, tmp_path):
+        # One record per machine and date (same-date order is then irrelevant), with
+        # a machine moved to a new code after the checkpoint
+        records = make_records()[['recordDate', 'machineNo', 'machineCode']]
+        moved = pd.DataFrame({'recordDate': [pd.Timestamp('2019-03-20')],
+                              'machineNo': ['NO.01'], 'machineCode': ['MD50-000']}).astype(records.dtypes)
+        records = (pd.concat([records, moved]).drop_duplicates(['recordDate', 'machineNo'], keep='last')
+                   .sort_values('recordDate').reset_index(drop=True))
+        path = tmp_path / "checkpoint.json"
+        cutoff = pd.Timestamp('2019-03-01')
+
+        tracker = MachineLayoutTracker(records[records['recordDate'] <= cutoff], schemas, checkpoint_path=str(path))
+        tracker._prepare_data()
+        tracker.detect_all_layout_changes()
+
+        tracker = MachineLayoutTracker(records, schemas, checkpoint_path=str(path))
+        tracker._prepare_data()
+        resumed = tracker._resume_sweep(with_changes=True)
+        assert resumed.rows_swept == int((records['recordDate'] <= cutoff).sum())
+
+        changes = tracker.detect_all_layout_changes()
+        assert changes == legacy_layout_changes(records)
+        assert '2019-03-20T00:00:00' in changes
+        assert load_checkpoint(path).last_date == records['recordDate'].max().isoformat()
+
+        # A corrected record invalidates the checkpoint: full sweep of the edited history
+        edited = records.copy()
+        edited.iloc[0, edited.columns.get_loc('machineCode')] = 'MD99-000'
+        tracker = MachineLayoutTracker(edited, schemas, checkpoint_path=str(path))
+        tracker._prepare_data()
+        assert tracker._resume_sweep(with_changes=True).last_date is None
+        assert tracker.detect_all_layout_changes() == legacy_layout_changes(tracker.record_df)
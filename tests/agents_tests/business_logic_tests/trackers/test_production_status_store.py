@@ -0,0 +1,74 @@
+# tests/agents_tests/business_logic_tests/trackers/test_production_status_store.py
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.orderProgressTracker.production_status_store import (
+    NESTED_FIELD_TYPES, PRODUCTION_STATUS_COLUMN_TYPES, PRODUCTION_STATUS_SHEET,
+    load_production_status, production_status_sidecar_path)
+from agents.result_store import result_manifest_path, sheet_to_table, write_result_store, write_sheet_file
+from optiMoldMaster.opti_mold_master import OptiMoldIQ
+from tests.agents_tests.business_logic_tests.trackers.test_progress_tracker import (
+    as_status, extract, make_records)
+
+def make_production_status(n_unstarted: int = 5) -> pd.DataFrame:
+    status = as_status(extract(make_records())[0])
+    # POs without production records: no lists or maps
+    unstarted = pd.DataFrame({'poNo': [f'NEW{i:03d}' for i in range(n_unstarted)]})
+    status = pd.concat([status, unstarted], ignore_index=True).fillna(pd.NA)
+    return status.assign(
+        proStatus='MOLDING', etaStatus='PENDING', itemType='TYPE', moldList='M001/M002',
+        lastestRecordTime=pd.Timestamp('2024-04-29 06:00'), lastestMachineNo='NO.01',
+        lastestMoldNo='M001', warningNotes='')
+
+def normalized(records):
+    # Excel reads empty strings back as NaN and keeps NaN in all-empty float columns
+    return [{key: None if value == '' or (isinstance(value, float) and np.isnan(value)) else value
+             for key, value in record.items()} for record in records]
+
+def as_lists(df: pd.DataFrame, col: str):
+    return [value if isinstance(value, (list, dict)) else None for value in df[col]]
+
+class TestProductionStatusStore:
+
+    @pytest.fixture
+    def status(self):
+        return make_production_status()
+
+    def test_round_trip_keeps_lists_and_maps(self, status, tmp_path):
+        excel_path = tmp_path / "20240101_0000_progress_tracker_result.xlsx"
+        write_result_store(excel_path, {PRODUCTION_STATUS_SHEET: status}, PRODUCTION_STATUS_COLUMN_TYPES)
+
+        loaded = load_production_status(result_manifest_path(excel_path))
+
+        assert loaded.columns.tolist() == status.columns.tolist()
+        for col in NESTED_FIELD_TYPES:
+            # Same values and key order as produced by ProgressTracker
+            assert repr(loaded[col].tolist()) == repr(as_lists(status, col)), col
+
+    def test_legacy_sidecar(self, status, tmp_path):
+        excel_path = tmp_path / "20240101_0000_progress_tracker_result.xlsx"
+        write_sheet_file(sheet_to_table(status, NESTED_FIELD_TYPES), production_status_sidecar_path(excel_path))
+
+        loaded = load_production_status(excel_path)
+
+        for col in NESTED_FIELD_TYPES:
+            assert repr(loaded[col].tolist()) == repr(as_lists(status, col)), col
+
+    def test_excel_only_result(self, tmp_path):
+        assert load_production_status(tmp_path / "result.xlsx") is None
+
+    def test_tracker_view_matches_excel(self, status, tmp_path):
+        excel_path = tmp_path / "result.xlsx"
+        with pd.ExcelWriter(excel_path) as writer:
+            status.to_excel(writer, sheet_name='productionStatus', index=False)
+        write_result_store(excel_path, {PRODUCTION_STATUS_SHEET: status}, PRODUCTION_STATUS_COLUMN_TYPES)
+        orchestrator = object.__new__(OptiMoldIQ)
+
+        from_store = orchestrator._process_tracker_result(load_production_status(excel_path))
+        from_excel = orchestrator._process_tracker_result(pd.read_excel(excel_path, sheet_name='productionStatus'))
+
+        for key in ['daily_data', 'tracking_data']:
+            assert normalized(from_store[key]) == normalized(from_excel[key])
+        assert isinstance(from_store['tracking_data'][0]['moldShotMap'], dict)
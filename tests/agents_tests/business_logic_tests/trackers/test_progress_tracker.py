@@ -0,0 +1,175 @@
+# tests/agents_tests/business_logic_tests/trackers/test_progress_tracker.py
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+from loguru import logger
+from datetime import datetime, timedelta
+
+from agents.orderProgressTracker.tracker_utils import ProgressTracker
+
+SHIFT_START_MAP = {"1": "06:00", "2": "14:00", "3": "22:00", "HC": "08:00"}
+
+def make_records(n_rows: int = 5_000, n_pos: int = 300, days: int = 120, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    po_numbers = [f'PO{i:05d}' for i in range(n_pos)]
+    df = pd.DataFrame({
+        'recordDate': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, days, n_rows), 'D'),
+        'workingShift': pd.Series(rng.choice(['1', '2', '3', 'HC', 'X', None], n_rows,
+                                             p=[.3, .3, .3, .05, .03, .02]), dtype='string'),
+        'machineNo': pd.Series(rng.choice([f'NO.{i:02d}' for i in range(10)], n_rows), dtype='string'),
+        'machineCode': pd.Series(rng.choice([f'MD{i}' for i in range(15)], n_rows), dtype='string'),
+        'moldNo': pd.Series(rng.choice([f'M{i:03d}' for i in range(40)] + [None], n_rows), dtype='string'),
+        'moldShot': pd.Series(rng.choice([0, 100, 950, 1200, None], n_rows), dtype='Int64'),
+        'moldCavity': pd.Series(rng.choice([1, 2, 4, None], n_rows), dtype='Int64'),
+        'itemTotalQuantity': pd.Series(rng.choice([0, 500, 1000, 2000, None], n_rows), dtype='Int64'),
+        'itemGoodQuantity': pd.Series(rng.choice([0, 480, 990, 1950, None], n_rows), dtype='Int64'),
+        'poNote': pd.Series(rng.choice(po_numbers + [None], n_rows), dtype='string'),
+        'plasticResinCode': pd.Series(rng.choice(['R1', 'R2', 'R3'], n_rows), dtype='string'),
+        'colorMasterbatchCode': pd.Series(rng.choice(['C1', 'C2', None], n_rows), dtype='string'),
+        'additiveMasterbatchCode': pd.Series(rng.choice(['A1', None], n_rows), dtype='string'),
+    })
+    return df.sort_values('recordDate').reset_index(drop=True)
+
+def make_tracker() -> ProgressTracker:
+    # Only the record processing helpers are exercised: skip schema validation
+    tracker = object.__new__(ProgressTracker)
+    tracker.logger = logger
+    return tracker
+
+def extract(records: pd.DataFrame):
+    return make_tracker()._extract_product_records(records, SHIFT_START_MAP)
+
+def as_status(agg_df: pd.DataFrame) -> pd.DataFrame:
+    return agg_df.assign(startedDate=agg_df['startedDate'].dt.strftime('%Y-%m-%d'),
+                         actualFinishedDate=pd.NA, poReceivedDate='2024-01-01', itemCode='ITEM',
+                         itemName='item', poETA='2024-06-01', itemQuantity=5_000, itemRemain=100)
+
+#--------------------------------------------------#
+# Former row-wise implementations (reference only) #
+#--------------------------------------------------#
+def legacy_shift_start(row, shift_start_map):
+    start_time_str = shift_start_map.get(str(row['workingShift']))
+    if not start_time_str:
+        return pd.NaT
+    hour, minute = map(int, start_time_str.split(":"))
+    return pd.Timestamp(datetime.combine(pd.to_datetime(row['recordDate']).date(), datetime.min.time())
+                        + timedelta(hours=hour, minutes=minute))
+
+def legacy_material_codes(df):
+    def combinations(group):
+        result = []
+        for _, row in group.iterrows():
+            combination = {field: row[field] if pd.notna(row[field]) else None
+                           for field in ProgressTracker.MATERIAL_FIELDS}
+            if combination not in result:
+                result.append(combination)
+        return result
+    return df.groupby('poNote').apply(combinations, include_groups=False).to_dict()
+
+def legacy_map(df, key_field, value_field):
+    return (df.groupby(['poNote', key_field])[value_field].sum().reset_index()
+            .groupby('poNote')[[key_field, value_field]]
+            .apply(lambda x: {k.strftime('%Y-%m-%d') if key_field == 'recordDate' else k: int(v)
+                              for k, v in zip(x[key_field], x[value_field])})
+            .to_dict())
+
+def legacy_map_rows(df, field_name, first_col, second_col, count_col, columns_to_keep):
+    rows = []
+    for _, row in df.iterrows():
+        info = row[field_name]
+        if not isinstance(info, dict) or not info:
+            continue
+        for first_info, second_info in info.items():
+            rows.append({**{col: row[col] for col in columns_to_keep},
+                         first_col: first_info, second_col: second_info, count_col: len(info)})
+    return pd.DataFrame(rows)
+
+class TestProgressTrackerRecords:
+
+    @pytest.fixture
+    def records(self):
+        return make_records()
+
+    def test_shift_starts_match_row_wise_version(self, records):
+        shift_starts = ProgressTracker._get_shift_starts(records, SHIFT_START_MAP)
+        expected = records.apply(lambda row: legacy_shift_start(row, SHIFT_START_MAP), axis=1)
+
+        assert shift_starts.isna().tolist() == expected.isna().tolist()
+        assert (shift_starts.dropna() == pd.to_datetime(expected.dropna())).all()
+
+    def test_material_codes_match_row_wise_version(self, records):
+        assert ProgressTracker._extract_material_codes(records) == legacy_material_codes(records)
+
+    def test_missing_resin_code_raises(self, records):
+        records.loc[3, 'plasticResinCode'] = None
+
+        with pytest.raises(ValueError):
+            ProgressTracker._extract_material_codes(records.assign(poNote='PO00001'))
+
+    def test_aggregation_maps_match_groupby_apply_version(self, records):
+        records = records.assign(machineHist=records['machineNo'] + '_' + records['machineCode'],
+                                 dateShiftCombined=records['recordDate'].dt.strftime('%Y-%m-%d')
+                                 + '_shift_' + records['workingShift'])
+
+        maps = ProgressTracker._create_aggregation_maps(records)
+
+        for map_name, (key_field, value_field) in ProgressTracker.AGGREGATION_MAP_FIELDS.items():
+            expected = legacy_map(records, key_field, value_field)
+            assert maps[map_name] == expected
+            # Same key order inside every PO map
+            assert [list(m) for m in maps[map_name].values()] == [list(m) for m in expected.values()]
+
+    def test_aggregated_records(self, records):
+        agg_df, producing_po_list, not_working_df = extract(records)
+        working = records[records['itemTotalQuantity'].fillna(0) > 0]
+
+        assert agg_df['poNo'].tolist() == sorted(working['poNote'].dropna().unique())
+        assert len(not_working_df) == len(records) - len(working)
+        assert set(producing_po_list) <= set(agg_df['poNo'])
+
+        po = agg_df.iloc[0]
+        po_records = working[working['poNote'] == po['poNo']]
+        assert po['moldHist'] == po_records['moldNo'].dropna().unique().tolist()
+        assert po['moldedQuantity'] == po_records['itemGoodQuantity'].sum()
+        assert sum(po['dayQuantityMap'].values()) == po_records['itemGoodQuantity'].sum()
+
+    @pytest.mark.parametrize("field_name, first_col, second_col, count_col", [
+        ('moldShotMap', 'moldNo', 'shotCount', 'numOfMold'),
+        ('machineQuantityMap', 'machineCode', 'moldedQuantity', 'numOfMachine'),
+        ('dayQuantityMap', 'workingDay', 'moldedQuantity', 'numOfDay'),
+    ])
+    def test_flattened_maps_match_row_wise_version(self, records, field_name, first_col, second_col, count_col):
+        status = as_status(extract(records)[0])
+        columns_to_keep = ['poReceivedDate', 'poNo', 'itemCode', 'itemName', 'poETA',
+                           'itemQuantity', 'itemRemain', 'startedDate', 'actualFinishedDate']
+
+        result = make_tracker()._pro_status_fattening(status, field_name)
+        expected = legacy_map_rows(status, field_name, first_col, second_col, count_col, columns_to_keep)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+        # Maps read back from Excel are stored as strings
+        stringified = status.assign(**{field_name: status[field_name].astype(str)})
+        pd.testing.assert_frame_equal(make_tracker()._pro_status_fattening(stringified, field_name),
+                                      expected, check_dtype=False)
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestProgressTrackerBenchmark:
+    """Micro-benchmark: a year of production records"""
+
+    def test_one_year_of_records(self):
+        records = make_records(n_rows=365 * 3 * 60, n_pos=6_000, days=365)
+
+        start = time.perf_counter()
+        agg_df, _, _ = extract(records)
+        status = as_status(agg_df)
+        for field_name in ['moldShotMap', 'machineQuantityMap', 'dayQuantityMap', 'materialComponentMap']:
+            make_tracker()._pro_status_fattening(status, field_name)
+        elapsed = time.perf_counter() - start
+
+        assert len(agg_df) > 5_900
+        # The former row-wise version needed about half a minute for this input
+        assert elapsed < 5
@@ -0,0 +1,120 @@
+# tests/agents_tests/business_logic_tests/trackers/test_tracking_state.py
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.orderProgressTracker.tracker_utils import ProgressTracker
+from agents.orderProgressTracker.tracking_state import (
+    load_tracking_state, make_settings_key, save_tracking_state)
+from tests.agents_tests.business_logic_tests.trackers.test_progress_tracker import (
+    SHIFT_START_MAP, make_records, make_tracker)
+
+def make_shift_ordered_records(seed: int = 0) -> pd.DataFrame:
+    # Records are appended shift by shift (rows without a valid shift first)
+    records = make_records(seed=seed)
+    shift_starts = ProgressTracker._get_shift_starts(records, SHIFT_START_MAP)
+    order = np.argsort(shift_starts.fillna(pd.Timestamp.min).to_numpy(), kind='stable')
+    return records.iloc[order].reset_index(drop=True)
+
+def records_until(records: pd.DataFrame, watermark: str) -> pd.DataFrame:
+    shift_starts = ProgressTracker._get_shift_starts(records, SHIFT_START_MAP)
+    return records[(shift_starts <= pd.Timestamp(watermark)) | shift_starts.isna()]
+
+def track(records: pd.DataFrame, previous_state=None):
+    return make_tracker()._track_product_records(records, SHIFT_START_MAP, previous_state)
+
+class TestIncrementalTracking:
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("watermark", ['2024-01-01 06:00', '2024-02-10 14:00', '2024-04-28 22:00'])
+    def test_incremental_matches_full_history(self, seed, watermark, tmp_path):
+        records = make_shift_ordered_records(seed)
+        _, previous_state, _ = track(records_until(records, watermark))
+        save_tracking_state(tmp_path, previous_state)
+
+        aggregates, state, records_aggregated = track(records, load_tracking_state(tmp_path))
+        incremental = make_tracker()._extract_product_records(records, SHIFT_START_MAP, aggregates)
+        full = make_tracker()._extract_product_records(records, SHIFT_START_MAP)
+
+        assert records_aggregated == len(records) - len(records_until(records, watermark))
+        assert state.rows_folded == len(records)
+        pd.testing.assert_frame_equal(incremental[0], full[0])
+        assert incremental[1] == full[1]
+        pd.testing.assert_frame_equal(incremental[2], full[2])
+
+        # Latest shifts per PO (paused POs, latest machine and mold)
+        full_aggregates, _, _ = track(records)
+        for name in ['latest_working_shifts', 'latest_po_records']:
+            pd.testing.assert_frame_equal(aggregates[name], full_aggregates[name], check_dtype=False)
+
+    def test_no_new_records_reuses_state(self):
+        records = make_shift_ordered_records()
+        _, previous_state, _ = track(records)
+
+        aggregates, state, records_aggregated = track(records, previous_state)
+
+        assert records_aggregated == 0
+        assert aggregates is previous_state.aggregates
+        assert state.watermark == previous_state.watermark
+
+    def test_rewritten_history_is_fully_aggregated(self):
+        records = make_shift_ordered_records()
+        _, previous_state, _ = track(records_until(records, '2024-02-10 14:00'))
+
+        _, _, records_aggregated = track(records.drop(index=[0, 1]), previous_state)
+
+        assert records_aggregated == len(records) - 2
+
+    def test_changed_shift_start_map_is_fully_aggregated(self):
+        records = make_shift_ordered_records()
+        _, previous_state, _ = track(records_until(records, '2024-02-10 14:00'))
+
+        assert previous_state.settings_key == make_settings_key(SHIFT_START_MAP)
+        assert not previous_state.is_resumable(
+            records,
+            ProgressTracker._get_shift_starts(records, SHIFT_START_MAP),
+            make_settings_key({**SHIFT_START_MAP, "HC": "07:00"}))
+
+    def test_corrected_record_is_fully_aggregated(self):
+        records = make_shift_ordered_records()
+        _, previous_state, _ = track(records)
+
+        # Same row count, one corrected good quantity
+        corrected = records.copy()
+        corrected.loc[corrected['itemGoodQuantity'].notna().idxmax(), 'itemGoodQuantity'] += 1
+        _, _, records_aggregated = track(corrected, previous_state)
+
+        assert records_aggregated == len(records)
+
+class TestTrackingState:
+
+    def test_round_trip(self, tmp_path):
+        records = make_shift_ordered_records()
+        _, saved, _ = track(records)
+        save_tracking_state(tmp_path, saved)
+
+        loaded = load_tracking_state(tmp_path)
+
+        assert loaded.watermark == ProgressTracker._get_shift_starts(records, SHIFT_START_MAP).max().isoformat()
+        assert loaded.rows_folded == len(records)
+        assert loaded.settings_key == saved.settings_key
+        assert loaded.rows_digest == saved.rows_digest
+        assert list(loaded.aggregates) == list(saved.aggregates)
+        for name, table in saved.aggregates.items():
+            pd.testing.assert_frame_equal(loaded.aggregates[name], table, check_dtype=False)
+
+    def test_missing_state(self, tmp_path):
+        assert load_tracking_state(tmp_path / "missing") is None
+
+    def test_interrupted_save_leaves_no_state(self, tmp_path, monkeypatch):
+        _, state, _ = track(make_shift_ordered_records())
+        save_tracking_state(tmp_path, state)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(pd.DataFrame, "to_parquet", fail)
+
+        with pytest.raises(OSError):
+            save_tracking_state(tmp_path, state)
+        assert load_tracking_state(tmp_path) is None
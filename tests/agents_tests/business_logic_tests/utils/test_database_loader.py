@@ -0,0 +1,296 @@
+# tests/agents_tests/business_logic_tests/utils/test_database_loader.py
+
+import os
+import json
+import pytest
+import threading
+import contextvars
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from agents.database_loader import (
+    DATASET_MANIFEST_NAME,
+    UNDATED_PARTITION,
+    arrow_mirror_path,
+    database_date_bounds,
+    dataset_files,
+    load_database,
+    read_dataset_manifest,
+    schema_dtypes,
+)
+from agents.dataframe_store import DataFrameStore
+from agents.dataPipelineOrchestrator.configs.partitioned_dataset import write_database
+from agents.dataPipelineOrchestrator.configs.change_detection import read_rows
+from agents.dataPipelineOrchestrator.configs.save_output_formatter import save_databases
+
+@pytest.fixture
+def product_records():
+    return pd.DataFrame({
+        "recordDate": pd.to_datetime(["2019-01-31", "2018-11-02", None, "2018-11-15", "2019-01-01"]),
+        "machineCode": pd.Series(["M1", "M2", "M3", "M1", "M2"], dtype="string"),
+        "itemGoodQuantity": [10, 20, 30, 40, 50],
+    })
+
+@pytest.fixture
+def dataset_path(tmp_path, product_records):
+    path = tmp_path / "20250101_000000_productRecords.parquet"
+    write_database(path, "productRecords", product_records)
+    return path
+
+class TestPartitionedLayout:
+
+    def test_manifest_lists_month_partitions(self, dataset_path):
+        manifest = read_dataset_manifest(dataset_path)
+
+        assert manifest["partition_column"] == "recordDate"
+        assert [p["key"] for p in manifest["partitions"]] == ["2018-11", "2019-01", UNDATED_PARTITION]
+        assert [p["rows"] for p in manifest["partitions"]] == [2, 2, 1]
+        assert (dataset_path / DATASET_MANIFEST_NAME).is_file()
+
+    def test_full_read_matches_pandas(self, dataset_path, product_records):
+        loaded = load_database(dataset_path)
+
+        pd.testing.assert_frame_equal(loaded, pd.read_parquet(dataset_path))
+        pd.testing.assert_frame_equal(
+            loaded.sort_values("itemGoodQuantity").reset_index(drop=True),
+            product_records.sort_values("itemGoodQuantity").reset_index(drop=True))
+
+    def test_unpartitioned_database_stays_single_file(self, tmp_path):
+        path = tmp_path / "itemInfo.parquet"
+        write_database(path, "itemInfo", pd.DataFrame({"itemCode": ["I1"]}))
+
+        assert path.is_file()
+        assert read_dataset_manifest(path) is None
+        assert dataset_files(path) == [path]
+
+class TestLoadDatabase:
+
+    def test_date_range_prunes_partitions(self, dataset_path):
+        loaded = load_database(dataset_path, start="2018-11-01", end="2018-11-10")
+        assert loaded["itemGoodQuantity"].tolist() == [20]
+
+    def test_partition_keys_and_projection(self, dataset_path):
+        loaded = load_database(dataset_path, columns=["itemGoodQuantity"], partitions=["2019-01"])
+
+        assert list(loaded.columns) == ["itemGoodQuantity"]
+        assert sorted(loaded["itemGoodQuantity"].tolist()) == [10, 50]
+
+    def test_empty_selection_keeps_schema(self, dataset_path, product_records):
+        loaded = load_database(dataset_path, start="2030-01-01")
+
+        assert loaded.empty
+        assert loaded.dtypes.equals(product_records.dtypes)
+
+    def test_single_file_requires_date_column(self, tmp_path, product_records):
+        path = tmp_path / "records.parquet"
+        product_records.to_parquet(path, index=False)
+
+        with pytest.raises(ValueError):
+            load_database(path, start="2019-01-01")
+        loaded = load_database(path, start="2019-01-01", date_column="recordDate")
+        assert sorted(loaded["itemGoodQuantity"].tolist()) == [10, 50]
+
+    def test_date_bounds_from_manifest(self, dataset_path):
+        assert database_date_bounds(dataset_path) == (pd.Timestamp("2018-11-02"), pd.Timestamp("2019-01-31"))
+
+    def test_read_rows_across_partitions(self, dataset_path):
+        full = load_database(dataset_path)
+        positions = np.array([0, 3, 4])
+
+        pd.testing.assert_frame_equal(read_rows(dataset_path, positions), full.iloc[positions].reset_index(drop=True))
+
+class TestSavePartitionedDatabase:
+
+    def test_change_replaces_dataset_directory(self, tmp_path, product_records, monkeypatch):
+        import agents.dataPipelineOrchestrator.configs.save_output_formatter as formatter
+
+        database_dir = tmp_path / "DataCollector"
+        annotations_path = database_dir / "newest" / "path_annotations.json"
+
+        save_databases(database_dir, {"dynamicDB": {"productRecords": product_records}}, {}, annotations_path)
+        first = json.loads(annotations_path.read_text(encoding="utf-8"))
+        old_path = Path(first["productRecords"])
+
+        real_datetime = formatter.datetime
+        class LaterDatetime(real_datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return real_datetime(2100, 1, 1, 0, 0, 0)
+        monkeypatch.setattr(formatter, "datetime", LaterDatetime)
+
+        changed = product_records.iloc[1:].reset_index(drop=True)
+        save_databases(database_dir, {"dynamicDB": {"productRecords": changed}}, first, annotations_path)
+        second = json.loads(annotations_path.read_text(encoding="utf-8"))
+
+        assert read_dataset_manifest(second["productRecords"]) is not None
+        assert not old_path.exists()
+        assert sorted(load_database(second["productRecords"])["itemGoodQuantity"].tolist()) == [20, 30, 40, 50]
+
+class TestDataFrameStore:
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        import agents.dataframe_store as dataframe_store
+        store = DataFrameStore()
+        monkeypatch.setattr(dataframe_store, "_default_store", store)
+        return store
+
+    def test_full_reads_share_one_decode_within_session(self, store, dataset_path):
+        with store.session():
+            first = load_database(dataset_path)
+            second = load_database(dataset_path)
+
+        assert (store.misses, store.hits) == (1, 1)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_no_sharing_without_session(self, store, dataset_path):
+        load_database(dataset_path)
+        assert len(store) == 0
+
+    def test_consumer_edits_do_not_leak(self, store, dataset_path):
+        with store.session():
+            first = load_database(dataset_path)
+            first.loc[0, "itemGoodQuantity"] = -1
+            first["extra"] = 1
+            second = load_database(dataset_path)
+
+        assert -1 not in second["itemGoodQuantity"].tolist()
+        assert "extra" not in second.columns
+
+    def test_new_version_replaces_stale_entry(self, store, tmp_path):
+        path = tmp_path / "itemInfo.parquet"
+        pd.DataFrame({"itemCode": ["I1"]}).to_parquet(path, index=False)
+
+        with store.session():
+            load_database(path)
+            pd.DataFrame({"itemCode": ["I1", "I2"]}).to_parquet(path, index=False)
+            os.utime(path, ns=(0, 0))
+            assert len(load_database(path)) == 2
+
+        assert (store.misses, len(store)) == (2, 1)
+
+    def test_budget_evicts_only_released_entries(self, store, tmp_path):
+        store.memory_budget_bytes = 0
+        paths = []
+        for name in ("a", "b"):
+            paths.append(tmp_path / f"{name}.parquet")
+            pd.DataFrame({"x": range(10)}).to_parquet(paths[-1], index=False)
+
+        with store.session():
+            for path in paths:
+                load_database(path)
+            assert len(store) == 2          # pinned by the open session
+
+        assert len(store) == 0
+
+    def test_overlapping_sessions_pin_only_their_loads(self, store, tmp_path):
+        store.memory_budget_bytes = 0
+        paths = {}
+        for name in ("a", "b"):
+            paths[name] = tmp_path / f"{name}.parquet"
+            pd.DataFrame({"x": range(10)}).to_parquet(paths[name], index=False)
+
+        loaded, release = threading.Event(), threading.Event()
+        def other_run():
+            with store.session():
+                load_database(paths["a"])
+                loaded.set()
+                release.wait(5)
+        thread = threading.Thread(target=other_run)
+        thread.start()
+        loaded.wait(5)
+
+        with store.session():
+            load_database(paths["b"])
+        # "b" is released although the other run is still open; "a" stays pinned by it
+        assert len(store) == 1
+
+        release.set()
+        thread.join()
+        assert len(store) == 0
+
+    def test_module_threads_join_the_run_session(self, store, dataset_path):
+        with store.session():
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(contextvars.copy_context().run, load_database, dataset_path)
+                           for _ in range(2)]
+                [future.result() for future in futures]
+
+        assert (store.misses, store.hits) == (1, 1)
+
+    def test_deep_copies_without_copy_on_write(self, store, dataset_path, monkeypatch):
+        monkeypatch.setattr("agents.dataframe_store._copy_on_write", lambda: False)
+        with store.session():
+            first = load_database(dataset_path)
+            second = load_database(dataset_path)
+
+        assert not np.shares_memory(first["itemGoodQuantity"].to_numpy(),
+                                    second["itemGoodQuantity"].to_numpy())
+
+class TestArrowBackend:
+
+    def test_matches_pandas_backend(self, dataset_path):
+        arrow_df = load_database(dataset_path, backend="arrow")
+        pandas_df = load_database(dataset_path, backend="pandas")
+
+        assert arrow_df["machineCode"].dtype == pd.StringDtype("pyarrow")
+        pd.testing.assert_frame_equal(arrow_df, pandas_df, check_dtype=False)
+
+    def test_mirror_written_once_and_ignored_by_pandas(self, dataset_path):
+        load_database(dataset_path, backend="arrow")
+        mirrors = sorted(p.name for p in dataset_path.glob("_*.arrow"))
+        assert mirrors == ["_2018-11.arrow", "_2019-01.arrow", "_undated.arrow"]
+
+        mtimes = [p.stat().st_mtime_ns for p in dataset_path.glob("_*.arrow")]
+        load_database(dataset_path, backend="arrow", partitions=["2018-11"])
+        assert [p.stat().st_mtime_ns for p in dataset_path.glob("_*.arrow")] == mtimes
+
+        assert len(pd.read_parquet(dataset_path)) == 5
+
+    def test_stale_mirror_is_rebuilt(self, tmp_path):
+        path = tmp_path / "itemInfo.parquet"
+        pd.DataFrame({"itemCode": ["I1"]}).to_parquet(path, index=False)
+        load_database(path, backend="arrow")
+
+        pd.DataFrame({"itemCode": ["I1", "I2"]}).to_parquet(path, index=False)
+        os.utime(arrow_mirror_path(path), ns=(0, 0))
+
+        assert load_database(path, backend="arrow")["itemCode"].tolist() == ["I1", "I2"]
+
+    def test_schema_dtypes_and_projection(self, dataset_path):
+        loaded = load_database(dataset_path, backend="arrow", columns=["machineCode", "itemGoodQuantity"],
+                               dtypes={"machineCode": "string", "itemGoodQuantity": "Int64"})
+
+        assert loaded["machineCode"].dtype == pd.StringDtype("pyarrow")
+        assert loaded["itemGoodQuantity"].dtype == "Int64"
+
+    def test_store_keeps_backends_and_dtypes_apart(self, dataset_path, monkeypatch):
+        import agents.dataframe_store as dataframe_store
+        store = DataFrameStore()
+        monkeypatch.setattr(dataframe_store, "_default_store", store)
+        dtypes = {"itemGoodQuantity": "Int64"}
+
+        with store.session():
+            pandas_df = load_database(dataset_path)
+            arrow_df = load_database(dataset_path, backend="arrow")
+            typed_df = load_database(dataset_path, dtypes=dtypes)
+            typed_again = load_database(dataset_path, dtypes=dtypes)
+
+        assert (store.misses, store.hits, len(store)) == (3, 1, 3)
+        assert pandas_df["itemGoodQuantity"].dtype == arrow_df["itemGoodQuantity"].dtype == "int64"
+        assert typed_df["itemGoodQuantity"].dtype == "Int64"
+        assert typed_again["itemGoodQuantity"].dtype == "Int64"
+
+    def test_schema_dtypes_lookup(self):
+        schemas = {"dynamicDB": {"productRecords": {"dtypes": {"poNote": "string"}}},
+                   "staticDB": {"itemInfo": {"dtypes": {"itemCode": "string"}}}}
+
+        assert schema_dtypes(schemas, "productRecords") == {"poNote": "string"}
+        assert schema_dtypes(schemas, "itemInfo") == {"itemCode": "string"}
+        assert schema_dtypes(schemas, "moldInfo") is None
+
+    def test_unknown_backend(self, dataset_path):
+        with pytest.raises(ValueError):
+            load_database(dataset_path, backend="polars")
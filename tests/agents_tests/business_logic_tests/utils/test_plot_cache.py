@@ -0,0 +1,174 @@
+# tests/agents_tests/business_logic_tests/utils/test_plot_cache.py
+
+import os
+import json
+import time
+import pytest
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from agents.dashboardBuilder.plotters.plot_cache import (
+    PlotRenderCache, run_plot_tasks, task_fingerprint)
+
+CALLS = []
+
+def make_frame():
+    return pd.DataFrame({
+        "machineCode": ["M1", "M2", "M3"],
+        "shots": [100, 250, 0],
+        "moldHist": [["A"], [], ["A", "B"]],
+    })
+
+def single_plotter(df, visualization_config_path=None, **kwargs):
+    CALLS.append("single")
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.bar(df["machineCode"], df["shots"])
+    return fig
+
+def multi_page_plotter(df, visualization_config_path=None, **kwargs):
+    CALLS.append("multi")
+    figs = []
+    for _ in range(2):
+        fig, ax = plt.subplots(figsize=(2, 2))
+        ax.plot(df["shots"])
+        figs.append(fig)
+    return {"pages": 2}, figs
+
+def make_task(output_dir, df, func=single_plotter, config_path=None, timestamp="20240101_0000", kwargs=None):
+    name = func.__name__
+    path = os.path.join(output_dir, f"{timestamp}_{name}.png")
+    return (df, config_path, name, func, path, timestamp, kwargs or {})
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+class TestTaskFingerprint:
+
+    def test_same_content_same_fingerprint(self, tmp_path):
+        first = make_task(tmp_path, make_frame())
+        second = make_task(tmp_path, make_frame(), timestamp="20240102_0000")
+
+        assert task_fingerprint(first) == task_fingerprint(second)
+
+    def test_inputs_change_fingerprint(self, tmp_path):
+        config_path = tmp_path / "visualization_config.json"
+        config_path.write_text(json.dumps({"sns_style": "default"}))
+        base = task_fingerprint(make_task(tmp_path, make_frame(), config_path=str(config_path)))
+
+        changed_df = make_frame()
+        changed_df.loc[0, "shots"] = 101
+        assert task_fingerprint(make_task(tmp_path, changed_df, config_path=str(config_path))) != base
+        assert task_fingerprint(make_task(tmp_path, make_frame(), config_path=str(config_path),
+                                          kwargs={"top_n": 5})) != base
+        assert task_fingerprint(make_task(tmp_path, make_frame(), config_path=str(config_path))
+                                + ("print",)) != base
+
+        config_path.write_text(json.dumps({"sns_style": "whitegrid"}))
+        assert task_fingerprint(make_task(tmp_path, make_frame(), config_path=str(config_path))) != base
+
+class TestRunPlotTasks:
+
+    def test_unchanged_plots_are_reused(self, tmp_path):
+        cache_dir = tmp_path / "plot_cache"
+        first_tasks = [make_task(tmp_path, make_frame()), make_task(tmp_path, make_frame(), multi_page_plotter)]
+        results, failed = run_plot_tasks(first_tasks, enable_parallel=False, max_workers=1,
+                                         plot_cache_dir=cache_dir)
+        assert not failed
+        assert sorted(CALLS) == ["multi", "single"]
+
+        CALLS.clear()
+        second_tasks = [make_task(tmp_path, make_frame(), timestamp="20240102_0000"),
+                        make_task(tmp_path, make_frame(), multi_page_plotter, timestamp="20240102_0000")]
+        results, failed = run_plot_tasks(second_tasks, enable_parallel=False, max_workers=1,
+                                         plot_cache_dir=cache_dir)
+
+        assert not failed
+        assert CALLS == []
+        paths = {name: paths for _, name, paths, _, _ in results}
+        assert paths["single_plotter"] == [str(tmp_path / "20240102_0000_single_plotter.png")]
+        assert paths["multi_page_plotter"] == [
+            str(tmp_path / f"20240102_0000_multi_page_plotter_page{i}.png") for i in (1, 2)]
+        assert all(os.path.getsize(p) > 0 for p in paths["multi_page_plotter"])
+
+    def test_changed_data_is_rendered(self, tmp_path):
+        cache_dir = tmp_path / "plot_cache"
+        run_plot_tasks([make_task(tmp_path, make_frame())], False, 1, plot_cache_dir=cache_dir)
+
+        changed_df = make_frame()
+        changed_df.loc[1, "shots"] = 0
+        run_plot_tasks([make_task(tmp_path, changed_df, timestamp="20240102_0000")], False, 1,
+                       plot_cache_dir=cache_dir)
+
+        assert CALLS == ["single", "single"]
+
+    def test_rerender_does_not_change_cached_files(self, tmp_path):
+        cache_dir = tmp_path / "plot_cache"
+        task = make_task(tmp_path, make_frame())
+        run_plot_tasks([task], False, 1, plot_cache_dir=cache_dir)
+        cached_file = next(cache_dir.glob("*/0.png"))
+        cached_bytes = cached_file.read_bytes()
+
+        # Same output path, other data: the linked output file is replaced, not overwritten
+        changed_df = make_frame()
+        changed_df["shots"] = [1, 2, 3]
+        run_plot_tasks([make_task(tmp_path, changed_df)], False, 1, plot_cache_dir=cache_dir)
+
+        assert cached_file.read_bytes() == cached_bytes
+
+    def test_tasks_sharing_a_name_are_cached_separately(self, tmp_path):
+        cache_dir = tmp_path / "plot_cache"
+        changed_df = make_frame()
+        changed_df["shots"] = [1, 2, 3]
+        first_dirs = [tmp_path / "first_a", tmp_path / "first_b"]
+        for output_dir in first_dirs:
+            output_dir.mkdir()
+        run_plot_tasks([make_task(first_dirs[0], make_frame()), make_task(first_dirs[1], changed_df)],
+                       False, 1, plot_cache_dir=cache_dir)
+
+        CALLS.clear()
+        second_dirs = [tmp_path / "second_a", tmp_path / "second_b"]
+        for output_dir in second_dirs:
+            output_dir.mkdir()
+        results, _ = run_plot_tasks([make_task(second_dirs[0], make_frame()), make_task(second_dirs[1], changed_df)],
+                                    False, 1, plot_cache_dir=cache_dir)
+
+        assert CALLS == []
+        for (_, _, paths, _, _), first_dir in zip(results, first_dirs):
+            rendered = first_dir / os.path.basename(paths[0])
+            assert open(paths[0], "rb").read() == rendered.read_bytes()
+
+    def test_without_cache_dir_every_plot_is_rendered(self, tmp_path):
+        for _ in range(2):
+            run_plot_tasks([make_task(tmp_path, make_frame())], False, 1)
+
+        assert CALLS == ["single", "single"]
+
+class TestEviction:
+
+    def fill(self, tmp_path, cache, count):
+        for i in range(count):
+            df = make_frame()
+            df["shots"] = i
+            task = make_task(tmp_path, df, timestamp=f"2024010{i}_0000")
+            run_plot_tasks([task], False, 1, plot_cache_dir=cache.cache_dir)
+        return sorted(cache.cache_dir.iterdir(), key=lambda d: (d / "entry.json").stat().st_mtime)
+
+    def test_evicts_old_entries(self, tmp_path):
+        cache = PlotRenderCache(tmp_path / "plot_cache", max_age_days=1)
+        entries = self.fill(tmp_path, cache, 2)
+        old = time.time() - 2 * 86400
+        os.utime(entries[0] / "entry.json", (old, old))
+
+        assert cache.evict() == 1
+        assert not entries[0].exists() and entries[1].exists()
+
+    def test_evicts_least_recently_used_above_size(self, tmp_path):
+        cache = PlotRenderCache(tmp_path / "plot_cache")
+        entries = self.fill(tmp_path, cache, 3)
+        entry_size = sum(f.stat().st_size for f in entries[0].iterdir())
+        cache.max_size_mb = 2.5 * entry_size / (1024 * 1024)
+
+        assert cache.evict() == 1
+        assert not entries[0].exists()
+        assert entries[1].exists() and entries[2].exists()
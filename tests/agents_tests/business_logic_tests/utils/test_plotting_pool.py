@@ -0,0 +1,95 @@
+# tests/agents_tests/business_logic_tests/utils/test_plotting_pool.py
+
+import os
+import pytest
+import pandas as pd
+
+from agents.dashboardBuilder.plotters.plotting_pool import (
+    PlottingPool, SharedFrame, run_shared_task, share_frames)
+from agents.dashboardBuilder.plotters.utils import execute_tasks_parallel
+
+def make_frame():
+    return pd.DataFrame({
+        "machineCode": ["M1", "M2", "M3"],
+        "shots": [100, 250, 0],
+        "date": pd.to_datetime(["2024-01-05", "2024-01-06", None]),
+    })
+
+# Module-level workers: picklable for the process pool
+def summarize_task(task):
+    name, (df, scale) = task
+    return True, name, (os.getpid(), int(df["shots"].sum()) * scale), "", 0.0
+
+def describe_task(task):
+    _, df = task
+    return type(df).__name__, df.columns.tolist(), df.dtypes.astype(str).tolist()
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    pool = PlottingPool(shared_dir=str(tmp_path))
+    monkeypatch.setattr("agents.dashboardBuilder.plotters.utils.get_plotting_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+class TestShareFrames:
+
+    def test_shared_frame_written_once(self, tmp_path):
+        df = make_frame()
+
+        shared = share_frames([("a", (df, 1)), ("b", (df, 2)), ("c", make_frame())], tmp_path)
+
+        assert isinstance(shared[0][1][0], SharedFrame)
+        assert shared[0][1][0] == shared[1][1][0]
+        assert shared[2][1] != shared[0][1][0]
+        assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+    def test_object_columns_are_passed_inline(self, tmp_path):
+        df = pd.DataFrame({"moldHist": [["M1"], []]})
+
+        shared = share_frames([("a", df)], tmp_path)
+
+        assert shared[0][1] is df
+        assert not list(tmp_path.iterdir())
+
+    def test_run_shared_task_resolves_frames(self, tmp_path):
+        df = make_frame()
+        shared = share_frames([("a", df)], tmp_path)
+
+        kind, columns, dtypes = run_shared_task(describe_task, shared[0])
+
+        assert kind == "DataFrame"
+        assert columns == df.columns.tolist()
+        assert dtypes == df.dtypes.astype(str).tolist()
+
+class TestPlottingPool:
+
+    def test_pool_is_reused_across_batches(self, pool):
+        df = make_frame()
+        tasks = [(f"plot_{i}", (df, i)) for i in range(4)]
+
+        first, failed = execute_tasks_parallel(tasks, summarize_task, max_workers=2)
+        executor = pool.start()
+        second, _ = execute_tasks_parallel(tasks, summarize_task, max_workers=2)
+
+        assert not failed
+        assert sorted(result[2][1] for result in first) == [0, 350, 700, 1050]
+        assert pool.start() is executor
+        # Same worker processes served both batches
+        assert {result[2][0] for result in second} <= {pid for pid in executor._processes}
+
+    def test_batch_files_removed(self, pool, tmp_path):
+        with pool.batch([("a", make_frame())], max_workers=1) as shared:
+            assert os.path.exists(shared[0][1].path)
+        assert not list(tmp_path.iterdir())
+
+    def test_pool_grows_when_idle(self, pool):
+        pool.start(1)
+        pool.start(2)
+
+        assert pool.max_workers == 2
+
+    def test_pool_keeps_workers_during_batch(self, pool):
+        pool.start(1)
+        with pool.batch([], max_workers=1):
+            pool.start(2)
+            assert pool.max_workers == 1
@@ -0,0 +1,149 @@
+# tests/agents_tests/business_logic_tests/utils/test_result_store.py
+
+import pytest
+import pandas as pd
+import pyarrow as pa
+
+from agents.result_store import (
+    export_result_excel, has_result_store, read_result, read_result_manifest,
+    result_manifest_path, result_sheet_digest, result_sheet_names, write_result_store)
+
+def make_result():
+    return {
+        "status": pd.DataFrame({
+            "poNo": ["PO1", "PO2", "PO3"],
+            "itemQuantity": [100, 250, 0],
+            "itemRemain": [10.5, None, 0.0],
+            "poETA": pd.to_datetime(["2024-01-05", None, "2024-02-01"]),
+            "moldHist": [["M1", "M2"], [], None],
+            "shotMap": [{"M1": 10, "M2": 3}, {}, None],
+        }),
+        "warnings": pd.DataFrame({"poNo": ["PO2"], "warningType": ["missing_eta"]}),
+    }
+
+COLUMN_TYPES = {"status": {"shotMap": pa.map_(pa.string(), pa.int64())}}
+
+@pytest.fixture
+def excel_path(tmp_path):
+    return tmp_path / "20240101_0000_test_result.xlsx"
+
+class TestResultStore:
+
+    def test_round_trip(self, excel_path):
+        data = make_result()
+        write_result_store(excel_path, data, COLUMN_TYPES)
+
+        loaded = read_result(excel_path, sheet_name=None)
+
+        assert list(loaded) == ["status", "warnings"]
+        status = loaded["status"]
+        assert status.columns.tolist() == data["status"].columns.tolist()
+        assert status["itemQuantity"].tolist() == [100, 250, 0]
+        assert status["poETA"].iloc[0] == pd.Timestamp("2024-01-05")
+        # Declared nested columns keep lists/dicts, others are stored as in Excel
+        assert status["shotMap"].tolist() == [{"M1": 10, "M2": 3}, {}, None]
+        assert status["moldHist"].tolist()[:2] == ["['M1', 'M2']", "[]"]
+        pd.testing.assert_frame_equal(loaded["warnings"], data["warnings"], check_dtype=False)
+
+    def test_matches_excel(self, excel_path):
+        data = make_result()
+        write_result_store(excel_path, data)
+        with pd.ExcelWriter(excel_path) as writer:
+            for sheet_name, df in data.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+        from_store = read_result(excel_path)
+        from_excel = pd.read_excel(excel_path)
+
+        # Excel reads empty cells back as NaN
+        pd.testing.assert_frame_equal(from_store.fillna(""), from_excel.fillna(""), check_dtype=False)
+
+    def test_sheet_selection(self, excel_path):
+        write_result_store(excel_path, make_result())
+
+        assert read_result(excel_path)["poNo"].tolist() == ["PO1", "PO2", "PO3"]
+        assert read_result(excel_path, 1)["warningType"].tolist() == ["missing_eta"]
+        assert list(read_result(excel_path, ["warnings"])) == ["warnings"]
+        assert result_sheet_names(excel_path) == ["status", "warnings"]
+
+        with pytest.raises(ValueError):
+            read_result(excel_path, "missing")
+        with pytest.raises(ValueError):
+            read_result(excel_path, 2)
+
+    def test_single_dataframe(self, excel_path):
+        df = make_result()["warnings"]
+        write_result_store(excel_path, df)
+
+        assert result_sheet_names(excel_path) == ["Sheet1"]
+        pd.testing.assert_frame_equal(read_result(excel_path), df, check_dtype=False)
+
+    def test_manifest_path_is_accepted(self, excel_path):
+        write_result_store(excel_path, make_result())
+        manifest_path = result_manifest_path(excel_path)
+
+        assert read_result_manifest(manifest_path)["result"] == excel_path.name
+        assert read_result(manifest_path, "warnings")["poNo"].tolist() == ["PO2"]
+
+    def test_mixed_type_column_is_stored_as_text(self, excel_path):
+        write_result_store(excel_path, pd.DataFrame({"value": [1, "x", None]}))
+
+        assert read_result(excel_path)["value"].tolist()[:2] == ["1", "x"]
+
+    def test_excel_only_result(self, excel_path):
+        df = make_result()["warnings"]
+        df.to_excel(excel_path, index=False)
+
+        assert not has_result_store(excel_path)
+        pd.testing.assert_frame_equal(read_result(excel_path), df, check_dtype=False)
+
+    def test_sheet_digest(self, excel_path):
+        write_result_store(excel_path, make_result(), COLUMN_TYPES)
+        next_path = excel_path.with_name("20240102_0000_test_result.xlsx")
+        changed = make_result()
+        changed["warnings"].loc[0, "warningType"] = "late"
+        write_result_store(next_path, changed, COLUMN_TYPES)
+
+        assert result_sheet_digest(next_path, "status") == result_sheet_digest(excel_path, "status")
+        assert result_sheet_digest(next_path, "warnings") != result_sheet_digest(excel_path, "warnings")
+        with pytest.raises(ValueError):
+            result_sheet_digest(excel_path, "missing")
+
+    def test_invalid_data(self, excel_path):
+        with pytest.raises(TypeError):
+            write_result_store(excel_path, {"sheet": [1, 2]})
+
+    def test_interrupted_save_leaves_no_store(self, excel_path, monkeypatch):
+        write_result_store(excel_path, make_result())
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr("agents.result_store.pq.write_table", fail)
+
+        with pytest.raises(OSError):
+            write_result_store(excel_path, make_result())
+        assert not has_result_store(excel_path)
+
+class TestExportResultExcel:
+
+    def test_lazy_export(self, excel_path):
+        data = make_result()
+        write_result_store(excel_path, data, COLUMN_TYPES)
+
+        exported = export_result_excel(result_manifest_path(excel_path))
+
+        assert exported == excel_path
+        sheets = pd.read_excel(excel_path, sheet_name=None)
+        assert list(sheets) == ["status", "warnings"]
+        assert sheets["status"]["shotMap"].iloc[0] == "{'M1': 10, 'M2': 3}"
+
+    def test_existing_excel_is_kept(self, excel_path):
+        write_result_store(excel_path, make_result())
+        excel_path.write_bytes(b"existing")
+
+        assert export_result_excel(excel_path) == excel_path
+        assert excel_path.read_bytes() == b"existing"
+
+    def test_missing_result(self, excel_path):
+        with pytest.raises(FileNotFoundError):
+            export_result_excel(excel_path)
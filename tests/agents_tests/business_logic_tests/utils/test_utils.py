@@ -2,6 +2,7 @@
 
 import pytest
 import pandas as pd
+import pyarrow as pa
 import json
 import shutil
 from pathlib import Path
@@ -16,6 +17,7 @@ from agents.utils import (
      load_annotation_path, read_change_log, extract_latest_saved_files,
      log_dict_as_table, get_latest_change_row, rank_nonzero
      )
+from agents.result_store import read_result, result_manifest_path
 
 class TestLoadJson:
     """Test suite for load_json function"""
@@ -422,6 +424,52 @@ class TestSaveOutputWithVersioning:
         
         assert "Saved new file" in result
 
+    def test_save_writes_result_store(self, tmp_path):
+        """Test result store is written next to the Excel file"""
+        df = pd.DataFrame({"A": [1, 2], "B": [[1], [2, 3]]})
+
+        result = save_output_with_versioning(
+            data={"values": df},
+            output_dir=tmp_path,
+            filename_prefix="test",
+            column_types={"values": {"B": pa.list_(pa.int64())}}
+        )
+
+        excel_path = next((tmp_path / "newest").glob("*.xlsx"))
+        assert f"Saved result store: {result_manifest_path(excel_path)}" in result
+        assert read_change_log_paths(result) == [str(excel_path)]
+        assert read_result(excel_path, "values")["B"].tolist() == [[1], [2, 3]]
+
+    def test_save_with_lazy_excel_export(self, tmp_path):
+        """Test lazy export only writes the result store"""
+        df = pd.DataFrame({"A": [1, 2]})
+
+        result = save_output_with_versioning(
+            data=df,
+            output_dir=tmp_path,
+            filename_prefix="test",
+            excel_export="lazy"
+        )
+
+        assert list((tmp_path / "newest").glob("*.xlsx")) == []
+        manifest_path = next((tmp_path / "newest").glob("*.manifest.json"))
+        assert read_change_log_paths(result) == [str(manifest_path)]
+        pd.testing.assert_frame_equal(read_result(manifest_path), df)
+
+    def test_save_invalid_excel_export(self, tmp_path):
+        """Test unknown export mode raises ValueError"""
+        with pytest.raises(ValueError, match="Excel export mode"):
+            save_output_with_versioning(
+                data=pd.DataFrame({"A": [1]}),
+                output_dir=tmp_path,
+                filename_prefix="test",
+                excel_export="never"
+            )
+
+
+def read_change_log_paths(export_log: str):
+    return extract_latest_saved_files(f"EXPORT LOG:\n{export_log}")
+
 
 class TestUpdateWeightAndSaveConfidenceReport:
     """Test suite for update_weight_and_save_confidence_report function"""
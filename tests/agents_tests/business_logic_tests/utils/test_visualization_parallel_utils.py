@@ -2,6 +2,7 @@
 import pytest
 import os
 import tempfile
+import json
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -20,7 +21,9 @@ from agents.dashboardBuilder.plotters.utils import (
     execute_tasks_parallel,
     execute_tasks_sequential,
     execute_tasks,
-    process_plot_results
+    process_plot_results,
+    load_render_profile,
+    RENDER_PROFILE_ENV
 )
 
 # ==================== FIXTURES ====================
@@ -485,6 +488,127 @@ class TestPlotSingleChart:
         assert kwargs_received["custom_param"] == "value"
         assert kwargs_received["another_param"] == 42
 
+# ==================== TEST RENDER PROFILES ====================
+
+class TestRenderProfiles:
+    """Test render profiles of plot_single_chart"""
+    
+    @staticmethod
+    def plot_func(data, visualization_config_path=None, **kwargs):
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.plot(data)
+        return fig
+    
+    def make_args(self, temp_dir, config_path=None, render_profile=None):
+        args = ([1, 2, 3], config_path, "profile_plot", self.plot_func,
+                os.path.join(temp_dir, "profile_plot.png"), "timestamp", {})
+        return args + (render_profile,) if render_profile else args
+    
+    def test_default_profile_is_preview(self, temp_dir, monkeypatch):
+        """Should save a 96 dpi PNG by default"""
+        monkeypatch.delenv(RENDER_PROFILE_ENV, raising=False)
+        
+        success, _, paths, _, _ = plot_single_chart(self.make_args(temp_dir))
+        
+        assert success is True
+        assert paths == [os.path.join(temp_dir, "profile_plot.png")]
+        with Image.open(paths[0]) as img:
+            assert img.size == (384, 288)
+    
+    def test_print_profile_saves_pdf(self, temp_dir):
+        """Should save a PDF when the task requests the print profile"""
+        success, _, paths, _, _ = plot_single_chart(self.make_args(temp_dir, render_profile="print"))
+        
+        assert success is True
+        assert paths == [os.path.join(temp_dir, "profile_plot.pdf")]
+        with open(paths[0], "rb") as f:
+            assert f.read(4) == b"%PDF"
+    
+    def test_env_variable_selects_profile(self, temp_dir, monkeypatch):
+        """Should use the profile named by the environment variable"""
+        monkeypatch.setenv(RENDER_PROFILE_ENV, "print")
+        
+        assert load_render_profile()["format"] == "pdf"
+        assert load_render_profile(render_profile="preview")["dpi"] == 96
+    
+    def test_config_overrides_profiles(self, temp_dir, monkeypatch):
+        """Should read profiles and the default profile from the visualization config"""
+        monkeypatch.delenv(RENDER_PROFILE_ENV, raising=False)
+        config_path = os.path.join(temp_dir, "visualization_config.json")
+        with open(config_path, "w") as f:
+            json.dump({"render_profile": "web",
+                       "render_profiles": {"web": {"format": "webp", "dpi": 72}}}, f)
+        
+        success, _, paths, _, _ = plot_single_chart(self.make_args(temp_dir, config_path))
+        
+        assert success is True
+        assert paths[0].endswith(".webp")
+        assert load_render_profile(config_path, "print")["dpi"] == 300
+    
+    def test_unknown_profile_fails_task(self, temp_dir):
+        """Should report an unknown profile as a failed plot"""
+        success, _, paths, error, _ = plot_single_chart(self.make_args(temp_dir, render_profile="poster"))
+        
+        assert success is False
+        assert paths == []
+        assert "Unknown render profile" in error
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestRenderProfileBenchmark:
+    """Micro-benchmark: per-plot render time and file size of each render profile"""
+
+    N_PLOTS = 5
+    PROFILES = {
+        # Former save_plot() options
+        "legacy": {"format": "png", "dpi": 300, "bbox_inches": "tight"},
+        "preview": {"format": "png", "dpi": 96, "bbox_inches": None, "pil_kwargs": {"compress_level": 1}},
+        "webp": {"format": "webp", "dpi": 96, "bbox_inches": None},
+        "print": {"format": "pdf", "dpi": 300, "bbox_inches": "tight", "pad_inches": 0.5},
+    }
+
+    @staticmethod
+    def plot_func(data, visualization_config_path=None, **kwargs):
+        # Dashboard-like figure: a grid of bar, line and scatter panels
+        fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+        for i, ax in enumerate(axes.flat):
+            if i % 3 == 0:
+                ax.bar(range(40), data[:40])
+            elif i % 3 == 1:
+                ax.plot(data)
+            else:
+                ax.scatter(data[:-1], data[1:], s=4)
+            ax.set_title(f"Panel {i + 1}")
+        return fig
+
+    def test_profiles(self, temp_dir):
+        config_path = os.path.join(temp_dir, "visualization_config.json")
+        with open(config_path, "w") as f:
+            json.dump({"render_profiles": self.PROFILES}, f)
+        data = [((i * 7919) % 1000) / 10 for i in range(2_000)]
+
+        report = {}
+        for name in self.PROFILES:
+            elapsed, size = 0.0, 0
+            for i in range(self.N_PLOTS):
+                args = (data, config_path, f"{name}_{i}", self.plot_func,
+                        os.path.join(temp_dir, f"{name}_{i}.png"), "timestamp", {}, name)
+                start = time.perf_counter()
+                success, _, paths, error, _ = plot_single_chart(args)
+                elapsed += time.perf_counter() - start
+                assert success is True, error
+                size += os.path.getsize(paths[0])
+            report[name] = (elapsed / self.N_PLOTS, size / self.N_PLOTS)
+
+        print("\nRender profile   time/plot   bytes/plot")
+        for name, (seconds, size) in report.items():
+            print(f"{name:<16} {seconds * 1000:7.0f} ms  {size:11,.0f}")
+
+        # Previews render faster and smaller than the former 300 dpi PNGs
+        assert report["preview"][0] < report["legacy"][0]
+        assert report["preview"][1] < report["legacy"][1]
+        assert report["webp"][1] < report["legacy"][1]
+
 # ==================== TEST EXECUTE_TASKS ====================
 
 class TestExecuteTasks:
@@ -0,0 +1,153 @@
+# tests/agents_tests/business_logic_tests/validators/test_warning_builder.py
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from agents.validationOrchestrator.dynamic_cross_data_validator import DynamicCrossDataValidator
+from agents.validationOrchestrator.static_cross_data_checker import StaticCrossDataChecker
+
+COMPOSITION_FIELDS = ['itemCode', 'itemName', 'plasticResinCode', 'plasticResin',
+                      'colorMasterbatchCode', 'colorMasterbatch',
+                      'additiveMasterbatchCode', 'additiveMasterbatch']
+
+def make_records(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    def strings(choices, missing=0.1):
+        values = rng.choice(choices, n_rows).astype(object)
+        values[rng.random(n_rows) < missing] = None
+        return pd.Series(values, dtype="string")
+
+    df = pd.DataFrame({
+        'recordDate': pd.Timestamp('2019-01-01') + pd.to_timedelta(rng.integers(0, 365, n_rows), 'D'),
+        'workingShift': strings(['1', '2', '3']),
+        'poNote': strings(['IM1901001', 'IM1901002', 'IM1901003']),
+        'machineNo': strings(['NO.01', 'NO.02']),
+        'machineCode': strings(['MD50S-000', 'EC50ST-000']),
+        'itemCode': strings(['10236M', '10237M']),
+        'itemName': strings(['AB-1', 'AB-2']),
+        'moldNo': strings(['10236M-001', '10237M-002']),
+        'machineTonnage': strings(['50', '100'], missing=0).astype(str),
+        'plasticResinCode': strings(['10045', '10046']),
+        'plasticResin': strings(['PP', 'ABS']),
+        'colorMasterbatchCode': strings(['20001'], missing=0.5),
+        'colorMasterbatch': strings(['RED'], missing=0.5),
+        'additiveMasterbatchCode': strings(['30001'], missing=0.8),
+        'additiveMasterbatch': strings(['UV'], missing=0.8),
+    })
+    df.loc[::13, 'recordDate'] = pd.NaT
+    return df
+
+#--------------------------------------------------#
+# Former per-row implementations (reference only)  #
+#--------------------------------------------------#
+def legacy_component_string(row):
+    parts = []
+    if pd.notna(row.get('plasticResin')) and pd.notna(row.get('plasticResinCode')):
+        parts.append(f"{row['plasticResinCode']}_{row['plasticResin']}")
+    else:
+        return pd.NA
+    if pd.notna(row.get('colorMasterbatch')) and pd.notna(row.get('colorMasterbatchCode')):
+        parts.append(f"{row['colorMasterbatchCode']}_{row['colorMasterbatch']}")
+    if pd.notna(row.get('additiveMasterbatch')) and pd.notna(row.get('additiveMasterbatchCode')):
+        parts.append(f"{row['additiveMasterbatchCode']}_{row['additiveMasterbatch']}")
+    return " | ".join(parts)
+
+def legacy_mold_warnings(df):
+    results = []
+    for _, row in df.iterrows():
+        record_date = row['recordDate'].strftime('%Y-%m-%d') if pd.notna(row['recordDate']) else 'N/A'
+        context_info = (f"{row['poNote']}, {record_date}, {row['workingShift']}, {row['machineNo']}, "
+                        f"{row['itemCode']}, {row['itemName']}, {row['moldNo']}")
+        mismatch_type = f"{row['moldNo']}_and_({row['itemCode']},{row['itemName']})_not_matched"
+        required_action = 'update_moldInfo_or_double_check_productRecords'
+        results.append({
+            'poNo': row['poNote'],
+            'warningType': 'item_mold_warnings',
+            'mismatchType': 'item_and_mold_not_matched',
+            'requiredAction': required_action,
+            'message': f"({context_info}) - Mismatch: {mismatch_type}. Please {required_action}",
+        })
+    return pd.DataFrame(results)
+
+def legacy_composition_warnings(df, df_name):
+    results = []
+    for _, row in df.iterrows():
+        context_info = f"{row['poNo']}"
+        detail_info = ", ".join([row[field] if pd.notna(row[field]) else '' for field in COMPOSITION_FIELDS])
+        required_action = f'update_itemCompositionSummary_or_double_check_{df_name}'
+        results.append({
+            'poNo': row['poNo'],
+            'warningType': 'composition_warnings',
+            'mismatchType': 'item_composition_not_matched',
+            'requiredAction': required_action,
+            'message': f"({context_info}) - Mismatch: {detail_info}_not_matched - Please: {required_action}",
+        })
+    return pd.DataFrame(results)
+
+class TestColumnarWarnings:
+
+    @pytest.fixture
+    def records(self):
+        return make_records(2_000)
+
+    def test_component_string_matches_row_version(self, records):
+        expected = records.apply(legacy_component_string, axis=1)
+        pd.testing.assert_series_equal(DynamicCrossDataValidator._build_component_string(records), expected)
+
+    def test_mold_warnings_match_row_version(self, records):
+        pd.testing.assert_frame_equal(DynamicCrossDataValidator._process_mold_warnings(records),
+                                      legacy_mold_warnings(records))
+
+    def test_composition_warnings_match_row_version(self, records):
+        po_records = records.rename(columns={'poNote': 'poNo'})
+        pd.testing.assert_frame_equal(
+            StaticCrossDataChecker._process_composition_warnings(po_records, 'purchaseOrders', COMPOSITION_FIELDS),
+            legacy_composition_warnings(po_records, 'purchaseOrders'))
+
+    def test_static_missing_date_still_fails(self, records):
+        po_records = records.rename(columns={'poNote': 'poNo'})
+        with pytest.raises(ValueError):
+            StaticCrossDataChecker._process_item_warnings(po_records, 'productRecords')
+
+    def test_convert_results_stacks_categories(self, records):
+        results = {
+            'invalid_warnings': {'invalid_item': []},
+            'mismatch_warnings': {
+                'item_warnings': DynamicCrossDataValidator._process_item_warnings(records.head(3)),
+                'item_mold_warnings': DynamicCrossDataValidator._process_mold_warnings(records.head(2)),
+            },
+        }
+        mismatch_df = DynamicCrossDataValidator._convert_results(results)['mismatch_warnings']
+
+        assert len(mismatch_df) == 5
+        assert mismatch_df['warningType'].tolist() == ['item_warnings'] * 3 + ['item_mold_warnings'] * 2
+
+@pytest.fixture(scope="module")
+def large_records():
+    records = make_records(TestWarningBenchmark.N_ROWS, seed=1)
+    records['item_composition'] = DynamicCrossDataValidator._build_component_string(records)
+    return records
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestWarningBenchmark:
+    """Micro-benchmark: columnar warning generation on 1M mismatched records"""
+
+    N_ROWS = 1_000_000
+
+    def test_one_million_rows(self, large_records):
+        start = time.perf_counter()
+        warnings_df = DynamicCrossDataValidator._process_composition_warnings(large_records)
+        elapsed = time.perf_counter() - start
+
+        assert len(warnings_df) == self.N_ROWS
+        # The former iterrows() loop needed minutes for this input
+        assert elapsed < 30
+
+        sample = large_records.sample(1_000, random_state=0)
+        pd.testing.assert_series_equal(
+            DynamicCrossDataValidator._build_component_string(sample),
+            sample.apply(legacy_component_string, axis=1))
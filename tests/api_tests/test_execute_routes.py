@@ -0,0 +1,101 @@
+# tests/api_tests/test_execute_routes.py
+
+import time
+import threading
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_job_scheduler, get_orchestrator
+from api.job_scheduler import JobScheduler, is_job_finished
+from api.routes import execute
+
+class FakeRecord:
+    def __init__(self, execution_id):
+        self.execution_id = execution_id
+        self.status = "success"
+        self.summary = {"modules": {"M1": "success"}}
+
+class FakeOrchestrator:
+    """Runs instantly; the viz data of each run stays pending until published"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.viz_status = {}
+        self._lock = threading.Lock()
+
+    def list_workflows(self):
+        return ["wf1", "wf2"]
+
+    def execute(self, workflow_name):
+        execution_id = f"run-{workflow_name}"
+        self.viz_status[execution_id] = "pending"
+        return FakeRecord(execution_id)
+
+    def get_viz_status(self, execution_id):
+        return self.viz_status.get(execution_id, "unknown")
+
+    def on_viz_published(self, execution_id, listener):
+        with self._lock:
+            self.listeners[execution_id] = listener
+
+    def publish(self, execution_id):
+        self.viz_status[execution_id] = "ok"
+        self.listeners.pop(execution_id)("ok")
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise TimeoutError
+        time.sleep(0.01)
+
+@pytest.fixture
+def orchestrator():
+    return FakeOrchestrator()
+
+@pytest.fixture
+def client(tmp_path, orchestrator):
+    scheduler = JobScheduler(execute.make_workflow_runner(orchestrator),
+                             db_path=tmp_path / "jobs.sqlite", max_workers=1)
+    app = FastAPI()
+    app.include_router(execute.router)
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+    app.dependency_overrides[get_job_scheduler] = lambda: scheduler
+    with TestClient(app) as client:
+        yield client
+    scheduler.shutdown()
+
+class TestExecuteRoutes:
+
+    def test_pending_viz_does_not_hold_the_worker(self, client, orchestrator):
+        first = client.post("/api/execute/wf1").json()
+        # The single worker is free again while wf1's viz data is still pending
+        second = client.post("/api/execute/wf2").json()
+        wait_for(lambda: len(orchestrator.listeners) == 2)
+
+        job = client.get(f"/api/execute/{first['job_id']}/status").json()
+        assert job["status"] == "success" and job["viz_status"] == "pending"
+        assert not is_job_finished(job)
+
+        orchestrator.publish("run-wf1")
+        job = client.get(f"/api/execute/{first['job_id']}/status").json()
+        assert job["viz_status"] == "ok" and is_job_finished(job)
+        assert not is_job_finished(client.get(f"/api/execute/{second['job_id']}/status").json())
+
+    def test_events_end_after_viz_is_published(self, client, orchestrator):
+        job = client.post("/api/execute/wf1").json()
+        wait_for(lambda: "run-wf1" in orchestrator.listeners)
+        threading.Timer(0.3, orchestrator.publish, args=("run-wf1",)).start()
+
+        with client.stream("GET", f"/api/execute/{job['job_id']}/events") as response:
+            body = "".join(response.iter_text())
+
+        assert '"viz_status": "pending"' in body
+        assert '"viz_status": "ok"' in body
+        assert body.endswith("event: end\ndata: {}\n\n")
+
+    def test_unknown_workflow(self, client):
+        assert client.post("/api/execute/missing").status_code == 404
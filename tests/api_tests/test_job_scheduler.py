@@ -0,0 +1,185 @@
+# tests/api_tests/test_job_scheduler.py
+
+import time
+import sqlite3
+import threading
+import pytest
+
+from api.job_scheduler import JobScheduler, is_job_finished
+
+class BlockingRunner:
+    """Runs until released; records the workflows it ran"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, workflow_name, report):
+        with self._lock:
+            self.calls.append(workflow_name)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.started.set()
+        try:
+            self.release.wait(5)
+            if workflow_name == "broken":
+                raise RuntimeError("module crashed")
+            report(status="success", modules={"M1": "success"}, execution_id="run1")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+def wait_finished(scheduler, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = scheduler.get_job(job_id)
+        if is_job_finished(job):
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+@pytest.fixture
+def runner():
+    runner = BlockingRunner()
+    yield runner
+    runner.release.set()
+
+@pytest.fixture
+def scheduler(tmp_path, runner):
+    scheduler = JobScheduler(runner, db_path=tmp_path / "jobs.sqlite", max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+class TestJobScheduler:
+
+    def test_job_lifecycle(self, scheduler, runner):
+        job, coalesced = scheduler.submit("wf")
+        assert not coalesced and job["status"] == "pending"
+        runner.release.set()
+
+        job = wait_finished(scheduler, job["job_id"])
+
+        assert job["status"] == "success"
+        assert job["modules"] == {"M1": "success"}
+        assert job["execution_id"] == "run1"
+        assert job["started_at"] <= job["finished_at"]
+
+    def test_identical_requests_are_coalesced(self, scheduler, runner):
+        first, _ = scheduler.submit("wf")
+        runner.started.wait(5)
+        second, coalesced = scheduler.submit("wf")
+        assert coalesced and second["job_id"] == first["job_id"]
+        assert second["requests"] == 2
+
+        runner.release.set()
+        wait_finished(scheduler, first["job_id"])
+        assert runner.calls == ["wf"]
+
+        # A request after the job finished starts a new run
+        third, coalesced = scheduler.submit("wf")
+        assert not coalesced and third["job_id"] != first["job_id"]
+        wait_finished(scheduler, third["job_id"])
+        assert runner.calls == ["wf", "wf"]
+
+    def test_worker_pool_is_bounded(self, scheduler, runner):
+        jobs = [scheduler.submit(f"wf{i}")[0] for i in range(4)]
+        time.sleep(0.1)
+
+        assert [scheduler.get_job(j["job_id"])["status"] for j in jobs].count("running") == 2
+        runner.release.set()
+        for job in jobs:
+            wait_finished(scheduler, job["job_id"])
+        assert runner.max_active == 2
+
+    def test_runner_error_fails_job(self, scheduler, runner):
+        runner.release.set()
+        job, _ = scheduler.submit("broken")
+
+        job = wait_finished(scheduler, job["job_id"])
+
+        assert job["status"] == "failed"
+        assert job["error"] == "module crashed"
+
+    def test_settling_job_releases_its_worker(self, tmp_path):
+        finishers = {}
+
+        def runner(workflow_name, report):
+            report(status="success", viz_status="pending")
+            return lambda finish: finishers.setdefault(workflow_name, finish)
+
+        scheduler = JobScheduler(runner, db_path=tmp_path / "jobs.sqlite", max_workers=1)
+        try:
+            first, _ = scheduler.submit("wf1")
+            second, _ = scheduler.submit("wf2")
+            deadline = time.time() + 5
+            while len(finishers) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+
+            # Both ran on the single worker; neither is finished before settling
+            assert set(finishers) == {"wf1", "wf2"}
+            assert not is_job_finished(scheduler.get_job(first["job_id"]))
+
+            finishers["wf1"]()
+            job = scheduler.get_job(first["job_id"])
+            assert job["status"] == "success" and is_job_finished(job)
+            assert not is_job_finished(scheduler.get_job(second["job_id"]))
+        finally:
+            scheduler.shutdown()
+
+class TestPersistence:
+
+    def test_jobs_survive_restart(self, tmp_path, runner):
+        db_path = tmp_path / "jobs.sqlite"
+        runner.release.set()
+        scheduler = JobScheduler(runner, db_path=db_path)
+        job, _ = scheduler.submit("wf")
+        wait_finished(scheduler, job["job_id"])
+        scheduler.shutdown()
+
+        reopened = JobScheduler(runner, db_path=db_path)
+        try:
+            assert reopened.get_job(job["job_id"])["modules"] == {"M1": "success"}
+        finally:
+            reopened.shutdown()
+
+    def test_interrupted_jobs_are_failed(self, tmp_path, runner):
+        db_path = tmp_path / "jobs.sqlite"
+        scheduler = JobScheduler(runner, db_path=db_path)
+        job, _ = scheduler.submit("wf")
+        runner.started.wait(5)
+        # Simulate a crash: the state file is left with a running job
+        snapshot = tmp_path / "crashed.sqlite"
+        with sqlite3.connect(str(snapshot)) as dst:
+            scheduler._db.backup(dst)
+        runner.release.set()
+        scheduler.shutdown()
+
+        reopened = JobScheduler(runner, db_path=snapshot)
+        try:
+            job = reopened.get_job(job["job_id"])
+            assert job["status"] == "failed" and is_job_finished(job)
+            # No active job left: a new request is not coalesced onto it
+            assert not reopened.submit("wf")[1]
+        finally:
+            reopened.shutdown()
+
+    def test_old_jobs_expire(self, tmp_path, runner):
+        db_path = tmp_path / "jobs.sqlite"
+        runner.release.set()
+        scheduler = JobScheduler(runner, db_path=db_path, ttl_hours=1)
+        job, _ = scheduler.submit("wf")
+        wait_finished(scheduler, job["job_id"])
+        with scheduler._db:
+            scheduler._db.execute("UPDATE jobs SET finished_at = ?", (time.time() - 7200,))
+        scheduler.shutdown()
+
+        reopened = JobScheduler(runner, db_path=db_path, ttl_hours=1)
+        try:
+            assert reopened.get_job(job["job_id"]) is None
+            assert reopened._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+        finally:
+            reopened.shutdown()
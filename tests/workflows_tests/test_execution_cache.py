@@ -0,0 +1,274 @@
+# tests/workflows_tests/test_execution_cache.py
+
+import json
+import time
+import pytest
+import pandas as pd
+from pathlib import Path
+from unittest.mock import Mock
+
+from agents.database_loader import load_database
+from agents.dataPipelineOrchestrator.configs.partitioned_dataset import write_partitioned_dataset
+from modules.base_module import ModuleResult
+from workflows.cache.execution_cache import ExecutionCache, compute_fingerprint
+from workflows.executor import WorkflowExecutor
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakeModule:
+    """Minimal picklable-friendly module stand-in with deterministic attributes"""
+
+    MODULE_VERSION = "1"
+
+    def __init__(self, name, inputs, config=None, status="success", outputs=None):
+        self.module_name = name
+        self.config = config or {"key": "value"}
+        self.dependencies = {}
+        self.cache_outputs = outputs or []
+        self._inputs = inputs
+        self.status = status
+        self.calls = 0
+
+    @property
+    def cache_inputs(self):
+        return self._inputs
+
+    def safe_execute(self):
+        self.calls += 1
+        return ModuleResult(status=self.status, data={"run": self.calls}, message=self.status)
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "source.txt"
+    path.write_text("v1")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExecutionCache(cache_dir=str(tmp_path / "cache"))
+
+
+# ============================================================================
+# FINGERPRINT TESTS
+# ============================================================================
+
+class TestFingerprint:
+
+    def test_stable_for_unchanged_inputs(self, source_file):
+        module = FakeModule("M", [str(source_file)])
+        assert compute_fingerprint(module) == compute_fingerprint(module)
+
+    def test_changes_with_file_content(self, source_file):
+        module = FakeModule("M", [str(source_file)])
+        before = compute_fingerprint(module)
+        source_file.write_text("v2")
+        assert compute_fingerprint(module) != before
+
+    def test_changes_with_config_and_version(self, source_file):
+        module = FakeModule("M", [str(source_file)])
+        before = compute_fingerprint(module)
+        module.config = {"key": "other"}
+        assert compute_fingerprint(module) != before
+        module.config = {"key": "value"}
+        module.MODULE_VERSION = "2"
+        assert compute_fingerprint(module) != before
+
+    def test_annotations_expand_to_referenced_files(self, tmp_path):
+        parquet = tmp_path / "productRecords.parquet"
+        parquet.write_bytes(b"a")
+        annotations = tmp_path / "path_annotations.json"
+        annotations.write_text(json.dumps({"productRecords": str(parquet)}))
+
+        module = FakeModule("M", [str(annotations)])
+        before = compute_fingerprint(module)
+        parquet.write_bytes(b"ab")
+        assert compute_fingerprint(module) != before
+
+    def test_annotations_expand_partitioned_datasets(self, tmp_path):
+        dataset = tmp_path / "20240101_0000_productRecords.parquet"
+        df = pd.DataFrame({
+            "recordDate": pd.to_datetime(["2024-01-05", "2024-02-03", None]),
+            "itemCode": ["I1", "I2", "I3"],
+        })
+        write_partitioned_dataset(dataset, df, "productRecords", "recordDate")
+        annotations = tmp_path / "path_annotations.json"
+        annotations.write_text(json.dumps({"productRecords": str(dataset)}))
+
+        module = FakeModule("M", [str(annotations)])
+        before = compute_fingerprint(module)
+
+        # Arrow mirrors written by the loader do not change the fingerprint
+        load_database(dataset, backend="arrow")
+        assert compute_fingerprint(module) == before
+
+        df.loc[0, "itemCode"] = "I9"
+        write_partitioned_dataset(dataset, df, "productRecords", "recordDate")
+        assert compute_fingerprint(module) != before
+
+
+# ============================================================================
+# CACHE STORAGE TESTS
+# ============================================================================
+
+class TestExecutionCache:
+
+    def test_put_get_and_counters(self, cache):
+        result = ModuleResult(status="success", data={"a": 1}, message="ok")
+        assert cache.get("abc") is None
+        assert cache.put("abc", "M", result)
+
+        cached = cache.get("abc")
+        assert cached.data == {"a": 1}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_failed_results_not_stored(self, cache):
+        assert not cache.put("abc", "M", ModuleResult(status="failed", data=None, message="x"))
+        assert cache.stats()["entries"] == 0
+
+    def test_persists_across_instances(self, tmp_path):
+        first = ExecutionCache(cache_dir=str(tmp_path / "cache"))
+        first.put("abc", "M", ModuleResult(status="success", data=1, message="ok"))
+
+        second = ExecutionCache(cache_dir=str(tmp_path / "cache"))
+        assert second.get("abc").data == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ExecutionCache(cache_dir=str(tmp_path / "cache"), max_entries=2)
+        for key in ["a", "b"]:
+            cache.put(key, "M", ModuleResult(status="success", data=key, message="ok"))
+            time.sleep(0.01)
+        cache.get("a")  # "b" becomes least recently used
+        cache.put("c", "M", ModuleResult(status="success", data="c", message="ok"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ExecutionCache(cache_dir=str(tmp_path / "cache"), ttl_seconds=0.01)
+        cache.put("a", "M", ModuleResult(status="success", data=1, message="ok"))
+        time.sleep(0.05)
+        assert cache.get("a") is None
+
+    def test_hits_defer_index_writes(self, tmp_path):
+        cache = ExecutionCache(cache_dir=str(tmp_path / "cache"))
+        cache.put("a", "M", ModuleResult(status="success", data=1, message="ok"))
+        index_path = tmp_path / "cache" / "index.json"
+        written = index_path.read_text()
+
+        for _ in range(5):
+            cache.get("a")
+        assert index_path.read_text() == written
+
+        cache.flush()
+        last_access = json.loads(index_path.read_text())["a"]["last_access"]
+        assert last_access > json.loads(written)["a"]["last_access"]
+
+    def test_missing_outputs_are_a_miss(self, cache, tmp_path):
+        output = tmp_path / "change_log.txt"
+        output.write_text("log")
+        cache.put("a", "M", ModuleResult(status="success", data=1, message="ok"))
+
+        assert cache.get("a", [str(output)]) is not None
+        output.unlink()
+        assert cache.get("a", [str(output)]) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_invalidate_by_module(self, cache):
+        cache.put("a", "M1", ModuleResult(status="success", data=1, message="ok"))
+        cache.put("b", "M2", ModuleResult(status="success", data=2, message="ok"))
+        assert cache.invalidate("M1") == 1
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+
+# ============================================================================
+# EXECUTOR INTEGRATION TESTS
+# ============================================================================
+
+class TestExecutorWithResultCache:
+
+    @pytest.fixture
+    def workflow_dir(self, tmp_path):
+        workflows = tmp_path / "workflows"
+        workflows.mkdir()
+        (workflows / "wf.json").write_text(json.dumps({
+            "modules": [{"module": "M", "required": True, "dependency_policy": None}]
+        }))
+        return str(workflows)
+
+    def _executor(self, workflow_dir, module, cache_dir):
+        registry = Mock()
+        registry.get_module_instance.return_value = module
+        return WorkflowExecutor(
+            registry=registry,
+            workflows_dir=workflow_dir,
+            result_cache=ExecutionCache(cache_dir=cache_dir)
+        )
+
+    def test_hit_across_restarts(self, tmp_path, workflow_dir, source_file):
+        module = FakeModule("M", [str(source_file)])
+        cache_dir = str(tmp_path / "cache")
+
+        self._executor(workflow_dir, module, cache_dir).execute("wf")
+        result = self._executor(workflow_dir, module, cache_dir).execute("wf")
+
+        assert result.is_success()
+        assert module.calls == 1
+
+    def test_miss_when_input_changes(self, tmp_path, workflow_dir, source_file):
+        module = FakeModule("M", [str(source_file)])
+        executor = self._executor(workflow_dir, module, str(tmp_path / "cache"))
+
+        executor.execute("wf")
+        source_file.write_text("v2")
+        result = executor.execute("wf")
+
+        assert result.results["M"]["data"] == {"run": 2}
+        assert module.calls == 2
+
+    def test_fingerprint_error_runs_module(self, tmp_path, workflow_dir, source_file, monkeypatch):
+        module = FakeModule("M", [str(source_file)])
+        executor = self._executor(workflow_dir, module, str(tmp_path / "cache"))
+
+        def fail(module_instance):
+            raise PermissionError("input not readable")
+        monkeypatch.setattr(executor.result_cache, "fingerprint", fail)
+
+        result = executor.execute("wf")
+
+        assert result.is_success()
+        assert module.calls == 1
+        assert executor.result_cache.stats()["entries"] == 0
+
+    def test_deleted_outputs_rerun_module(self, tmp_path, workflow_dir, source_file):
+        output = tmp_path / "shared_db" / "change_log.txt"
+        output.parent.mkdir()
+        module = FakeModule("M", [str(source_file)], outputs=[str(output)])
+        original_execute = module.safe_execute
+
+        def execute_and_write():
+            output.write_text("log")
+            return original_execute()
+        module.safe_execute = execute_and_write
+        executor = self._executor(workflow_dir, module, str(tmp_path / "cache"))
+
+        executor.execute("wf")
+        executor.execute("wf")
+        assert module.calls == 1
+
+        # Outputs cleaned up: the cached result is not reused
+        output.unlink()
+        result = executor.execute("wf")
+
+        assert result.results["M"]["data"] == {"run": 2}
+        assert output.exists()
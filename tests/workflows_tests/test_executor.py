@@ -1060,4 +1060,135 @@ class TestEdgeCases:
         result = executor.execute("no_deps")
         
         assert result.is_success()
-        assert result.results["IndependentModule"]["status"] == "success"
\ No newline at end of file
+        assert result.results["IndependentModule"]["status"] == "success"
+
+# ============================================================================
+# PARALLEL (DAG) EXECUTION TESTS
+# ============================================================================
+
+class TestParallelExecution:
+    """Test DAG-parallel execution mode"""
+
+    @staticmethod
+    def _make_module(dependencies, status="success", delay=0.0, events=None, name=None):
+        import time
+
+        module = Mock()
+        module.dependencies = dependencies
+
+        def _run():
+            if events is not None:
+                events.append(("start", name))
+            time.sleep(delay)
+            if events is not None:
+                events.append(("end", name))
+            return ModuleResult(status=status, data=None, message=status)
+
+        module.safe_execute.side_effect = _run
+        return module
+
+    @pytest.fixture
+    def diamond_workflow(self):
+        return {
+            "execution_mode": "parallel",
+            "modules": [
+                {"module": "Pipeline", "required": True, "dependency_policy": "strict"},
+                {"module": "Validation", "required": True, "dependency_policy": "strict"},
+                {"module": "Analytics", "required": True, "dependency_policy": "strict"},
+                {"module": "Tracking", "required": True, "dependency_policy": "strict"},
+            ]
+        }
+
+    def test_invalid_execution_mode(self, mock_registry, workflows_dir):
+        with pytest.raises(ValueError, match="Unknown execution_mode"):
+            WorkflowExecutor(registry=mock_registry, workflows_dir=workflows_dir,
+                             execution_mode="random")
+
+    def test_independent_modules_run_concurrently(
+        self, executor, mock_registry, create_workflow_file, diamond_workflow
+    ):
+        events = []
+        modules = {
+            "Pipeline": self._make_module({}, events=events, name="Pipeline"),
+            "Validation": self._make_module({"Pipeline": "p"}, events=events, name="Validation"),
+            "Analytics": self._make_module({"Validation": "v"}, delay=0.2, events=events, name="Analytics"),
+            "Tracking": self._make_module({"Validation": "v"}, delay=0.2, events=events, name="Tracking"),
+        }
+        mock_registry.get_module_instance.side_effect = lambda name, cfg: modules[name]
+        create_workflow_file("diamond", diamond_workflow)
+
+        result = executor.execute("diamond")
+
+        assert result.is_success()
+        # Workflow order is preserved in the response
+        assert list(result.results.keys()) == ["Pipeline", "Validation", "Analytics", "Tracking"]
+        # Upstream modules finish before downstream modules start
+        assert events.index(("end", "Validation")) < events.index(("start", "Analytics"))
+        # Both leaves start before either of them ends
+        first_end = min(events.index(("end", "Analytics")), events.index(("end", "Tracking")))
+        assert events.index(("start", "Analytics")) < first_end
+        assert events.index(("start", "Tracking")) < first_end
+
+    def test_required_failure_stops_downstream(
+        self, executor, mock_registry, create_workflow_file, diamond_workflow
+    ):
+        modules = {
+            "Pipeline": self._make_module({}),
+            "Validation": self._make_module({"Pipeline": "p"}, status="failed"),
+            "Analytics": self._make_module({"Validation": "v"}),
+            "Tracking": self._make_module({"Validation": "v"}),
+        }
+        mock_registry.get_module_instance.side_effect = lambda name, cfg: modules[name]
+        create_workflow_file("diamond_fail", diamond_workflow)
+
+        result = executor.execute("diamond_fail")
+
+        assert result.is_failed()
+        assert "Module Validation failed" in result.message
+        assert "Analytics" not in result.results
+        modules["Analytics"].safe_execute.assert_not_called()
+        modules["Tracking"].safe_execute.assert_not_called()
+
+    def test_dependency_policy_still_applied(
+        self, executor, mock_registry, create_workflow_file
+    ):
+        workflow = {
+            "execution_mode": "parallel",
+            "modules": [
+                {"module": "Orphan", "required": False, "dependency_policy": "strict"},
+                {"module": "Standalone", "required": False, "dependency_policy": "strict"},
+            ]
+        }
+        modules = {
+            "Orphan": self._make_module({"MissingModule": "/nonexistent"}),
+            "Standalone": self._make_module({}),
+        }
+        mock_registry.get_module_instance.side_effect = lambda name, cfg: modules[name]
+        create_workflow_file("policy", workflow)
+
+        result = executor.execute("policy")
+
+        assert result.is_success()
+        assert result.results["Orphan"]["status"] == "skipped"
+        assert result.results["Standalone"]["status"] == "success"
+        modules["Orphan"].safe_execute.assert_not_called()
+
+    def test_circular_dependencies_rejected(
+        self, executor, mock_registry, create_workflow_file
+    ):
+        workflow = {
+            "execution_mode": "parallel",
+            "modules": [
+                {"module": "A", "required": True, "dependency_policy": None},
+                {"module": "B", "required": True, "dependency_policy": None},
+            ]
+        }
+        modules = {
+            "A": self._make_module({"B": "b"}),
+            "B": self._make_module({"A": "a"}),
+        }
+        mock_registry.get_module_instance.side_effect = lambda name, cfg: modules[name]
+        create_workflow_file("cycle", workflow)
+
+        with pytest.raises(ValueError, match="Circular module dependencies"):
+            executor.execute("cycle")
@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import threading
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
 
@@ -805,6 +806,122 @@ class TestCacheManagement:
         assert len(stats['execution']) == 0
 
 
+# ============================================================================
+# VIZ EXTRACTION TESTS
+# ============================================================================
+
+class TestVizExtraction:
+    """Test background, incremental viz extraction"""
+
+    @staticmethod
+    def success_result():
+        return WorkflowExecutorResult(
+            execution_id="abc123",
+            workflow_name="workflow1",
+            status="success",
+            message="Completed"
+        )
+
+    @patch('optiMoldMaster.opti_mold_master.WorkflowExecutor')
+    def test_run_returned_before_viz_is_ready(
+        self,
+        MockWorkflowExecutor,
+        orchestrator_with_workflows
+    ):
+        """Run record is returned while viz extraction is pending, then filled in"""
+        MockWorkflowExecutor.return_value.execute.return_value = self.success_result()
+        release = threading.Event()
+
+        def slow_process_viz_data(workflow_name, viz_data_paths):
+            release.wait(timeout=10)
+            return {"Agent": {"sheet": [{"a": 1}]}}
+
+        orc = orchestrator_with_workflows
+        with patch.object(orc, "_get_data_paths", return_value={"Module1": Path("result.xlsx")}), \
+             patch.object(orc, "_process_viz_data", side_effect=slow_process_viz_data):
+            record = orc.execute("workflow1")
+
+            assert record.viz_data is None
+            assert orc.get_viz_status(record.execution_id) == "pending"
+
+            release.set()
+            viz = orc.wait_for_viz(record.execution_id, timeout=10)
+
+        assert viz == {"Agent": {"sheet": [{"a": 1}]}}
+        assert record.viz_data == viz
+        assert orc.get_viz_data("workflow1") == viz
+        assert orc.get_cache_stats()["viz"] == {"workflow1": "ok"}
+
+    @patch('optiMoldMaster.opti_mold_master.WorkflowExecutor')
+    def test_sync_viz_extraction(
+        self,
+        MockWorkflowExecutor,
+        mock_module_registry,
+        workflows_dir,
+        sample_workflows
+    ):
+        """async_viz=False extracts viz before returning the run record"""
+        MockWorkflowExecutor.return_value.execute.return_value = self.success_result()
+        orc = OptiMoldIQ(
+            module_registry=mock_module_registry,
+            workflows_dir=str(workflows_dir),
+            async_viz=False
+        )
+
+        with patch.object(orc, "_get_data_paths", return_value={"Module1": Path("result.xlsx")}), \
+             patch.object(orc, "_process_viz_data", return_value={"Agent": {}}):
+            record = orc.execute("workflow1")
+
+        assert record.viz_data == {"Agent": {}}
+
+    @patch('optiMoldMaster.opti_mold_master.WorkflowExecutor')
+    def test_failed_viz_extraction(
+        self,
+        MockWorkflowExecutor,
+        orchestrator_with_workflows
+    ):
+        """Extraction errors leave the run without viz data"""
+        MockWorkflowExecutor.return_value.execute.return_value = self.success_result()
+        orc = orchestrator_with_workflows
+
+        with patch.object(orc, "_get_data_paths", return_value={"Module1": Path("result.xlsx")}), \
+             patch.object(orc, "_process_viz_data", side_effect=KeyError("sheet")):
+            record = orc.execute("workflow1")
+            viz = orc.wait_for_viz(record.execution_id, timeout=10)
+
+        assert viz is None
+        assert orc.get_viz_status(record.execution_id) == "failed/empty"
+
+    def test_unchanged_sheets_are_reused(self, mock_module_registry, workflows_dir, tmp_path):
+        """Sheets with unchanged content are not read again"""
+        import pandas as pd
+        from agents.result_store import read_result, write_result_store
+
+        orc = OptiMoldIQ(
+            module_registry=mock_module_registry,
+            workflows_dir=str(workflows_dir),
+            sheet_name_params={"Module1": {"AgentA": ["records", "warnings"]}}
+        )
+        records = pd.DataFrame({"poNo": ["PO1", "PO2"], "shots": [10, 20],
+                                "date": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+
+        first_path = tmp_path / "newest" / "20240101_0000_agent_a_result.xlsx"
+        first_path.parent.mkdir()
+        write_result_store(first_path, {"records": records, "warnings": pd.DataFrame({"note": ["a"]})})
+        first = orc._process_viz_data("workflow1", {"Module1": {"AgentA": first_path}})
+
+        second_path = first_path.with_name("20240102_0000_agent_a_result.xlsx")
+        write_result_store(second_path, {"records": records.copy(), "warnings": pd.DataFrame({"note": ["b"]})})
+        with patch('optiMoldMaster.opti_mold_master.read_result', wraps=read_result) as mock_read:
+            second = orc._process_viz_data("workflow1", {"Module1": {"AgentA": second_path}})
+
+        assert [c.kwargs["sheet_name"] for c in mock_read.call_args_list] == ["warnings"]
+        assert list(second["AgentA"]) == ["records", "warnings"]
+        assert second["AgentA"]["records"] == first["AgentA"]["records"]
+        assert second["AgentA"]["records"][0]["date"] == "2024-01-01"
+        assert second["AgentA"]["warnings"] == [{"note": "b"}]
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -891,6 +1008,46 @@ class TestOrchestratorIntegration:
         assert "valid" in orchestrator.list_workflows()
 
 
+# ============================================================================
+# VIZ PUBLICATION TESTS
+# ============================================================================
+
+class TestVizListeners:
+    """Test callbacks on the viz data of a run"""
+
+    def test_listener_waits_for_pending_viz(self, orchestrator):
+        """Should call the listener when the pending viz data is published"""
+        release = threading.Event()
+        orchestrator._viz_futures["run1"] = orchestrator._viz_executor.submit(release.wait, 5)
+        statuses = []
+
+        orchestrator.on_viz_published("run1", statuses.append)
+        assert statuses == []
+
+        orchestrator._publish_viz("run1", {"sheet": []})
+        release.set()
+        assert statuses == ["ok"]
+        assert "run1" not in orchestrator._viz_listeners
+
+    def test_listener_of_published_viz_runs_immediately(self, orchestrator):
+        """Should call the listener right away when nothing is pending"""
+        orchestrator._publish_viz("run1", None)
+        statuses = []
+
+        orchestrator.on_viz_published("run1", statuses.append)
+
+        assert statuses == ["failed/empty"]
+
+    def test_failing_listener_does_not_break_publication(self, orchestrator):
+        """Should log listener errors and still publish the viz data"""
+        orchestrator._viz_futures["run1"] = Mock()
+        orchestrator.on_viz_published("run1", Mock(side_effect=RuntimeError("boom")))
+
+        orchestrator._publish_viz("run1", {"sheet": []})
+
+        assert orchestrator.get_viz_status("run1") == "ok"
+
+
 # ============================================================================
 # ERROR HANDLING TESTS
 # ============================================================================
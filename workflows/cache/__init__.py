@@ -0,0 +1,9 @@
+# workflows/cache/__init__.py
+
+from workflows.cache.execution_cache import ExecutionCache, CacheEntry, compute_fingerprint
+
+__all__ = [
+    "ExecutionCache",
+    "CacheEntry",
+    "compute_fingerprint",
+]
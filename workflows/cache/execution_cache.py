@@ -0,0 +1,299 @@
+# workflows/cache/execution_cache.py
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, asdict
+import hashlib
+import json
+import pickle
+import threading
+import time
+from loguru import logger
+
+from modules.base_module import ModuleResult
+
+# Files at or below this size are fingerprinted by content, larger files by (size, mtime)
+_CONTENT_HASH_MAX_BYTES = 1 * 1024 * 1024
+
+_INDEX_FILE = "index.json"
+
+# Last-access updates of cache hits are written to the index at most this often (or on flush)
+_INDEX_FLUSH_SECONDS = 30.0
+
+
+@dataclass
+class CacheEntry:
+    """Index record for one persisted module result"""
+    fingerprint: str
+    module_name: str
+    file_name: str
+    size_bytes: int
+    created_at: float
+    last_access: float
+
+
+def _file_signature(path: Path, hash_contents: bool) -> Dict[str, Any]:
+    """Cheap, stable signature of a file: content hash for small files, size/mtime otherwise."""
+    stat = path.stat()
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if hash_contents and stat.st_size <= _CONTENT_HASH_MAX_BYTES:
+        signature = {"size": stat.st_size, "sha256": hashlib.sha256(path.read_bytes()).hexdigest()}
+    return signature
+
+
+def _directory_files(path: Path) -> List[Path]:
+    """Files under a directory, without the Arrow mirrors the database loader derives (_{stem}.arrow)."""
+    return sorted(
+        p for p in path.rglob("*")
+        if p.is_file() and not (p.name.startswith("_") and p.suffix == ".arrow")
+    )
+
+
+def _expand_inputs(paths: List[str]) -> List[Path]:
+    """
+    Resolve the concrete files behind a module's declared inputs.
+
+    - directories are expanded recursively
+    - path_annotations.json also pulls in every parquet file (or partitioned
+      dataset directory) it references, so a new parquet version changes the fingerprint
+    """
+    expanded = []
+    for raw in paths:
+        if not raw:
+            continue
+        path = Path(raw)
+        if path.is_dir():
+            expanded.extend(_directory_files(path))
+            continue
+        expanded.append(path)
+        if path.name == "path_annotations.json" and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    annotations = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not expand annotations {path}: {e}")
+                continue
+            for referenced in sorted(p for p in annotations.values() if isinstance(p, str)):
+                referenced = Path(referenced)
+                if referenced.is_dir():
+                    expanded.extend(_directory_files(referenced))
+                else:
+                    expanded.append(referenced)
+    return expanded
+
+
+def compute_fingerprint(module_instance, hash_contents: bool = True) -> str:
+    """
+    Compute a content-addressed key for a module run.
+
+    Combines the module name and version, its loaded configuration and the
+    signatures of every input resource declared by `module_instance.cache_inputs`.
+    """
+    inputs = {}
+    for path in _expand_inputs(module_instance.cache_inputs):
+        inputs[str(path)] = _file_signature(path, hash_contents) if path.exists() else None
+
+    payload = {
+        "module": module_instance.module_name,
+        "version": getattr(module_instance, "MODULE_VERSION", None),
+        "config": module_instance.config,
+        "inputs": inputs,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ExecutionCache:
+    """
+    Persistent, content-addressed cache of ModuleResult objects.
+
+    - Results are pickled to `cache_dir/{fingerprint}.pkl`
+    - `cache_dir/index.json` keeps entry metadata for LRU/TTL eviction
+    - Only successful results are stored
+    - Hits only update `last_access` in memory; the index is rewritten at most
+      every `index_flush_seconds`, on put/invalidate, or on flush()
+    - Thread-safe (shared by executors running modules in parallel)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: Optional[int] = 128,
+        max_size_bytes: Optional[int] = 512 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        hash_contents: bool = True,
+        index_flush_seconds: float = _INDEX_FLUSH_SECONDS,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hash_contents = hash_contents
+        self.index_flush_seconds = index_flush_seconds
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, CacheEntry] = self._load_index()
+        self._index_dirty = False
+        self._index_saved_at = time.time()
+
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+    def _load_index(self) -> Dict[str, CacheEntry]:
+        index_path = self.cache_dir / _INDEX_FILE
+        if not index_path.exists():
+            return {}
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {key: CacheEntry(**value) for key, value in raw.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring corrupted cache index {index_path}: {e}")
+            return {}
+
+    def _save_index(self):
+        index_path = self.cache_dir / _INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({key: asdict(entry) for key, entry in self._entries.items()}, f, indent=2)
+        tmp_path.replace(index_path)
+        self._index_dirty = False
+        self._index_saved_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def fingerprint(self, module_instance) -> str:
+        return compute_fingerprint(module_instance, hash_contents=self.hash_contents)
+
+    def get(self, fingerprint: str, outputs: Optional[List[str]] = None) -> Optional[ModuleResult]:
+        """
+        Cached result of `fingerprint`. A miss as well if any of `outputs` (the resources
+        the module wrote, expanded like inputs) no longer exists: the module must run again.
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None or self._is_expired(entry):
+                if entry is not None:
+                    self._remove(fingerprint)
+                    self._save_index()
+                self._misses += 1
+                return None
+
+            missing = [path for path in _expand_inputs(outputs or []) if not path.exists()]
+            if missing:
+                logger.info(f"Outputs of {entry.module_name} are missing ({missing[0]}), cache entry not reused")
+                self._misses += 1
+                return None
+
+            try:
+                with open(self.cache_dir / entry.file_name, "rb") as f:
+                    result = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️ Dropping unreadable cache entry {entry.module_name} ({fingerprint[:12]}): {e}")
+                self._remove(fingerprint)
+                self._save_index()
+                self._misses += 1
+                return None
+
+            entry.last_access = time.time()
+            self._index_dirty = True
+            if entry.last_access - self._index_saved_at >= self.index_flush_seconds:
+                self._save_index()
+            self._hits += 1
+            return result
+
+    def put(self, fingerprint: str, module_name: str, result: ModuleResult) -> bool:
+        if not result.is_success():
+            return False
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"⚠️ Result of {module_name} is not cacheable: {e}")
+            return False
+
+        with self._lock:
+            file_name = f"{fingerprint}.pkl"
+            (self.cache_dir / file_name).write_bytes(payload)
+            now = time.time()
+            self._entries[fingerprint] = CacheEntry(
+                fingerprint=fingerprint,
+                module_name=module_name,
+                file_name=file_name,
+                size_bytes=len(payload),
+                created_at=now,
+                last_access=now,
+            )
+            self._stores += 1
+            self._evict()
+            self._save_index()
+        return True
+
+    def invalidate(self, module_name: Optional[str] = None) -> int:
+        """Drop all entries (or only those of one module). Returns the number removed."""
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if module_name is None or entry.module_name == module_name
+            ]
+            for key in keys:
+                self._remove(key)
+            self._save_index()
+        return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def flush(self):
+        """Write pending last-access updates to the index."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_dir": str(self.cache_dir),
+                "entries": len(self._entries),
+                "size_bytes": sum(entry.size_bytes for entry in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+            }
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        return self.ttl_seconds is not None and time.time() - entry.created_at > self.ttl_seconds
+
+    def _remove(self, fingerprint: str):
+        entry = self._entries.pop(fingerprint, None)
+        if entry is not None:
+            (self.cache_dir / entry.file_name).unlink(missing_ok=True)
+
+    def _evict(self):
+        for key in [k for k, e in self._entries.items() if self._is_expired(e)]:
+            self._remove(key)
+            self._evictions += 1
+
+        lru_order = sorted(self._entries.values(), key=lambda e: e.last_access)
+        total_size = sum(entry.size_bytes for entry in lru_order)
+        while lru_order and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_size_bytes is not None and total_size > self.max_size_bytes)
+        ):
+            oldest = lru_order.pop(0)
+            total_size -= oldest.size_bytes
+            self._remove(oldest.fingerprint)
+            self._evictions += 1
@@ -1,15 +1,19 @@
 # workflows/executor.py
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 import json
 import uuid
 from loguru import logger
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import contextvars
 
 from modules.base_module import ModuleResult
 from workflows.dependency_policies.factory import DependencyPolicyFactory
 from workflows.registry.registry import ModuleRegistry
+from workflows.cache.execution_cache import ExecutionCache
+from agents.dataframe_store import get_dataframe_store
 
 @dataclass
 class WorkflowExecutorResult:
@@ -39,16 +43,53 @@ class WorkflowExecutor:
        → failed? STOP / SKIP
     3. safe_execute()
     4. update context
+
+    Execution modes:
+    - 'sequential' (default): modules run strictly in workflow list order
+    - 'parallel': modules are scheduled from a DAG built from each module's
+      `dependencies` (restricted to modules in the workflow) plus optional
+      `depends_on` entries in the workflow JSON. Independent modules run
+      concurrently on a thread pool; `required` fail-fast and per-module
+      `dependency_policy` checks are preserved.
+
+    The mode can be set on the executor or overridden per workflow with the
+    top-level `execution_mode` / `max_workers` keys of the workflow JSON.
+
+    Result reuse:
+    - without `result_cache`: results are reused by module name for the
+      lifetime of the executor (in-process only)
+    - with `result_cache` (ExecutionCache): results are reused only when the
+      module's input fingerprint (config, version, input files) matches a
+      persisted entry, across restarts
+
+    Shared databases:
+    - every workflow run opens a session of the process-wide DataFrameStore
+      (agents.dataframe_store), so modules loading the same database version
+      through load_database share one decoded copy
     """
 
+    EXECUTION_MODES = ("sequential", "parallel")
+
     def __init__(
         self,
         registry: ModuleRegistry,
         workflows_dir: str,
+        execution_mode: str = "sequential",
+        max_workers: Optional[int] = None,
+        result_cache: Optional[ExecutionCache] = None,
     ):
         self.registry = registry
+        self.result_cache = result_cache
         self.workflows_dir = Path(workflows_dir)
 
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"Unknown execution_mode: '{execution_mode}'. "
+                f"Available: {list(self.EXECUTION_MODES)}"
+            )
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+
         # Cache execution results across workflow run
         self._execution_cache: Dict[str, ModuleResult] = {}
 
@@ -73,6 +114,18 @@ class WorkflowExecutor:
         self,
         workflow_name: str) -> WorkflowExecutorResult:
 
+        # Modules of one run share decoded databases
+        with get_dataframe_store().session():
+            try:
+                return self._execute_workflow(workflow_name)
+            finally:
+                if self.result_cache is not None:
+                    self.result_cache.flush()
+
+    def _execute_workflow(
+        self,
+        workflow_name: str) -> WorkflowExecutorResult:
+
         workflow = self._load_workflow(workflow_name)
         workflow_modules = workflow["modules"]
         requested_modules = [m["module"] for m in workflow_modules]
@@ -82,6 +135,21 @@ class WorkflowExecutor:
         execution_id = uuid.uuid4().hex[:8]
         logger.info(f"[{execution_id}] ▶️ Executing workflow: {workflow_name}")
 
+        execution_mode = workflow.get("execution_mode", self.execution_mode)
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"Unknown execution_mode: '{execution_mode}'. "
+                f"Available: {list(self.EXECUTION_MODES)}"
+            )
+
+        if execution_mode == "parallel":
+            return self._execute_parallel(
+                workflow_name,
+                execution_id,
+                workflow_modules,
+                max_workers=workflow.get("max_workers", self.max_workers)
+            )
+
         # --------------------------------------------------------------
         # Execute modules
         # --------------------------------------------------------------
@@ -91,15 +159,21 @@ class WorkflowExecutor:
             module_dependency_policy = module.get("dependency_policy")
             module_required = module.get("required", False)
 
-            if module_name in self._execution_cache:
+            if self.result_cache is None and module_name in self._execution_cache:
                 logger.info(f"[{execution_id}] ♻️ Reusing cached result: {module_name}")
                 result = self._execution_cache[module_name]
                 results[module_name] = result
                 continue
 
             # 🔹 Instantiate FIRST
-            logger.info(f"[{execution_id}] 🚀 Executing module: {module_name}")
             module_instance = self.registry.get_module_instance(module_name, module_config_path)
+
+            cached, fingerprint = self._lookup_persisted(module_name, module_instance, execution_id)
+            if cached is not None:
+                results[module_name] = cached
+                continue
+
+            logger.info(f"[{execution_id}] 🚀 Executing module: {module_name}")
             
             dependency_policy = DependencyPolicyFactory.create(module_dependency_policy)
 
@@ -137,7 +211,7 @@ class WorkflowExecutor:
             # 🔹 Execute
             result = module_instance.safe_execute()
 
-            self._execution_cache[module_name] = result
+            self._store_result(module_name, fingerprint, result)
             results[module_name] = result
 
             if module_required and result.is_failed():
@@ -160,6 +234,204 @@ class WorkflowExecutor:
             results=results
         )
 
+    # ------------------------------------------------------------------
+    # DAG-parallel execution
+    # ------------------------------------------------------------------
+    def _execute_parallel(
+        self,
+        workflow_name: str,
+        execution_id: str,
+        workflow_modules: List[Dict[str, Any]],
+        max_workers: Optional[int] = None) -> WorkflowExecutorResult:
+
+        # Duplicate entries collapse onto one node (same as cache reuse in sequential mode)
+        module_specs: Dict[str, Dict[str, Any]] = {}
+        for module in workflow_modules:
+            module_specs.setdefault(module.get("module"), module)
+        requested_modules = list(module_specs.keys())
+
+        results: Dict[str, ModuleResult] = {}
+        instances: Dict[str, Any] = {}
+
+        for module_name, module in module_specs.items():
+            if self.result_cache is None and module_name in self._execution_cache:
+                logger.info(f"[{execution_id}] ♻️ Reusing cached result: {module_name}")
+                results[module_name] = self._execution_cache[module_name]
+                continue
+            instances[module_name] = self.registry.get_module_instance(
+                module_name, module.get("config_file", None))
+
+        upstreams = self._build_dependency_graph(module_specs, instances)
+        pending = [name for name in requested_modules if name not in results]
+
+        logger.info(
+            f"[{execution_id}] 🔀 Parallel execution: {len(pending)} module(s), "
+            f"max_workers={max_workers or 'auto'}"
+        )
+
+        failure: Optional[str] = None
+        running = {}
+        fingerprints: Dict[str, Optional[str]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix=f"workflow-{execution_id}") as pool:
+            while pending or running:
+
+                # 🔹 Dispatch every module whose upstream modules are finished
+                if failure is None:
+                    for module_name in [m for m in pending if upstreams[m].issubset(results)]:
+                        pending.remove(module_name)
+                        module = module_specs[module_name]
+
+                        # Fingerprint only now: upstream outputs are final
+                        cached, fingerprints[module_name] = self._lookup_persisted(
+                            module_name, instances[module_name], execution_id)
+                        if cached is not None:
+                            results[module_name] = cached
+                            continue
+
+                        dependency_policy = DependencyPolicyFactory.create(module.get("dependency_policy"))
+                        dep_result = self.validate_dependencies(
+                            module_instance=instances[module_name],
+                            requested_modules=requested_modules,
+                            dependency_policy=dependency_policy
+                        )
+
+                        if not dep_result.valid:
+                            logger.error(
+                                f"[{execution_id}] Dependency validation failed for {module_name}: "
+                                f"{dep_result.summary()}"
+                            )
+                            if module.get("required", False):
+                                failure = f"Dependency validation failed: {module_name}"
+                                break
+                            results[module_name] = ModuleResult(
+                                status="skipped",
+                                data=None,
+                                message=f"Dependencies not met: {dep_result.summary()}",
+                                errors=[issue.to_dict() for issue in dep_result.errors.values()]
+                            )
+                            continue
+
+                        logger.info(f"[{execution_id}] 🚀 Executing module: {module_name}")
+                        # Copied context: module loads belong to this run's DataFrameStore session
+                        running[pool.submit(contextvars.copy_context().run,
+                                            instances[module_name].safe_execute)] = module_name
+
+                if not running:
+                    if failure is None and pending:
+                        # Skipped modules may unblock others without anything in flight
+                        if any(upstreams[m].issubset(results) for m in pending):
+                            continue
+                        raise RuntimeError(
+                            f"Unable to schedule modules: {pending}")
+                    break
+
+                # 🔹 Collect finished modules
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    module_name = running.pop(future)
+                    result = future.result()
+
+                    self._store_result(module_name, fingerprints.get(module_name), result)
+                    results[module_name] = result
+
+                    if module_specs[module_name].get("required", False) and result.is_failed():
+                        logger.error(f"[{execution_id}] ❌ Required module failed: {module_name}")
+                        if failure is None:
+                            failure = f"Module {module_name} failed"
+
+        # Keep workflow order in the response (consumers rely on the last module)
+        ordered_results = {name: results[name] for name in requested_modules if name in results}
+
+        if failure is not None:
+            return self._build_response(
+                workflow_name,
+                execution_id,
+                status="failed",
+                message=failure,
+                results=ordered_results
+            )
+
+        logger.info(f"[{execution_id}] ✅ Workflow completed successfully: {workflow_name}")
+        return self._build_response(
+            workflow_name,
+            execution_id,
+            status="success",
+            message="Workflow completed successfully",
+            results=ordered_results
+        )
+
+    def _build_dependency_graph(
+        self,
+        module_specs: Dict[str, Dict[str, Any]],
+        instances: Dict[str, Any]) -> Dict[str, Set[str]]:
+        """
+        Build upstream sets for every workflow module.
+
+        Edges come from module `dependencies` and the optional `depends_on`
+        list in the workflow JSON; dependencies outside the workflow are left
+        to the dependency policy (database lookup) and do not create edges.
+        """
+        upstreams: Dict[str, Set[str]] = {}
+        for module_name, module in module_specs.items():
+            deps = set(module.get("depends_on", []))
+            if module_name in instances:
+                deps.update(instances[module_name].dependencies.keys())
+            upstreams[module_name] = {d for d in deps if d in module_specs and d != module_name}
+
+        # Detect cycles (Kahn's algorithm)
+        indegree = {name: len(deps) for name, deps in upstreams.items()}
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for name, deps in upstreams.items():
+                if current in deps:
+                    indegree[name] -= 1
+                    if indegree[name] == 0:
+                        ready.append(name)
+        if visited != len(upstreams):
+            cyclic = [name for name, degree in indegree.items() if degree > 0]
+            raise ValueError(f"Circular module dependencies detected: {cyclic}")
+
+        return upstreams
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+    def _lookup_persisted(
+        self,
+        module_name: str,
+        module_instance,
+        execution_id: str) -> Tuple[Optional[ModuleResult], Optional[str]]:
+        """Return (cached result or None, fingerprint) from the persistent cache."""
+        if self.result_cache is None:
+            return None, None
+
+        try:
+            fingerprint = self.result_cache.fingerprint(module_instance)
+        except Exception as e:
+            # Unreadable inputs: run the module normally, without caching its result
+            logger.warning(f"[{execution_id}] ⚠️ Could not fingerprint {module_name}, cache skipped: {e}")
+            return None, None
+
+        cached = self.result_cache.get(fingerprint, getattr(module_instance, "cache_outputs", None))
+        if cached is not None:
+            logger.info(f"[{execution_id}] ♻️ Reusing persisted result: {module_name} ({fingerprint[:12]})")
+            self._execution_cache[module_name] = cached
+        return cached, fingerprint
+
+    def _store_result(
+        self,
+        module_name: str,
+        fingerprint: Optional[str],
+        result: ModuleResult):
+        self._execution_cache[module_name] = result
+        if self.result_cache is not None and fingerprint is not None:
+            self.result_cache.put(fingerprint, module_name, result)
+
     # ------------------------------------------------------------------
     # Dependency validation
     # ------------------------------------------------------------------